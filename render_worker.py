@@ -0,0 +1,52 @@
+"""
+렌더 워커 (다중 프로세스 배포 모드)
+
+웹 프로세스와 같은 작업 DB(TASK_DB_PATH)를 공유하며,
+대기 중인 비디오 생성/재생성 작업을 가져와 실행
+
+사용법:
+    TASK_BACKEND=shared python render_worker.py
+
+여러 개 실행하면 렌더링을 병렬로 처리 (렌더링 용량 = 실행한 워커 수)
+
+웹/워커 프로세스는 모두 작업 DB가 있는 한 호스트에서 실행해야 함:
+    작업 DB는 SQLite WAL 모드(공유 메모리)와 fcntl 파일 잠금을 사용하므로 로컬 디스크에 두어야 하며,
+    NFS/SMB 등 네트워크 파일시스템에 두고 여러 호스트에서 접근하면 DB가 손상되거나
+    다른 노드의 변경이 보이지 않을 수 있음 (여러 서버로 나누는 배포는 지원하지 않음)
+    TASK_DB_PATH=/var/lib/daily-english/tasks.db python render_worker.py --worker-id render-01
+
+워커는 실행 중인 작업의 임대(WORKER_LEASE_SECONDS, 기본 60초)를 주기적으로 연장하며,
+워커가 죽어 임대가 만료되면 다른 워커가 작업을 회수하여 마지막 완료 단계부터 재개
+(WORKER_MAX_ATTEMPTS회 실패한 작업은 오류 처리)
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 / web 경로 (web/app.py의 작업 함수 사용)
+PROJECT_ROOT = Path(__file__).parent
+sys.path.append(str(PROJECT_ROOT))
+sys.path.append(str(PROJECT_ROOT / 'web'))
+
+# 공유 모드 강제 (app 임포트 전에 설정해야 SharedJobQueue가 사용됨)
+os.environ['TASK_BACKEND'] = 'shared'
+
+
+def main():
+    """렌더 워커 실행"""
+    parser = argparse.ArgumentParser(description='Daily English Mecca 렌더 워커')
+    parser.add_argument('--worker-id', help='워커 ID (기본: 호스트명-PID)')
+    args = parser.parse_args()
+
+    import app as web_app
+
+    try:
+        web_app.run_render_worker(worker_id=args.worker_id)
+    except KeyboardInterrupt:
+        print("\n👋 렌더 워커 종료")
+
+
+if __name__ == '__main__':
+    main()
@@ -6,15 +6,29 @@
 
 백그라운드 실행:
     nohup python scheduler.py >> logs/scheduler.log 2>&1 &
+
+직접 제출 모드 (Flask 서버 없이 작업 시스템에 바로 제출):
+    python scheduler.py --direct
+    TASK_BACKEND=shared python scheduler.py --direct  (웹 서버/렌더 워커와 함께 운영할 때)
+
+    - SCHEDULE_SLOTS의 여러 슬롯/포맷을 하루에 여러 번 실행
+    - SCHEDULER_MAX_CONCURRENT개까지 동시에 진행 (나머지는 앞 작업이 끝나면 제출)
+    - 스케줄러가 내려가 있던 동안 놓친 실행은 SCHEDULER_CATCHUP_HOURS 이내면 다시 실행
+    - 작업 상태를 폴링하지 않고 작업 종료 콜백으로 완료 처리
+    - 새벽(PREFETCH_AT)에 다음 PREFETCH_DAYS일 분량의 문장/이미지/음성을 미리 생성
+      → 예정 시각의 생성 작업은 렌더링만 실행
+    - YOUTUBE_AUTO_UPLOAD=1이면 완성된 비디오를 YouTube 업로드 큐에 등록
 """
 
+import argparse
 import os
 import sys
+import threading
 import schedule
 import time
 import requests
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 # 프로젝트 루트 경로
@@ -37,6 +51,26 @@ DAILY_THEMES = {
     6: {'theme': 'study', 'detail': '영어 공부'}        # 일요일
 }
 
+# 퀴즈 주제 순환 (직접 제출 모드의 퀴즈 슬롯)
+QUIZ_TOPICS = ['adjectives', 'prepositions', 'articles', 'verbs', 'pronouns', 'countable', 'comparatives', 'confusing']
+
+# 직접 제출 모드 설정
+SCHEDULER_STATE_PATH = LOG_DIR / 'scheduler_state.json'  # 슬롯별 실행 기록 (재시작 후 중복 실행 방지)
+SCHEDULER_MAX_CONCURRENT = int(os.getenv('SCHEDULER_MAX_CONCURRENT', 2))  # 동시에 진행할 스케줄 작업 수
+SCHEDULER_CATCHUP_HOURS = float(os.getenv('SCHEDULER_CATCHUP_HOURS', 24))  # 놓친 실행 따라잡기 기간
+PREFETCH_AT = os.getenv('PREFETCH_AT', '02:00')  # 사전 생성 시각 (API 사용량이 적은 새벽)
+PREFETCH_DAYS = int(os.getenv('PREFETCH_DAYS', 2))  # 사전 생성 기간 (일, 0이면 사용 안 함)
+
+# 완성된 비디오 YouTube 자동 업로드 (직접 제출 모드, client_secrets.json 필요)
+YOUTUBE_AUTO_UPLOAD = os.getenv('YOUTUBE_AUTO_UPLOAD', '').lower() in ('1', 'true', 'yes')
+YOUTUBE_PRIVACY_STATUS = os.getenv('YOUTUBE_PRIVACY_STATUS', 'private')  # 자동 업로드 공개 상태
+YOUTUBE_UPLOAD_PARALLEL = int(os.getenv('YOUTUBE_UPLOAD_PARALLEL', 2))  # 동시 업로드 수
+YOUTUBE_CHUNK_MB = int(os.getenv('YOUTUBE_CHUNK_MB', 8))  # 업로드 청크 크기 (MB)
+UPLOAD_STORE_PATH = Path(os.getenv('OUTPUT_DIR', PROJECT_ROOT / 'output')) / 'youtube_uploads.json'  # 업로드 세션 기록 (재시작 후 이어서 업로드)
+
+# 성공 로그 동시 기록 방지 (직접 제출 모드에서는 완료 콜백이 워커 스레드에서 호출됨)
+_success_log_lock = threading.Lock()
+
 
 def log_message(message):
     """로그 메시지 출력 및 파일 저장"""
@@ -108,23 +142,13 @@ def generate_daily_video():
                         log_message(f"   다운로드: http://localhost:5001{status_data.get('result', {}).get('video_path', '')}")
 
                         # 성공 로그 저장
-                        success_log = LOG_DIR / 'success_videos.json'
-                        success_data = []
-
-                        if success_log.exists():
-                            with open(success_log, 'r', encoding='utf-8') as f:
-                                success_data = json.load(f)
-
-                        success_data.append({
+                        save_success_log({
                             'date': datetime.now().isoformat(),
                             'task_id': task_id,
                             'theme': theme_config,
                             'result': status_data.get('result')
                         })
 
-                        with open(success_log, 'w', encoding='utf-8') as f:
-                            json.dump(success_data, f, indent=2, ensure_ascii=False)
-
                         return True
 
                     elif task_status == 'error':
@@ -149,6 +173,217 @@ def generate_daily_video():
         log_message("=" * 50 + "\n")
 
 
+def save_success_log(entry):
+    """성공한 비디오 기록 추가 (logs/success_videos.json)"""
+    success_log = LOG_DIR / 'success_videos.json'
+
+    with _success_log_lock:
+        success_data = []
+        if success_log.exists():
+            with open(success_log, 'r', encoding='utf-8') as f:
+                success_data = json.load(f)
+
+        success_data.append(entry)
+
+        with open(success_log, 'w', encoding='utf-8') as f:
+            json.dump(success_data, f, indent=2, ensure_ascii=False)
+
+
+# ==================== 직접 제출 모드 ====================
+
+def theme_payload(day):
+    """요일별 테마 묶음"""
+    theme_config = DAILY_THEMES[day.weekday()]
+    return {'format': 'theme', 'theme': theme_config['theme'], 'theme_detail': theme_config['detail'], 'voice': 'nova'}
+
+
+def quiz_payload(day):
+    """날짜별 퀴즈 주제 순환"""
+    return {
+        'format': 'quiz',
+        'quiz_topic': QUIZ_TOPICS[day.toordinal() % len(QUIZ_TOPICS)],
+        'quiz_difficulty': 'intermediate',
+        'voice': 'nova'
+    }
+
+
+def story_payload(day):
+    """월~일 = 스토리 시리즈 Day 1~7"""
+    return {
+        'format': 'other',
+        'other_format': 'story',
+        'story_theme': '해외 여행',
+        'story_day': day.weekday() + 1,
+        'voice': 'nova'
+    }
+
+
+def pronunciation_payload(day):
+    """발음 연습"""
+    return {'format': 'other', 'other_format': 'pronunciation', 'voice': 'nova'}
+
+
+def prefetch_payload_builder(content_slots):
+    """
+    사전 생성 슬롯의 입력값 생성 함수
+
+    사전 생성 시각 이후 PREFETCH_DAYS일 동안 예정된 슬롯의 요청 목록을 만듦
+    (문장/이미지/음성을 미리 생성해 두면 예정 시각에는 렌더링만 실행)
+    """
+    from src.jobs import SlotScheduler
+
+    def build(day):
+        hour, minute = (int(part) for part in PREFETCH_AT.split(':'))
+        prefetch_at = datetime.combine(day, datetime.min.time()).replace(hour=hour, minute=minute)
+        horizon = prefetch_at + timedelta(days=PREFETCH_DAYS)
+
+        items = []
+        for offset in range(PREFETCH_DAYS + 1):
+            target = day + timedelta(days=offset)
+            for slot in content_slots:
+                scheduled_at = slot.occurrence(target)
+                if scheduled_at and prefetch_at < scheduled_at <= horizon:
+                    items.append({
+                        'key': SlotScheduler.run_key(slot.name, target),
+                        'date': target.isoformat(),
+                        'request': slot.build_payload(target)
+                    })
+        return {'kind': 'prefetch', 'items': items}
+
+    return build
+
+
+def build_schedule_slots():
+    """직접 제출 모드의 일일 슬롯 (슬롯 이름을 바꾸면 실행 기록이 새로 시작됨)"""
+    from src.jobs import ScheduleSlot
+
+    content_slots = [
+        ScheduleSlot('morning_theme', '07:00', theme_payload),
+        ScheduleSlot('noon_quiz', '12:00', quiz_payload),
+        ScheduleSlot('evening_story', '18:00', story_payload),
+        ScheduleSlot('weekend_pronunciation', '10:00', pronunciation_payload, weekdays=(5, 6)),
+    ]
+
+    if PREFETCH_DAYS <= 0:
+        return content_slots
+    return content_slots + [
+        ScheduleSlot('night_prefetch', PREFETCH_AT, prefetch_payload_builder(content_slots))
+    ]
+
+
+def run_direct():
+    """작업 시스템에 직접 제출하는 스케줄러 실행 (Flask 서버 불필요)"""
+    sys.path.append(str(PROJECT_ROOT / 'web'))
+    import app as web_app
+    from src.jobs import SlotScheduler
+
+    log_message("🚀 Daily English Mecca 스케줄러 시작 (직접 제출 모드)")
+    log_message(f"   작업 백엔드: {web_app.app.config['TASK_BACKEND']}")
+
+    if not os.getenv("OPENAI_API_KEY"):
+        log_message("❌ OPENAI_API_KEY가 설정되지 않았습니다!")
+        sys.exit(1)
+
+    if not web_app.shared_backend:
+        # local 모드에서는 이 프로세스의 워커가 작업을 실행하므로 중단된 작업도 여기서 재개
+        web_app.recover_interrupted_tasks()
+
+    uploader = upload_queue = None
+    if YOUTUBE_AUTO_UPLOAD:
+        from src.youtube_uploader import YouTubeUploader
+
+        uploader = YouTubeUploader(chunk_size=YOUTUBE_CHUNK_MB * 1024 * 1024)
+        upload_queue = uploader.create_upload_queue(
+            str(UPLOAD_STORE_PATH),
+            max_parallel=YOUTUBE_UPLOAD_PARALLEL,
+            on_finished=lambda upload: log_message(
+                f"📤 업로드 {upload['status']}: {upload['body']['snippet']['title']} "
+                f"{upload.get('video_id') or upload.get('error') or ''}"
+            )
+        )
+        resumed = upload_queue.resume()
+        log_message(f"   YouTube 자동 업로드: {YOUTUBE_PRIVACY_STATUS} (중단된 업로드 {resumed}개 재개)")
+
+    def notify(on_done):
+        """TaskStatus 종료 콜백 → 스케줄러 콜백 (status, 작업 정보)"""
+        return lambda task: on_done(task.status, task.to_dict())
+
+    def submit(payload, on_done):
+        if payload.get('kind') == 'prefetch':
+            # 생성 작업과 같은 콘텐츠 입력값으로 변환해야 사전 생성 결과가 적중함
+            items = [
+                {'key': item['key'], 'date': item['date'], 'content': web_app.build_content_request(item['request'])}
+                for item in payload['items']
+            ]
+            task, deduplicated = web_app.enqueue_prefetch(items)
+        else:
+            content = web_app.build_content_request(payload)
+            task, deduplicated = web_app.enqueue_generate(
+                content, payload.get('voice', 'nova'), run_key=payload.get('run_key')
+            )
+        if deduplicated:
+            log_message(f"   ♻ 진행 중인 동일 작업에 연결: {task.task_id}")
+        web_app.watch_task(task.task_id, notify(on_done))
+        return task.task_id
+
+    def attach(task_id, on_done):
+        return web_app.watch_task(task_id, notify(on_done))
+
+    def on_finished(run, task_info):
+        if task_info['kind'] == 'prefetch':
+            result = task_info.get('result') or {}
+            log_message(f"📦 사전 생성 {task_info['status']}: 새로 준비 {result.get('prepared', 0)}개, "
+                        f"이미 준비됨 {result.get('skipped', 0)}개 {task_info.get('error') or ''}")
+            return
+
+        if task_info['status'] == 'completed':
+            result = task_info.get('result') or {}
+            log_message(f"🎉 비디오 생성 완료: {run['slot']} ({run['date']}) - {result.get('video_filename', '')}")
+            save_success_log({
+                'date': datetime.now().isoformat(),
+                'task_id': task_info['task_id'],
+                'slot': run['slot'],
+                'scheduled_date': run['date'],
+                'result': result
+            })
+
+            if upload_queue is not None:
+                output_dir = web_app.app.config['OUTPUT_DIR']
+                task_id = task_info['task_id']
+                queued = uploader.upload_from_metadata(
+                    str(output_dir / 'videos' / f'daily_english_{task_id}.mp4'),
+                    str(output_dir / 'metadata' / f'metadata_{task_id}.json'),
+                    queue=upload_queue,
+                    privacy_status=YOUTUBE_PRIVACY_STATUS
+                )
+                log_message(f"📥 업로드 대기열 등록: {queued['title']} ({queued['upload_id']})")
+        elif task_info['status'] == 'error':
+            log_message(f"❌ 비디오 생성 실패: {run['slot']} ({run['date']}) - {task_info.get('error')}")
+
+    scheduler = SlotScheduler(
+        build_schedule_slots(),
+        submit,
+        attach,
+        str(SCHEDULER_STATE_PATH),
+        max_concurrent=SCHEDULER_MAX_CONCURRENT,
+        catchup_hours=SCHEDULER_CATCHUP_HOURS,
+        on_finished=on_finished,
+        log=log_message
+    )
+    scheduler.start()
+
+    log_message(f"⏰ 스케줄 등록 완료 (동시 진행 {SCHEDULER_MAX_CONCURRENT}개, 따라잡기 {SCHEDULER_CATCHUP_HOURS:g}시간)")
+    for next_run in scheduler.status()['next_runs']:
+        log_message(f"   - {next_run}")
+
+    log_message("\n대기 중... (Ctrl+C로 종료)")
+
+    try:
+        scheduler.run_forever(interval=60)
+    except KeyboardInterrupt:
+        log_message("\n👋 스케줄러 종료")
+
+
 def check_server():
     """Flask 서버 실행 확인"""
     try:
@@ -160,6 +395,15 @@ def check_server():
 
 def main():
     """메인 스케줄러"""
+    parser = argparse.ArgumentParser(description='Daily English Mecca 스케줄러')
+    parser.add_argument('--direct', action='store_true',
+                        help='Flask API 대신 작업 시스템에 직접 제출 (여러 슬롯/포맷, 놓친 실행 따라잡기)')
+    args = parser.parse_args()
+
+    if args.direct:
+        run_direct()
+        return
+
     log_message("🚀 Daily English Mecca 스케줄러 시작")
     log_message(f"   프로젝트 경로: {PROJECT_ROOT}")
     log_message(f"   로그 경로: {LOG_DIR}")
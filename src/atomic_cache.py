@@ -0,0 +1,257 @@
+"""
+캐시 파일 동시성 안전 쓰기 모듈
+
+- 임시 파일에 쓴 뒤 os.replace로 원자적 교체 (반쯤 쓰인 파일 노출 방지)
+- 캐시 키별 파일 락 (여러 프로세스가 같은 resources/ 공유 가능)
+- 같은 키의 동시 요청은 하나의 생성 작업을 공유 (single-flight)
+"""
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 내 락만 사용
+    fcntl = None
+
+
+@contextmanager
+def atomic_path(final_path):
+    """
+    최종 경로와 같은 디렉토리의 임시 파일 경로를 제공하고,
+    블록이 정상 종료되면 os.replace로 최종 경로에 원자적으로 반영
+
+    Args:
+        final_path: 최종 파일 경로
+
+    Yields:
+        임시 파일 경로 (str)
+    """
+    final_path = Path(final_path)
+    final_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # 확장자를 .tmp로 끝내서 glob("*.png") 등 통계/목록에서 제외
+    fd, tmp_path = tempfile.mkstemp(
+        dir=str(final_path.parent),
+        prefix=f".{final_path.name}.",
+        suffix=".tmp"
+    )
+    os.close(fd)
+
+    try:
+        yield tmp_path
+        os.replace(tmp_path, final_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_bytes(final_path, data: bytes) -> str:
+    """
+    바이트 데이터를 원자적으로 파일에 저장
+
+    Args:
+        final_path: 저장 경로
+        data: 저장할 데이터
+
+    Returns:
+        저장된 파일 경로
+    """
+    with atomic_path(final_path) as tmp_path:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+    return str(final_path)
+
+
+def atomic_copy(src_path, dst_path) -> str:
+    """
+    파일을 원자적으로 복사 (복사 도중의 파일이 dst에 보이지 않음)
+
+    Args:
+        src_path: 원본 파일 경로
+        dst_path: 대상 파일 경로
+
+    Returns:
+        대상 파일 경로
+    """
+    import shutil
+
+    with atomic_path(dst_path) as tmp_path:
+        shutil.copyfile(src_path, tmp_path)
+    return str(dst_path)
+
+
+def atomic_link(src_path, dst_path) -> str:
+    """
+    파일을 하드 링크로 원자적으로 반영 (다른 파일시스템 등 링크가 안 되면 복사)
+
+    dst는 src와 같은 파일이 되므로 dst를 제자리에서 수정하면 src도 바뀜
+
+    Args:
+        src_path: 원본 파일 경로
+        dst_path: 대상 파일 경로
+
+    Returns:
+        대상 파일 경로
+    """
+    import shutil
+
+    with atomic_path(dst_path) as tmp_path:
+        os.unlink(tmp_path)
+        try:
+            os.link(src_path, tmp_path)
+        except OSError:
+            shutil.copyfile(src_path, tmp_path)
+    return str(dst_path)
+
+
+@contextmanager
+def file_lock(target_path):
+    """
+    대상 파일별 배타적 락 (프로세스 간)
+
+    락 파일은 '<대상 경로>.lock'에 생성되며, 락을 가진 채 remove_lock_file로만 삭제
+    (락을 얻은 뒤 락 파일이 그사이 삭제/교체되었으면 새 락 파일로 다시 시도)
+
+    Args:
+        target_path: 락을 걸 대상 파일 경로
+    """
+    lock_path = Path(f"{target_path}.lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    while True:
+        lock_file = open(lock_path, 'a')
+        if fcntl is None:
+            break
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            if os.stat(lock_path).st_ino == os.fstat(lock_file.fileno()).st_ino:
+                break
+        except FileNotFoundError:
+            pass
+        lock_file.close()
+
+    try:
+        yield
+    finally:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        lock_file.close()
+
+
+def remove_lock_file(target_path):
+    """
+    대상 파일의 락 파일 삭제 (file_lock(target_path)를 가진 상태에서만 호출)
+
+    기다리던 다른 프로세스는 락을 얻은 뒤 파일이 사라진 것을 확인하고 새 락 파일로 다시 시도
+
+    Args:
+        target_path: file_lock에 사용한 대상 파일 경로
+    """
+    try:
+        os.unlink(f"{target_path}.lock")
+    except OSError:
+        pass
+
+
+class _Call:
+    """진행 중인 single-flight 호출"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    같은 키에 대한 동시 호출을 하나로 합치는 헬퍼
+
+    먼저 들어온 호출(leader)만 실제 함수를 실행하고,
+    이후 호출들은 leader의 결과(또는 예외)를 그대로 공유함
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key: str, fn):
+        """
+        키 단위로 fn을 한 번만 실행
+
+        Args:
+            key: 중복 판단 키
+            fn: 인자 없는 호출 가능 객체
+
+        Returns:
+            fn의 반환값
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not is_leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+        return call.result
+
+    def in_flight(self, key: str) -> bool:
+        """해당 키의 호출이 진행 중인지 확인"""
+        with self._lock:
+            return key in self._calls
+
+
+# 프로세스 전역 single-flight (캐시 경로를 키로 사용)
+_cache_flight = SingleFlight()
+
+
+def ensure_cached(cache_path, produce) -> bool:
+    """
+    캐시 파일이 없을 때만 생성 (동시성 안전)
+
+    1. 프로세스 내: 같은 캐시 경로에 대한 요청은 하나의 생성 작업을 공유
+    2. 프로세스 간: 파일 락을 잡은 뒤 존재 여부를 다시 확인
+    3. 생성 결과는 임시 파일 → os.replace로 원자적 반영
+
+    Args:
+        cache_path: 캐시 파일 경로
+        produce: produce(tmp_path) 형태로 임시 경로에 파일을 쓰는 함수
+
+    Returns:
+        이번 호출(또는 합류한 호출)에서 새로 생성했으면 True, 기존 캐시면 False
+    """
+    cache_path = Path(cache_path)
+    if cache_path.exists():
+        return False
+
+    def _fill():
+        with file_lock(cache_path):
+            # 다른 프로세스가 락을 잡고 있는 동안 생성했을 수 있음
+            if cache_path.exists():
+                return False
+            with atomic_path(cache_path) as tmp_path:
+                produce(tmp_path)
+            return True
+
+    return _cache_flight.do(str(cache_path), _fill)
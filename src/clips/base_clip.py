@@ -4,6 +4,7 @@ Base clip class with common functionality
 from abc import ABC, abstractmethod
 from moviepy import VideoClip, ColorClip, TextClip, CompositeVideoClip
 from src.config import VideoSettings
+from src.font_registry import install_moviepy_font_cache
 
 
 class BaseClip(ABC):
@@ -19,6 +20,9 @@ class BaseClip(ABC):
         self.height = height or VideoSettings.HEIGHT
         self.settings = VideoSettings
 
+        # TextClip 폰트 객체를 (경로, 크기)별로 재사용
+        install_moviepy_font_cache()
+
     @abstractmethod
     def create(self, **kwargs) -> VideoClip:
         """
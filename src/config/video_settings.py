@@ -1,6 +1,8 @@
 """
 비디오 생성 설정 (폰트, 색상, 위치, 크기 등)
 """
+from src.font_registry import resolve_font
+
 
 class VideoSettings:
     """비디오 생성 관련 모든 설정 상수"""
@@ -11,7 +13,8 @@ class VideoSettings:
     FPS = 30
 
     # === 폰트 ===
-    KOREAN_FONT = "/System/Library/AssetsV2/com_apple_MobileAsset_Font7/bad9b4bf17cf1669dde54184ba4431c22dcad27b.asset/AssetData/NanumGothic.ttc"
+    # 나눔고딕 (macOS 에셋 경로 우선, 없으면 Linux/Windows 한글 폰트로 대체)
+    KOREAN_FONT = resolve_font('nanum')
 
     # === 색상 ===
     class Colors:
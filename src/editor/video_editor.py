@@ -37,7 +37,9 @@ class VideoEditor:
     def regenerate_video(
         self,
         video_id: str,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        output_path: Optional[str] = None,
+        render_logger=None
     ) -> str:
         """
         편집된 설정으로 비디오 재생성
@@ -45,6 +47,8 @@ class VideoEditor:
         Args:
             video_id: 비디오 ID
             config: 편집 설정 (None이면 파일에서 로드)
+            output_path: 출력 파일 경로 (None이면 {video_id}_edited.mp4)
+            render_logger: write_videofile 로거 (None이면 콘솔 진행 바)
 
         Returns:
             생성된 비디오 파일 경로
@@ -61,6 +65,8 @@ class VideoEditor:
 
         # VideoCreator 인스턴스 생성 (resource_manager 전달로 인트로/아웃트로 이미지 사용)
         creator = VideoCreator(resource_manager=self.resource_manager)
+        if render_logger is not None:
+            creator.render_logger = render_logger
 
         # 전역 설정 적용
         global_settings = config.get("global_settings", {})
@@ -71,7 +77,8 @@ class VideoEditor:
         sentences, translations, image_paths, audio_info = self._extract_clip_data_with_audio(clips, video_id)
 
         # 비디오 생성
-        output_path = self.output_dir / f"{video_id}_edited.mp4"
+        if output_path is None:
+            output_path = self.output_dir / f"{video_id}_edited.mp4"
         creator.create_video(
             sentences=sentences,
             translations=translations,
@@ -261,7 +268,8 @@ class VideoEditor:
         translations: list,
         image_paths: list,
         tts_data: list,
-        config_overrides: Optional[Dict[str, Any]] = None
+        config_overrides: Optional[Dict[str, Any]] = None,
+        render_logger=None
     ) -> tuple:
         """
         새 비디오 생성 + 편집 설정 저장
@@ -273,6 +281,7 @@ class VideoEditor:
             image_paths: 이미지 경로 리스트
             tts_data: TTS 데이터 리스트
             config_overrides: 설정 오버라이드 (선택)
+            render_logger: write_videofile 로거 (None이면 콘솔 진행 바)
 
         Returns:
             (video_path, config_path) 튜플
@@ -298,6 +307,8 @@ class VideoEditor:
 
         # 4. 비디오 생성 (resource_manager 전달로 인트로/아웃트로 이미지 사용)
         creator = VideoCreator(resource_manager=self.resource_manager)
+        if render_logger is not None:
+            creator.render_logger = render_logger
         self._apply_global_settings(creator, config.get("global_settings", {}))
 
         output_path = self.output_dir / f"{video_id}.mp4"
@@ -0,0 +1,116 @@
+"""
+파일 서빙 헬퍼 (HTTP 캐시 / 부분 요청 지원)
+
+- 바이트 범위 요청 (Range → 206 Partial Content, 비디오 탐색용)
+- 콘텐츠 해시 기반 강한 ETag (If-None-Match → 304)
+- Last-Modified (If-Modified-Since → 304)
+- 콘텐츠 주소 파일(MD5 해시 파일명)은 장기 캐시(immutable),
+  그 외 파일은 매 요청 ETag 재검증(no-cache)
+"""
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from flask import send_file
+
+
+# 콘텐츠 주소 파일명: ResourceManager의 MD5 해시 파일명 (예: 3f2a...9c.png)
+_CONTENT_ADDRESSED_NAME = re.compile(r'^[0-9a-f]{32,64}$')
+
+# 장기 캐시 기간 (1년)
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+# 파일 해시 캐시: path → (mtime_ns, size, digest)
+_DIGEST_CACHE_SIZE = 1024
+_digest_cache = OrderedDict()
+_digest_lock = threading.Lock()
+
+
+def file_digest(path) -> str:
+    """
+    파일 내용의 SHA-256 해시 반환 (경로/수정시각/크기 기준으로 메모이즈)
+
+    큰 MP4를 요청마다 다시 읽지 않도록, 파일이 바뀌지 않았으면 이전 해시 재사용
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        16진수 해시 문자열
+    """
+    path = Path(path)
+    stat = path.stat()
+    key = str(path.resolve())
+
+    with _digest_lock:
+        cached = _digest_cache.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            _digest_cache.move_to_end(key)
+            return cached[2]
+
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            hasher.update(chunk)
+    digest = hasher.hexdigest()
+
+    with _digest_lock:
+        _digest_cache[key] = (stat.st_mtime_ns, stat.st_size, digest)
+        _digest_cache.move_to_end(key)
+        while len(_digest_cache) > _DIGEST_CACHE_SIZE:
+            _digest_cache.popitem(last=False)
+
+    return digest
+
+
+def is_content_addressed(path) -> bool:
+    """파일명이 콘텐츠 해시인지 확인 (내용이 바뀌면 파일명도 바뀌는 파일)"""
+    return bool(_CONTENT_ADDRESSED_NAME.match(Path(path).stem))
+
+
+def send_cached_file(
+    path,
+    mimetype: Optional[str] = None,
+    as_attachment: bool = False,
+    download_name: Optional[str] = None,
+    immutable: Optional[bool] = None
+):
+    """
+    Range / ETag / 조건부 GET을 지원하는 send_file
+
+    Args:
+        path: 파일 경로
+        mimetype: MIME 타입 (None이면 확장자로 추정)
+        as_attachment: 다운로드 첨부 여부
+        download_name: 다운로드 파일명
+        immutable: 장기 캐시 여부 (None이면 파일명이 콘텐츠 해시인지로 판단)
+
+    Returns:
+        Flask Response (200 / 206 / 304 / 416)
+    """
+    path = Path(path)
+    if immutable is None:
+        immutable = is_content_addressed(path)
+
+    response = send_file(
+        path,
+        mimetype=mimetype,
+        as_attachment=as_attachment,
+        download_name=download_name,
+        conditional=True,  # Range, If-None-Match, If-Modified-Since 처리
+        etag=file_digest(path),
+        last_modified=path.stat().st_mtime,
+        max_age=IMMUTABLE_MAX_AGE if immutable else None
+    )
+
+    if immutable:
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+    else:
+        # 같은 경로의 파일이 재생성될 수 있으므로 매번 ETag로 재검증
+        response.cache_control.no_cache = True
+
+    return response
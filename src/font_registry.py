@@ -0,0 +1,160 @@
+"""
+프로세스 전역 폰트 레지스트리
+
+- 폰트 패밀리(korean, korean_bold, nanum)를 한 번만 경로로 확인 (macOS → Linux → Windows 순, 없으면 DejaVu)
+  환경변수 FONT_<패밀리>(예: FONT_KOREAN=/path/font.ttf)로 지정 가능
+- (경로, 크기)별 FreeTypeFont 객체를 LRU로 보관 (썸네일/자막마다 폰트 파일을 다시 읽지 않음)
+- 텍스트 bbox 측정 결과 메모이즈 (같은 문구/폰트/크기 반복 측정 제거)
+- MoviePy TextClip도 같은 폰트 캐시를 사용하도록 연결 (install_moviepy_font_cache)
+"""
+import os
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+
+# 패밀리별 후보 경로 (앞에서부터 확인)
+FONT_FAMILIES = {
+    # 자막/타이틀 (비디오)
+    'korean': [
+        '/System/Library/Fonts/Supplemental/AppleGothic.ttf',  # macOS
+        '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',  # Ubuntu (fonts-nanum)
+        '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc',  # Debian/Ubuntu (fonts-noto-cjk)
+        '/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc',  # Arch/Fedora
+        'C:\\Windows\\Fonts\\malgun.ttf',  # Windows (맑은고딕)
+    ],
+    # 썸네일 (굵은 글씨)
+    'korean_bold': [
+        '/System/Library/Fonts/Supplemental/AppleGothic.ttf',  # macOS
+        '/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf',  # Ubuntu
+        '/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc',
+        '/usr/share/fonts/noto-cjk/NotoSansCJK-Bold.ttc',
+        'C:\\Windows\\Fonts\\malgunbd.ttf',
+        'C:\\Windows\\Fonts\\malgun.ttf',
+    ],
+    # 퀴즈 클립 (나눔고딕)
+    'nanum': [
+        '/System/Library/AssetsV2/com_apple_MobileAsset_Font7/bad9b4bf17cf1669dde54184ba4431c22dcad27b.asset/AssetData/NanumGothic.ttc',
+        '/Library/Fonts/NanumGothic.ttf',
+        '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
+        '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc',
+        '/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc',
+        'C:\\Windows\\Fonts\\malgun.ttf',
+    ],
+}
+
+# 모든 패밀리의 마지막 대체 폰트 (한글 미지원, 렌더링 실패 방지용)
+FALLBACK_FONTS = {
+    'korean': '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+    'korean_bold': '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
+    'nanum': '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+}
+
+# 캐시 크기 (폰트 객체: 경로×크기 조합 수, 측정: 문구×폰트×크기 조합 수)
+FONT_CACHE_SIZE = 64
+MEASURE_CACHE_SIZE = 4096
+
+# 텍스트 측정용 1x1 캔버스 (그리지 않고 bbox만 계산)
+_measure_draw = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+
+
+@lru_cache(maxsize=None)
+def resolve_font(family: str = 'korean') -> Optional[str]:
+    """
+    폰트 패밀리의 파일 경로 (프로세스당 한 번 확인)
+
+    Args:
+        family: 'korean', 'korean_bold', 'nanum'
+
+    Returns:
+        폰트 파일 경로 (사용 가능한 폰트가 없으면 None → PIL 기본 폰트)
+    """
+    if family not in FONT_FAMILIES:
+        raise ValueError(f"알 수 없는 폰트 패밀리입니다: {family}")
+
+    candidates = [os.getenv(f'FONT_{family.upper()}')] + FONT_FAMILIES[family] + [FALLBACK_FONTS[family]]
+    for font_path in candidates:
+        if font_path and os.path.exists(font_path):
+            print(f"✅ 폰트 로드 ({family}): {font_path}")
+            return font_path
+
+    print(f"⚠️ 시스템 폰트 없음 ({family}), 기본 폰트 사용")
+    return None
+
+
+@lru_cache(maxsize=FONT_CACHE_SIZE)
+def get_font(font_path: Optional[str], size: int):
+    """
+    (경로, 크기)별 폰트 객체 (LRU 캐시)
+
+    Args:
+        font_path: 폰트 파일 경로 (None이면 PIL 기본 폰트)
+        size: 폰트 크기 (px)
+
+    Returns:
+        FreeTypeFont (로드 실패 시 PIL 기본 폰트)
+    """
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except OSError as e:
+            print(f"⚠️ 폰트 로드 실패 ({font_path}, {size}px): {e}")
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=MEASURE_CACHE_SIZE)
+def text_bbox(text: str, font_path: Optional[str], size: int, stroke_width: int = 0) -> Tuple[int, int, int, int]:
+    """
+    (0, 0)에 그렸을 때의 텍스트 bbox (ImageDraw.textbbox와 동일, 결과 메모이즈)
+
+    Args:
+        text: 측정할 텍스트 (여러 줄 가능)
+        font_path: 폰트 파일 경로
+        size: 폰트 크기 (px)
+        stroke_width: 외곽선 두께
+
+    Returns:
+        (left, top, right, bottom)
+    """
+    return _measure_draw.textbbox((0, 0), text, font=get_font(font_path, size), stroke_width=stroke_width)
+
+
+def text_size(text: str, font_path: Optional[str], size: int, stroke_width: int = 0) -> Tuple[int, int]:
+    """텍스트 (너비, 높이)"""
+    left, top, right, bottom = text_bbox(text, font_path, size, stroke_width)
+    return right - left, bottom - top
+
+
+def cache_info() -> dict:
+    """폰트/측정 캐시 적중 통계"""
+    return {
+        'fonts': get_font.cache_info()._asdict(),
+        'measurements': text_bbox.cache_info()._asdict()
+    }
+
+
+class _CachedImageFont:
+    """
+    MoviePy용 ImageFont 대체 모듈
+
+    TextClip은 클립마다 ImageFont.truetype(경로, 크기)를 2~3번 호출하므로
+    경로로 여는 truetype만 폰트 캐시로 연결하고 나머지는 PIL ImageFont 그대로 사용
+    """
+
+    def __getattr__(self, name):
+        return getattr(ImageFont, name)
+
+    @staticmethod
+    def truetype(font=None, size=10, *args, **kwargs):
+        if args or kwargs or not isinstance(font, (str, os.PathLike)):
+            return ImageFont.truetype(font, size, *args, **kwargs)
+        return get_font(os.fspath(font), int(size))
+
+
+def install_moviepy_font_cache():
+    """MoviePy TextClip이 폰트 캐시를 사용하도록 설정 (여러 번 호출해도 한 번만 적용)"""
+    from moviepy.video import VideoClip as video_clip_module
+
+    if not isinstance(video_clip_module.ImageFont, _CachedImageFont):
+        video_clip_module.ImageFont = _CachedImageFont()
@@ -0,0 +1,187 @@
+"""
+미리보기용 축소 이미지(derivative) 생성/캐시 모듈
+
+편집기, 썸네일 히스토리 등 200~300px로 표시되는 곳에
+원본 PNG(1024x1792 DALL-E 이미지, 1280x720 썸네일) 대신 작은 WebP/JPEG를 제공
+
+- 캐시 키: 원본 파일 내용 해시 + 너비 + 포맷 (원본이 바뀌면 자동으로 새 파일)
+- 요청 너비는 정해진 단계로 올림 (임의의 w 값으로 캐시 파일이 늘어나지 않음)
+- 보관 기간/최대 용량 초과 시 오래 사용하지 않은 축소본부터 삭제 (prune_cache, 서버 시작 시 실행)
+"""
+import hashlib
+import os
+import time
+from pathlib import Path
+
+from .atomic_cache import ensure_cached, file_lock, remove_lock_file
+from .file_serving import file_digest
+
+
+# 허용 너비 단계 (요청 너비는 이 중 가장 가까운 큰 값으로 올림)
+DERIVATIVE_WIDTHS = (160, 320, 640, 1280)
+
+# 축소본 보관 기간 / 최대 용량 (마지막 사용 기준)
+DERIVATIVE_CACHE_MAX_AGE_DAYS = float(os.getenv('DERIVATIVE_CACHE_MAX_AGE_DAYS', 30))
+DERIVATIVE_CACHE_MAX_SIZE_MB = float(os.getenv('DERIVATIVE_CACHE_MAX_SIZE_MB', 1024))
+
+# 포맷별 확장자 / MIME / 저장 옵션
+DERIVATIVE_FORMATS = {
+    'webp': {'ext': 'webp', 'mimetype': 'image/webp', 'pil_format': 'WEBP', 'options': {'quality': 80, 'method': 4}},
+    'jpeg': {'ext': 'jpg', 'mimetype': 'image/jpeg', 'pil_format': 'JPEG', 'options': {'quality': 82, 'optimize': True, 'progressive': True}},
+}
+
+
+def snap_width(width: int) -> int:
+    """요청 너비를 허용 단계로 올림"""
+    for step in DERIVATIVE_WIDTHS:
+        if width <= step:
+            return step
+    return DERIVATIVE_WIDTHS[-1]
+
+
+class ImageDerivativeCache:
+    """축소 이미지 디스크 캐시"""
+
+    def __init__(self, cache_dir: str):
+        """
+        ImageDerivativeCache 초기화
+
+        Args:
+            cache_dir: 축소 이미지 저장 디렉토리
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get_derivative(self, source_path: str, width: int, fmt: str = 'webp') -> Path:
+        """
+        원본 이미지의 축소본 경로 반환 (없으면 생성)
+
+        Args:
+            source_path: 원본 이미지 경로
+            width: 요청 너비 (px, 허용 단계로 올림)
+            fmt: 'webp' 또는 'jpeg'
+
+        Returns:
+            축소 이미지 파일 경로
+        """
+        if fmt not in DERIVATIVE_FORMATS:
+            raise ValueError(f"지원하지 않는 포맷입니다: {fmt}")
+
+        format_info = DERIVATIVE_FORMATS[fmt]
+        width = snap_width(width)
+
+        key = hashlib.sha256(f"{file_digest(source_path)}_{width}_{fmt}".encode('utf-8')).hexdigest()
+        derivative_path = self.cache_dir / key[:2] / f"{key}.{format_info['ext']}"
+
+        created = ensure_cached(
+            derivative_path,
+            lambda tmp_path: self._render(source_path, tmp_path, width, format_info)
+        )
+        if not created:
+            # 최근 사용 표시 (수정 시각 갱신 → prune_cache에서 최근 사용 순으로 보존)
+            try:
+                os.utime(derivative_path)
+            except OSError:
+                pass
+        return derivative_path
+
+    def prune_cache(
+        self,
+        max_age_days: float = DERIVATIVE_CACHE_MAX_AGE_DAYS,
+        max_size_mb: float = DERIVATIVE_CACHE_MAX_SIZE_MB
+    ) -> int:
+        """
+        축소본 캐시 정리 (오래 사용하지 않은 축소본과 대상이 사라진 잠금 파일 삭제)
+
+        1. 마지막 사용(수정 시각)이 max_age_days보다 오래된 파일 삭제
+        2. 남은 용량이 max_size_mb를 넘으면 오래 사용하지 않은 파일부터 삭제
+
+        Args:
+            max_age_days: 보관 일수
+            max_size_mb: 캐시 최대 용량 (MB)
+
+        Returns:
+            삭제된 파일 수
+        """
+        entries = []
+        for format_info in DERIVATIVE_FORMATS.values():
+            for path in self.cache_dir.glob(f"*/*.{format_info['ext']}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        cutoff = time.time() - max_age_days * 86400
+        total_size = sum(size for _, size, _ in entries)
+        max_size = max_size_mb * 1024 * 1024
+
+        removed = 0
+        for mtime, size, path in entries:
+            if mtime >= cutoff and total_size <= max_size:
+                break
+            with file_lock(path):
+                path.unlink(missing_ok=True)
+                remove_lock_file(path)
+            total_size -= size
+            removed += 1
+
+        for lock_path in self.cache_dir.glob('*/*.lock'):
+            path = lock_path.with_suffix('')
+            with file_lock(path):
+                if not path.exists():
+                    remove_lock_file(path)
+
+        if removed:
+            print(f"✅ 축소 이미지 캐시 정리: {removed}개 삭제 (남은 용량 {total_size / (1024 * 1024):.1f}MB)")
+        return removed
+
+    @staticmethod
+    def mimetype(fmt: str) -> str:
+        """포맷의 MIME 타입"""
+        return DERIVATIVE_FORMATS[fmt]['mimetype']
+
+    @staticmethod
+    def _render(source_path: str, dest_path: str, width: int, format_info: dict):
+        """원본을 지정 너비로 축소하여 저장 (원본보다 크게 확대하지 않음)"""
+        from PIL import Image
+
+        with Image.open(source_path) as img:
+            img.draft('RGB', (width, width * 4))  # JPEG 원본은 디코딩 단계에서 축소
+            if img.width > width:
+                height = max(1, round(img.height * width / img.width))
+                img = img.resize((width, height), Image.LANCZOS)
+
+            if format_info['pil_format'] == 'JPEG':
+                if img.mode in ('RGBA', 'LA', 'P'):
+                    # 투명 영역은 흰 배경으로 합성
+                    rgba = img.convert('RGBA')
+                    background = Image.new('RGB', rgba.size, (255, 255, 255))
+                    background.paste(rgba, mask=rgba.split()[3])
+                    img = background
+                elif img.mode != 'RGB':
+                    img = img.convert('RGB')
+            elif img.mode not in ('RGB', 'RGBA'):
+                img = img.convert('RGBA')
+
+            img.save(dest_path, format=format_info['pil_format'], **format_info['options'])
+
+
+def negotiate_format(requested: str, accept_header: str) -> str:
+    """
+    출력 포맷 결정
+
+    Args:
+        requested: ?format= 값 (없으면 빈 문자열)
+        accept_header: 요청의 Accept 헤더
+
+    Returns:
+        'webp' 또는 'jpeg'
+    """
+    requested = (requested or '').lower()
+    if requested in ('jpg', 'jpeg'):
+        return 'jpeg'
+    if requested == 'webp':
+        return 'webp'
+    return 'webp' if 'image/webp' in (accept_header or '') else 'jpeg'
@@ -3,8 +3,8 @@ OpenAI DALL-E를 사용한 이미지 생성 모듈
 """
 import os
 from openai import OpenAI
-from pathlib import Path
 from .resource_manager import ResourceManager
+from .atomic_cache import atomic_copy, atomic_path, ensure_cached
 
 
 class ImageGenerator:
@@ -34,66 +34,24 @@ class ImageGenerator:
             생성된 이미지 파일 경로
         """
         try:
-            # 캐싱 사용 시, 이미 존재하는지 확인
+            # 캐싱 사용 시, 캐시 경로에 한 번만 생성 (동시 요청은 같은 생성 작업 공유)
             if self.use_cache and self.resource_manager:
                 cached_path = self.resource_manager.get_image_path(prompt)
                 if self.resource_manager.image_exists(prompt):
                     print(f"✓ 캐시된 이미지 사용: {prompt[:50]}...")
-                    # output_path가 cached_path와 같으면 그대로 반환
-                    if str(output_path) == str(cached_path):
-                        return str(cached_path)
-                    # 다르면 복사 (하위 호환성)
-                    import shutil
-                    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy(cached_path, output_path)
-                    return output_path
-
-            print(f"이미지 생성 중: {prompt[:50]}...")
-
-            response = self.client.images.generate(
-                model="dall-e-3",
-                prompt=prompt,
-                size=size,
-                quality="standard",
-                n=1,
-            )
-
-            image_url = response.data[0].url
-
-            # 이미지 다운로드 및 저장
-            import requests
-            from PIL import Image
-            import io
-
-            image_data = requests.get(image_url).content
-
-            # PIL로 이미지 로드하여 회전 필요 여부 확인
-            img = Image.open(io.BytesIO(image_data))
-            print(f"📸 원본 이미지 크기: {img.size} (width x height)")
-
-            # 가로 방향이면 90도 회전
-            if img.width > img.height:
-                print(f"⚠ 이미지가 가로 방향입니다. 90도 회전합니다.")
-                img = img.rotate(-90, expand=True)
-                print(f"✓ 회전 후 크기: {img.size}")
-
-                # 회전된 이미지를 바이트로 변환
-                buffer = io.BytesIO()
-                img.save(buffer, format='PNG')
-                image_data = buffer.getvalue()
-
-            # output_path에 저장
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'wb') as f:
-                f.write(image_data)
-
-            # 캐싱 사용 시, output_path와 cached_path가 다르면 리소스 폴더에도 저장
-            if self.use_cache and self.resource_manager:
-                cached_path = self.resource_manager.get_image_path(prompt)
-                if str(output_path) != str(cached_path):
-                    # 별도 경로에 캐시 복사본 저장
-                    with open(cached_path, 'wb') as f:
-                        f.write(image_data)
+
+                ensure_cached(cached_path, lambda tmp_path: self._download_image(prompt, tmp_path, size))
+
+                # output_path가 cached_path와 같으면 그대로 반환
+                if str(output_path) == str(cached_path):
+                    return str(cached_path)
+                # 다르면 복사 (하위 호환성)
+                atomic_copy(cached_path, output_path)
+                return output_path
+
+            # 캐시 미사용: output_path에 원자적으로 저장
+            with atomic_path(output_path) as tmp_path:
+                self._download_image(prompt, tmp_path, size)
 
             print(f"✓ 이미지 저장 완료: {output_path}")
             return output_path
@@ -102,6 +60,54 @@ class ImageGenerator:
             print(f"✗ 이미지 생성 실패: {e}")
             raise
 
+    def _download_image(self, prompt: str, dest_path: str, size: str):
+        """
+        DALL-E로 이미지를 생성하여 dest_path에 저장 (필요 시 세로 방향으로 회전)
+
+        Args:
+            prompt: 이미지 생성을 위한 프롬프트
+            dest_path: 저장 경로 (보통 원자적 쓰기용 임시 경로)
+            size: 이미지 크기
+        """
+        print(f"이미지 생성 중: {prompt[:50]}...")
+
+        response = self.client.images.generate(
+            model="dall-e-3",
+            prompt=prompt,
+            size=size,
+            quality="standard",
+            n=1,
+        )
+
+        image_url = response.data[0].url
+
+        # 이미지 다운로드 및 저장
+        import requests
+        from PIL import Image
+        import io
+
+        image_data = requests.get(image_url).content
+
+        # PIL로 이미지 로드하여 회전 필요 여부 확인
+        img = Image.open(io.BytesIO(image_data))
+        print(f"📸 원본 이미지 크기: {img.size} (width x height)")
+
+        # 가로 방향이면 90도 회전
+        if img.width > img.height:
+            print(f"⚠ 이미지가 가로 방향입니다. 90도 회전합니다.")
+            img = img.rotate(-90, expand=True)
+            print(f"✓ 회전 후 크기: {img.size}")
+
+            # 회전된 이미지를 바이트로 변환
+            buffer = io.BytesIO()
+            img.save(buffer, format='PNG')
+            image_data = buffer.getvalue()
+
+        with open(dest_path, 'wb') as f:
+            f.write(image_data)
+
+        print(f"✓ 이미지 저장 완료: {dest_path}")
+
     def generate_images_for_sentences(self, sentences: list[str], output_dir: str) -> list[str]:
         """
         여러 문장에 대한 이미지들을 생성
@@ -0,0 +1,15 @@
+"""
+백그라운드 작업 처리 모듈
+"""
+from .fanout import EventLog, fan_out
+from .job_queue import JobQueue, QueueFullError, TaskCancelled
+from .render_progress import RenderProgressLogger
+from .shared_queue import SharedJobQueue
+from .slot_scheduler import ScheduleSlot, SlotScheduler
+from .task_ids import new_task_id, request_hash
+from .task_store import TaskStore
+
+__all__ = [
+    'EventLog', 'fan_out', 'JobQueue', 'QueueFullError', 'TaskCancelled', 'RenderProgressLogger',
+    'ScheduleSlot', 'SharedJobQueue', 'SlotScheduler', 'TaskStore', 'new_task_id', 'request_hash'
+]
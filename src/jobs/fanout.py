@@ -0,0 +1,132 @@
+"""
+독립 단계 동시 실행 (fan-out) + 작업 이벤트 기록
+
+- 서로 의존하지 않는 단계들을 스레드 풀에서 동시에 실행
+- 단계별 타임아웃: 시간 안에 끝난 단계 결과만 사용하고, 늦은 단계는 계속 실행되도록 두고 Future로 반환
+  (호출자가 늦게 도착한 결과로 나중에 보완)
+  - 타임아웃은 단계가 풀에서 실행을 시작한 시점부터 계산 (여러 요청이 풀을 공유해
+    대기열에서 기다린 시간 때문에 실행도 못 한 단계가 타임아웃 처리되지 않도록)
+- EventLog: 진행 이벤트를 순서대로 기록하고 새 이벤트를 기다릴 수 있는 메모리 로그 (SSE/폴링용)
+"""
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# 실행을 시작하지 않은 단계가 있을 때 시작 여부를 확인하는 간격 (초)
+_START_POLL_INTERVAL = 0.05
+
+
+def fan_out(
+    executor: Executor,
+    steps: Dict[str, Tuple[Callable[[], Any], float]],
+    on_step: Optional[Callable[[str, str, Any], None]] = None
+) -> Tuple[Dict[str, Any], Dict[str, Future]]:
+    """
+    독립 단계들을 동시에 실행하고 단계별 타임아웃까지 기다림
+
+    전체 대기 시간은 단계 시간의 합이 아니라 가장 오래 걸린 단계(또는 가장 긴 타임아웃)
+    타임아웃은 각 단계가 실행을 시작한 시점부터 계산 (풀 대기열에서 기다린 시간 제외)
+
+    Args:
+        executor: 단계를 실행할 풀
+        steps: 단계 이름 → (인자 없는 함수, 타임아웃 초)
+        on_step: on_step(이름, 상태, 값) 콜백
+                 상태: 'done' (값: 결과), 'failed' (값: 예외), 'timeout' (값: None)
+
+    Returns:
+        (시간 안에 성공한 단계 결과 {이름: 결과}, 시간 안에 끝나지 않은 단계 {이름: Future})
+        실패한 단계는 어느 쪽에도 포함되지 않음
+    """
+    notify = on_step or (lambda name, status, value: None)
+    started_at = {}  # 단계 이름 → 실행 시작 시각 (워커 스레드가 기록)
+
+    def run(name, fn):
+        started_at[name] = time.monotonic()
+        return fn()
+
+    futures = {executor.submit(run, name, fn): name for name, (fn, _) in steps.items()}
+    timeouts = {name: timeout for name, (_, timeout) in steps.items()}
+
+    def deadline(name):
+        start = started_at.get(name)
+        return None if start is None else start + timeouts[name]
+
+    results = {}
+    late = {}
+    pending = set(futures)
+    while pending:
+        # 아직 시작하지 않은 단계가 있으면 시작 시점을 확인하기 위해 짧게 대기
+        deadlines = [deadline(futures[future]) for future in pending]
+        started = [value for value in deadlines if value is not None]
+        wait_time = max(0.0, min(started) - time.monotonic()) if started else _START_POLL_INTERVAL
+        if len(started) < len(deadlines):
+            wait_time = min(wait_time, _START_POLL_INTERVAL)
+        done, _ = wait(pending, timeout=wait_time, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            name = futures[future]
+            pending.discard(future)
+            error = future.exception()
+            if error is None:
+                results[name] = future.result()
+                notify(name, 'done', results[name])
+            else:
+                notify(name, 'failed', error)
+
+        now = time.monotonic()
+        for future in list(pending):
+            name = futures[future]
+            step_deadline = deadline(name)
+            if step_deadline is not None and step_deadline <= now:
+                pending.discard(future)
+                late[name] = future
+                notify(name, 'timeout', None)
+
+    return results, late
+
+
+class EventLog:
+    """
+    순서가 있는 진행 이벤트 로그 (스레드 안전)
+
+    이벤트 ID는 1부터 증가하며, 커서(마지막으로 받은 ID) 이후의 이벤트를 조회/대기
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._events: List[dict] = []
+        self.closed = False
+        self.updated_at = time.time()
+
+    def emit(self, event: str, data: dict, close: bool = False):
+        """
+        이벤트 추가
+
+        Args:
+            event: 이벤트 이름
+            data: JSON 직렬화 가능한 데이터
+            close: 마지막 이벤트 여부 (이후 대기 중인 구독자 종료)
+        """
+        with self._cond:
+            self._events.append({'id': len(self._events) + 1, 'event': event, 'data': data})
+            self.closed = self.closed or close
+            self.updated_at = time.time()
+            self._cond.notify_all()
+
+    def since(self, cursor: int = 0) -> List[dict]:
+        """커서 이후의 이벤트"""
+        with self._cond:
+            return self._events[max(0, cursor):]
+
+    def wait(self, cursor: int, timeout: float) -> List[dict]:
+        """
+        커서 이후 이벤트가 생기거나 로그가 닫힐 때까지 대기
+
+        Returns:
+            새 이벤트 (타임아웃이면 빈 리스트)
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: len(self._events) > cursor or self.closed, timeout=timeout)
+            return self._events[max(0, cursor):]
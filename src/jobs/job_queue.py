@@ -0,0 +1,201 @@
+"""
+작업 큐 + 고정 크기 워커 풀
+
+- 동시에 실행되는 작업 수를 워커 수로 제한
+- 단계별(API 호출 / 렌더링) 동시 실행 한도를 별도로 관리
+- 큐가 가득 차면 QueueFullError로 거절 (HTTP 429 + Retry-After)
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+
+class QueueFullError(Exception):
+    """작업 큐가 가득 찼을 때 발생"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"작업 큐가 가득 찼습니다. {retry_after}초 후 다시 시도해주세요.")
+        self.retry_after = retry_after
+
+
+class TaskCancelled(Exception):
+    """사용자가 취소한 작업을 중단할 때 발생 (작업 함수 내부에서 사용)"""
+
+    def __init__(self, task_id: str = ''):
+        super().__init__(f"작업이 취소되었습니다: {task_id}" if task_id else "작업이 취소되었습니다.")
+        self.task_id = task_id
+
+
+class JobQueue:
+    """
+    백그라운드 작업 큐
+
+    사용 예:
+        queue = JobQueue(num_workers=2, max_queue_size=10,
+                         stage_limits={'api': 4, 'render': 1})
+        queue.submit(task_id, generate_video_task, task_id, sentences)
+
+        # 작업 함수 내부
+        with queue.stage('render'):
+            video_creator.create_video(...)
+    """
+
+    def __init__(
+        self,
+        num_workers: int = 2,
+        max_queue_size: int = 10,
+        stage_limits: Optional[Dict[str, int]] = None
+    ):
+        """
+        JobQueue 초기화
+
+        Args:
+            num_workers: 동시에 실행할 작업 수 (워커 스레드 수)
+            max_queue_size: 대기열 최대 길이 (초과 시 QueueFullError)
+            stage_limits: 단계별 동시 실행 한도 (예: {'api': 4, 'render': 1})
+        """
+        self.num_workers = max(1, num_workers)
+        self.max_queue_size = max(0, max_queue_size)
+        self.stage_limits = dict(stage_limits or {})
+
+        self._pending = deque()  # (job_id, fn, args, kwargs)
+        self._running = set()
+        self._cond = threading.Condition()
+        self._stage_semaphores = {
+            name: threading.BoundedSemaphore(max(1, limit))
+            for name, limit in self.stage_limits.items()
+        }
+
+        # Retry-After 추정을 위한 평균 작업 시간 (초, 지수 이동 평균)
+        self._avg_duration = 180.0
+
+        self._workers = []
+        self._started = False
+
+    def _ensure_workers(self):
+        """첫 작업 제출 시 워커 스레드 시작"""
+        if self._started:
+            return
+        self._started = True
+        for idx in range(self.num_workers):
+            worker = threading.Thread(
+                target=self._worker_loop,
+                name=f"job-worker-{idx+1}",
+                daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def submit(self, job_id: str, fn: Callable, *args, **kwargs) -> int:
+        """
+        작업 제출
+
+        Args:
+            job_id: 작업 ID (큐 위치 조회용)
+            fn: 워커에서 실행할 함수
+            *args, **kwargs: fn에 전달할 인자
+
+        Returns:
+            대기열 위치 (1부터 시작, 바로 실행 가능하면 0)
+
+        Raises:
+            QueueFullError: 대기열이 가득 찬 경우
+        """
+        with self._cond:
+            if len(self._pending) >= self.max_queue_size and len(self._running) >= self.num_workers:
+                raise QueueFullError(self.estimate_retry_after())
+
+            self._ensure_workers()
+            self._pending.append((job_id, fn, args, kwargs))
+            idle_workers = self.num_workers - len(self._running)
+            position = max(0, len(self._pending) - idle_workers)
+            self._cond.notify()
+            return position
+
+    def position(self, job_id: str) -> Optional[int]:
+        """
+        대기열 위치 조회
+
+        Returns:
+            1부터 시작하는 대기 순번, 대기 중이 아니면 None
+        """
+        with self._cond:
+            for idx, (pending_id, _, _, _) in enumerate(self._pending):
+                if pending_id == job_id:
+                    return idx + 1
+        return None
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        대기 중인 작업 취소 (이미 실행 중인 작업은 취소하지 않음)
+
+        Returns:
+            대기열에서 제거되었으면 True
+        """
+        with self._cond:
+            for item in list(self._pending):
+                if item[0] == job_id:
+                    self._pending.remove(item)
+                    return True
+        return False
+
+    def is_running(self, job_id: str) -> bool:
+        """작업이 워커에서 실행 중인지 확인"""
+        with self._cond:
+            return job_id in self._running
+
+    def estimate_retry_after(self) -> int:
+        """대기열이 한 칸 비워질 때까지의 예상 시간 (초)"""
+        return max(5, int(self._avg_duration / self.num_workers))
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        단계별 동시 실행 한도 적용
+
+        stage_limits에 없는 단계 이름은 제한 없이 통과
+        """
+        semaphore = self._stage_semaphores.get(name)
+        if semaphore is None:
+            yield
+            return
+
+        semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    def stats(self) -> dict:
+        """큐 상태 반환"""
+        with self._cond:
+            return {
+                'workers': self.num_workers,
+                'running': len(self._running),
+                'queued': len(self._pending),
+                'max_queue_size': self.max_queue_size,
+                'stage_limits': dict(self.stage_limits)
+            }
+
+    def _worker_loop(self):
+        """워커 스레드: 대기열에서 작업을 꺼내 실행"""
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                job_id, fn, args, kwargs = self._pending.popleft()
+                self._running.add(job_id)
+
+            start_time = time.time()
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                # 작업 함수가 자체적으로 오류 상태를 기록하므로 워커는 계속 동작
+                print(f"[JobQueue] 작업 {job_id} 처리 중 예외: {e}")
+            finally:
+                elapsed = time.time() - start_time
+                with self._cond:
+                    self._running.discard(job_id)
+                    self._avg_duration = self._avg_duration * 0.8 + elapsed * 0.2
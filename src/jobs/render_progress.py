@@ -0,0 +1,73 @@
+"""
+MoviePy 렌더링 진행률 → 작업 상태 연결
+
+write_videofile(logger=...)에 전달하여
+- 프레임 진행률을 작업 진행률 구간(start~end)으로 환산해 보고
+- 취소 요청 시 렌더링 도중 TaskCancelled로 중단
+"""
+from typing import Callable, Optional
+
+from proglog import ProgressBarLogger
+
+from .job_queue import TaskCancelled
+
+
+# 비디오 프레임 진행 바 이름 (MoviePy 2.x: frame_index, 1.x: t)
+_FRAME_BARS = ('frame_index', 't')
+
+
+class RenderProgressLogger(ProgressBarLogger):
+    """
+    렌더링 진행률 로거
+
+    사용 예:
+        logger = RenderProgressLogger(
+            on_progress=lambda percent: task.update(percent, '비디오 렌더링 중...'),
+            is_cancelled=lambda: task.cancel_requested,
+            start=10, end=95
+        )
+        creator.render_logger = logger
+    """
+
+    def __init__(
+        self,
+        on_progress: Callable[[int], None],
+        is_cancelled: Optional[Callable[[], bool]] = None,
+        start: int = 0,
+        end: int = 100
+    ):
+        """
+        RenderProgressLogger 초기화
+
+        Args:
+            on_progress: 진행률(정수 %)이 바뀔 때 호출할 함수
+            is_cancelled: 취소 여부 확인 함수 (True면 렌더링 중단)
+            start: 렌더링 시작 시점의 작업 진행률
+            end: 렌더링 완료 시점의 작업 진행률
+        """
+        super().__init__()
+        self.on_progress = on_progress
+        self.is_cancelled = is_cancelled
+        self.start = start
+        self.end = end
+        self._last_percent = None
+
+    def bars_callback(self, bar, attr, value, old_value=None):
+        """진행 바 갱신 시 호출 (MoviePy가 프레임마다 호출)"""
+        if self.is_cancelled and self.is_cancelled():
+            raise TaskCancelled()
+
+        if bar not in _FRAME_BARS or attr != 'index':
+            return
+
+        total = self.bars[bar].get('total') or 0
+        if total <= 0:
+            return
+
+        fraction = min(1.0, max(0.0, value / total))
+        percent = int(self.start + (self.end - self.start) * fraction)
+
+        # 퍼센트가 바뀔 때만 보고 (프레임마다 상태 저장 방지)
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.on_progress(percent)
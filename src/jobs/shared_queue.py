@@ -0,0 +1,85 @@
+"""
+공유 작업 큐 (SQLite 파일 기반, 다중 프로세스 배포용)
+
+- 웹 프로세스: 작업 행(status=queued)을 TaskStore에 저장하고 submit()으로 대기열 한도만 확인
+- 렌더 워커 프로세스: TaskStore.claim_next()로 작업을 가져가 실행
+- 대기열 위치/취소/실행 여부는 모두 TaskStore를 조회하므로 어느 프로세스에서나 동일
+- 단계별 동시 실행 한도(stage)는 프로세스 단위로 적용 (전체 렌더링 수는 워커 프로세스 수로 조절)
+"""
+from typing import Dict, Optional
+
+from .job_queue import JobQueue, QueueFullError
+from .task_store import TaskStore
+
+
+class SharedJobQueue(JobQueue):
+    """
+    TaskStore를 대기열로 사용하는 작업 큐
+
+    JobQueue와 같은 조회 인터페이스(position, cancel, is_running, stage, stats)를 제공하며,
+    작업 실행은 이 프로세스가 아니라 렌더 워커 프로세스가 담당
+    """
+
+    def __init__(
+        self,
+        task_store: TaskStore,
+        max_queue_size: int = 10,
+        stage_limits: Optional[Dict[str, int]] = None
+    ):
+        """
+        SharedJobQueue 초기화
+
+        Args:
+            task_store: 공유 TaskStore (모든 프로세스가 같은 DB 파일 사용)
+            max_queue_size: 대기열 최대 길이 (초과 시 QueueFullError)
+            stage_limits: 이 프로세스에서의 단계별 동시 실행 한도
+        """
+        super().__init__(num_workers=1, max_queue_size=max_queue_size, stage_limits=stage_limits)
+        self.task_store = task_store
+
+    def submit(self, job_id: str, *args, **kwargs) -> int:
+        """
+        대기열 한도 확인 (작업 행은 호출 전에 queued 상태로 저장되어 있어야 함)
+
+        JobQueue.submit과 같은 형태로 호출할 수 있도록 실행 함수/인자를 받지만 사용하지 않음
+        (워커가 작업 행의 kind/params로 실행 함수와 인자를 결정)
+
+        Returns:
+            대기열 위치 (1부터 시작)
+
+        Raises:
+            QueueFullError: 대기열이 가득 찬 경우 (이번 작업 제외)
+        """
+        counts = self.task_store.count_by_status()
+        if counts.get('queued', 0) - 1 >= self.max_queue_size:
+            raise QueueFullError(self.estimate_retry_after())
+        return self.task_store.queue_position(job_id) or 0
+
+    def position(self, job_id: str) -> Optional[int]:
+        """대기열 위치 조회 (queued 상태가 아니면 None)"""
+        return self.task_store.queue_position(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """아직 워커가 가져가지 않은 작업 취소"""
+        return self.task_store.cancel_queued(job_id)
+
+    def is_running(self, job_id: str) -> bool:
+        """작업이 (어느 워커에서든) 실행 중인지 확인"""
+        record = self.task_store.get(job_id)
+        return bool(record and record['status'] == 'processing')
+
+    def estimate_retry_after(self) -> int:
+        """대기열이 한 칸 비워질 때까지의 예상 시간 (초, 실행 중인 작업 수 기준)"""
+        running = self.task_store.count_by_status().get('processing', 0)
+        return max(5, int(self._avg_duration / max(1, running)))
+
+    def stats(self) -> dict:
+        """큐 상태 반환"""
+        counts = self.task_store.count_by_status()
+        return {
+            'backend': 'shared',
+            'running': counts.get('processing', 0),
+            'queued': counts.get('queued', 0),
+            'max_queue_size': self.max_queue_size,
+            'stage_limits': dict(self.stage_limits)
+        }
@@ -0,0 +1,312 @@
+"""
+일일 슬롯 스케줄러 (작업 시스템에 직접 제출)
+
+- 슬롯: 매일(또는 지정 요일) 정해진 시각에 실행할 작업 (포맷/주제는 날짜별로 결정)
+- 동시 실행 한도(max_concurrent): 스케줄러가 제출한 작업 중 동시에 진행되는 수 제한
+- 놓친 실행 따라잡기: 프로세스가 내려가 있던 동안 지난 슬롯을 catchup_hours 이내면 다시 실행
+- 완료 콜백: 작업 상태를 폴링하지 않고 작업 시스템이 알려주는 종료 이벤트로 다음 작업 진행
+- 실행 기록(상태 파일)에 슬롯×날짜별 작업 ID/상태를 저장하여 재시작 후에도 중복 실행하지 않음
+"""
+import json
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from ..atomic_cache import atomic_write_bytes
+from .job_queue import QueueFullError
+
+
+class ScheduleSlot(NamedTuple):
+    """
+    일일 실행 슬롯
+
+    Attributes:
+        name: 슬롯 이름 (실행 기록 키, 변경하면 새 슬롯으로 취급)
+        at: 실행 시각 ('HH:MM')
+        build_payload: 실행 날짜 → 작업 입력값 (예: /api/generate 요청 JSON)
+        weekdays: 실행 요일 (0=월요일, None이면 매일)
+    """
+    name: str
+    at: str
+    build_payload: Callable[[date], dict]
+    weekdays: Optional[Tuple[int, ...]] = None
+
+    def occurrence(self, day: date) -> Optional[datetime]:
+        """해당 날짜의 실행 시각 (실행 요일이 아니면 None)"""
+        if self.weekdays is not None and day.weekday() not in self.weekdays:
+            return None
+        hour, minute = (int(part) for part in self.at.split(':'))
+        return datetime.combine(day, datetime.min.time()).replace(hour=hour, minute=minute)
+
+
+# 다시 제출하지 않는 실행 상태 (error는 max_attempts까지 재시도)
+_SETTLED_STATUSES = ('submitted', 'completed', 'cancelled')
+
+
+class SlotScheduler:
+    """
+    슬롯 스케줄러
+
+    작업 제출/완료 감지는 호출하는 쪽에서 주입:
+        submit(payload, on_done) -> task_id
+            작업을 제출하고, 작업이 끝나면 on_done(status, task_info)를 호출해야 함
+            payload는 슬롯 payload + 'run_key' (실행 키 '<슬롯>@<날짜>')
+            대기열이 가득 차면 QueueFullError
+        attach(task_id, on_done) -> bool
+            재시작 전에 제출한 작업에 완료 콜백 다시 연결 (작업이 없으면 False)
+
+    사용 예:
+        scheduler = SlotScheduler(slots, submit, attach, 'logs/scheduler_state.json', max_concurrent=2)
+        scheduler.start()
+        scheduler.run_forever(interval=60)
+    """
+
+    def __init__(
+        self,
+        slots: List[ScheduleSlot],
+        submit: Callable,
+        attach: Callable,
+        state_path: str,
+        max_concurrent: int = 2,
+        catchup_hours: float = 24,
+        max_attempts: int = 2,
+        on_finished: Optional[Callable[[dict, dict], None]] = None,
+        log: Callable[[str], None] = print
+    ):
+        """
+        SlotScheduler 초기화
+
+        Args:
+            slots: 실행 슬롯 목록
+            submit: 작업 제출 함수 (위 설명 참고)
+            attach: 완료 콜백 재연결 함수 (위 설명 참고)
+            state_path: 실행 기록 파일 경로 (JSON)
+            max_concurrent: 동시에 진행할 스케줄 작업 수
+            catchup_hours: 놓친 실행을 따라잡는 기간 (이보다 오래된 실행은 건너뜀)
+            max_attempts: 실패한 실행의 최대 시도 횟수
+            on_finished: 작업 종료 시 호출 (실행 기록, 작업 정보)
+            log: 로그 출력 함수
+        """
+        names = [slot.name for slot in slots]
+        if len(names) != len(set(names)):
+            raise ValueError(f"슬롯 이름이 중복되었습니다: {names}")
+
+        self.slots = {slot.name: slot for slot in slots}
+        self._submit = submit
+        self._attach = attach
+        self.state_path = Path(state_path)
+        self.max_concurrent = max(1, max_concurrent)
+        self.catchup = timedelta(hours=catchup_hours)
+        self.max_attempts = max(1, max_attempts)
+        self.on_finished = on_finished
+        self.log = log
+
+        self._lock = threading.RLock()
+        self._running = set()  # 진행 중인 실행 키
+        self._retry_at = None  # 대기열이 가득 찼을 때 다음 제출 시각
+        self._wake = threading.Event()  # 작업 종료 시 대기 중인 run_forever 깨우기
+        self._state = self._load_state()
+
+    # ==================== 실행 기록 ====================
+
+    def _load_state(self) -> dict:
+        """실행 기록 로드 (처음 실행이면 지금 이전의 슬롯은 따라잡지 않음)"""
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+
+        state.setdefault('initialized_at', datetime.now().isoformat())
+        state.setdefault('runs', {})
+        return state
+
+    def _save_state(self):
+        """실행 기록 저장 (오래된 기록 정리 후 원자적 쓰기)"""
+        horizon = (datetime.now() - self.catchup - timedelta(days=7)).date().isoformat()
+        self._state['runs'] = {
+            key: run for key, run in self._state['runs'].items()
+            if run['date'] >= horizon or key in self._running
+        }
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(
+            self.state_path,
+            json.dumps(self._state, ensure_ascii=False, indent=2).encode('utf-8')
+        )
+
+    @staticmethod
+    def run_key(slot_name: str, day: date) -> str:
+        """실행 기록 키 (슬롯 이름@날짜)"""
+        return f"{slot_name}@{day.isoformat()}"
+
+    def runs(self) -> Dict[str, dict]:
+        """실행 기록 사본"""
+        with self._lock:
+            return {key: dict(run) for key, run in self._state['runs'].items()}
+
+    # ==================== 스케줄링 ====================
+
+    def start(self):
+        """재시작 전에 제출한(진행 중이던) 작업에 완료 콜백 다시 연결"""
+        with self._lock:
+            for key, run in self._state['runs'].items():
+                if run['status'] != 'submitted':
+                    continue
+                self._running.add(key)
+                if self._attach(run['task_id'], self._done_callback(key)):
+                    self.log(f"♻ 진행 중인 스케줄 작업 연결: {key} ({run['task_id']})")
+                else:
+                    # 작업 DB에서 사라진 작업 → 실패로 기록하고 재시도 대상에 포함
+                    self._running.discard(key)
+                    run['status'] = 'error'
+                    run['error'] = '작업을 찾을 수 없습니다.'
+            self._save_state()
+
+    def due_runs(self, now: Optional[datetime] = None) -> List[Tuple[ScheduleSlot, date]]:
+        """
+        제출해야 하는 실행 목록 (예정 시각 순)
+
+        따라잡기 기간(catchup_hours) 이내이면서 아직 제출하지 않았거나
+        실패 후 재시도 횟수가 남은 실행
+        """
+        now = now or datetime.now()
+        window_start = max(
+            now - self.catchup,
+            datetime.fromisoformat(self._state['initialized_at'])
+        )
+
+        due = []
+        day = window_start.date()
+        while day <= now.date():
+            for slot in self.slots.values():
+                scheduled_at = slot.occurrence(day)
+                if scheduled_at is None or not window_start <= scheduled_at <= now:
+                    continue
+                run = self._state['runs'].get(self.run_key(slot.name, day))
+                if run and (run['status'] in _SETTLED_STATUSES or run['attempts'] >= self.max_attempts):
+                    continue
+                due.append((scheduled_at, slot, day))
+            day += timedelta(days=1)
+
+        due.sort(key=lambda item: item[0])
+        return [(slot, day) for _, slot, day in due]
+
+    def tick(self, now: Optional[datetime] = None) -> List[str]:
+        """
+        예정 시각이 지난 실행을 동시 실행 한도 안에서 제출
+
+        Returns:
+            이번에 제출한 실행 키 목록
+        """
+        now = now or datetime.now()
+        submitted = []
+        changed = False
+
+        with self._lock:
+            if self._retry_at and now < self._retry_at:
+                return submitted
+            self._retry_at = None
+
+            for slot, day in self.due_runs(now):
+                if len(self._running) >= self.max_concurrent:
+                    break
+
+                key = self.run_key(slot.name, day)
+                if key in self._running:
+                    continue
+
+                # 제출 중에 완료 콜백이 먼저 호출되어도 기록을 찾을 수 있도록 미리 submitted로 등록
+                previous = self._state['runs'].get(key)
+                run = dict(previous or {'slot': slot.name, 'date': day.isoformat(), 'attempts': 0})
+                run['attempts'] += 1
+                run.update(status='submitted', task_id=None, error=None, updated_at=now.isoformat())
+                self._state['runs'][key] = run
+                self._running.add(key)
+
+                try:
+                    task_id = self._submit(dict(slot.build_payload(day), run_key=key), self._done_callback(key))
+                except QueueFullError as e:
+                    # 대기열이 비워질 때까지 이번 실행과 뒤의 실행 모두 보류 (시도 횟수 유지)
+                    self._running.discard(key)
+                    if previous is None:
+                        del self._state['runs'][key]
+                    else:
+                        self._state['runs'][key] = previous
+                    self._retry_at = now + timedelta(seconds=e.retry_after)
+                    self.log(f"⏳ 작업 큐가 가득 참 - {e.retry_after}초 후 다시 제출: {key}")
+                    break
+                except Exception as e:
+                    self._running.discard(key)
+                    run.update(status='error', error=str(e))
+                    changed = True
+                    self.log(f"❌ 스케줄 작업 제출 실패: {key} ({run['attempts']}/{self.max_attempts}회) - {e}")
+                    continue
+
+                run['task_id'] = task_id
+                submitted.append(key)
+                late = now - slot.occurrence(day)
+                catchup_note = f" (놓친 실행 따라잡기, {int(late.total_seconds() // 60)}분 지연)" if late > timedelta(minutes=5) else ''
+                self.log(f"▶ 스케줄 작업 제출: {key} → {task_id}{catchup_note}")
+
+            if submitted or changed:
+                self._save_state()
+
+        return submitted
+
+    def _done_callback(self, key: str) -> Callable[[str, dict], None]:
+        """작업 종료 시 실행 기록을 갱신하는 콜백 생성"""
+        def on_done(status: str, task_info: dict):
+            with self._lock:
+                self._running.discard(key)
+                run = self._state['runs'].get(key)
+                if run is None:
+                    return
+                run.update(status=status, error=task_info.get('error'), updated_at=datetime.now().isoformat())
+                self._save_state()
+
+            self.log(f"■ 스케줄 작업 종료: {key} ({status})")
+            if self.on_finished:
+                try:
+                    self.on_finished(dict(run), task_info)
+                except Exception as e:
+                    self.log(f"⚠ 완료 처리 실패 ({key}): {e}")
+
+            # 빈 자리가 생겼으므로 다음 주기를 기다리지 않고 보류 중인 실행 제출
+            self._wake.set()
+
+        return on_done
+
+    def run_forever(self, interval: float = 60, stop_event: Optional[threading.Event] = None):
+        """
+        interval초마다(또는 작업이 끝날 때마다) tick 실행
+
+        Args:
+            interval: 예정 시각 확인 간격 (초)
+            stop_event: 설정되면 루프 종료
+        """
+        while not (stop_event and stop_event.is_set()):
+            try:
+                self.tick()
+            except Exception as e:
+                self.log(f"❌ 스케줄러 오류: {e}")
+            self._wake.wait(interval)
+            self._wake.clear()
+
+    def status(self) -> dict:
+        """스케줄러 상태 (진행 중인 실행, 다음 예정 실행)"""
+        now = datetime.now()
+        upcoming = []
+        for slot in self.slots.values():
+            for offset in range(8):
+                scheduled_at = slot.occurrence(now.date() + timedelta(days=offset))
+                if scheduled_at and scheduled_at > now:
+                    upcoming.append((scheduled_at, slot.name))
+                    break
+
+        with self._lock:
+            return {
+                'running': sorted(self._running),
+                'max_concurrent': self.max_concurrent,
+                'next_runs': [f"{name} {at:%Y-%m-%d %H:%M}" for at, name in sorted(upcoming)]
+            }
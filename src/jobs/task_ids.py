@@ -0,0 +1,38 @@
+"""
+작업 ID / 요청 해시
+
+- 작업 ID: 초 단위 타임스탬프 + 무작위 접미사 (같은 초에 제출돼도 충돌 없음)
+- 요청 해시: 키 순서/공백에 무관한 정규화 JSON의 SHA-256 (중복 요청 병합용)
+"""
+import hashlib
+import json
+import uuid
+from datetime import datetime
+
+
+def new_task_id(prefix: str = '') -> str:
+    """
+    충돌 없는 작업 ID 생성
+
+    Args:
+        prefix: ID 앞에 붙일 문자열 (예: 'regen_<video_id>')
+
+    Returns:
+        '[prefix_]YYYYMMDD_HHMMSS_xxxxxxxx' 형식의 ID (생성 순으로 정렬 가능)
+    """
+    task_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+    return f"{prefix}_{task_id}" if prefix else task_id
+
+
+def request_hash(payload) -> str:
+    """
+    요청 입력값의 정규화 해시
+
+    Args:
+        payload: JSON 직렬화 가능한 값 (딕셔너리 키 순서는 무시됨)
+
+    Returns:
+        16진수 SHA-256 해시
+    """
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
@@ -0,0 +1,427 @@
+"""
+SQLite 기반 작업 상태 저장소
+
+- 작업 입력값(params), 진행 상태, 로그, 결과를 영구 저장
+- 단계별 체크포인트(분석 결과, 이미지 경로, audio_info 등) 저장
+- 서버 재시작 후 중단된 작업을 마지막 완료 단계부터 재개하는 데 사용
+- 공유 모드(TASK_BACKEND=shared)에서는 여러 웹/렌더 워커 프로세스가 공유하는
+  작업 큐 역할도 함 (queued 행을 워커가 claim_next로 가져감)
+- 워커는 임대(lease) 기간 안에 heartbeat로 연장해야 하며,
+  만료된 작업은 requeue_expired로 다른 워커에게 다시 배정
+- WAL 모드는 같은 호스트의 공유 메모리로 동작 → DB 파일은 로컬 디스크에 두고
+  한 호스트의 프로세스끼리만 공유 (NFS/SMB에서 여러 호스트가 열면 DB 손상/변경 누락)
+"""
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+# 작업 DB를 두면 안 되는 네트워크 파일시스템 (/proc/mounts의 fstype)
+_NETWORK_FILESYSTEMS = ('nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', 'fuse.sshfs', 'glusterfs', 'ceph', '9p')
+
+# 종료되지 않은 작업 상태 (재시작 시 복구 대상)
+UNFINISHED_STATUSES = ('queued', 'processing')
+
+# 이전 버전 DB에 추가할 컬럼 (컬럼명 → 정의)
+_MIGRATIONS = {
+    'log_offset': "INTEGER NOT NULL DEFAULT 0",
+    'dedupe_key': "TEXT",
+    'version': "INTEGER NOT NULL DEFAULT 0",
+    'cancel_requested': "INTEGER NOT NULL DEFAULT 0",
+    'claimed_by': "TEXT",
+    'lease_expires_at': "REAL",
+    'attempts': "INTEGER NOT NULL DEFAULT 0",
+}
+
+
+class TaskStore:
+    """작업 상태 영구 저장소"""
+
+    def __init__(self, db_path: str):
+        """
+        TaskStore 초기화
+
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._init_db()
+
+        fstype = _filesystem_type(self.db_path)
+        if fstype in _NETWORK_FILESYSTEMS:
+            print(f"⚠️ 작업 DB가 네트워크 파일시스템({fstype})에 있음: {self.db_path} "
+                  f"(SQLite WAL/파일 잠금은 한 호스트의 로컬 디스크에서만 안전)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결 반환 (sqlite3 연결은 스레드 간 공유 불가)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self):
+        """테이블 생성"""
+        conn = self._connect()
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    task_id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL DEFAULT 'generate',
+                    dedupe_key TEXT,
+                    status TEXT NOT NULL,
+                    progress INTEGER NOT NULL DEFAULT 0,
+                    current_step TEXT NOT NULL DEFAULT '',
+                    params TEXT NOT NULL DEFAULT '{}',
+                    checkpoints TEXT NOT NULL DEFAULT '{}',
+                    logs TEXT NOT NULL DEFAULT '[]',
+                    log_offset INTEGER NOT NULL DEFAULT 0,
+                    version INTEGER NOT NULL DEFAULT 0,
+                    cancel_requested INTEGER NOT NULL DEFAULT 0,
+                    claimed_by TEXT,
+                    lease_expires_at REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    result TEXT,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)")
+
+            # 이전 버전 DB 마이그레이션
+            columns = {row['name'] for row in conn.execute("PRAGMA table_info(tasks)")}
+            for name, ddl in _MIGRATIONS.items():
+                if name not in columns:
+                    conn.execute(f"ALTER TABLE tasks ADD COLUMN {name} {ddl}")
+
+    def save(self, task: Dict, owner: Optional[str] = None) -> bool:
+        """
+        작업 상태 저장 (없으면 생성, 있으면 갱신)
+
+        저장할 때마다 version이 1씩 증가 (다른 프로세스의 상태 변경 감지용)
+        cancel_requested / claimed_by / 임대 정보는 전용 메서드로만 변경
+
+        Args:
+            task: task_id, kind, dedupe_key, status, progress, current_step,
+                  params, checkpoints, logs, log_offset, result, error 키를 가진 딕셔너리
+            owner: 렌더 워커 ID (지정 시 해당 워커가 작업을 가지고 있을 때만 갱신)
+
+        Returns:
+            저장 여부 (owner가 작업을 잃었으면 False)
+        """
+        now = datetime.now().isoformat()
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute("""
+                INSERT INTO tasks (task_id, kind, dedupe_key, status, progress, current_step,
+                                   params, checkpoints, logs, log_offset, result, error,
+                                   version, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+                ON CONFLICT(task_id) DO UPDATE SET
+                    kind = excluded.kind,
+                    dedupe_key = excluded.dedupe_key,
+                    status = excluded.status,
+                    progress = excluded.progress,
+                    current_step = excluded.current_step,
+                    params = excluded.params,
+                    checkpoints = excluded.checkpoints,
+                    logs = excluded.logs,
+                    log_offset = excluded.log_offset,
+                    result = excluded.result,
+                    error = excluded.error,
+                    version = tasks.version + 1,
+                    updated_at = excluded.updated_at
+                WHERE ? IS NULL OR tasks.claimed_by = ?
+            """, (
+                task['task_id'],
+                task.get('kind', 'generate'),
+                task.get('dedupe_key'),
+                task['status'],
+                int(task.get('progress', 0)),
+                task.get('current_step', ''),
+                json.dumps(task.get('params') or {}, ensure_ascii=False),
+                json.dumps(task.get('checkpoints') or {}, ensure_ascii=False),
+                json.dumps(task.get('logs') or [], ensure_ascii=False),
+                int(task.get('log_offset', 0)),
+                json.dumps(task['result'], ensure_ascii=False) if task.get('result') is not None else None,
+                task.get('error'),
+                now,
+                now,
+                owner,
+                owner
+            ))
+        return cursor.rowcount > 0
+
+    def get(self, task_id: str) -> Optional[Dict]:
+        """
+        작업 조회
+
+        Returns:
+            작업 딕셔너리 (없으면 None)
+        """
+        row = self._connect().execute(
+            "SELECT * FROM tasks WHERE task_id = ?", (task_id,)
+        ).fetchone()
+        return self._row_to_dict(row) if row else None
+
+    def list_unfinished(self) -> List[Dict]:
+        """종료되지 않은(queued/processing) 작업 목록 (생성 순)"""
+        placeholders = ','.join('?' * len(UNFINISHED_STATUSES))
+        rows = self._connect().execute(
+            f"SELECT * FROM tasks WHERE status IN ({placeholders}) ORDER BY created_at",
+            UNFINISHED_STATUSES
+        ).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def get_version(self, task_id: str) -> Optional[int]:
+        """작업의 현재 version 조회 (없으면 None)"""
+        row = self._connect().execute(
+            "SELECT version FROM tasks WHERE task_id = ?", (task_id,)
+        ).fetchone()
+        return row['version'] if row else None
+
+    def find_active(self, dedupe_key: str) -> Optional[Dict]:
+        """
+        같은 중복 제거 키로 대기/실행 중인 작업 조회
+
+        Returns:
+            가장 최근 작업 딕셔너리 (없으면 None)
+        """
+        placeholders = ','.join('?' * len(UNFINISHED_STATUSES))
+        row = self._connect().execute(
+            f"SELECT * FROM tasks WHERE dedupe_key = ? AND status IN ({placeholders}) "
+            f"ORDER BY created_at DESC LIMIT 1",
+            (dedupe_key, *UNFINISHED_STATUSES)
+        ).fetchone()
+        return self._row_to_dict(row) if row else None
+
+    def count_by_status(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        rows = self._connect().execute(
+            "SELECT status, COUNT(*) AS count FROM tasks GROUP BY status"
+        ).fetchall()
+        return {row['status']: row['count'] for row in rows}
+
+    def queue_position(self, task_id: str) -> Optional[int]:
+        """
+        대기열 위치 조회 (먼저 생성된 queued 작업 수 + 1)
+
+        Returns:
+            1부터 시작하는 대기 순번, queued 상태가 아니면 None
+        """
+        conn = self._connect()
+        target = conn.execute(
+            "SELECT created_at FROM tasks WHERE task_id = ? AND status = 'queued'", (task_id,)
+        ).fetchone()
+        if target is None:
+            return None
+
+        row = conn.execute("""
+            SELECT COUNT(*) AS ahead FROM tasks
+            WHERE status = 'queued' AND (created_at < ? OR (created_at = ? AND task_id < ?))
+        """, (target['created_at'], target['created_at'], task_id)).fetchone()
+        return row['ahead'] + 1
+
+    def claim_next(self, worker_id: str, kinds: List[str], lease_seconds: float = 60) -> Optional[Dict]:
+        """
+        가장 오래된 queued 작업을 processing으로 바꾸고 가져옴 (여러 워커가 동시에 호출해도 한 워커만 가져감)
+
+        Args:
+            worker_id: 작업을 가져가는 워커 ID
+            kinds: 처리할 수 있는 작업 종류
+            lease_seconds: 임대 기간 (이 안에 heartbeat가 없으면 다른 워커에게 재배정)
+
+        Returns:
+            작업 딕셔너리 (대기 중인 작업이 없으면 None)
+        """
+        if not kinds:
+            return None
+
+        conn = self._connect()
+        placeholders = ','.join('?' * len(kinds))
+        # 쓰기 잠금을 먼저 잡아 조회~갱신 사이에 다른 워커가 끼어들지 못하게 함
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                f"SELECT task_id FROM tasks WHERE status = 'queued' AND kind IN ({placeholders}) "
+                f"ORDER BY created_at, task_id LIMIT 1",
+                tuple(kinds)
+            ).fetchone()
+            if row is None:
+                conn.commit()
+                return None
+
+            conn.execute("""
+                UPDATE tasks SET status = 'processing', claimed_by = ?,
+                                 lease_expires_at = ?, attempts = attempts + 1,
+                                 version = version + 1, updated_at = ?
+                WHERE task_id = ?
+            """, (worker_id, time.time() + lease_seconds, datetime.now().isoformat(), row['task_id']))
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+        return self.get(row['task_id'])
+
+    def heartbeat(self, task_id: str, worker_id: str, lease_seconds: float = 60) -> bool:
+        """
+        작업 임대 연장
+
+        Returns:
+            연장 성공 여부 (만료되어 다른 워커에게 재배정되었으면 False)
+        """
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute("""
+                UPDATE tasks SET lease_expires_at = ?
+                WHERE task_id = ? AND claimed_by = ? AND status = 'processing'
+            """, (time.time() + lease_seconds, task_id, worker_id))
+        return cursor.rowcount > 0
+
+    def requeue_expired(self, max_attempts: int = 3) -> List[Dict]:
+        """
+        임대가 만료된(워커가 죽은) processing 작업을 다시 대기열로 되돌림
+
+        max_attempts번 실행했는데도 끝나지 않은 작업은 오류 처리 (매번 워커를 죽이는 작업 방지)
+
+        Returns:
+            처리된 작업 목록 [{'task_id', 'status', 'attempts', 'claimed_by'}, ...]
+        """
+        conn = self._connect()
+        now = datetime.now().isoformat()
+        handled = []
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute("""
+                SELECT task_id, attempts, claimed_by FROM tasks
+                WHERE status = 'processing' AND lease_expires_at IS NOT NULL AND lease_expires_at < ?
+            """, (time.time(),)).fetchall()
+
+            for row in rows:
+                if row['attempts'] >= max_attempts:
+                    conn.execute("""
+                        UPDATE tasks SET status = 'error', claimed_by = NULL, lease_expires_at = NULL,
+                                         error = ?, version = version + 1, updated_at = ?
+                        WHERE task_id = ?
+                    """, (f"렌더 워커가 응답하지 않습니다 ({row['attempts']}회 시도)", now, row['task_id']))
+                    status = 'error'
+                else:
+                    conn.execute("""
+                        UPDATE tasks SET status = 'queued', claimed_by = NULL, lease_expires_at = NULL,
+                                         version = version + 1, updated_at = ?
+                        WHERE task_id = ?
+                    """, (now, row['task_id']))
+                    status = 'queued'
+
+                handled.append({
+                    'task_id': row['task_id'],
+                    'status': status,
+                    'attempts': row['attempts'],
+                    'claimed_by': row['claimed_by']
+                })
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+        return handled
+
+    def cancel_queued(self, task_id: str) -> bool:
+        """
+        queued 작업을 cancelled로 변경 (워커가 아직 가져가지 않은 경우만)
+
+        Returns:
+            취소되었으면 True
+        """
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute("""
+                UPDATE tasks SET status = 'cancelled', cancel_requested = 1,
+                                 version = version + 1, updated_at = ?
+                WHERE task_id = ? AND status = 'queued'
+            """, (datetime.now().isoformat(), task_id))
+        return cursor.rowcount > 0
+
+    def request_cancel(self, task_id: str):
+        """실행 중인 작업에 취소 요청 기록 (실행 중인 워커가 확인 후 중단)"""
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "UPDATE tasks SET cancel_requested = 1 WHERE task_id = ?", (task_id,)
+            )
+
+    def is_cancel_requested(self, task_id: str) -> bool:
+        """취소 요청 여부 조회"""
+        row = self._connect().execute(
+            "SELECT cancel_requested FROM tasks WHERE task_id = ?", (task_id,)
+        ).fetchone()
+        return bool(row and row['cancel_requested'])
+
+    def delete(self, task_id: str):
+        """작업 삭제"""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,))
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict:
+        """DB 행을 딕셔너리로 변환 (JSON 컬럼 파싱)"""
+        return {
+            'task_id': row['task_id'],
+            'kind': row['kind'],
+            'dedupe_key': row['dedupe_key'],
+            'status': row['status'],
+            'progress': row['progress'],
+            'current_step': row['current_step'],
+            'params': json.loads(row['params']),
+            'checkpoints': json.loads(row['checkpoints']),
+            'logs': json.loads(row['logs']),
+            'log_offset': row['log_offset'],
+            'version': row['version'],
+            'cancel_requested': bool(row['cancel_requested']),
+            'claimed_by': row['claimed_by'],
+            'lease_expires_at': row['lease_expires_at'],
+            'attempts': row['attempts'],
+            'result': json.loads(row['result']) if row['result'] else None,
+            'error': row['error'],
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at']
+        }
+
+
+def _filesystem_type(path: Path) -> Optional[str]:
+    """
+    경로가 속한 마운트의 파일시스템 종류 (/proc/mounts 기준, 확인할 수 없으면 None)
+
+    Args:
+        path: 확인할 파일 경로
+
+    Returns:
+        파일시스템 종류 (예: 'ext4', 'nfs4')
+    """
+    try:
+        with open('/proc/mounts', 'r', encoding='utf-8') as f:
+            mounts = [line.split()[1:3] for line in f if len(line.split()) >= 3]
+    except OSError:
+        return None
+
+    resolved = str(path.resolve())
+    best, fstype = '', None
+    for mount_point, mount_type in mounts:
+        mount_point = mount_point.replace('\\040', ' ')
+        prefix = mount_point.rstrip('/') + '/'
+        if (resolved == mount_point or resolved.startswith(prefix)) and len(mount_point) >= len(best):
+            best, fstype = mount_point, mount_type
+    return fstype
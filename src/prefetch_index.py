@@ -0,0 +1,135 @@
+"""
+사전 생성(prefetch) 콘텐츠 인덱스
+
+예정된 스케줄 작업의 문장/분석/이미지/음성을 새벽에 미리 생성해 두고,
+아침 실행에서는 렌더링만 하도록 준비 상태를 기록
+
+- 이미지/음성 파일은 ResourceManager의 일반 캐시 경로(프롬프트/문장 해시)에 저장
+  → 인덱스에는 생성 작업의 체크포인트(content, analysis, images)와 준비 여부만 기록
+- 항목 키: '<슬롯>@<날짜>' (스케줄러 실행 키) - 스케줄 작업은 자신의 실행 키 항목만 사용
+  (실행 키가 없는 작업만 콘텐츠 입력값 해시로 조회)
+- 같은 요일 테마처럼 입력값이 반복되는 콘텐츠가 재사용되지 않도록 사용한 항목은 삭제
+"""
+import json
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from .atomic_cache import atomic_write_bytes, file_lock
+
+
+class PrefetchIndex:
+    """사전 생성 콘텐츠 인덱스 (JSON 파일, 프로세스 간 파일 잠금)"""
+
+    def __init__(self, index_path: str):
+        """
+        PrefetchIndex 초기화
+
+        Args:
+            index_path: 인덱스 파일 경로 (JSON)
+        """
+        self.index_path = Path(index_path)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _load(self) -> Dict[str, dict]:
+        """인덱스 로드 (없거나 손상되었으면 빈 인덱스)"""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, entries: Dict[str, dict]):
+        """인덱스 저장 (원자적 쓰기)"""
+        atomic_write_bytes(
+            self.index_path,
+            json.dumps(entries, ensure_ascii=False, indent=2).encode('utf-8')
+        )
+
+    def entries(self) -> Dict[str, dict]:
+        """전체 항목 (항목 키 → 항목)"""
+        return self._load()
+
+    def is_ready(self, entry_key: str) -> bool:
+        """항목의 모든 단계가 준비되었는지 확인"""
+        entry = self._load().get(entry_key)
+        return bool(entry and entry['ready'])
+
+    def put(self, entry_key: str, content_key: str, run_date: str, checkpoints: dict, ready: bool):
+        """
+        항목 저장 (단계가 끝날 때마다 호출하여 중단되어도 완료된 단계는 유지)
+
+        Args:
+            entry_key: 항목 키 ('<슬롯>@<날짜>')
+            content_key: 콘텐츠 입력값 해시 (request_hash(content))
+            run_date: 실행 예정 날짜 (YYYY-MM-DD)
+            checkpoints: 생성 작업 체크포인트 형식의 결과 (content, analysis, images)
+            ready: 음성까지 모두 준비되었는지 여부
+        """
+        with file_lock(self.index_path):
+            entries = self._load()
+            entries[entry_key] = {
+                'content_key': content_key,
+                'date': run_date,
+                'checkpoints': checkpoints,
+                'ready': ready,
+                'updated_at': datetime.now().isoformat()
+            }
+            self._save(entries)
+
+    def get(self, entry_key: str) -> Optional[dict]:
+        """항목 조회 (없으면 None)"""
+        return self._load().get(entry_key)
+
+    def take(self, content_key: str, run_key: Optional[str] = None) -> Optional[dict]:
+        """
+        준비된 항목을 꺼냄 (인덱스에서 삭제)
+
+        run_key가 있으면 해당 실행의 항목만 사용 (다른 슬롯/수동 요청의 항목을 가져가지 않음),
+        없으면 같은 콘텐츠 입력값의 준비된 항목 중 가장 이른 날짜의 항목
+
+        Args:
+            content_key: 콘텐츠 입력값 해시 (run_key 항목도 입력값이 같을 때만 사용)
+            run_key: 스케줄러 실행 키 ('<슬롯>@<날짜>')
+
+        Returns:
+            체크포인트 딕셔너리 (없으면 None)
+        """
+        today = date.today().isoformat()
+        with file_lock(self.index_path):
+            entries = self._load()
+            if run_key:
+                entry = entries.get(run_key)
+                if not (entry and entry['content_key'] == content_key and entry['ready']):
+                    return None
+                key = run_key
+            else:
+                candidates = sorted(
+                    (entry['date'], key) for key, entry in entries.items()
+                    if entry['content_key'] == content_key and entry['ready'] and entry['date'] >= today
+                )
+                if not candidates:
+                    return None
+                key = candidates[0][1]
+
+            entry = entries.pop(key)
+            self._save(entries)
+        return entry['checkpoints']
+
+    def prune(self, before: Optional[str] = None) -> int:
+        """
+        지난 날짜의 항목 삭제 (캐시 파일은 ResourceManager 캐시에 그대로 남음)
+
+        Args:
+            before: 이 날짜(YYYY-MM-DD) 이전 항목 삭제 (기본: 오늘)
+
+        Returns:
+            삭제된 항목 수
+        """
+        before = before or date.today().isoformat()
+        with file_lock(self.index_path):
+            entries = self._load()
+            kept = {key: entry for key, entry in entries.items() if entry['date'] >= before}
+            if len(kept) != len(entries):
+                self._save(kept)
+        return len(entries) - len(kept)
@@ -0,0 +1,239 @@
+"""
+렌더링 결과 캐시 (동일 입력 → 기존 MP4 재사용)
+
+- 캐시 키: 타임라인 입력값(문장, 번역, 이미지 그룹, 오디오 길이 등) + 렌더러 설정
+  + 인코더 프로필 + 렌더러 코드 해시 + 모든 소스 파일(이미지/오디오/배경음악)의 내용 해시
+- 소스 파일은 경로가 아닌 내용 해시로 키에 포함 (작업별 오디오 폴더에 복사된 같은 TTS도 적중)
+- 매니페스트에 소스 파일 경로/해시를 기록하여, 조회 시 소스가 삭제/변경되었으면 항목 삭제
+- 보관 기간/최대 용량 초과 시 오래 사용하지 않은 항목부터 삭제 (적중 시 매니페스트 수정 시각 갱신)
+- 적중 시 출력 경로에 하드 링크로 반영 (같은 파일시스템이면 복사 없음)
+"""
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from .atomic_cache import atomic_copy, atomic_link, atomic_write_bytes, file_lock, remove_lock_file
+from .file_serving import file_digest
+from .jobs import request_hash
+
+
+# 캐시 보관 기간 / 최대 용량 (마지막 사용 기준, 넘으면 오래 사용하지 않은 항목부터 삭제)
+RENDER_CACHE_MAX_AGE_DAYS = float(os.getenv('RENDER_CACHE_MAX_AGE_DAYS', 30))
+RENDER_CACHE_MAX_SIZE_MB = float(os.getenv('RENDER_CACHE_MAX_SIZE_MB', 10240))
+
+
+class RenderKey(NamedTuple):
+    """렌더 캐시 키와 소스 파일 목록 (경로 → 내용 해시)"""
+    key: str
+    sources: Dict[str, str]
+
+
+class RenderCache:
+    """렌더링 결과 디스크 캐시"""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_age_days: float = RENDER_CACHE_MAX_AGE_DAYS,
+        max_size_mb: float = RENDER_CACHE_MAX_SIZE_MB
+    ):
+        """
+        RenderCache 초기화
+
+        Args:
+            cache_dir: 캐시된 MP4 / 매니페스트 저장 디렉토리
+            max_age_days: 보관 일수 (마지막 사용 기준)
+            max_size_mb: 캐시 최대 용량 (MB)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_age_days = max_age_days
+        self.max_size_mb = max_size_mb
+
+    def make_key(self, kind: str, params: dict, assets: List[str]) -> RenderKey:
+        """
+        렌더 캐시 키 계산
+
+        Args:
+            kind: 렌더링 종류 (예: 'create_video', 'create_quiz_video')
+            params: 파일 경로를 제외한 입력값/설정 (JSON 직렬화 가능)
+            assets: 렌더링에 사용되는 소스 파일 경로 (순서 유지, 없는 파일은 None 취급)
+
+        Returns:
+            RenderKey
+        """
+        sources = {}
+        asset_digests = []
+        for path in assets:
+            if path and Path(path).exists():
+                digest = file_digest(path)
+                sources[str(path)] = digest
+                asset_digests.append(digest)
+            else:
+                asset_digests.append(None)
+
+        key = request_hash({'kind': kind, 'params': params, 'assets': asset_digests})
+        return RenderKey(key, sources)
+
+    def _entry_paths(self, key: str):
+        """캐시 항목의 (비디오, 매니페스트) 경로"""
+        entry_dir = self.cache_dir / key[:2]
+        return entry_dir / f"{key}.mp4", entry_dir / f"{key}.json"
+
+    def restore(self, render_key: RenderKey, output_path: str) -> bool:
+        """
+        캐시된 렌더링 결과를 output_path에 하드 링크로 반영 (링크가 안 되면 복사)
+
+        소스 파일이 삭제되었거나 내용이 바뀐 항목은 삭제하고 미적중 처리
+        output_path는 캐시 항목과 같은 파일일 수 있으므로 제자리에서 덮어쓰지 말고 삭제 후 새로 써야 함
+
+        Returns:
+            적중 여부
+        """
+        video_path, manifest_path = self._entry_paths(render_key.key)
+        if not video_path.exists():
+            return False
+
+        if not self._verify(manifest_path):
+            # 저장 중인 항목(매니페스트 쓰기 전)을 지우지 않도록 잠근 뒤 다시 확인
+            with file_lock(video_path):
+                if not self._verify(manifest_path):
+                    self.evict(render_key.key)
+                    return False
+
+        with file_lock(video_path):
+            if not video_path.exists():
+                return False
+            atomic_link(str(video_path), str(output_path))
+            # 최근 사용 표시 (비디오는 출력 파일과 같은 inode이므로 매니페스트 시각 갱신)
+            os.utime(manifest_path)
+        return True
+
+    def store(self, render_key: RenderKey, video_path: str):
+        """
+        렌더링 결과를 캐시에 저장
+
+        Args:
+            render_key: make_key() 결과
+            video_path: 렌더링된 MP4 경로
+        """
+        cached_video, manifest_path = self._entry_paths(render_key.key)
+        cached_video.parent.mkdir(parents=True, exist_ok=True)
+
+        manifest = {
+            'key': render_key.key,
+            'sources': render_key.sources,
+            'created_at': datetime.now().isoformat()
+        }
+
+        with file_lock(cached_video):
+            atomic_copy(str(video_path), str(cached_video))
+            atomic_write_bytes(
+                manifest_path,
+                json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8')
+            )
+
+        self.enforce_limits()
+
+    def evict(self, key: str):
+        """캐시 항목 삭제 (비디오 + 매니페스트)"""
+        for path in self._entry_paths(key):
+            path.unlink(missing_ok=True)
+
+    def prune(self) -> int:
+        """
+        모든 캐시 항목 검증 (소스가 사라졌거나 바뀐 항목, 짝이 맞지 않는 파일 삭제)
+        + 보관 기간/최대 용량 적용 + 대상이 사라진 잠금 파일 삭제
+
+        Returns:
+            삭제된 항목 수
+        """
+        evicted = 0
+        for manifest_path in self.cache_dir.glob('*/*.json'):
+            video_path = manifest_path.with_suffix('.mp4')
+            # store()와 같은 잠금 → 저장 중(비디오만 있고 매니페스트 쓰기 전)인 항목은 건드리지 않음
+            with file_lock(video_path):
+                if not video_path.exists() or not self._verify(manifest_path):
+                    self.evict(manifest_path.stem)
+                    evicted += 1
+
+        for video_path in self.cache_dir.glob('*/*.mp4'):
+            with file_lock(video_path):
+                if video_path.exists() and not video_path.with_suffix('.json').exists():
+                    video_path.unlink()
+                    evicted += 1
+
+        evicted += self.enforce_limits()
+
+        for lock_path in self.cache_dir.glob('*/*.mp4.lock'):
+            video_path = lock_path.with_suffix('')
+            with file_lock(video_path):
+                if not video_path.exists():
+                    remove_lock_file(video_path)
+
+        return evicted
+
+    def enforce_limits(self) -> int:
+        """
+        보관 기간/최대 용량 적용 (소스 검증 없이 파일 정보만 사용 → 저장할 때마다 호출)
+
+        1. 마지막 사용(매니페스트 수정 시각)이 max_age_days보다 오래된 항목 삭제
+        2. 남은 용량이 max_size_mb를 넘으면 오래 사용하지 않은 항목부터 삭제
+
+        Returns:
+            삭제된 항목 수
+        """
+        entries = []
+        for manifest_path in self.cache_dir.glob('*/*.json'):
+            try:
+                last_used = manifest_path.stat().st_mtime
+                size = manifest_path.with_suffix('.mp4').stat().st_size
+            except OSError:
+                continue
+            entries.append((last_used, size, manifest_path))
+        entries.sort()
+
+        cutoff = time.time() - self.max_age_days * 86400
+        total_size = sum(size for _, size, _ in entries)
+        max_size = self.max_size_mb * 1024 * 1024
+
+        evicted = 0
+        for last_used, size, manifest_path in entries:
+            if last_used >= cutoff and total_size <= max_size:
+                break
+            video_path = manifest_path.with_suffix('.mp4')
+            with file_lock(video_path):
+                self.evict(manifest_path.stem)
+                remove_lock_file(video_path)
+            total_size -= size
+            evicted += 1
+
+        if evicted:
+            print(f"✅ 렌더 캐시 정리: {evicted}개 삭제 (남은 용량 {total_size / (1024 * 1024):.1f}MB)")
+        return evicted
+
+    def _verify(self, manifest_path: Path) -> bool:
+        """매니페스트의 소스 파일이 모두 남아있고 내용이 같은지 확인"""
+        manifest = self._load_manifest(manifest_path)
+        if manifest is None:
+            return False
+
+        for path, digest in manifest['sources'].items():
+            try:
+                if file_digest(path) != digest:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    @staticmethod
+    def _load_manifest(manifest_path: Path) -> Optional[dict]:
+        """매니페스트 로드 (없거나 손상되었으면 None)"""
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
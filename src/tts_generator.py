@@ -5,6 +5,11 @@ import os
 from openai import OpenAI
 from pathlib import Path
 from .resource_manager import ResourceManager
+from .atomic_cache import atomic_copy, atomic_path, ensure_cached
+
+
+# 문장별 다중 음성 생성 시 기본 음성 (학습 효과 향상)
+DEFAULT_VOICES = ["alloy", "nova", "shimmer"]
 
 
 class TTSGenerator:
@@ -34,34 +39,35 @@ class TTSGenerator:
             생성된 음성 파일 경로
         """
         try:
-            # 캐싱 사용 시, 이미 존재하는지 확인
+            def _synthesize(dest_path):
+                response = self.client.audio.speech.create(
+                    model="tts-1",
+                    voice=voice,
+                    input=text
+                )
+                response.stream_to_file(dest_path)
+
+            # 캐싱 사용 시, 캐시 경로에 한 번만 생성 (동시 요청은 같은 생성 작업 공유)
             if self.use_cache and self.resource_manager:
                 cached_path = self.resource_manager.get_audio_path(text, voice)
                 if self.resource_manager.audio_exists(text, voice):
                     print(f"✓ 캐시된 오디오 사용: {text[:50]}...")
-                    # 캐시된 오디오를 output_path로 복사
-                    import shutil
-                    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy(cached_path, output_path)
-                    return output_path
+                else:
+                    print(f"음성 생성 중: {text[:50]}...")
 
-            print(f"음성 생성 중: {text[:50]}...")
+                if ensure_cached(cached_path, _synthesize):
+                    print(f"✓ 음성 캐시 저장: {cached_path}")
 
-            response = self.client.audio.speech.create(
-                model="tts-1",
-                voice=voice,
-                input=text
-            )
+                # 캐시된 오디오를 output_path로 복사
+                if str(output_path) != str(cached_path):
+                    atomic_copy(cached_path, output_path)
+                return output_path
 
-            # output_path에 저장
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            response.stream_to_file(output_path)
+            print(f"음성 생성 중: {text[:50]}...")
 
-            # 캐싱 사용 시, 리소스 폴더에도 저장
-            if self.use_cache and self.resource_manager:
-                cached_path = self.resource_manager.get_audio_path(text, voice)
-                import shutil
-                shutil.copy(output_path, cached_path)
+            # output_path에 원자적으로 저장
+            with atomic_path(output_path) as tmp_path:
+                _synthesize(tmp_path)
 
             print(f"✓ 음성 저장 완료: {output_path}")
             return output_path
@@ -177,7 +183,7 @@ class TTSGenerator:
             ]
         """
         if voices is None:
-            voices = ["alloy", "nova", "shimmer"]
+            voices = DEFAULT_VOICES
 
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         audio_info = []
@@ -17,6 +17,20 @@ from src.config.kelly_dialogues import (
     get_random_quiz_intro, get_random_quiz_outro
 )
 from src.config.video_settings import VideoSettings
+from src.render_cache import RenderCache
+from src.file_serving import file_digest
+from src.font_registry import install_moviepy_font_cache, resolve_font
+
+
+# 쇼츠/퀴즈 비디오 인코더 설정 (렌더 캐시 키에 포함)
+ENCODER_PROFILE = {
+    'codec': 'libx264',
+    'audio_codec': 'aac',
+    'preset': 'medium'
+}
+
+# 렌더 캐시 키에서 제외할 속성 (렌더링 결과와 무관한 객체)
+_NON_RENDER_ATTRS = ('image_generator', 'resource_manager', 'render_logger', 'render_cache')
 
 
 class VideoCreator:
@@ -37,10 +51,128 @@ class VideoCreator:
         # Kelly Cat 캐릭터 사용 여부
         self.use_kelly = use_kelly
 
+        # 한글 폰트 (프로세스 전역 레지스트리에서 한 번만 확인, TextClip 폰트 객체는 LRU 캐시 사용)
+        self.korean_font = resolve_font('korean')
+        install_moviepy_font_cache()
+
         # 커스텀 인트로/아웃트로 이미지 경로 (설정에서 가져옴)
         self.intro_custom_image = None
         self.outro_custom_image = None
 
+        # write_videofile 로거 ('bar': 콘솔 진행 바, 작업 진행률 보고 시 RenderProgressLogger)
+        self.render_logger = 'bar'
+
+        # 렌더링 결과 캐시 (동일 입력이면 기존 MP4 재사용, None이면 사용 안 함)
+        self.render_cache = (
+            RenderCache(str(Path(resource_manager.resources_dir) / 'renders'))
+            if resource_manager else None
+        )
+
+    @staticmethod
+    def _temp_audiofile(output_path: str) -> str:
+        """
+        출력 파일별 임시 오디오 경로
+
+        작업 디렉토리의 고정 파일명(temp-audio.m4a)을 쓰면
+        동시에 렌더링되는 비디오끼리 오디오가 섞이므로 출력 경로 옆에 생성
+        """
+        output = Path(output_path)
+        return str(output.with_name(f"{output.stem}.temp-audio.m4a"))
+
+    def _render_key(self, kind: str, params: dict, assets: list):
+        """
+        렌더 캐시 키 계산 (렌더 캐시 미사용 또는 계산 실패 시 None)
+
+        Args:
+            kind: 렌더링 함수 이름
+            params: 파일 경로를 제외한 타임라인 입력값
+            assets: 타임라인에 사용되는 파일 경로 (이미지, 오디오)
+        """
+        if self.render_cache is None:
+            return None
+
+        settings = {
+            name: value for name, value in vars(self).items()
+            if name not in _NON_RENDER_ATTRS
+            and isinstance(value, (str, int, float, bool, type(None), list, tuple, dict))
+        }
+
+        # 설정 외에 암묵적으로 사용하는 파일 (커스텀 인트로/아웃트로, 배경 음악, Kelly 이미지)
+        implicit_assets = [self.intro_custom_image, self.outro_custom_image]
+        if self.resource_manager:
+            resources_dir = Path(self.resource_manager.resources_dir)
+            implicit_assets += [
+                str(resources_dir / name)
+                for name in ('background_music_original.mp3', 'background_music.mp3', 'bgm.mp3')
+            ]
+            implicit_assets += sorted(str(path) for path in (resources_dir / 'images').glob('kelly_*.png'))
+
+        try:
+            return self.render_cache.make_key(kind, {
+                'params': params,
+                'settings': settings,
+                'encoder': ENCODER_PROFILE,
+                'renderer': file_digest(__file__)  # 렌더링 코드가 바뀌면 캐시 무효화
+            }, list(assets) + implicit_assets)
+        except Exception as e:
+            print(f"⚠ 렌더 캐시 키 계산 실패 (캐시 없이 렌더링): {e}")
+            return None
+
+    def _restore_cached_render(self, render_key, output_path: str) -> bool:
+        """
+        렌더 캐시 적중 시 output_path에 반영하고 True 반환
+
+        미적중이면 기존 output_path 삭제 (이전에 복원한 캐시 항목의 하드 링크일 수 있으므로
+        write_videofile이 같은 파일을 덮어써 캐시 항목을 망가뜨리지 않도록)
+        """
+        if self.render_cache is None:
+            return False
+        if render_key is not None:
+            try:
+                if self.render_cache.restore(render_key, output_path):
+                    print(f"♻ 동일한 입력의 렌더링 결과 재사용: {output_path}")
+                    return True
+            except Exception as e:
+                print(f"⚠ 렌더 캐시 조회 실패: {e}")
+
+        try:
+            Path(output_path).unlink(missing_ok=True)
+        except OSError:
+            pass
+        return False
+
+    def _store_render(self, render_key, output_path: str):
+        """렌더링 결과를 캐시에 저장 (실패해도 렌더링 결과에는 영향 없음)"""
+        if render_key is None:
+            return
+        try:
+            self.render_cache.store(render_key, output_path)
+        except Exception as e:
+            print(f"⚠ 렌더 캐시 저장 실패: {e}")
+
+    @staticmethod
+    def _split_audio_info(audio_info: list) -> tuple:
+        """
+        audio_info를 경로 없는 타임라인 정보와 오디오 파일 목록으로 분리
+
+        Returns:
+            (경로를 제외한 audio_info, 오디오 파일 경로 리스트)
+        """
+        timeline = []
+        audio_paths = []
+        for info in audio_info:
+            entry = {key: value for key, value in info.items() if key not in ('path', 'voices')}
+            if 'path' in info:
+                audio_paths.append(info['path'])
+            if 'voices' in info:
+                entry['voices'] = {}
+                for voice in sorted(info['voices']):
+                    voice_info = info['voices'][voice]
+                    entry['voices'][voice] = {k: v for k, v in voice_info.items() if k != 'path'}
+                    audio_paths.append(voice_info.get('path'))
+            timeline.append(entry)
+        return timeline, audio_paths
+
     def _get_kelly_image_path(self, kelly_type: str = "casual_hoodie") -> str:
         """
         Kelly 캐릭터 이미지 경로 가져오기
@@ -89,6 +221,17 @@ class VideoCreator:
         Returns:
             생성된 비디오 파일 경로
         """
+        audio_timeline, audio_paths = self._split_audio_info(audio_info)
+        render_key = self._render_key('create_video', {
+            'sentences': sentences,
+            'translations': translations,
+            'image_groups': image_groups,
+            'hook_phrase': hook_phrase,
+            'audio': audio_timeline
+        }, list(image_paths) + audio_paths)
+        if self._restore_cached_render(render_key, output_path):
+            return output_path
+
         try:
             print("비디오 생성 중...")
 
@@ -237,17 +380,16 @@ class VideoCreator:
             final_video.write_videofile(
                 output_path,
                 fps=self.fps,
-                codec='libx264',
-                audio_codec='aac',
-                temp_audiofile='temp-audio.m4a',
+                temp_audiofile=self._temp_audiofile(output_path),
                 remove_temp=True,
-                preset='medium',
-                logger='bar',  # 프로그레스 바 표시
+                logger=self.render_logger,  # 프로그레스 바 표시
                 threads=4,     # 멀티스레드 (안정성 향상)
-                ffmpeg_params=['-max_muxing_queue_size', '9999']  # 파이프 버퍼 증가 (Broken pipe 방지)
+                ffmpeg_params=['-max_muxing_queue_size', '9999'],  # 파이프 버퍼 증가 (Broken pipe 방지)
+                **ENCODER_PROFILE
             )
 
             print(f"[DEBUG] write_videofile 완료")
+            self._store_render(render_key, output_path)
 
             # 리소스 정리
             for audio_clip in audio_clips:
@@ -372,7 +514,7 @@ class VideoCreator:
             print("✓ 폴백 그라데이션 배경 생성 완료")
 
         # 텍스트 (한글 지원 폰트 - 직접 경로 지정)
-        korean_font = "/System/Library/Fonts/Supplemental/AppleGothic.ttf"
+        korean_font = self.korean_font
 
         # ===== Kelly Cat 추가 여부 결정 =====
         layers = [bg]  # 기본 배경
@@ -568,7 +710,7 @@ class VideoCreator:
         text_clips = []
 
         # 한글 폰트 경로
-        korean_font = "/System/Library/Fonts/Supplemental/AppleGothic.ttf"
+        korean_font = self.korean_font
 
         # 텍스트 배경 박스 (가독성 향상) - 화면 하단에 작게 배치
         # 포맷에 따라 위치 조정 (Shorts: 1400, Longform: 650)
@@ -665,7 +807,7 @@ class VideoCreator:
         Returns:
             문장 VideoClip
         """
-        korean_font = "/System/Library/Fonts/Supplemental/AppleGothic.ttf"
+        korean_font = self.korean_font
         layers = []
 
         # 1. 배경 (파스텔 블루)
@@ -809,7 +951,7 @@ class VideoCreator:
             )
 
         # 한글 폰트 직접 경로 지정
-        korean_font = "/System/Library/Fonts/Supplemental/AppleGothic.ttf"
+        korean_font = self.korean_font
 
         # ===== Kelly Cat 추가 여부 결정 =====
         layers = [bg]  # 기본 배경
@@ -903,7 +1045,7 @@ class VideoCreator:
         Returns:
             인트로 VideoClip
         """
-        korean_font = "/System/Library/Fonts/Supplemental/AppleGothic.ttf"
+        korean_font = self.korean_font
         layers = []
 
         # 1. 배경 (그라데이션 효과를 위한 파스텔 블루)
@@ -1011,7 +1153,7 @@ class VideoCreator:
         Returns:
             아웃트로 VideoClip
         """
-        korean_font = "/System/Library/Fonts/Supplemental/AppleGothic.ttf"
+        korean_font = self.korean_font
         layers = []
 
         # 1. 배경 (파스텔 핑크)
@@ -1101,6 +1243,14 @@ class VideoCreator:
         Returns:
             생성된 비디오 파일 경로
         """
+        audio_timeline, audio_paths = self._split_audio_info(audio_info)
+        render_key = self._render_key('create_quiz_video', {
+            'quiz_data': quiz_data,
+            'audio': audio_timeline
+        }, audio_paths)
+        if self._restore_cached_render(render_key, output_path):
+            return output_path
+
         try:
             print("퀴즈 비디오 생성 중...")
 
@@ -1237,17 +1387,16 @@ class VideoCreator:
             final_video.write_videofile(
                 output_path,
                 fps=self.fps,
-                codec='libx264',
-                logger='bar',  # 프로그레스 바 표시
+                logger=self.render_logger,  # 프로그레스 바 표시
                 threads=4,     # 멀티스레드 (안정성 향상)
                 ffmpeg_params=['-max_muxing_queue_size', '9999'],  # 파이프 버퍼 증가 (Broken pipe 방지)
-                audio_codec='aac',
-                temp_audiofile='temp-audio.m4a',
+                temp_audiofile=self._temp_audiofile(output_path),
                 remove_temp=True,
-                preset='medium'
+                **ENCODER_PROFILE
             )
 
             print(f"[DEBUG] write_videofile 완료")
+            self._store_render(render_key, output_path)
 
             # 리소스 정리
             for audio_clip in audio_clips:
@@ -1288,7 +1437,7 @@ class VideoCreator:
         # 파스텔 블루 배경
         bg = ColorClip(size=(self.width, self.height), color=(100, 150, 255), duration=duration)
 
-        korean_font = "/System/Library/Fonts/Supplemental/AppleGothic.ttf"
+        korean_font = self.korean_font
 
         # 질문
         question_txt = TextClip(
@@ -1339,7 +1488,7 @@ class VideoCreator:
         # 파스텔 블루 배경 (문제 클립과 동일)
         bg = ColorClip(size=(self.width, self.height), color=(100, 150, 255), duration=duration)
 
-        korean_font = "/System/Library/Fonts/Supplemental/AppleGothic.ttf"
+        korean_font = self.korean_font
 
         # 질문 (작게 표시 - 상단)
         question_txt = TextClip(
@@ -1429,7 +1578,7 @@ class VideoCreator:
         # 파스텔 그린 배경
         bg = ColorClip(size=(self.width, self.height), color=(100, 200, 100), duration=duration)
 
-        korean_font = "/System/Library/Fonts/Supplemental/AppleGothic.ttf"
+        korean_font = self.korean_font
 
         # "정답은..." (작게)
         title_txt = TextClip(
@@ -1477,7 +1626,7 @@ class VideoCreator:
         # 파스텔 옐로우 배경
         bg = ColorClip(size=(self.width, self.height), color=(255, 220, 100), duration=duration)
 
-        korean_font = "/System/Library/Fonts/Supplemental/AppleGothic.ttf"
+        korean_font = self.korean_font
 
         # "해설" 타이틀
         title_txt = TextClip(
@@ -1509,7 +1658,7 @@ class VideoCreator:
         # 파스텔 퍼플 배경
         bg = ColorClip(size=(self.width, self.height), color=(180, 150, 255), duration=duration)
 
-        korean_font = "/System/Library/Fonts/Supplemental/AppleGothic.ttf"
+        korean_font = self.korean_font
 
         # "예문 N" 타이틀
         title_txt = TextClip(
@@ -1611,7 +1760,7 @@ Simple flat design with pastel colors."""
                 duration=duration
             )
 
-        korean_font = "/System/Library/Fonts/Supplemental/AppleGothic.ttf"
+        korean_font = self.korean_font
 
         # ===== 개선: "Daily English Mecca" 브랜딩 추가 (최상단) =====
         branding_text = TextClip(
@@ -1775,7 +1924,7 @@ Simple flat design with pastel colors."""
             stroke_width=3,  # 외곽선 (가독성)
             method='caption',  # 자동 줄바꿈 및 높이 조정
             size=(self.width - 160, None),  # 좌우 여백 80px, 높이는 자동
-            font='AppleGothic',
+            font=self.korean_font,
             text_align='center'
         ).with_position(('center', 1650)).with_duration(duration)  # 하단에 위치 (폰트 잘림 방지)
 
@@ -1788,7 +1937,7 @@ Simple flat design with pastel colors."""
             stroke_width=3,
             method='caption',
             size=(self.width - 200, None),
-            font='AppleGothic',
+            font=self.korean_font,
             text_align='center'
         ).with_position(('center', 180)).with_duration(duration)  # 상단 (폰트 잘림 방지)
 
@@ -1844,7 +1993,7 @@ Simple flat design with pastel colors."""
             stroke_width=4,
             method='caption',
             size=(self.width - 160, None),  # 높이 자동
-            font='AppleGothic',
+            font=self.korean_font,
             text_align='center'
         ).with_position(('center', 760)).with_duration(duration)  # 중앙보다 약간 위 (폰트 잘림 방지)
 
@@ -1857,7 +2006,7 @@ Simple flat design with pastel colors."""
             stroke_width=3,
             method='caption',
             size=(self.width - 200, None),
-            font='AppleGothic',
+            font=self.korean_font,
             text_align='center'
         ).with_position(('center', 1050)).with_duration(duration)  # 하단 (폰트 잘림 방지)
 
@@ -1918,7 +2067,7 @@ Simple flat design with pastel colors."""
             stroke_width=2,
             method='caption',
             size=(self.width - 180, None),
-            font='AppleGothic',
+            font=self.korean_font,
             text_align='center'
         ).with_position(('center', 700)).with_duration(duration)
 
@@ -1929,7 +2078,7 @@ Simple flat design with pastel colors."""
             color='#4A4A4A',  # 회색
             method='caption',
             size=(self.width - 200, None),
-            font='AppleGothic',
+            font=self.korean_font,
             text_align='center'
         ).with_position(('center', 950)).with_duration(duration)
 
@@ -1942,7 +2091,7 @@ Simple flat design with pastel colors."""
             stroke_width=3,
             method='caption',
             size=(self.width - 200, None),
-            font='AppleGothic',
+            font=self.korean_font,
             text_align='center'
         ).with_position(('center', 420)).with_duration(duration)
 
@@ -2011,7 +2160,7 @@ Simple flat design with pastel colors."""
             stroke_width=2,
             method='caption',
             size=(self.width // 2 - 80, None),
-            font='AppleGothic',
+            font=self.korean_font,
             text_align='center'
         ).with_position((40, 650)).with_duration(duration)
 
@@ -2024,7 +2173,7 @@ Simple flat design with pastel colors."""
             stroke_width=2,
             method='caption',
             size=(self.width // 2 - 80, None),
-            font='AppleGothic',
+            font=self.korean_font,
             text_align='center'
         ).with_position((40, 450)).with_duration(duration)
 
@@ -2035,7 +2184,7 @@ Simple flat design with pastel colors."""
             color='#4A4A4A',
             method='caption',
             size=(self.width // 2 - 100, None),
-            font='AppleGothic',
+            font=self.korean_font,
             text_align='center'
         ).with_position((self.width // 2 + 50, 600)).with_duration(duration)
 
@@ -2048,7 +2197,7 @@ Simple flat design with pastel colors."""
             stroke_width=2,
             method='caption',
             size=(self.width // 2 - 100, None),
-            font='AppleGothic',
+            font=self.korean_font,
             text_align='center'
         ).with_position((self.width // 2 + 50, 450)).with_duration(duration)
 
@@ -2119,7 +2268,7 @@ Simple flat design with pastel colors."""
             stroke_width=4,
             method='caption',
             size=(self.width - 160, None),
-            font='AppleGothic',
+            font=self.korean_font,
             text_align='center'
         ).with_position(('center', 320)).with_duration(duration)
 
@@ -2151,7 +2300,7 @@ Simple flat design with pastel colors."""
                 stroke_width=2,
                 method='caption',
                 size=(self.width - 160, None),
-                font='AppleGothic',
+                font=self.korean_font,
                 text_align='center'
             ).with_position(('center', y_positions[idx])).with_duration(duration)
 
@@ -2162,7 +2311,7 @@ Simple flat design with pastel colors."""
                 color='#666666',
                 method='caption',
                 size=(self.width - 180, None),
-                font='AppleGothic',
+                font=self.korean_font,
                 text_align='center'
             ).with_position(('center', y_positions[idx] + 70)).with_duration(duration)
 
@@ -2176,7 +2325,7 @@ Simple flat design with pastel colors."""
                     color='#888888',
                     method='caption',
                     size=(self.width - 200, None),
-                    font='AppleGothic',
+                    font=self.korean_font,
                     text_align='center'
                 ).with_position(('center', y_positions[idx] + 130)).with_duration(duration)
                 clips.append(example_txt)
@@ -2387,7 +2536,7 @@ Simple flat design with pastel colors."""
             fps=24,
             codec='libx264',
             audio_codec='aac',
-            temp_audiofile='temp-audio.m4a',
+            temp_audiofile=self._temp_audiofile(output_path),
             remove_temp=True,
             logger=None  # 로그 출력 최소화
         )
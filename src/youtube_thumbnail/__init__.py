@@ -14,7 +14,8 @@ from .channel_profile import ChannelProfile
 from .thumbnail_engine import YouTubeThumbnailEngine
 from .history_manager import ThumbnailHistory
 from .style_analyzer import StyleAnalyzer
-from .variation_engine import VariationEngine
+from .variation_engine import VariationEngine, VARIATION_TYPES
+from .grid_renderer import VariationGridRenderer
 from .styles import THUMBNAIL_STYLES, get_style, list_styles
 
 __all__ = [
@@ -24,6 +25,8 @@ __all__ = [
     'ThumbnailHistory',
     'StyleAnalyzer',
     'VariationEngine',
+    'VARIATION_TYPES',
+    'VariationGridRenderer',
     'THUMBNAIL_STYLES',
     'get_style',
     'list_styles'
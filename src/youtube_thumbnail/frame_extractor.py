@@ -6,14 +6,59 @@ FFmpeg를 사용하여 YouTube 동영상에서 3개의 프레임을 캡처합니
 - 중간 부분 (duration / 2)
 - 끝 부분 (duration - 5초)
 
+모든 시간대를 FFmpeg 한 번의 실행으로 추출 (시간대별 입력 시크, 스트림 연결 동시 진행)
+실패한 시간대만 시간대별 FFmpeg를 제한된 수만큼 동시에 실행하여 재시도
+추출한 프레임은 (동영상 ID, 시간, 해상도)별로 캐시
+
+장면 채점 모드 (strategy='scored'):
+- 동영상 전체에 고르게 나눈 시점마다 입력 시크 후 그 다음 키프레임 하나만 저해상도로 디코딩
+  (-skip_frame nokey, FFmpeg 한 번 실행 - 원격 스트림도 처음부터 끝까지 읽지 않음)
+- 선명도/대비/색감/인물 영역 밝기로 채점하여 서로 다른 장면의 상위 프레임 선택 (frame_scorer)
+- 선택된 시간대만 고해상도로 다시 추출
+
 Author: Kelly & Claude Code
 Date: 2025-11-09
 """
+import json
+import re
 import subprocess
 import os
+import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
-import yt_dlp
+from typing import Dict, Optional, List, Tuple
+
+import numpy as np
+
+from src.atomic_cache import atomic_write_bytes
+
+from .frame_scorer import color_histogram, frame_metrics, score_frames, select_distinct
+
+try:
+    import yt_dlp
+except ImportError:  # 선택 의존성: YouTube URL 해석에만 필요 (로컬 파일/스트림 URL 추출은 가능)
+    yt_dlp = None
+
+
+# 프레임 선택 방식 (fixed: 고정 시간대, scored: 키프레임 채점)
+FRAME_STRATEGIES = ('fixed', 'scored')
+
+# 키프레임 채점용 디코딩 크기 (16:9)
+SCAN_WIDTH = 160
+SCAN_HEIGHT = 90
+
+# 고해상도 재추출에 사용할 최대 포맷 높이
+MAX_FRAME_HEIGHT = 1080
+
+# 키프레임 채점용 시크 지점 수 (동영상 길이에 고르게 분배)
+SCAN_SAMPLES = 16
+
+# FFmpeg showinfo 필터 출력의 프레임 시간 (필터 이름 showinfo@k<입력 번호>)
+_PTS_TIME_PATTERN = re.compile(r'\[showinfo@k(\d+) @ [^\]]*\] n:\s*0 .*?pts_time:\s*(-?[\d.]+)')
+
+# FFmpeg 입력 정보의 동영상 길이
+_DURATION_PATTERN = re.compile(r'Duration:\s*(\d+):(\d+):([\d.]+)')
 
 
 class VideoFrameExtractor:
@@ -23,13 +68,22 @@ class VideoFrameExtractor:
     FFmpeg를 사용하여 특정 시간대의 프레임을 이미지로 저장합니다.
     """
 
-    def __init__(self, output_dir: str = 'output/youtube_thumbnails/frames'):
+    def __init__(
+        self,
+        output_dir: str = 'output/youtube_thumbnails/frames',
+        max_parallel: int = 3,
+        timeout: int = 60
+    ):
         """
         Args:
-            output_dir: 프레임 이미지 저장 디렉토리
+            output_dir: 프레임 이미지 저장 디렉토리 (프레임 캐시)
+            max_parallel: 시간대별 재시도 시 동시에 실행할 FFmpeg 수
+            timeout: FFmpeg 실행 타임아웃 (초, 한 번의 실행 전체 기준)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.max_parallel = max(1, max_parallel)
+        self.timeout = timeout
 
         # FFmpeg 설치 확인
         self.ffmpeg_available = self._check_ffmpeg()
@@ -55,7 +109,8 @@ class VideoFrameExtractor:
     def extract_frames_from_url(
         self,
         youtube_url: str,
-        count: int = 3
+        count: int = 3,
+        strategy: str = 'fixed'
     ) -> List[str]:
         """
         YouTube URL에서 여러 프레임 추출 (FFmpeg 스트리밍 - 전체 다운로드 불필요)
@@ -63,6 +118,7 @@ class VideoFrameExtractor:
         Args:
             youtube_url: YouTube 동영상 URL
             count: 추출할 프레임 개수 (기본 3개)
+            strategy: 'fixed' (시작/중간/끝 고정 시간대) 또는 'scored' (키프레임 채점 후 상위 장면)
 
         Returns:
             프레임 이미지 파일 경로 리스트
@@ -75,10 +131,17 @@ class VideoFrameExtractor:
                 )
             >>> # frames = ['/path/frame_0s.jpg', '/path/frame_30s.jpg', '/path/frame_60s.jpg']
         """
+        if strategy not in FRAME_STRATEGIES:
+            raise ValueError(f"알 수 없는 프레임 선택 방식입니다: {strategy}")
+
         if not self.ffmpeg_available:
             print("❌ FFmpeg 없음, 프레임 추출 불가")
             return []
 
+        if yt_dlp is None:
+            print("❌ yt-dlp 없음, YouTube 스트림 URL 확인 불가")
+            return []
+
         try:
             print(f"📹 YouTube 프레임 추출 중: {youtube_url}")
 
@@ -93,62 +156,51 @@ class VideoFrameExtractor:
                 duration = info.get('duration', 0)  # 초 단위
                 video_id = info.get('id', 'unknown')
 
-                # 스트림 URL 가져오기 (최저 화질 - 빠른 추출)
+                # 스트림 URL 가져오기 (프레임 추출: 1080p 이하 최고 화질)
                 formats = info.get('formats', [])
-
-                # worst 포맷 선택 (mp4, 낮은 해상도)
-                video_url = None
-                for fmt in reversed(formats):  # worst부터 탐색
-                    if fmt.get('ext') == 'mp4' and fmt.get('vcodec') != 'none' and fmt.get('url'):
-                        video_url = fmt.get('url')
-                        break
-
-                # 대체: 아무 비디오 포맷이나
-                if not video_url:
-                    for fmt in formats:
-                        if fmt.get('vcodec') != 'none' and fmt.get('url'):
-                            video_url = fmt.get('url')
-                            break
+                video_format = self._pick_format(formats, best=True)
 
             if duration == 0:
                 print("⚠️ 동영상 길이를 알 수 없음")
                 return []
 
-            if not video_url:
+            if not video_format:
                 print("⚠️ 스트림 URL을 찾을 수 없음")
                 return []
 
             print(f"  ✅ 동영상 길이: {duration}초")
 
+            height = video_format.get('height')
+            resolution = f'{height}p' if height else 'src'
+
+            if strategy == 'scored':
+                # 저화질 스트림으로 키프레임 채점 → 선택된 장면만 고화질 스트림에서 추출
+                scan_format = self._pick_format(formats) or video_format
+                scan_height = scan_format.get('height')
+                frame_paths = self.extract_best_frames(
+                    scan_format['url'],
+                    count,
+                    video_id=video_id,
+                    resolution=f'{scan_height}p' if scan_height else 'src',
+                    full_source=video_format['url'],
+                    full_resolution=resolution,
+                    duration=duration
+                )
+                if frame_paths:
+                    return frame_paths
+                print("  ⚠️ 키프레임 채점 실패, 고정 시간대로 추출")
+
             # 2. 프레임 추출할 시간대 계산
             timestamps = self._calculate_timestamps(duration, count)
             print(f"  📸 프레임 추출 시간대: {timestamps}")
 
-            # 3. FFmpeg로 각 시간대 프레임 추출 (스트리밍 - 다운로드 불필요!)
-            frame_paths = []
-            for i, timestamp in enumerate(timestamps, 1):
-                frame_path = self.output_dir / f'{video_id}_frame_{i}_{timestamp}s.jpg'
-
-                # 캐시 확인
-                if frame_path.exists():
-                    print(f"  ✓ 캐시된 프레임 사용: {frame_path.name}")
-                    frame_paths.append(str(frame_path))
-                    continue
-
-                # FFmpeg 스트리밍 추출 (전체 다운로드 없이!)
-                success = self._extract_frame_from_stream(
-                    video_url,
-                    timestamp,
-                    str(frame_path)
-                )
-
-                if success:
-                    frame_paths.append(str(frame_path))
-                    print(f"  ✅ 프레임 추출: {frame_path.name}")
-                else:
-                    print(f"  ⚠️ 프레임 추출 실패: {timestamp}초")
-
-            return frame_paths
+            # 3. FFmpeg로 모든 시간대 프레임 추출 (스트리밍 - 다운로드 불필요!)
+            return self.extract_frames(
+                video_format['url'],
+                timestamps,
+                video_id=video_id,
+                resolution=resolution
+            )
 
         except Exception as e:
             print(f"❌ 프레임 추출 실패: {e}")
@@ -156,6 +208,292 @@ class VideoFrameExtractor:
             traceback.print_exc()
             return []
 
+    def extract_frames(
+        self,
+        source: str,
+        timestamps: List[float],
+        video_id: str,
+        resolution: str = 'src'
+    ) -> List[str]:
+        """
+        동영상(스트림 URL 또는 로컬 파일)에서 여러 시간대의 프레임 추출
+
+        캐시에 없는 시간대를 FFmpeg 한 번의 실행으로 추출하고,
+        실패한 시간대만 시간대별 FFmpeg로 동시에(max_parallel개까지) 재시도
+
+        Args:
+            source: FFmpeg 입력 (스트림 URL, HTTP URL 또는 로컬 파일 경로)
+            timestamps: 추출할 시간 리스트 (초)
+            video_id: 동영상 ID (캐시 키)
+            resolution: 해상도 표시 (캐시 키, 예: '360p')
+
+        Returns:
+            프레임 이미지 파일 경로 리스트 (추출에 성공한 시간대만, timestamps 순서)
+        """
+        if not self.ffmpeg_available:
+            print("❌ FFmpeg 없음, 프레임 추출 불가")
+            return []
+
+        frame_paths = {timestamp: self._frame_path(video_id, timestamp, resolution) for timestamp in timestamps}
+
+        # 캐시 확인
+        missing = []
+        for timestamp, frame_path in frame_paths.items():
+            if frame_path.exists():
+                print(f"  ✓ 캐시된 프레임 사용: {frame_path.name}")
+            else:
+                missing.append(timestamp)
+
+        # 한 번의 FFmpeg 실행으로 모든 시간대 추출
+        retry = missing
+        if len(missing) > 1:
+            self._extract_frames_from_stream(source, {t: str(frame_paths[t]) for t in missing})
+            retry = [timestamp for timestamp in missing if not frame_paths[timestamp].exists()]
+            if retry:
+                print(f"  ⚠️ 일괄 추출 실패, 시간대별 재시도: {retry}")
+
+        # 남은 시간대는 시간대별 FFmpeg를 동시에 실행
+        if retry:
+            with ThreadPoolExecutor(max_workers=min(self.max_parallel, len(retry))) as executor:
+                list(executor.map(
+                    lambda timestamp: self._extract_frame_from_stream(source, timestamp, str(frame_paths[timestamp])),
+                    retry
+                ))
+
+        for timestamp in missing:
+            if frame_paths[timestamp].exists():
+                print(f"  ✅ 프레임 추출: {frame_paths[timestamp].name}")
+            else:
+                print(f"  ⚠️ 프레임 추출 실패: {timestamp}초")
+
+        return [str(frame_paths[t]) for t in timestamps if frame_paths[t].exists()]
+
+    def extract_best_frames(
+        self,
+        source: str,
+        count: int,
+        video_id: str,
+        resolution: str = 'src',
+        full_source: Optional[str] = None,
+        full_resolution: Optional[str] = None,
+        duration: Optional[float] = None
+    ) -> List[str]:
+        """
+        키프레임을 채점하여 서로 다른 장면의 상위 프레임 추출
+
+        source 전체에 고르게 나눈 시점의 키프레임을 저해상도로 디코딩해 채점하고,
+        선택된 시간대만 full_source에서 원래 해상도로 추출 (extract_frames)
+        선택 결과는 (동영상 ID, 개수, 해상도)별로 저장하여 다시 채점하지 않음
+
+        Args:
+            source: 채점용 FFmpeg 입력 (저화질 스트림 URL 또는 파일 경로)
+            count: 추출할 프레임 개수
+            video_id: 동영상 ID (캐시 키)
+            resolution: source 해상도 표시 (캐시 키)
+            full_source: 최종 프레임 추출 입력 (기본: source)
+            full_resolution: full_source 해상도 표시 (기본: resolution)
+            duration: 동영상 길이 (초, 없으면 FFmpeg로 확인)
+
+        Returns:
+            프레임 이미지 파일 경로 리스트 (점수 순, 채점 실패 시 빈 리스트)
+        """
+        if not self.ffmpeg_available:
+            print("❌ FFmpeg 없음, 프레임 추출 불가")
+            return []
+
+        selection_path = self.output_dir / f'{video_id}_best{count}_{resolution}.json'
+        try:
+            with open(selection_path, 'r', encoding='utf-8') as f:
+                timestamps = json.load(f)
+            print(f"  ♻ 저장된 장면 선택 사용: {timestamps}")
+        except (OSError, ValueError):
+            timestamps = self._select_best_timestamps(source, count, duration)
+            if not timestamps:
+                return []
+            atomic_write_bytes(selection_path, json.dumps(timestamps).encode('utf-8'))
+
+        return self.extract_frames(
+            full_source or source,
+            timestamps,
+            video_id=video_id,
+            resolution=full_resolution or resolution
+        )
+
+    def _select_best_timestamps(self, source: str, count: int, duration: Optional[float] = None) -> List[float]:
+        """
+        키프레임 채점 후 서로 다른 장면의 상위 시간대 선택
+
+        Returns:
+            시간(초, 밀리초 단위 반올림) 리스트 (점수 순)
+        """
+        if not duration:
+            duration = self._probe_duration(source)
+        if not duration:
+            print("  ⚠️ 동영상 길이를 알 수 없어 키프레임 채점 불가")
+            return []
+
+        timestamps, metrics, histograms = self._scan_keyframes(source, duration)
+        if not timestamps:
+            print("  ⚠️ 채점할 키프레임 없음")
+            return []
+
+        scores = score_frames(metrics)
+        selected = select_distinct(histograms, scores, count)
+        best = [timestamps[index] for index in selected]
+        print(f"  🎯 키프레임 {len(timestamps)}개 채점, 선택: {best}")
+        return best
+
+    def _probe_duration(self, source: str) -> float:
+        """FFmpeg 입력 정보에서 동영상 길이(초) 확인 (실패 시 0)"""
+        try:
+            result = subprocess.run(
+                ['ffmpeg', '-hide_banner', '-i', source],
+                capture_output=True, text=True, timeout=self.timeout
+            )
+        except Exception as e:
+            print(f"  ⚠️ FFmpeg 실행 실패: {e}")
+            return 0.0
+
+        match = _DURATION_PATTERN.search(result.stderr)
+        if not match:
+            return 0.0
+        hours, minutes, seconds = match.groups()
+        return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+    def _scan_keyframes(self, source: str, duration: float) -> Tuple[List[float], List[dict], List[np.ndarray]]:
+        """
+        동영상 전체에 고르게 나눈 시점의 키프레임을 저해상도로 디코딩하면서 프레임별 지표 계산
+
+        _extract_frames_from_stream과 같은 방식: 시점마다 같은 입력을 열고 입력 앞 -ss로 시크,
+        -skip_frame nokey로 시크 지점 다음 키프레임 하나만 디코딩 (-frames:v 1)
+        → 원격 스트림도 시점별로 필요한 부분만 읽음 (처음부터 순서대로 끝까지 읽지 않음)
+        타임아웃이 지나면 그때까지 완성된 키프레임만 사용
+
+        Args:
+            source: FFmpeg 입력 (스트림 URL 또는 파일 경로)
+            duration: 동영상 길이 (초)
+
+        Returns:
+            (시간 리스트, 지표 리스트, 히스토그램 리스트) - 같은 순서, 시간 순
+        """
+        seek_points = [round(duration * (index + 0.5) / SCAN_SAMPLES, 3) for index in range(SCAN_SAMPLES)]
+        frame_size = SCAN_WIDTH * SCAN_HEIGHT * 3
+
+        with tempfile.TemporaryDirectory(dir=str(self.output_dir), prefix='.scan_') as scan_dir:
+            # -copyts: showinfo가 시크 후 0부터가 아닌 동영상 기준 시간을 출력
+            cmd = ['ffmpeg', '-hide_banner', '-nostats', '-loglevel', 'info', '-copyts']
+            for seek_point in seek_points:
+                cmd += ['-skip_frame', 'nokey', '-ss', str(seek_point), '-i', source]
+
+            raw_paths = []
+            for index in range(len(seek_points)):
+                raw_paths.append(os.path.join(scan_dir, f'{index}.rgb'))
+                cmd += [
+                    '-map', f'{index}:v:0',
+                    '-frames:v', '1',
+                    '-vf', f'scale={SCAN_WIDTH}:{SCAN_HEIGHT},showinfo@k{index}',  # 저해상도 + 프레임 시간 출력
+                    '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+                    '-y', raw_paths[index]
+                ]
+
+            try:
+                stderr = subprocess.run(cmd, capture_output=True, text=True, timeout=self.timeout).stderr
+            except subprocess.TimeoutExpired as e:
+                stderr = e.stderr.decode('utf-8', 'replace') if isinstance(e.stderr, bytes) else (e.stderr or '')
+                print(f"  ⚠️ 키프레임 채점 타임아웃 ({self.timeout}초 초과), 완성된 키프레임만 사용")
+            except Exception as e:
+                print(f"  ⚠️ FFmpeg 실행 실패: {e}")
+                return [], [], []
+
+            pts_times = {int(index): float(pts_time) for index, pts_time in _PTS_TIME_PATTERN.findall(stderr)}
+
+            # 시간 순 + 같은 키프레임(가까운 시크 지점이 같은 키프레임에 도달)은 한 번만
+            keyframes = {}
+            for index, raw_path in enumerate(raw_paths):
+                if index not in pts_times:
+                    continue
+                try:
+                    with open(raw_path, 'rb') as f:
+                        data = f.read()
+                except OSError:
+                    continue
+                if len(data) == frame_size:
+                    keyframes.setdefault(round(max(0.0, pts_times[index]), 3), data)
+
+        timestamps = sorted(keyframes)
+        metrics = []
+        histograms = []
+        for timestamp in timestamps:
+            frame = np.frombuffer(keyframes[timestamp], dtype=np.uint8).reshape(SCAN_HEIGHT, SCAN_WIDTH, 3)
+            metrics.append(frame_metrics(frame))
+            histograms.append(color_histogram(frame))
+
+        return timestamps, metrics, histograms
+
+    @staticmethod
+    def _pick_format(formats: List[dict], best: bool = False) -> Optional[dict]:
+        """
+        yt-dlp 포맷 선택
+
+        Args:
+            formats: yt-dlp info['formats'] (낮은 화질 → 높은 화질 순)
+            best: False면 가장 낮은 화질 (키프레임 채점, mp4 우선),
+                  True면 MAX_FRAME_HEIGHT 이하의 가장 높은 화질 (프레임 추출, mp4 우선)
+
+        Returns:
+            포맷 딕셔너리 (비디오 포맷이 없으면 None)
+        """
+        videos = [fmt for fmt in formats if fmt.get('vcodec') != 'none' and fmt.get('url')]
+
+        if best:
+            candidates = [fmt for fmt in videos if (fmt.get('height') or 0) <= MAX_FRAME_HEIGHT]
+            return max(
+                candidates,
+                key=lambda fmt: (fmt.get('height') or 0, fmt.get('ext') == 'mp4'),
+                default=None
+            )
+
+        return min(
+            videos,
+            key=lambda fmt: (fmt.get('height') or 0, fmt.get('ext') != 'mp4'),
+            default=None
+        )
+
+    def _frame_path(self, video_id: str, timestamp: float, resolution: str) -> Path:
+        """프레임 캐시 경로 (동영상 ID, 시간, 해상도별)"""
+        return self.output_dir / f'{video_id}_{timestamp}s_{resolution}.jpg'
+
+    @staticmethod
+    def _partial_path(output_path: str) -> str:
+        """
+        FFmpeg가 쓰는 중인 임시 파일 경로 (완성된 뒤 최종 경로로 교체)
+
+        같은 프로세스의 여러 스레드가 같은 프레임을 동시에 추출할 수 있으므로 호출마다 다른 이름 사용
+        """
+        output = Path(output_path)
+        return str(output.with_name(f'.{output.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.part'))
+
+    @staticmethod
+    def _commit_frame(partial_path: str, output_path: Optional[str]) -> bool:
+        """
+        임시 파일이 정상 이미지면 최종 경로로 교체
+
+        Args:
+            partial_path: FFmpeg 출력 임시 파일
+            output_path: 최종 경로 (None이면 임시 파일만 삭제 - 타임아웃/실패 등으로 미완성일 수 있을 때)
+
+        Returns:
+            최종 경로 반영 여부
+        """
+        try:
+            if output_path and os.path.getsize(partial_path) > 0:
+                os.replace(partial_path, output_path)
+                return True
+            os.unlink(partial_path)
+        except OSError:
+            pass
+        return False
+
     def _calculate_timestamps(self, duration: int, count: int) -> List[int]:
         """
         동영상 길이에 따라 프레임 추출할 시간대 계산
@@ -195,6 +533,53 @@ class VideoFrameExtractor:
 
         return timestamps
 
+    def _extract_frames_from_stream(self, video_url: str, outputs: Dict[int, str]) -> bool:
+        """
+        한 번의 FFmpeg 실행으로 여러 시간대의 프레임 추출
+
+        시간대마다 같은 스트림을 입력으로 열고 입력 앞 -ss로 시크
+        (FFmpeg가 모든 입력을 동시에 열어 시크하므로 시간대별로 프로세스를 순서대로 실행하지 않음)
+
+        Args:
+            video_url: 비디오 스트림 URL 또는 파일 경로
+            outputs: 시간(초) → 출력 이미지 경로
+
+        Returns:
+            모든 프레임 추출 성공 여부
+        """
+        cmd = ['ffmpeg', '-hide_banner', '-loglevel', 'error']
+        for timestamp in outputs:
+            cmd += ['-ss', str(timestamp), '-i', video_url]  # 입력별 시크 (input 앞 - 빠름!)
+
+        partial_paths = {}
+        for index, (timestamp, output_path) in enumerate(outputs.items()):
+            partial_paths[timestamp] = self._partial_path(output_path)
+            cmd += [
+                '-map', f'{index}:v:0',       # 해당 시간대 입력의 영상
+                '-frames:v', '1',             # 1프레임만
+                '-q:v', '1',                  # 최고 품질
+                '-f', 'mjpeg',                # 임시 파일 확장자와 무관하게 JPEG
+                '-y', partial_paths[timestamp]
+            ]
+
+        completed = False
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=self.timeout)
+            completed = result.returncode == 0
+            if not completed:
+                print(f"  ⚠️ FFmpeg 실패 (코드 {result.returncode}): {result.stderr.strip()[-200:]}")
+        except subprocess.TimeoutExpired:
+            print(f"  ⚠️ FFmpeg 타임아웃 ({self.timeout}초 초과)")
+        except Exception as e:
+            print(f"  ⚠️ FFmpeg 실행 실패: {e}")
+
+        # 정상 종료한 실행의 프레임만 반영 (실패/중단된 실행의 출력은 잘린 파일일 수 있으므로 버림)
+        results = [
+            self._commit_frame(partial_paths[timestamp], output_path if completed else None)
+            for timestamp, output_path in outputs.items()
+        ]
+        return all(results)
+
     def _extract_frame_from_stream(
         self,
         video_url: str,
@@ -219,30 +604,35 @@ class VideoFrameExtractor:
             # -vframes 1: 1개 프레임만
             # -q:v 1: 최고 품질 (1-5, 낮을수록 좋음) - 2→1로 변경
             # -y: 덮어쓰기
+            partial_path = self._partial_path(output_path)
             cmd = [
                 'ffmpeg',
                 '-ss', str(timestamp),        # 시크 시간 (input 앞에 - 빠름!)
                 '-i', video_url,              # 스트림 URL
                 '-vframes', '1',              # 1프레임만
                 '-q:v', '1',                  # 최고 품질 (2→1)
+                '-f', 'mjpeg',                # 임시 파일 확장자와 무관하게 JPEG
                 '-y',                         # 덮어쓰기
-                output_path
+                partial_path
             ]
 
             result = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=60  # 스트리밍은 60초 타임아웃
+                timeout=self.timeout  # 스트리밍 타임아웃 (기본 60초)
             )
 
-            return result.returncode == 0
+            # 실패한 실행의 출력은 잘린 파일일 수 있으므로 캐시에 반영하지 않음
+            return self._commit_frame(partial_path, output_path if result.returncode == 0 else None)
 
         except subprocess.TimeoutExpired:
-            print(f"  ⚠️ FFmpeg 타임아웃 (60초 초과)")
+            self._commit_frame(partial_path, None)  # 미완성 임시 파일 정리
+            print(f"  ⚠️ FFmpeg 타임아웃 ({self.timeout}초 초과)")
             return False
 
         except Exception as e:
+            self._commit_frame(partial_path, None)
             print(f"  ⚠️ FFmpeg 실행 실패: {e}")
             return False
 
@@ -0,0 +1,179 @@
+"""
+썸네일 배경 후보 프레임 채점
+
+저해상도로 디코딩한 후보 프레임(키프레임)을 NumPy 지표로 채점하고
+서로 다른 장면의 상위 프레임을 고릅니다.
+(프레임은 디코딩하면서 지표/히스토그램만 남기고 버릴 수 있도록 채점과 선택은 지표만 사용)
+
+- 선명도: 라플라시안 분산 (흐린 움직임/초점 나간 장면 제외)
+- 대비: 밝기 표준편차
+- 색감: Hasler-Süsstrunk colorfulness
+- 인물 영역 밝기: 피부색(YCbCr) 영역, 없으면 화면 중앙 상단의 노출이 적정한지
+- 검은 화면/하얀 화면/단색 전환 장면은 0점
+- 중복 제거: 색상 히스토그램 거리가 가까운 장면은 하나만 선택
+"""
+from typing import List
+
+import numpy as np
+
+
+# 지표별 가중치 (각 지표는 후보들 중 최댓값 기준으로 0~1 정규화 후 합산)
+SCORE_WEIGHTS = {
+    'sharpness': 0.35,
+    'contrast': 0.25,
+    'colorfulness': 0.2,
+    'face_brightness': 0.2,
+}
+
+# 전환 장면 판정 (평균 밝기 범위 밖이거나 대비가 거의 없으면 제외)
+MIN_MEAN_BRIGHTNESS = 20
+MAX_MEAN_BRIGHTNESS = 235
+MIN_CONTRAST = 8
+
+# 인물 영역 목표 밝기 (0~255)
+TARGET_FACE_BRIGHTNESS = 150
+
+# 피부색 영역으로 볼 최소 비율
+MIN_SKIN_RATIO = 0.02
+
+# 히스토그램 (채널당 구간 수) / 다른 장면으로 볼 최소 거리 (0~1, 총변동 거리)
+HISTOGRAM_BINS = 8
+MIN_HISTOGRAM_DISTANCE = 0.25
+
+
+def _luma(frame: np.ndarray) -> np.ndarray:
+    """RGB(uint8) → 밝기 (float32, BT.601)"""
+    rgb = frame.astype(np.float32)
+    return 0.299 * rgb[..., 0] + 0.587 * rgb[..., 1] + 0.114 * rgb[..., 2]
+
+
+def _sharpness(luma: np.ndarray) -> float:
+    """라플라시안(4-이웃) 분산"""
+    laplacian = (
+        luma[:-2, 1:-1] + luma[2:, 1:-1] + luma[1:-1, :-2] + luma[1:-1, 2:]
+        - 4 * luma[1:-1, 1:-1]
+    )
+    return float(laplacian.var())
+
+
+def _colorfulness(frame: np.ndarray) -> float:
+    """Hasler-Süsstrunk colorfulness"""
+    rgb = frame.astype(np.float32)
+    rg = rgb[..., 0] - rgb[..., 1]
+    yb = 0.5 * (rgb[..., 0] + rgb[..., 1]) - rgb[..., 2]
+    return float(np.hypot(rg.std(), yb.std()) + 0.3 * np.hypot(rg.mean(), yb.mean()))
+
+
+def _face_brightness(frame: np.ndarray, luma: np.ndarray) -> float:
+    """
+    인물 영역 노출 점수 (0~1, 목표 밝기에 가까울수록 높음)
+
+    피부색 픽셀(YCbCr 범위)이 충분하면 그 영역의 밝기,
+    아니면 인물이 주로 위치하는 화면 중앙 상단의 밝기 사용
+    """
+    rgb = frame.astype(np.float32)
+    cb = 128 - 0.168736 * rgb[..., 0] - 0.331264 * rgb[..., 1] + 0.5 * rgb[..., 2]
+    cr = 128 + 0.5 * rgb[..., 0] - 0.418688 * rgb[..., 1] - 0.081312 * rgb[..., 2]
+    skin = (cb >= 77) & (cb <= 127) & (cr >= 133) & (cr <= 173)
+
+    if skin.mean() >= MIN_SKIN_RATIO:
+        brightness = float(luma[skin].mean())
+    else:
+        height, width = luma.shape
+        brightness = float(luma[height // 6:height * 2 // 3, width // 4:width * 3 // 4].mean())
+
+    return max(0.0, 1.0 - abs(brightness - TARGET_FACE_BRIGHTNESS) / TARGET_FACE_BRIGHTNESS)
+
+
+def frame_metrics(frame: np.ndarray) -> dict:
+    """
+    프레임 하나의 지표
+
+    Args:
+        frame: RGB 이미지 배열 (H, W, 3), uint8
+
+    Returns:
+        {'brightness', 'sharpness', 'contrast', 'colorfulness', 'face_brightness'}
+    """
+    luma = _luma(frame)
+    return {
+        'brightness': float(luma.mean()),
+        'sharpness': _sharpness(luma),
+        'contrast': float(luma.std()),
+        'colorfulness': _colorfulness(frame),
+        'face_brightness': _face_brightness(frame, luma),
+    }
+
+
+def score_frames(metrics: List[dict]) -> np.ndarray:
+    """
+    후보 프레임 채점 (지표는 후보 전체 기준으로 정규화하므로 모든 후보의 지표가 필요)
+
+    Args:
+        metrics: 프레임별 frame_metrics 결과 리스트
+
+    Returns:
+        프레임별 점수 배열 (0~1, 전환 장면은 0)
+    """
+    scores = np.zeros(len(metrics), dtype=np.float32)
+    if not metrics:
+        return scores
+
+    for name, weight in SCORE_WEIGHTS.items():
+        values = np.array([m[name] for m in metrics], dtype=np.float32)
+        peak = values.max()
+        if peak > 0:
+            scores += weight * values / peak
+
+    # 검은/하얀 화면, 단색 전환 장면 제외
+    for index, m in enumerate(metrics):
+        if not (MIN_MEAN_BRIGHTNESS <= m['brightness'] <= MAX_MEAN_BRIGHTNESS) or m['contrast'] < MIN_CONTRAST:
+            scores[index] = 0.0
+
+    return scores
+
+
+def color_histogram(frame: np.ndarray, bins: int = HISTOGRAM_BINS) -> np.ndarray:
+    """RGB 결합 히스토그램 (bins³ 구간, 합 1로 정규화)"""
+    quantized = (frame.reshape(-1, 3) // (256 // bins)).astype(np.int64)
+    index = (quantized[:, 0] * bins + quantized[:, 1]) * bins + quantized[:, 2]
+    histogram = np.bincount(index, minlength=bins ** 3).astype(np.float32)
+    return histogram / histogram.sum()
+
+
+def select_distinct(
+    histograms: List[np.ndarray],
+    scores: np.ndarray,
+    count: int,
+    min_distance: float = MIN_HISTOGRAM_DISTANCE
+) -> List[int]:
+    """
+    점수가 높은 순서로 서로 다른 장면의 프레임 선택
+
+    이미 고른 프레임과 히스토그램 거리가 min_distance 미만이면 건너뛰고,
+    그래도 부족하면 건너뛴 프레임 중 점수 순으로 채움 (0점 프레임은 선택하지 않음)
+
+    Args:
+        histograms: 프레임별 color_histogram 결과 리스트
+        scores: score_frames 결과
+        count: 선택할 개수
+        min_distance: 다른 장면으로 볼 최소 히스토그램 거리 (0~1)
+
+    Returns:
+        선택된 프레임 인덱스 리스트 (점수 순)
+    """
+    ranked = [int(index) for index in np.argsort(-scores, kind='stable') if scores[index] > 0]
+
+    selected = []
+    skipped = []
+    for index in ranked:
+        if len(selected) >= count:
+            break
+        # 총변동 거리: 0 (같은 분포) ~ 1 (겹치지 않음)
+        if all(0.5 * np.abs(histograms[index] - histograms[other]).sum() >= min_distance for other in selected):
+            selected.append(index)
+        else:
+            skipped.append(index)
+
+    selected += skipped[:count - len(selected)]
+    return selected
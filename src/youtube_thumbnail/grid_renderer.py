@@ -0,0 +1,284 @@
+"""
+변형 그리드 병렬 렌더러
+
+하나의 기준 설정에서 만든 여러 변형(색상/레이아웃/완전 새 디자인)을
+프로세스 풀에서 동시에 렌더링합니다.
+
+- 배경 이미지는 부모 프로세스에서 한 번만 디코딩/리사이즈/샤프닝
+- 준비된 배경은 공유 메모리로 워커에 전달 (워커마다 다시 디코딩하거나 복사해 전송하지 않음)
+- 렌더링 결과를 한 장의 모아보기 이미지(contact sheet)로 합성
+- 프로세스 풀은 모듈 전역으로 한 번만 만들어 재사용 (요청마다 프로세스를 새로 시작하지 않음)
+  - 웹 서버는 여러 스레드를 실행 중이므로 fork 대신 forkserver로 워커 시작
+    (다른 스레드가 잡고 있던 잠금을 복제한 채 fork되어 워커가 멈추는 문제 방지)
+  - forkserver는 이 모듈만 미리 임포트하고, 워커도 __main__(web/app.py 등)을 다시 실행하지 않음
+    (웹 앱을 임포트하면 작업 큐 스레드/블루프린트 정리 스레드가 시작되므로)
+  - forkserver가 없는 플랫폼(Windows)에서는 spawn 대신 현재 프로세스에서 순서대로 렌더링
+"""
+import io
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import context as mp_context, shared_memory
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+from PIL import Image
+
+from src.atomic_cache import atomic_path
+from src.jobs import request_hash
+
+from .thumbnail_engine import YouTubeThumbnailEngine
+
+
+# 공유 렌더링 프로세스 풀 (_get_pool에서 처음 사용할 때 생성)
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+# 워커 프로세스별 썸네일 엔진 캐시: (output_dir, cache_dir) → 엔진
+_worker_engines = {}
+
+
+if 'forkserver' in multiprocessing.get_all_start_methods():
+    from multiprocessing import popen_forkserver, reduction, spawn, util
+
+    class _WorkerPopen(popen_forkserver.Popen):
+        """__main__ 모듈 정보를 빼고 워커를 시작하는 forkserver Popen (popen_forkserver.Popen._launch와 동일)"""
+
+        def _launch(self, process_obj):
+            prep_data = spawn.get_preparation_data(process_obj._name)
+            prep_data.pop('init_main_from_path', None)
+            prep_data.pop('init_main_from_name', None)
+            buf = io.BytesIO()
+            mp_context.set_spawning_popen(self)
+            try:
+                reduction.dump(prep_data, buf)
+                reduction.dump(process_obj, buf)
+            finally:
+                mp_context.set_spawning_popen(None)
+
+            self.sentinel, w = popen_forkserver.forkserver.connect_to_new_process(self._fds)
+            _parent_w = os.dup(w)
+            self.finalizer = util.Finalize(self, util.close_fds, (_parent_w, self.sentinel))
+            with open(w, 'wb', closefd=True) as f:
+                f.write(buf.getbuffer())
+            self.pid = popen_forkserver.forkserver.read_signed(self.sentinel)
+
+    class _WorkerProcess(mp_context.ForkServerProcess):
+        @staticmethod
+        def _Popen(process_obj):
+            return _WorkerPopen(process_obj)
+
+    class _WorkerContext(mp_context.ForkServerContext):
+        """렌더링 워커용 forkserver 컨텍스트 (웹 앱 모듈을 임포트하지 않음)"""
+        Process = _WorkerProcess
+else:
+    _WorkerContext = None
+
+
+def _get_pool(max_workers: int) -> Optional[ProcessPoolExecutor]:
+    """
+    공유 프로세스 풀 반환 (없으면 생성, 프로세스 수는 처음 만들 때 결정)
+
+    Returns:
+        프로세스 풀 (forkserver를 쓸 수 없으면 None → 현재 프로세스에서 렌더링)
+    """
+    global _pool
+    if _WorkerContext is None:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            context = _WorkerContext()
+            # forkserver에는 이 모듈만 미리 임포트 (기본값 ['__main__']이면 웹 앱 전체가 임포트됨)
+            context.set_forkserver_preload([__name__])
+            _pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+            print(f"🎨 변형 그리드 프로세스 풀 시작: {max_workers}개 (forkserver)")
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor):
+    """워커가 비정상 종료되어 깨진 풀 폐기 (다음 요청에서 새로 생성)"""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _render_variation(job: tuple) -> str:
+    """
+    워커에서 변형 하나 렌더링 (같은 배경이면 공유 메모리의 배경 사용)
+
+    Args:
+        job: (output_dir, cache_dir, 변형 설정, 준비된 배경의 원본 경로, 공유 메모리 이름, 배열 shape)
+    """
+    output_dir, cache_dir, config, background_path, shm_name, shape = job
+
+    engine = _worker_engines.get((output_dir, cache_dir))
+    if engine is None:
+        engine = _worker_engines[(output_dir, cache_dir)] = YouTubeThumbnailEngine(
+            output_dir=output_dir, cache_dir=cache_dir
+        )
+    params = YouTubeThumbnailEngine.render_params(config)
+
+    if shm_name and params['background_image_path'] == background_path:
+        # 요청별 공유 메모리에 연결해 RGB 배열 → 새 이미지로 복사 (해제는 부모가 담당)
+        shm = shared_memory.SharedMemory(name=shm_name)
+        try:
+            background = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+            params['background_image'] = Image.fromarray(background.copy())
+            del background
+        finally:
+            shm.close()
+
+    return engine.create_thumbnail(**params)
+
+
+class VariationGridRenderer:
+    """
+    변형 그리드 병렬 렌더러
+
+    사용 예:
+        renderer = VariationGridRenderer(output_dir='output/youtube_thumbnails/abc123')
+        paths = renderer.render(variation_configs)
+        sheet = renderer.create_contact_sheet(paths)
+    """
+
+    def __init__(self, output_dir: str, cache_dir: Optional[str] = None, max_workers: Optional[int] = None):
+        """
+        Args:
+            output_dir: 썸네일 저장 디렉토리
+            cache_dir: 렌더링 결과 저장소 (YouTubeThumbnailEngine 참고, 기본: output_dir)
+            max_workers: 공유 프로세스 풀의 프로세스 수 (풀을 처음 만들 때만 적용, 기본: CPU 수)
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.engine = YouTubeThumbnailEngine(output_dir=str(self.output_dir), cache_dir=cache_dir)
+
+    def render(self, configs: List[dict]) -> List[str]:
+        """
+        변형 설정들을 병렬 렌더링
+
+        Args:
+            configs: 변형 설정 리스트 (create_variation_grid 결과, 보통 같은 배경 사용)
+
+        Returns:
+            썸네일 파일 경로 리스트 (configs 순서)
+        """
+        if not configs:
+            return []
+
+        # 이미 렌더링한 설정은 저장된 결과 사용 (모두 있으면 배경 준비/프로세스 풀 생략)
+        paths = [None] * len(configs)
+        pending = []
+        for index, config in enumerate(configs):
+            cached_path = self.engine.thumbnail_path(**YouTubeThumbnailEngine.render_params(config))
+            if cached_path.exists():
+                self.engine.mark_used(cached_path)
+                paths[index] = str(cached_path)
+            else:
+                pending.append(index)
+
+        if not pending:
+            print(f"♻ 변형 그리드 캐시 적중: {len(configs)}개 모두 렌더링 생략")
+            return paths
+
+        # 배경 한 번만 준비 (첫 번째 설정의 배경, 다른 배경을 쓰는 설정은 워커가 직접 로드)
+        background_path = configs[pending[0]].get('background_image_path')
+        if not (background_path and os.path.exists(background_path)):
+            background_path = None
+
+        shm = None
+        shape = ()
+        try:
+            if background_path:
+                background = np.asarray(self.engine.prepare_background(background_path))
+                shape = background.shape
+                shm = shared_memory.SharedMemory(create=True, size=background.nbytes)
+                np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)[:] = background
+
+            print(f"🎨 변형 그리드 렌더링: {len(pending)}개 (저장된 결과 {len(configs) - len(pending)}개)")
+
+            jobs = [
+                (
+                    str(self.output_dir), str(self.engine.cache_dir), configs[index],
+                    background_path, shm.name if shm else None, shape
+                )
+                for index in pending
+            ]
+            pool = _get_pool(self.max_workers)
+            if pool is None:
+                results = map(_render_variation, jobs)
+            else:
+                results = pool.map(_render_variation, jobs)
+            try:
+                for index, path in zip(pending, results):
+                    paths[index] = path
+            except BrokenProcessPool:
+                _discard_pool(pool)
+                raise
+
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+        print(f"✅ 변형 그리드 렌더링 완료: {len(pending)}개")
+        return paths
+
+    def create_contact_sheet(
+        self,
+        thumbnail_paths: List[str],
+        output_path: Optional[str] = None,
+        columns: int = 4,
+        tile_width: int = 320,
+        gap: int = 8
+    ) -> str:
+        """
+        썸네일 모아보기 이미지(contact sheet) 생성
+
+        Args:
+            thumbnail_paths: 썸네일 파일 경로 리스트 (그리드 순서)
+            output_path: 저장 경로 (기본: 렌더링 결과 저장소에 썸네일 목록 해시로 저장, 같은 그리드는 재사용)
+            columns: 열 개수
+            tile_width: 썸네일 하나의 너비 (px, 높이는 16:9 비율)
+            gap: 썸네일 간격 (px)
+
+        Returns:
+            저장된 파일 경로
+        """
+        tile_height = tile_width * YouTubeThumbnailEngine.HEIGHT // YouTubeThumbnailEngine.WIDTH
+        columns = max(1, min(columns, len(thumbnail_paths)))
+        rows = math.ceil(len(thumbnail_paths) / columns)
+
+        if output_path is None:
+            # 썸네일 파일명이 내용 해시이므로 파일명 목록 + 배치 설정으로 키 생성
+            key = request_hash({
+                'tiles': [Path(path).name for path in thumbnail_paths],
+                'layout': [columns, tile_width, gap]
+            })
+            output_path = self.engine.cache_dir / f'contact_sheet_{key}.png'
+            if output_path.exists():
+                print(f"♻ 모아보기 이미지 캐시 적중: {output_path.name}")
+                self.engine.mark_used(output_path)
+                return str(output_path)
+
+        sheet = Image.new(
+            'RGB',
+            (columns * tile_width + (columns + 1) * gap, rows * tile_height + (rows + 1) * gap),
+            '#202020'
+        )
+        for index, path in enumerate(thumbnail_paths):
+            with Image.open(path) as thumbnail:
+                tile = thumbnail.convert('RGB').resize((tile_width, tile_height), Image.Resampling.LANCZOS)
+            row, column = divmod(index, columns)
+            sheet.paste(tile, (gap + column * (tile_width + gap), gap + row * (tile_height + gap)))
+
+        with atomic_path(output_path) as tmp_path:
+            sheet.save(tmp_path, 'PNG')
+        print(f"✅ 모아보기 이미지 생성: {output_path} ({columns}x{rows})")
+        return str(output_path)
@@ -4,15 +4,45 @@
 세션별로 생성된 썸네일 버전들을 저장하고 관리합니다.
 재생성 기능을 위한 버전 관리 시스템.
 
+- 세션/버전 목록은 SQLite 인덱스(sessions/index.db)에 저장 (버전 추가 = 행 추가, 세션 파일 재작성 없음)
+- 버전 번호는 쓰기 트랜잭션 안에서 결정 → 여러 스레드/프로세스가 동시에 저장해도 번호가 겹치지 않음
+- 세션 목록은 updated_at 인덱스로 조회 (세션 수와 무관하게 limit개만 읽음, 오프셋/커서 페이지네이션)
+- 썸네일/모아보기 이미지는 콘텐츠 주소 저장소(sessions/blobs/<해시>.png)에 한 번만 저장
+  - 버전은 블롭 해시를 가리키고 블롭마다 참조 수 관리 (같은 이미지를 다시 저장하면 참조 수만 증가)
+  - 새 블롭은 원본의 하드 링크로 만듦 (같은 파일시스템이면 복사 없음 → 저장은 인덱스 쓰기만)
+  - 버전/세션 삭제로 참조 수가 0이 된 블롭은 같은 트랜잭션에서 삭제
+  - 하드 링크이므로 블롭 삭제는 링크 하나를 지울 뿐, 디스크 공간은 렌더링 저장소(renders/)의 원본
+    링크까지 사라져야 반환됨. renders/는 YouTubeThumbnailEngine.prune_cache가 나이/크기 기준으로
+    정리(썸네일 블루프린트 등록 시 백그라운드 스레드로 시작) → 버전/세션 삭제와 오래된 세션 정리로
+    참조가 끊긴 이미지는 다음 renders/ 정리 후 실제로 해제됨
+  - 반대로 renders/ 정리는 히스토리에 영향 없음 (블롭 링크가 남아 있으므로 저장된 버전 이미지는 유지)
+- 버전별 생성 설정은 인덱스에 저장 (config_v{n}.json 파일 없음)
+- 이전 형식(session.json, 세션 디렉토리의 thumbnail_v{n}.png)은 인덱스를 처음 열 때 한 번 블롭 저장소로 옮김
+
 Author: Kelly & Claude Code
 Date: 2025-11-09
 """
 import json
+import os
 import shutil
+import sqlite3
+import threading
 import uuid
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, List
+from datetime import datetime, timedelta
+from typing import Optional, List, Sequence, Tuple
+
+from src.atomic_cache import atomic_copy
+from src.file_serving import file_digest
+
+
+# 인덱스 스키마 버전 (PRAGMA user_version)
+# 1: session.json 가져오기 완료
+# 2: 썸네일/모아보기 이미지를 블롭 저장소로 이동, 생성 설정을 인덱스에 저장
+_SCHEMA_VERSION = 2
+
+# 블롭 저장소 디렉토리 (session_dir 기준)
+BLOB_DIR_NAME = 'blobs'
 
 
 class ThumbnailHistory:
@@ -26,10 +56,339 @@ class ThumbnailHistory:
     def __init__(self, session_dir: str = 'output/youtube_thumbnails/sessions'):
         """
         Args:
-            session_dir: 세션 저장 디렉토리
+            session_dir: 세션 저장 디렉토리 (인덱스 DB와 블롭 저장소도 이 디렉토리에 저장)
         """
         self.session_dir = Path(session_dir)
         self.session_dir.mkdir(parents=True, exist_ok=True)
+        self.blob_dir = self.session_dir / BLOB_DIR_NAME
+        self.db_path = self.session_dir / 'index.db'
+        self._local = threading.local()
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결 반환 (sqlite3 연결은 스레드 간 공유 불가)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self):
+        """테이블 생성 + 이전 형식 세션 가져오기 (처음 한 번)"""
+        conn = self._connect()
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sessions (
+                    session_id TEXT PRIMARY KEY,
+                    initial_data TEXT NOT NULL DEFAULT '{}',
+                    last_version INTEGER NOT NULL DEFAULT 0,
+                    thumbnail_count INTEGER NOT NULL DEFAULT 0,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_updated ON sessions(updated_at, session_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_created ON sessions(created_at)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS blobs (
+                    blob_hash TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    refcount INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            self._create_version_tables(conn)
+
+        if conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+            self._migrate(conn)
+
+    @staticmethod
+    def _create_version_tables(conn: sqlite3.Connection):
+        """버전/모아보기 이미지 테이블 생성 (블롭 해시 참조)"""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS versions (
+                session_id TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                blob_hash TEXT NOT NULL,
+                config TEXT NOT NULL DEFAULT '{}',
+                variation_type TEXT NOT NULL DEFAULT 'initial',
+                file_size INTEGER NOT NULL DEFAULT 0,
+                created_at TEXT NOT NULL,
+                PRIMARY KEY (session_id, version)
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS contact_sheets (
+                session_id TEXT NOT NULL,
+                first_version INTEGER NOT NULL,
+                last_version INTEGER NOT NULL,
+                blob_hash TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                PRIMARY KEY (session_id, first_version)
+            )
+        """)
+
+    def _migrate(self, conn: sqlite3.Connection):
+        """
+        이전 형식 데이터를 인덱스 + 블롭 저장소로 옮기기
+
+        - 스키마 0 (새 인덱스): 세션 디렉토리의 session.json 가져오기
+        - 스키마 1: 파일 경로를 가리키던 버전/모아보기 이미지 행을 블롭 참조로 변환
+        옮긴 원본 파일은 커밋 후 삭제 (실패 시 원본 그대로 유지)
+        """
+        created = []
+        moved = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 다른 프로세스가 먼저 옮겼으면 생략
+            schema = conn.execute("PRAGMA user_version").fetchone()[0]
+            if schema >= _SCHEMA_VERSION:
+                conn.commit()
+                return
+
+            if schema == 0:
+                migrated = self._import_legacy_sessions(conn, created, moved)
+            else:
+                migrated = self._migrate_paths_to_blobs(conn, created, moved)
+
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            self._remove_files(created)
+            raise
+
+        self._remove_files(moved)
+        for session_path in {path.parent for path in moved}:
+            try:
+                session_path.rmdir()
+            except OSError:
+                pass  # 다른 파일이 남아 있으면 디렉토리 유지
+
+        if migrated:
+            print(f"✅ 기존 세션 {migrated}개를 히스토리 블롭 저장소로 옮김")
+
+    def _import_legacy_sessions(self, conn: sqlite3.Connection, created: list, moved: list) -> int:
+        """session.json 세션을 인덱스로 가져오기 (이미지는 블롭 저장소로)"""
+        imported = 0
+        for session_file in self.session_dir.glob('*/session.json'):
+            try:
+                with open(session_file, 'r', encoding='utf-8') as f:
+                    metadata = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ 세션 파일 읽기 실패 (건너뜀): {session_file} ({e})")
+                continue
+
+            session_id = metadata.get('session_id') or session_file.parent.name
+            thumbnails = metadata.get('thumbnails', [])
+            conn.execute("""
+                INSERT OR IGNORE INTO sessions
+                    (session_id, initial_data, last_version, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (
+                session_id,
+                json.dumps(metadata.get('initial_data') or {}, ensure_ascii=False),
+                max((t['version'] for t in thumbnails), default=0),
+                metadata['created_at'],
+                metadata.get('updated_at', metadata['created_at'])
+            ))
+            for thumb in thumbnails:
+                self._adopt_version(conn, session_id, thumb, created, moved)
+            for sheet in metadata.get('contact_sheets', []):
+                if sheet.get('versions'):
+                    self._adopt_contact_sheet(
+                        conn, session_id, min(sheet['versions']), max(sheet['versions']),
+                        sheet['path'], sheet['created_at'], created, moved
+                    )
+            self._update_thumbnail_count(conn, session_id)
+
+            moved.append(session_file)
+            imported += 1
+
+        return imported
+
+    def _migrate_paths_to_blobs(self, conn: sqlite3.Connection, created: list, moved: list) -> int:
+        """스키마 1 테이블(파일 경로 + config_v{n}.json) → 블롭 참조 테이블"""
+        conn.execute("ALTER TABLE versions RENAME TO versions_v1")
+        conn.execute("ALTER TABLE contact_sheets RENAME TO contact_sheets_v1")
+        self._create_version_tables(conn)
+
+        sessions = set()
+        for row in conn.execute("SELECT * FROM versions_v1 ORDER BY rowid").fetchall():
+            self._adopt_version(conn, row['session_id'], dict(row), created, moved)
+            sessions.add(row['session_id'])
+        for row in conn.execute("SELECT * FROM contact_sheets_v1").fetchall():
+            self._adopt_contact_sheet(
+                conn, row['session_id'], row['first_version'], row['last_version'],
+                row['path'], row['created_at'], created, moved
+            )
+
+        conn.execute("DROP TABLE versions_v1")
+        conn.execute("DROP TABLE contact_sheets_v1")
+        for session_id in sessions:
+            self._update_thumbnail_count(conn, session_id)
+
+        # 스키마 1에서 가져온 뒤 남겨 둔 session.json 정리
+        for row in conn.execute("SELECT session_id FROM sessions").fetchall():
+            session_file = self.session_dir / row['session_id'] / 'session.json'
+            if session_file.exists():
+                moved.append(session_file)
+        return len(sessions)
+
+    def _adopt_version(self, conn: sqlite3.Connection, session_id: str, thumb: dict, created: list, moved: list):
+        """이전 형식 버전 하나를 블롭 참조 행으로 (썸네일 파일이 없으면 건너뜀)"""
+        thumbnail_file = Path(thumb['thumbnail_path'])
+        if not thumbnail_file.exists():
+            print(f"⚠️ 썸네일 파일 없음 (건너뜀): {session_id} v{thumb['version']}")
+            return
+
+        config = {}
+        config_file = Path(thumb['config_path'])
+        if config_file.exists():
+            with open(config_file, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+            moved.append(config_file)
+
+        blob_hash, size = self._store_blob(conn, thumbnail_file, created)
+        cursor = conn.execute("""
+            INSERT OR IGNORE INTO versions
+                (session_id, version, blob_hash, config, variation_type, file_size, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (
+            session_id, thumb['version'], blob_hash, json.dumps(config, ensure_ascii=False),
+            thumb.get('variation_type', 'initial'), size, thumb['created_at']
+        ))
+        if not cursor.rowcount:
+            self._release_blobs(conn, [blob_hash])  # 이미 있는 버전 (참조 수 되돌림)
+        moved.append(thumbnail_file)
+
+    def _adopt_contact_sheet(
+        self,
+        conn: sqlite3.Connection,
+        session_id: str,
+        first_version: int,
+        last_version: int,
+        path: str,
+        created_at: str,
+        created: list,
+        moved: list
+    ):
+        """이전 형식 모아보기 이미지를 블롭 참조 행으로 (파일이 없으면 건너뜀)"""
+        sheet_file = Path(path)
+        if not sheet_file.exists():
+            return
+
+        blob_hash, _ = self._store_blob(conn, sheet_file, created)
+        cursor = conn.execute("""
+            INSERT OR IGNORE INTO contact_sheets (session_id, first_version, last_version, blob_hash, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, (session_id, first_version, last_version, blob_hash, created_at))
+        if not cursor.rowcount:
+            self._release_blobs(conn, [blob_hash])
+        moved.append(sheet_file)
+
+    def _blob_path(self, blob_hash: str) -> Path:
+        """블롭 파일 경로 (해시 앞 2자리로 디렉토리 분산)"""
+        return self.blob_dir / blob_hash[:2] / f'{blob_hash}.png'
+
+    def _store_blob(self, conn: sqlite3.Connection, source, created: list) -> Tuple[str, int]:
+        """
+        이미지를 블롭 저장소에 추가하고 참조 수 1 증가 (쓰기 트랜잭션 안에서 호출)
+
+        같은 내용의 블롭이 있으면 참조 수만 증가하고, 없으면 원본의 하드 링크로 생성
+        (다른 파일시스템 등 링크가 안 되면 복사). 원본 렌더링 결과는 원자적으로 쓰이고
+        제자리에서 수정되지 않으므로 링크를 공유해도 안전
+
+        Args:
+            conn: 쓰기 트랜잭션 중인 연결
+            source: 이미지 파일 경로
+            created: 새로 만든 블롭 파일을 추가할 리스트 (롤백 시 삭제용)
+
+        Returns:
+            (블롭 해시, 파일 크기)
+        """
+        blob_hash = file_digest(source)
+        blob_file = self._blob_path(blob_hash)
+
+        # 파일이 없으면 생성 (참조 행은 있는데 파일이 사라진 경우도 복구)
+        if not blob_file.exists():
+            blob_file.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(source, blob_file)
+            except FileExistsError:
+                pass
+            except OSError:
+                atomic_copy(source, blob_file)
+            else:
+                created.append(blob_file)
+
+        size = blob_file.stat().st_size
+        conn.execute("""
+            INSERT INTO blobs (blob_hash, size, refcount) VALUES (?, ?, 1)
+            ON CONFLICT(blob_hash) DO UPDATE SET refcount = refcount + 1
+        """, (blob_hash, size))
+        return blob_hash, size
+
+    def _release_blobs(self, conn: sqlite3.Connection, blob_hashes: Sequence[str]) -> int:
+        """
+        블롭 참조 수 감소 + 참조 수가 0이 된 블롭 삭제 (쓰기 트랜잭션 안에서 호출)
+
+        파일 삭제도 쓰기 잠금을 가진 채 수행 → 같은 내용을 저장하는 다른 트랜잭션과 엇갈리지 않음
+        (비게 된 blobs/<xx>/ 디렉토리도 함께 삭제)
+        블롭은 renders/ 원본의 하드 링크 → 공간 반환은 renders/ 정리(prune_cache) 이후 (모듈 설명 참고)
+
+        Returns:
+            삭제된 블롭 수
+        """
+        if not blob_hashes:
+            return 0
+
+        conn.executemany(
+            "UPDATE blobs SET refcount = refcount - 1 WHERE blob_hash = ?",
+            [(blob_hash,) for blob_hash in blob_hashes]
+        )
+        garbage = [row['blob_hash'] for row in conn.execute("SELECT blob_hash FROM blobs WHERE refcount <= 0")]
+        conn.execute("DELETE FROM blobs WHERE refcount <= 0")
+        blob_files = [self._blob_path(blob_hash) for blob_hash in garbage]
+        self._remove_files(blob_files)
+        for shard_dir in {path.parent for path in blob_files}:
+            try:
+                shard_dir.rmdir()
+            except OSError:
+                pass  # 다른 블롭이 남아 있으면 디렉토리 유지
+        return len(garbage)
+
+    @staticmethod
+    def _remove_files(paths: Sequence[Path]):
+        """파일 삭제 (이미 없으면 무시)"""
+        for path in paths:
+            try:
+                Path(path).unlink()
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _update_thumbnail_count(conn: sqlite3.Connection, session_id: str, updated_at: Optional[str] = None):
+        """세션의 버전 수 갱신 (updated_at 지정 시 함께 갱신)"""
+        conn.execute("""
+            UPDATE sessions SET
+                thumbnail_count = (SELECT COUNT(*) FROM versions WHERE session_id = ?),
+                updated_at = COALESCE(?, updated_at)
+            WHERE session_id = ?
+        """, (session_id, updated_at, session_id))
+
+    @staticmethod
+    def _session_row_to_dict(row: sqlite3.Row) -> dict:
+        """세션 행 → 목록 항목 (cursor: 다음 페이지 조회용 커서)"""
+        return {
+            'session_id': row['session_id'],
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at'],
+            'thumbnail_count': row['thumbnail_count'],
+            'cursor': f"{row['updated_at']}|{row['session_id']}"
+        }
 
     def create_session(self, initial_data: dict = None) -> str:
         """
@@ -48,24 +407,19 @@ class ThumbnailHistory:
                     'youtube_url': 'https://...'
                 })
         """
-        # 고유한 세션 ID 생성
-        session_id = str(uuid.uuid4())[:8]
-        session_path = self.session_dir / session_id
-        session_path.mkdir(exist_ok=True)
-
-        # 세션 메타데이터 초기화
-        metadata = {
-            'session_id': session_id,
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat(),
-            'initial_data': initial_data or {},
-            'thumbnails': []  # 버전 리스트
-        }
-
-        # 세션 파일 저장
-        session_file = session_path / 'session.json'
-        with open(session_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        now = datetime.now().isoformat()
+        conn = self._connect()
+
+        # 고유한 세션 ID 생성 (드물게 겹치면 다시 생성)
+        while True:
+            session_id = str(uuid.uuid4())[:8]
+            with conn:
+                cursor = conn.execute("""
+                    INSERT OR IGNORE INTO sessions (session_id, initial_data, created_at, updated_at)
+                    VALUES (?, ?, ?, ?)
+                """, (session_id, json.dumps(initial_data or {}, ensure_ascii=False), now, now))
+            if cursor.rowcount:
+                break
 
         print(f"✅ 새 세션 생성: {session_id}")
         return session_id
@@ -97,48 +451,124 @@ class ThumbnailHistory:
                     config={'style': 'fire_english', ...}
                 )
         """
-        session_path = self.session_dir / session_id
+        return self.save_thumbnails(session_id, [(thumbnail_path, config)], first_version=version)[0]
 
-        if not session_path.exists():
-            raise ValueError(f"세션 없음: {session_id}")
-
-        # 세션 메타데이터 로드
-        session_file = session_path / 'session.json'
-        with open(session_file, 'r', encoding='utf-8') as f:
-            metadata = json.load(f)
-
-        # 버전 번호 결정
-        if version is None:
-            version = len(metadata['thumbnails']) + 1
-
-        # 썸네일 복사 (버전별 파일명)
-        thumbnail_file = session_path / f'thumbnail_v{version}.png'
-        shutil.copy(thumbnail_path, thumbnail_file)
-
-        # 설정 저장
-        config_file = session_path / f'config_v{version}.json'
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, ensure_ascii=False, indent=2)
-
-        # 메타데이터 업데이트
-        thumbnail_info = {
-            'version': version,
-            'thumbnail_path': str(thumbnail_file),
-            'config_path': str(config_file),
-            'created_at': datetime.now().isoformat(),
-            'variation_type': config.get('variation_type', 'initial'),
-            'file_size': thumbnail_file.stat().st_size
-        }
+    def save_thumbnails(
+        self,
+        session_id: str,
+        items: Sequence[Tuple[str, dict]],
+        first_version: Optional[int] = None,
+        contact_sheet_path: Optional[str] = None
+    ) -> List[int]:
+        """
+        여러 썸네일 버전을 한 번에 저장 (인덱스에 버전 행 추가)
+
+        쓰기 트랜잭션(BEGIN IMMEDIATE) 안에서 버전 번호를 정하고 이미지를 블롭 저장소에 추가한 뒤
+        버전 행을 추가 → 여러 스레드/프로세스가 동시에 저장해도 버전 번호가 겹치지 않음
+        이미 저장된 이미지(같은 내용)는 참조 수만 증가
 
-        metadata['thumbnails'].append(thumbnail_info)
-        metadata['updated_at'] = datetime.now().isoformat()
+        Args:
+            session_id: 세션 ID
+            items: (썸네일 파일 경로, 생성 설정) 리스트
+            first_version: 첫 버전 번호 (None이면 마지막 버전 다음 번호)
+            contact_sheet_path: 함께 저장할 모아보기 이미지(contact sheet) 경로
 
-        # 세션 파일 업데이트
-        with open(session_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        Returns:
+            저장된 버전 번호 리스트 (items 순서)
+        """
+        conn = self._connect()
+        created = []
+
+        # 쓰기 잠금을 먼저 잡아 번호 조회~행 추가 사이에 다른 저장이 끼어들지 못하게 함
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT last_version FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            if row is None:
+                raise ValueError(f"세션 없음: {session_id}")
+
+            # 버전 번호 결정 (삭제된 버전 번호는 다시 쓰지 않음)
+            if first_version is None:
+                first_version = row['last_version'] + 1
+
+            now = datetime.now().isoformat()
+            versions = []
+            replaced = []
+            for offset, (thumbnail_path, config) in enumerate(items):
+                version = first_version + offset
+                blob_hash, size = self._store_blob(conn, thumbnail_path, created)
+
+                # 같은 번호를 지정해 다시 저장하면 교체 (이전 이미지 참조 해제)
+                previous = conn.execute(
+                    "SELECT blob_hash FROM versions WHERE session_id = ? AND version = ?", (session_id, version)
+                ).fetchone()
+                if previous:
+                    replaced.append(previous['blob_hash'])
+
+                conn.execute("""
+                    INSERT OR REPLACE INTO versions
+                        (session_id, version, blob_hash, config, variation_type, file_size, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    session_id, version, blob_hash, json.dumps(config, ensure_ascii=False),
+                    config.get('variation_type', 'initial'), size, now
+                ))
+                versions.append(version)
+
+            # 모아보기 이미지 (변형 그리드, 첫 버전 번호로 저장)
+            if contact_sheet_path and versions:
+                blob_hash, _ = self._store_blob(conn, contact_sheet_path, created)
+                previous = conn.execute(
+                    "SELECT blob_hash FROM contact_sheets WHERE session_id = ? AND first_version = ?",
+                    (session_id, versions[0])
+                ).fetchone()
+                if previous:
+                    replaced.append(previous['blob_hash'])
+
+                conn.execute("""
+                    INSERT OR REPLACE INTO contact_sheets (session_id, first_version, last_version, blob_hash, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (session_id, versions[0], versions[-1], blob_hash, now))
+
+            conn.execute(
+                "UPDATE sessions SET last_version = MAX(last_version, ?) WHERE session_id = ?",
+                (max(versions, default=0), session_id)
+            )
+            self._update_thumbnail_count(conn, session_id, now)
+            self._release_blobs(conn, replaced)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            self._remove_files(created)
+            raise
+
+        for version in versions:
+            print(f"✅ 썸네일 저장: {session_id} v{version}")
+        return versions
+
+    def get_contact_sheet_path(self, session_id: str, version: int) -> Optional[str]:
+        """
+        버전이 포함된 변형 그리드의 모아보기 이미지 경로
 
-        print(f"✅ 썸네일 저장: {session_id} v{version}")
-        return version
+        Args:
+            session_id: 세션 ID
+            version: 그리드에 포함된 버전 번호
+
+        Returns:
+            파일 경로 또는 None
+        """
+        rows = self._connect().execute("""
+            SELECT blob_hash FROM contact_sheets
+            WHERE session_id = ? AND first_version <= ? AND last_version >= ?
+            ORDER BY first_version DESC
+        """, (session_id, version, version)).fetchall()
+
+        for row in rows:
+            sheet_file = self._blob_path(row['blob_hash'])
+            if sheet_file.exists():
+                return str(sheet_file)
+        return None
 
     def get_session_thumbnails(self, session_id: str) -> List[dict]:
         """
@@ -148,7 +578,7 @@ class ThumbnailHistory:
             session_id: 세션 ID
 
         Returns:
-            썸네일 정보 리스트
+            썸네일 정보 리스트 (저장 순서)
 
         Example:
             >>> history = ThumbnailHistory()
@@ -156,17 +586,20 @@ class ThumbnailHistory:
             >>> for thumb in thumbnails:
                     print(f"v{thumb['version']}: {thumb['created_at']}")
         """
-        session_path = self.session_dir / session_id
-        session_file = session_path / 'session.json'
-
-        if not session_file.exists():
+        conn = self._connect()
+        if conn.execute("SELECT 1 FROM sessions WHERE session_id = ?", (session_id,)).fetchone() is None:
             print(f"⚠️ 세션 없음: {session_id}")
             return []
 
-        with open(session_file, 'r', encoding='utf-8') as f:
-            metadata = json.load(f)
-
-        return metadata['thumbnails']
+        # rowid 순 = 저장 순서 (같은 번호로 다시 저장한 버전은 마지막)
+        rows = conn.execute("""
+            SELECT version, blob_hash, created_at, variation_type, file_size
+            FROM versions WHERE session_id = ? ORDER BY rowid
+        """, (session_id,)).fetchall()
+        return [
+            {**dict(row), 'thumbnail_path': str(self._blob_path(row['blob_hash']))}
+            for row in rows
+        ]
 
     def load_thumbnail_config(self, session_id: str, version: int) -> Optional[dict]:
         """
@@ -184,14 +617,15 @@ class ThumbnailHistory:
             >>> config = history.load_thumbnail_config('abc123', 2)
             >>> # 버전 2의 설정으로 재생성 가능
         """
-        config_file = self.session_dir / session_id / f'config_v{version}.json'
+        row = self._connect().execute(
+            "SELECT config FROM versions WHERE session_id = ? AND version = ?", (session_id, version)
+        ).fetchone()
 
-        if not config_file.exists():
-            print(f"⚠️ 설정 파일 없음: v{version}")
+        if row is None:
+            print(f"⚠️ 설정 없음: v{version}")
             return None
 
-        with open(config_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json.loads(row['config'])
 
     def get_thumbnail_path(self, session_id: str, version: int) -> Optional[str]:
         """
@@ -204,8 +638,13 @@ class ThumbnailHistory:
         Returns:
             파일 경로 또는 None
         """
-        thumbnail_file = self.session_dir / session_id / f'thumbnail_v{version}.png'
+        row = self._connect().execute(
+            "SELECT blob_hash FROM versions WHERE session_id = ? AND version = ?", (session_id, version)
+        ).fetchone()
+        if row is None:
+            return None
 
+        thumbnail_file = self._blob_path(row['blob_hash'])
         if thumbnail_file.exists():
             return str(thumbnail_file)
         else:
@@ -221,16 +660,14 @@ class ThumbnailHistory:
         Returns:
             최신 버전 번호 또는 None
         """
-        thumbnails = self.get_session_thumbnails(session_id)
-
-        if thumbnails:
-            return max(t['version'] for t in thumbnails)
-        else:
-            return None
+        row = self._connect().execute(
+            "SELECT MAX(version) FROM versions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        return row[0]
 
     def delete_version(self, session_id: str, version: int) -> bool:
         """
-        특정 버전 삭제
+        특정 버전 삭제 (다른 버전/세션이 참조하지 않는 이미지는 함께 삭제)
 
         Args:
             session_id: 세션 ID
@@ -246,42 +683,29 @@ class ThumbnailHistory:
             print("❌ 최초 버전(v1)은 삭제할 수 없습니다.")
             return False
 
-        session_path = self.session_dir / session_id
-        thumbnail_file = session_path / f'thumbnail_v{version}.png'
-        config_file = session_path / f'config_v{version}.json'
-
-        # 파일 삭제
-        deleted = False
-        if thumbnail_file.exists():
-            thumbnail_file.unlink()
-            deleted = True
-
-        if config_file.exists():
-            config_file.unlink()
-            deleted = True
-
-        # 메타데이터 업데이트
-        if deleted:
-            session_file = session_path / 'session.json'
-            with open(session_file, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-
-            # 해당 버전 제거
-            metadata['thumbnails'] = [
-                t for t in metadata['thumbnails'] if t['version'] != version
-            ]
-            metadata['updated_at'] = datetime.now().isoformat()
-
-            with open(session_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, ensure_ascii=False, indent=2)
-
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT blob_hash FROM versions WHERE session_id = ? AND version = ?", (session_id, version)
+            ).fetchone()
+            if row:
+                conn.execute("DELETE FROM versions WHERE session_id = ? AND version = ?", (session_id, version))
+                self._update_thumbnail_count(conn, session_id, datetime.now().isoformat())
+                self._release_blobs(conn, [row['blob_hash']])
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+        if row:
             print(f"✅ 버전 삭제: {session_id} v{version}")
 
-        return deleted
+        return row is not None
 
     def delete_session(self, session_id: str) -> bool:
         """
-        세션 전체 삭제
+        세션 전체 삭제 (한 트랜잭션에서 모든 참조 해제, 참조 수가 0이 된 이미지만 삭제)
 
         Args:
             session_id: 세션 ID
@@ -289,54 +713,73 @@ class ThumbnailHistory:
         Returns:
             성공 여부
         """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            blob_hashes = [row['blob_hash'] for row in conn.execute("""
+                SELECT blob_hash FROM versions WHERE session_id = ?
+                UNION ALL
+                SELECT blob_hash FROM contact_sheets WHERE session_id = ?
+            """, (session_id, session_id))]
+            cursor = conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            conn.execute("DELETE FROM versions WHERE session_id = ?", (session_id,))
+            conn.execute("DELETE FROM contact_sheets WHERE session_id = ?", (session_id,))
+            removed = self._release_blobs(conn, blob_hashes)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+        # 이전 형식 세션 디렉토리가 남아 있으면 함께 삭제
         session_path = self.session_dir / session_id
-
-        if session_path.exists():
+        if session_path.is_dir():
             shutil.rmtree(session_path)
-            print(f"✅ 세션 삭제: {session_id}")
+
+        if cursor.rowcount:
+            print(f"✅ 세션 삭제: {session_id} (이미지 {removed}개 삭제)")
             return True
         else:
             print(f"⚠️ 세션 없음: {session_id}")
             return False
 
-    def list_sessions(self, limit: int = 10) -> List[dict]:
+    def list_sessions(self, limit: int = 10, offset: int = 0, cursor: Optional[str] = None) -> List[dict]:
         """
-        최근 세션 목록
+        최근 세션 목록 (updated_at 인덱스 조회 - 세션 수와 무관하게 limit개만 읽음)
 
         Args:
             limit: 반환할 세션 개수
+            offset: 건너뛸 세션 개수 (페이지 번호 방식)
+            cursor: 이전 페이지 마지막 항목의 'cursor' 값 (지정 시 그 다음 세션부터, 깊은 페이지도 일정 비용)
 
         Returns:
-            세션 정보 리스트 (최신순)
+            세션 정보 리스트 (최신순, 각 항목의 'cursor'로 다음 페이지 조회)
 
         Example:
             >>> history = ThumbnailHistory()
             >>> sessions = history.list_sessions(5)
             >>> for session in sessions:
                     print(f"{session['session_id']}: {session['created_at']}")
+            >>> next_page = history.list_sessions(5, cursor=sessions[-1]['cursor'])
         """
-        session_files = list(self.session_dir.glob('*/session.json'))
-
-        # 세션 정보 로드
-        sessions = []
-        for session_file in session_files:
-            with open(session_file, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-                sessions.append({
-                    'session_id': metadata['session_id'],
-                    'created_at': metadata['created_at'],
-                    'updated_at': metadata['updated_at'],
-                    'thumbnail_count': len(metadata['thumbnails'])
-                })
-
-        # 최신순 정렬
-        sessions.sort(key=lambda x: x['updated_at'], reverse=True)
-
-        return sessions[:limit]
+        query = "SELECT session_id, created_at, updated_at, thumbnail_count FROM sessions"
+        params = []
+        if cursor:
+            updated_at, _, session_id = cursor.partition('|')
+            query += " WHERE (updated_at, session_id) < (?, ?)"
+            params += [updated_at, session_id]
+        query += " ORDER BY updated_at DESC, session_id DESC LIMIT ? OFFSET ?"
+        params += [max(0, limit), max(0, offset)]
+
+        rows = self._connect().execute(query, params).fetchall()
+        return [self._session_row_to_dict(row) for row in rows]
+
+    def count_sessions(self) -> int:
+        """전체 세션 수"""
+        return self._connect().execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
 
     def cleanup_old_sessions(self, days: int = 30) -> int:
         """
-        오래된 세션 자동 삭제
+        오래된 세션 자동 삭제 (created_at 인덱스로 대상만 조회)
 
         Args:
             days: 보관 일수 (기본 30일)
@@ -344,20 +787,14 @@ class ThumbnailHistory:
         Returns:
             삭제된 세션 개수
         """
-        from datetime import timedelta
+        cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
+        rows = self._connect().execute(
+            "SELECT session_id FROM sessions WHERE created_at < ?", (cutoff_date,)
+        ).fetchall()
 
-        cutoff_date = datetime.now() - timedelta(days=days)
         deleted_count = 0
-
-        for session_file in self.session_dir.glob('*/session.json'):
-            with open(session_file, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-
-            created_at = datetime.fromisoformat(metadata['created_at'])
-
-            if created_at < cutoff_date:
-                session_id = metadata['session_id']
-                self.delete_session(session_id)
+        for row in rows:
+            if self.delete_session(row['session_id']):
                 deleted_count += 1
 
         if deleted_count > 0:
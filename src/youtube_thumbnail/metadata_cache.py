@@ -0,0 +1,120 @@
+"""
+YouTube 메타데이터 디스크 캐시
+
+- 항목별 JSON 파일 (키: 'video_<동영상 ID>', 'channel_<채널 ID/핸들>')
+- TTL 이내: 저장된 값 그대로 사용 (yt-dlp 실행 없음)
+- TTL 경과 ~ TTL + stale_ttl: 저장된 값을 바로 반환하고 백그라운드에서 갱신 (stale-while-revalidate)
+- 그 이후: 다시 추출 (실패하면 만료된 값이라도 반환)
+- 같은 키의 동시 추출은 하나로 합침 (SingleFlight)
+"""
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from src.atomic_cache import SingleFlight, atomic_write_bytes
+
+
+# 파일명에 쓸 수 없는 문자 (키는 동영상 ID/핸들이므로 보통 그대로 유지)
+_UNSAFE_KEY_CHARS = re.compile(r'[^A-Za-z0-9_.@-]')
+
+
+class MetadataCache:
+    """메타데이터 디스크 캐시 (TTL + stale-while-revalidate)"""
+
+    def __init__(self, cache_dir: str):
+        """
+        MetadataCache 초기화
+
+        Args:
+            cache_dir: 항목 JSON 저장 디렉토리
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._flight = SingleFlight()
+
+    def _entry_path(self, key: str) -> Path:
+        """항목 파일 경로"""
+        return self.cache_dir / f"{_UNSAFE_KEY_CHARS.sub('_', key)}.json"
+
+    def load(self, key: str) -> Optional[dict]:
+        """
+        저장된 항목 (없거나 손상되었으면 None)
+
+        Returns:
+            {'fetched_at': float(epoch 초), 'data': dict}
+        """
+        try:
+            with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if isinstance(entry, dict) and 'fetched_at' in entry and 'data' in entry:
+                return entry
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def store(self, key: str, data: dict):
+        """항목 저장 (원자적 쓰기, 추출 시각 기록)"""
+        entry = {'fetched_at': time.time(), 'data': data}
+        atomic_write_bytes(
+            self._entry_path(key),
+            json.dumps(entry, ensure_ascii=False, indent=2).encode('utf-8')
+        )
+
+    def get(
+        self,
+        key: str,
+        fetch: Callable[[], Optional[dict]],
+        ttl: float,
+        stale_ttl: float = 0
+    ) -> Optional[dict]:
+        """
+        캐시 조회 (없거나 만료되었으면 fetch로 추출 후 저장)
+
+        Args:
+            key: 항목 키
+            fetch: 인자 없이 메타데이터를 추출하는 함수 (실패 시 None - 저장하지 않음)
+            ttl: 저장된 값을 그대로 사용할 시간 (초)
+            stale_ttl: TTL 경과 후 저장된 값을 반환하면서 백그라운드로 갱신할 시간 (초)
+
+        Returns:
+            메타데이터 (추출 실패 + 저장된 값 없음이면 None)
+        """
+        entry = self.load(key)
+        if entry is not None:
+            age = time.time() - entry['fetched_at']
+            if age < ttl:
+                print(f"♻ 메타데이터 캐시 적중: {key} ({int(age)}초 전)")
+                return entry['data']
+            if age < ttl + stale_ttl:
+                print(f"♻ 메타데이터 캐시 적중 (만료, 백그라운드 갱신): {key} ({int(age)}초 전)")
+                self._refresh_in_background(key, fetch)
+                return entry['data']
+
+        data = self._flight.do(key, lambda: self._fetch_and_store(key, fetch))
+        if data is None and entry is not None:
+            print(f"⚠️ 메타데이터 갱신 실패, 만료된 캐시 사용: {key}")
+            return entry['data']
+        return data
+
+    def _fetch_and_store(self, key: str, fetch: Callable[[], Optional[dict]]) -> Optional[dict]:
+        """추출 성공 시 저장"""
+        data = fetch()
+        if data is not None:
+            self.store(key, data)
+        return data
+
+    def _refresh_in_background(self, key: str, fetch: Callable[[], Optional[dict]]):
+        """백그라운드 갱신 (이미 갱신 중인 키는 건너뜀)"""
+        if self._flight.in_flight(key):
+            return
+
+        def refresh():
+            try:
+                self._flight.do(key, lambda: self._fetch_and_store(key, fetch))
+            except Exception as e:
+                print(f"⚠️ 메타데이터 백그라운드 갱신 실패 ({key}): {e}")
+
+        threading.Thread(target=refresh, name=f'metadata-refresh-{key}', daemon=True).start()
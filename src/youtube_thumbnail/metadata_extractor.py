@@ -4,14 +4,79 @@ YouTube 메타데이터 추출 모듈
 yt-dlp를 사용하여 YouTube URL에서 메타데이터를 추출합니다.
 의존성: yt-dlp (선택사항, 없어도 기존 시스템 정상 작동)
 
+cache_dir를 지정하면 동영상/채널 정보를 정규화된 ID(동영상 ID, 채널 ID/핸들)별로 캐시
+(TTL 이내는 yt-dlp 실행 없음, 만료 후 일정 기간은 저장된 값 반환 + 백그라운드 갱신)
+채널 아이콘은 아이콘 URL별 파일로 저장하여 세션 간 재사용
+
 Author: Kelly & Claude Code
 Date: 2025-11-09
 """
+import re
 import subprocess
 import json
 import requests
 from pathlib import Path
 from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from src.atomic_cache import atomic_write_bytes
+from src.jobs import request_hash
+
+from .metadata_cache import MetadataCache
+
+
+# 캐시 유지 시간 (초): 동영상 정보 6시간, 채널 정보 7일, 만료 후 백그라운드 갱신하며 사용할 기간 7일
+VIDEO_TTL = 6 * 3600
+CHANNEL_TTL = 7 * 24 * 3600
+STALE_TTL = 7 * 24 * 3600
+
+_VIDEO_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{11}$')
+
+
+def video_id_from_url(url: str) -> Optional[str]:
+    """
+    YouTube URL의 동영상 ID (watch?v=, youtu.be/, shorts/, embed/, live/)
+
+    Returns:
+        11자리 동영상 ID (알 수 없는 형식이면 None)
+    """
+    parsed = urlparse(url.strip())
+    host = (parsed.hostname or '').lower()
+    parts = [part for part in parsed.path.split('/') if part]
+
+    candidate = None
+    if host == 'youtu.be' and parts:
+        candidate = parts[0]
+    elif host.endswith('youtube.com') or host.endswith('youtube-nocookie.com'):
+        candidate = parse_qs(parsed.query).get('v', [None])[0]
+        if not candidate and len(parts) >= 2 and parts[0] in ('shorts', 'embed', 'live', 'v'):
+            candidate = parts[1]
+
+    return candidate if candidate and _VIDEO_ID_PATTERN.match(candidate) else None
+
+
+def channel_key_from_url(url: str) -> Optional[str]:
+    """
+    YouTube 채널 URL의 정규화된 키 (/channel/UC..., /@핸들, /c/이름, /user/이름)
+
+    Returns:
+        'UC...' 또는 '@핸들'(소문자) / 'c.이름' / 'user.이름' (알 수 없는 형식이면 None)
+    """
+    parsed = urlparse(url.strip())
+    host = (parsed.hostname or '').lower()
+    if not host.endswith('youtube.com'):
+        return None
+
+    parts = [part for part in parsed.path.split('/') if part]
+    if not parts:
+        return None
+    if parts[0].startswith('@'):
+        return parts[0].lower()  # 핸들은 대소문자 구분 없음
+    if len(parts) >= 2 and parts[0] == 'channel':
+        return parts[1]
+    if len(parts) >= 2 and parts[0] in ('c', 'user'):
+        return f'{parts[0]}.{parts[1].lower()}'
+    return None
 
 
 class YouTubeMetadataExtractor:
@@ -22,8 +87,25 @@ class YouTubeMetadataExtractor:
     yt-dlp가 없어도 None을 반환하여 안전하게 처리.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        video_ttl: float = VIDEO_TTL,
+        channel_ttl: float = CHANNEL_TTL,
+        stale_ttl: float = STALE_TTL
+    ):
+        """
+        Args:
+            cache_dir: 메타데이터 캐시 디렉토리 (None이면 캐시 없이 매번 추출)
+            video_ttl: 동영상 정보 캐시 유지 시간 (초)
+            channel_ttl: 채널 정보 캐시 유지 시간 (초)
+            stale_ttl: 만료 후 저장된 값을 반환하며 백그라운드로 갱신할 기간 (초)
+        """
         self.yt_dlp_available = self._check_yt_dlp()
+        self.cache = MetadataCache(cache_dir) if cache_dir else None
+        self.video_ttl = video_ttl
+        self.channel_ttl = channel_ttl
+        self.stale_ttl = stale_ttl
 
     def _check_yt_dlp(self) -> bool:
         """yt-dlp 설치 여부 확인"""
@@ -45,7 +127,7 @@ class YouTubeMetadataExtractor:
 
     def extract(self, url: str) -> Optional[dict]:
         """
-        YouTube URL에서 메타데이터 추출
+        YouTube URL에서 메타데이터 추출 (캐시 사용 시 동영상 ID별 캐시)
 
         Args:
             url: YouTube URL (watch?v=... 또는 youtu.be/...)
@@ -61,6 +143,14 @@ class YouTubeMetadataExtractor:
             }
             또는 None (실패 시)
         """
+        if self.cache is None:
+            return self._extract(url)
+
+        key = video_id_from_url(url) or f'url_{request_hash(url)[:16]}'
+        return self.cache.get(f'video_{key}', lambda: self._extract(url), self.video_ttl, self.stale_ttl)
+
+    def _extract(self, url: str) -> Optional[dict]:
+        """yt-dlp로 동영상 메타데이터 추출 (extract 참고)"""
         if not self.yt_dlp_available:
             return None
 
@@ -110,7 +200,7 @@ class YouTubeMetadataExtractor:
 
     def extract_channel_info(self, channel_url: str, output_dir: str = 'output/youtube_thumbnails/channels') -> Optional[dict]:
         """
-        YouTube 채널 정보 추출 (아이콘 포함)
+        YouTube 채널 정보 추출 (아이콘 포함, 캐시 사용 시 채널 ID/핸들별 캐시)
 
         Args:
             channel_url: YouTube 채널 URL (예: https://www.youtube.com/@aion-vibecoding)
@@ -131,6 +221,31 @@ class YouTubeMetadataExtractor:
             >>> info = extractor.extract_channel_info("https://www.youtube.com/@aion-vibecoding")
             >>> # info['icon_path'] → '/path/to/channel_icon.jpg'
         """
+        if self.cache is None:
+            return self._extract_channel_info(channel_url, output_dir)
+
+        key = channel_key_from_url(channel_url) or f'url_{request_hash(channel_url)[:16]}'
+        channel_info = self.cache.get(
+            f'channel_{key}',
+            lambda: self._extract_channel_info(channel_url, output_dir),
+            self.channel_ttl,
+            self.stale_ttl
+        )
+
+        # 저장된 아이콘 파일이 지워졌으면 아이콘만 다시 다운로드 (yt-dlp 실행 없음)
+        if channel_info and channel_info.get('icon_url') and not (
+            channel_info.get('icon_path') and Path(channel_info['icon_path']).exists()
+        ):
+            channel_info = dict(channel_info, icon_path=self._download_channel_icon(
+                channel_info['icon_url'],
+                channel_info['channel_id'] or 'unknown',
+                output_dir
+            ))
+
+        return channel_info
+
+    def _extract_channel_info(self, channel_url: str, output_dir: str) -> Optional[dict]:
+        """yt-dlp로 채널 정보 추출 + 아이콘 다운로드 (extract_channel_info 참고)"""
         if not self.yt_dlp_available:
             print("⚠️ yt-dlp 없음 (채널 정보 추출 불가)")
             return None
@@ -197,7 +312,7 @@ class YouTubeMetadataExtractor:
 
     def _download_channel_icon(self, icon_url: str, channel_id: str, output_dir: str) -> str:
         """
-        채널 아이콘 이미지 다운로드
+        채널 아이콘 이미지 다운로드 (아이콘 URL별 파일, 이미 있으면 재사용)
 
         Args:
             icon_url: 아이콘 URL
@@ -216,7 +331,8 @@ class YouTubeMetadataExtractor:
             if ext not in ['jpg', 'jpeg', 'png', 'webp']:
                 ext = 'jpg'
 
-            icon_file = output_path / f'{channel_id}_icon.{ext}'
+            # 아이콘이 바뀌면 URL도 바뀌므로 URL 해시로 파일 구분
+            icon_file = output_path / f'{channel_id}_icon_{request_hash(icon_url)[:12]}.{ext}'
 
             # 이미 다운로드된 경우 재사용
             if icon_file.exists():
@@ -227,8 +343,7 @@ class YouTubeMetadataExtractor:
             response = requests.get(icon_url, timeout=10)
             response.raise_for_status()
 
-            with open(icon_file, 'wb') as f:
-                f.write(response.content)
+            atomic_write_bytes(icon_file, response.content)
 
             print(f"✅ 채널 아이콘 다운로드: {icon_file}")
             return str(icon_file)
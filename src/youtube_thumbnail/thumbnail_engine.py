@@ -7,10 +7,57 @@ PIL을 사용하여 전문적인 YouTube 썸네일을 생성합니다.
 Author: Kelly & Claude Code
 Date: 2025-11-09
 """
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
+from PIL import Image, ImageDraw, ImageFilter
+from functools import lru_cache
+import hashlib
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 import os
+import time
+
+import numpy as np
+
+from src.atomic_cache import atomic_path
+from src.file_serving import file_digest
+from src.font_registry import get_font, resolve_font, text_bbox
+from src.jobs import request_hash
+
+
+@lru_cache(maxsize=64)
+def _band_alpha(height: int, max_alpha: int = 120) -> np.ndarray:
+    """
+    세로 그라데이션 밴드의 행별 알파값 (같은 높이의 밴드는 재사용)
+
+    중앙에서 max_alpha, 위/아래 끝으로 갈수록 절반까지 투명해짐
+
+    Returns:
+        (height,) uint8 배열 (읽기 전용)
+    """
+    center = height / 2
+    distance_from_center = np.abs(np.arange(height, dtype=np.float32) - center)
+    alpha_ratio = 1.0 - (distance_from_center / center) * 0.5  # 0.5~1.0
+    alpha = (max_alpha * alpha_ratio).astype(np.uint8)
+    alpha.flags.writeable = False
+    return alpha
+
+
+def _darken_region(canvas: Image.Image, box: Tuple[int, int, int, int], alpha: Union[int, np.ndarray]):
+    """
+    캔버스 영역을 검은색 반투명 레이어로 덮은 것처럼 어둡게 (배열 연산 한 번, 제자리 수정)
+
+    Args:
+        canvas: 대상 이미지 (RGB 또는 RGBA, RGBA는 색상 채널만 어둡게 함)
+        box: 영역 (left, top, right, bottom)
+        alpha: 레이어 불투명도 0~255 (상수 또는 행별 (높이,) 배열)
+    """
+    region = np.array(canvas.crop(box))
+    keep = 255 - np.asarray(alpha, dtype=np.uint16)
+    if keep.ndim == 1:
+        keep = keep[:, None, None]  # 행별 알파 → 모든 열에 적용
+
+    rgb = region[..., :3].astype(np.uint16)
+    region[..., :3] = (rgb * keep + 127) // 255
+    canvas.paste(Image.fromarray(region), box[:2])
 
 
 class YouTubeThumbnailEngine:
@@ -25,38 +72,29 @@ class YouTubeThumbnailEngine:
     WIDTH = 1280
     HEIGHT = 720
 
-    def __init__(self, output_dir: str = 'output/youtube_thumbnails'):
+    def __init__(self, output_dir: str = 'output/youtube_thumbnails', cache_dir: Optional[str] = None):
         """
         Args:
             output_dir: 썸네일 저장 디렉토리
+            cache_dir: 렌더링 결과 저장소 (입력값 해시별 PNG, 기본: output_dir)
+                       여러 세션이 같은 저장소를 쓰면 설정이 같은 썸네일은 다시 렌더링하지 않음
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.output_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         # 폰트 설정
         self.font_path = self._find_font()
 
     def _find_font(self) -> Optional[str]:
         """
-        시스템 폰트 찾기 (AppleGothic 우선)
+        시스템 폰트 찾기 (AppleGothic 우선, 프로세스 전역 폰트 레지스트리에서 한 번만 확인)
 
         Returns:
             폰트 파일 경로 또는 None
         """
-        font_candidates = [
-            '/System/Library/Fonts/Supplemental/AppleGothic.ttf',  # macOS
-            '/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf',  # Ubuntu
-            'C:\\Windows\\Fonts\\malgun.ttf',  # Windows (맑은고딕)
-            '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf'  # Linux fallback
-        ]
-
-        for font_path in font_candidates:
-            if os.path.exists(font_path):
-                print(f"✅ 폰트 로드: {font_path}")
-                return font_path
-
-        print("⚠️ 시스템 폰트 없음, 기본 폰트 사용")
-        return None
+        return resolve_font('korean_bold')
 
     def create_thumbnail(
         self,
@@ -68,7 +106,8 @@ class YouTubeThumbnailEngine:
         background_image_path: Optional[str] = None,
         channel_icon_path: Optional[str] = None,
         text_position: str = 'center',
-        brand_colors: Optional[dict] = None
+        brand_colors: Optional[dict] = None,
+        background_image: Optional[Image.Image] = None
     ) -> str:
         """
         TED 스타일 썸네일 생성 (유튜브 영상 스크린샷 기반)
@@ -83,9 +122,10 @@ class YouTubeThumbnailEngine:
             channel_icon_path: 채널 아이콘 경로 (NEW, 원형으로 표시)
             text_position: 텍스트 위치 ('left', 'center', 'right')
             brand_colors: 브랜드 색상 dict
+            background_image: prepare_background()로 미리 준비한 배경 (여러 썸네일이 같은 배경을 쓸 때, 원본은 수정하지 않음)
 
         Returns:
-            생성된 썸네일 파일 경로
+            생성된 썸네일 파일 경로 (cache_dir/thumbnail_<입력값 해시>.png, 같은 입력이면 렌더링 없이 기존 파일)
 
         Example (TED Style):
             >>> engine = YouTubeThumbnailEngine()
@@ -97,24 +137,38 @@ class YouTubeThumbnailEngine:
                     text_position='center'
                 )
         """
+        # 0. 같은 입력으로 렌더링한 결과가 있으면 그대로 반환
+        output_path = self.thumbnail_path(
+            main_text=main_text,
+            subtitle_text=subtitle_text,
+            style=style,
+            sentence_count=sentence_count,
+            video_duration=video_duration,
+            background_image_path=background_image_path,
+            channel_icon_path=channel_icon_path,
+            text_position=text_position,
+            brand_colors=brand_colors,
+            background_image=background_image
+        )
+        if output_path.exists():
+            print(f"♻ 썸네일 캐시 적중: {output_path.name}")
+            self.mark_used(output_path)
+            return str(output_path)
+
         # 1. 배경 이미지 로드 (YouTube 스크린샷 또는 생성)
-        if background_image_path and os.path.exists(background_image_path):
+        if background_image is not None:
+            # 미리 디코딩/샤프닝된 배경 (이후 단계가 캔버스를 직접 수정하므로 복사본 사용)
+            canvas = background_image.convert('RGB') if background_image.mode != 'RGB' else background_image.copy()
+        elif background_image_path and os.path.exists(background_image_path):
             # TED 스타일: 실제 YouTube 영상 스크린샷 사용
-            canvas = Image.open(background_image_path)
-            canvas = canvas.resize((self.WIDTH, self.HEIGHT), Image.Resampling.LANCZOS)
-
-            # 이미지 샤프닝 (선명도 향상) - 흐림 문제 해결
-            canvas = canvas.filter(ImageFilter.SHARPEN)
-            canvas = canvas.filter(ImageFilter.SHARPEN)  # 2회 적용으로 더 선명하게
-
-            print(f"  ✅ 배경 이미지 로드 + 샤프닝 적용: {background_image_path}")
+            canvas = self.prepare_background(background_image_path)
         else:
             # 폴백: 빈 캔버스 생성 (배경 그리기)
             canvas = Image.new('RGB', (self.WIDTH, self.HEIGHT), 'white')
             self._draw_background(canvas, style, brand_colors)
 
         # 2. 반투명 오버레이 (텍스트 가독성 향상, 선택사항)
-        if background_image_path:
+        if background_image is not None or background_image_path:
             self._add_darkening_overlay(canvas, opacity=0.3)
 
         # 3. 텍스트 추가 (TED 스타일: 중앙 또는 커스텀 위치)
@@ -131,13 +185,154 @@ class YouTubeThumbnailEngine:
         if video_duration:
             self._add_duration_badge(canvas, video_duration)
 
-        # 저장
-        output_path = self.output_dir / f'thumbnail_{hash(main_text)}.png'
-        canvas.save(output_path, 'PNG', quality=95)
+        # 저장 (원자적 쓰기: 동시에 같은 썸네일을 렌더링해도 완성된 파일만 보임)
+        with atomic_path(output_path) as tmp_path:
+            canvas.save(tmp_path, 'PNG', quality=95)
 
         print(f"✅ TED 스타일 썸네일 생성: {output_path}")
         return str(output_path)
 
+    def render_key(
+        self,
+        background_image: Optional[Image.Image] = None,
+        **params
+    ) -> str:
+        """
+        썸네일 입력값 해시 (렌더링 결과 파일명)
+
+        텍스트/스타일/색상/위치/배지 + 배경/채널 아이콘 파일 내용 해시
+        + 폰트 + 렌더링 코드 해시 (코드가 바뀌면 새로 렌더링)
+
+        Args:
+            background_image: 미리 준비한 배경 (배경 파일 경로가 없을 때만 이미지 내용으로 해시)
+            **params: create_thumbnail 인자 (background_image 제외)
+
+        Returns:
+            16진수 SHA-256 해시
+        """
+        assets = {}
+        for name in ('background_image_path', 'channel_icon_path'):
+            path = params.pop(name, None)
+            if path and os.path.exists(path):
+                assets[name] = file_digest(path)
+            else:
+                # 없는 배경 경로도 오버레이 적용 여부가 달라지므로 구분
+                assets[name] = 'missing' if path else None
+
+        if background_image is not None and assets['background_image_path'] in (None, 'missing'):
+            assets['background_image_path'] = hashlib.sha256(background_image.tobytes()).hexdigest()
+
+        return request_hash({
+            'params': params,
+            'assets': assets,
+            'font': self.font_path,
+            'size': [self.WIDTH, self.HEIGHT],
+            'renderer': file_digest(__file__)
+        })
+
+    def thumbnail_path(self, background_image: Optional[Image.Image] = None, **params) -> Path:
+        """
+        입력값에 해당하는 렌더링 결과 경로 (파일이 있으면 렌더링 불필요)
+
+        Args:
+            background_image: 미리 준비한 배경
+            **params: create_thumbnail 인자 (background_image 제외)
+        """
+        return self.cache_dir / f'thumbnail_{self.render_key(background_image=background_image, **params)}.png'
+
+    @staticmethod
+    def mark_used(path: Path):
+        """저장소 파일을 방금 사용한 것으로 표시 (수정 시각 갱신 → prune_cache에서 최근 사용 순으로 보존)"""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def prune_cache(self, max_age_days: float = 30, max_size_mb: float = 2048) -> int:
+        """
+        렌더링 결과 저장소 정리 (오래 사용하지 않은 썸네일/모아보기 이미지 삭제)
+
+        1. 마지막 사용(수정 시각)이 max_age_days보다 오래된 파일 삭제
+        2. 남은 용량이 max_size_mb를 넘으면 오래 사용하지 않은 파일부터 삭제
+
+        히스토리에 저장된 버전은 이 파일의 하드 링크이므로 삭제해도 히스토리 이미지는 유지됨
+
+        Args:
+            max_age_days: 보관 일수
+            max_size_mb: 저장소 최대 용량 (MB)
+
+        Returns:
+            삭제된 파일 수
+        """
+        entries = []
+        for pattern in ('thumbnail_*.png', 'contact_sheet_*.png'):
+            for path in self.cache_dir.glob(pattern):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        cutoff = time.time() - max_age_days * 86400
+        total_size = sum(size for _, size, _ in entries)
+        max_size = max_size_mb * 1024 * 1024
+
+        removed = 0
+        for mtime, size, path in entries:
+            if mtime >= cutoff and total_size <= max_size:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+            removed += 1
+
+        if removed:
+            print(f"✅ 썸네일 렌더링 저장소 정리: {removed}개 삭제 (남은 용량 {total_size / (1024 * 1024):.1f}MB)")
+        return removed
+
+    def prepare_background(self, background_image_path: str) -> Image.Image:
+        """
+        배경 이미지 준비 (썸네일 크기로 리사이즈 + 샤프닝)
+
+        Args:
+            background_image_path: YouTube 영상 스크린샷 경로
+
+        Returns:
+            RGB 이미지 (WIDTH x HEIGHT)
+        """
+        canvas = Image.open(background_image_path).convert('RGB')
+        canvas = canvas.resize((self.WIDTH, self.HEIGHT), Image.Resampling.LANCZOS)
+
+        # 이미지 샤프닝 (선명도 향상) - 흐림 문제 해결
+        canvas = canvas.filter(ImageFilter.SHARPEN)
+        canvas = canvas.filter(ImageFilter.SHARPEN)  # 2회 적용으로 더 선명하게
+
+        print(f"  ✅ 배경 이미지 로드 + 샤프닝 적용: {background_image_path}")
+        return canvas
+
+    @staticmethod
+    def render_params(config: dict) -> dict:
+        """
+        히스토리 설정(ThumbnailHistory.load_thumbnail_config - 인덱스에 저장된 버전별 설정)에서 create_thumbnail 인자 추출
+
+        Args:
+            config: 썸네일 생성 설정 (생성/재생성 API가 저장한 설정)
+
+        Returns:
+            create_thumbnail 키워드 인자
+        """
+        return {
+            'main_text': config.get('main_text', ''),
+            'subtitle_text': config.get('subtitle_text', ''),
+            'style': config.get('style', 'fire_english'),
+            'sentence_count': config.get('sentence_count'),
+            'video_duration': config.get('video_duration', ''),
+            'background_image_path': config.get('background_image_path'),
+            'channel_icon_path': config.get('channel_icon_path'),
+            'text_position': config.get('text_position', 'center'),
+            'brand_colors': config.get('brand_colors')
+        }
+
     def _draw_background(
         self,
         canvas: Image.Image,
@@ -185,8 +380,7 @@ class YouTubeThumbnailEngine:
             canvas: 대상 이미지
             opacity: 불투명도 (0.0 = 투명, 1.0 = 완전 불투명)
         """
-        overlay = Image.new('RGBA', canvas.size, (0, 0, 0, int(255 * opacity)))
-        canvas.paste(overlay, (0, 0), overlay)
+        _darken_region(canvas, (0, 0) + canvas.size, int(255 * opacity))
         print(f"  ✅ 반투명 오버레이 추가 (opacity={opacity})")
 
     def _add_channel_icon(self, canvas: Image.Image, icon_path: str):
@@ -267,16 +461,8 @@ class YouTubeThumbnailEngine:
         main_font_size = 90
         sub_font_size = 50
 
-        try:
-            if self.font_path:
-                main_font = ImageFont.truetype(self.font_path, main_font_size)
-                sub_font = ImageFont.truetype(self.font_path, sub_font_size)
-            else:
-                main_font = ImageFont.load_default()
-                sub_font = ImageFont.load_default()
-        except Exception:
-            main_font = ImageFont.load_default()
-            sub_font = ImageFont.load_default()
+        main_font = get_font(self.font_path, main_font_size)
+        sub_font = get_font(self.font_path, sub_font_size)
 
         # 텍스트 색상 (흰색, 가독성 높음)
         text_color = '#FFFFFF'
@@ -285,7 +471,7 @@ class YouTubeThumbnailEngine:
         y_main = self.HEIGHT // 2 - 50  # 중앙보다 약간 위
 
         # 텍스트 크기 계산
-        bbox_main = draw.textbbox((0, 0), main_text, font=main_font)
+        bbox_main = text_bbox(main_text, self.font_path, main_font_size)
         main_width = bbox_main[2] - bbox_main[0]
         main_height = bbox_main[3] - bbox_main[1]
 
@@ -307,33 +493,16 @@ class YouTubeThumbnailEngine:
 
         # 서브 텍스트가 있으면 박스 확장
         if subtitle_text:
-            bbox_sub = draw.textbbox((0, 0), subtitle_text, font=sub_font)
+            bbox_sub = text_bbox(subtitle_text, self.font_path, sub_font_size)
             sub_width = bbox_sub[2] - bbox_sub[0]
             box_y2 += 80  # 서브 텍스트 공간
 
-        # 세로 그라데이션 오버레이 (위에서 아래로 어두워짐)
-        overlay_box = Image.new('RGBA', canvas.size, (0, 0, 0, 0))
-        draw_overlay = ImageDraw.Draw(overlay_box)
-
-        gradient_height = box_y2 - box_y1
-        for i in range(int(gradient_height)):
-            y = box_y1 + i
-            if y < 0 or y >= self.HEIGHT:
-                continue
-
-            # 그라데이션 알파값 (중앙이 가장 어두움)
-            # 중앙 50%에서 최대 불투명도 (120), 위/아래로 갈수록 투명해짐
-            center = gradient_height / 2
-            distance_from_center = abs(i - center)
-            alpha_ratio = 1.0 - (distance_from_center / center) * 0.5  # 0.5~1.0
-            alpha = int(120 * alpha_ratio)  # 최대 120 (약 47% 불투명)
-
-            draw_overlay.line(
-                [(box_x1, y), (box_x2, y)],
-                fill=(0, 0, 0, alpha)
-            )
-
-        canvas.paste(overlay_box, (0, 0), overlay_box)
+        # 세로 그라데이션 오버레이 (중앙이 가장 어두움, 최대 120 ≈ 47% 불투명)
+        # 행별 알파 배열로 텍스트 영역을 한 번에 어둡게 (캔버스 밖 영역은 잘라냄)
+        band_alpha = _band_alpha(int(box_y2 - box_y1))[:max(0, self.HEIGHT - box_y1)]
+        band_x2 = min(self.WIDTH, box_x2 + 1)  # 오른쪽 끝 열 포함
+        if len(band_alpha) and band_x2 > box_x1:
+            _darken_region(canvas, (box_x1, box_y1, band_x2, box_y1 + len(band_alpha)), band_alpha)
 
         # 개선된 디자인 2: 강한 텍스트 외곽선 (stroke)
         # 여러 번 그려서 두꺼운 외곽선 효과
@@ -358,7 +527,7 @@ class YouTubeThumbnailEngine:
         if subtitle_text:
             y_sub = y_main + main_height + 20
 
-            bbox_sub = draw.textbbox((0, 0), subtitle_text, font=sub_font)
+            bbox_sub = text_bbox(subtitle_text, self.font_path, sub_font_size)
             sub_width = bbox_sub[2] - bbox_sub[0]
 
             if text_position == 'left':
@@ -381,8 +550,9 @@ class YouTubeThumbnailEngine:
                         font=sub_font
                     )
 
-            # 서브 텍스트 (금색)
-            draw.text((x_sub, y_sub), subtitle_text, fill='#FFD700', font=sub_font)
+            # 서브 텍스트 (기본 금색, 브랜드 강조색이 있으면 강조색)
+            sub_color = brand_colors.get('accent') if brand_colors else None
+            draw.text((x_sub, y_sub), subtitle_text, fill=sub_color or '#FFD700', font=sub_font)
 
         print(f"  ✅ TED 텍스트 추가 (개선된 디자인): {text_position} 정렬, 그라데이션 오버레이 + 강한 외곽선")
 
@@ -398,13 +568,7 @@ class YouTubeThumbnailEngine:
 
         # 폰트 크기 결정
         font_size = 100
-        try:
-            if self.font_path:
-                font = ImageFont.truetype(self.font_path, font_size)
-            else:
-                font = ImageFont.load_default()
-        except Exception:
-            font = ImageFont.load_default()
+        font = get_font(self.font_path, font_size)
 
         # 텍스트 색상
         if style == 'fire_english':
@@ -415,7 +579,7 @@ class YouTubeThumbnailEngine:
             y_position = 200
 
         # 텍스트 크기 계산 (PIL 2.x)
-        bbox = draw.textbbox((0, 0), text, font=font)
+        bbox = text_bbox(text, self.font_path, font_size)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
 
@@ -445,19 +609,13 @@ class YouTubeThumbnailEngine:
         draw = ImageDraw.Draw(canvas)
 
         font_size = 60
-        try:
-            if self.font_path:
-                font = ImageFont.truetype(self.font_path, font_size)
-            else:
-                font = ImageFont.load_default()
-        except Exception:
-            font = ImageFont.load_default()
+        font = get_font(self.font_path, font_size)
 
         # 텍스트 박스 (하단)
         y_position = self.HEIGHT - 150
 
         # 텍스트 크기
-        bbox = draw.textbbox((0, 0), text, font=font)
+        bbox = text_bbox(text, self.font_path, font_size)
         text_width = bbox[2] - bbox[0]
 
         x = (self.WIDTH - text_width) // 2
@@ -494,16 +652,10 @@ class YouTubeThumbnailEngine:
 
         # 숫자 텍스트
         font_size = 50
-        try:
-            if self.font_path:
-                font = ImageFont.truetype(self.font_path, font_size)
-            else:
-                font = ImageFont.load_default()
-        except Exception:
-            font = ImageFont.load_default()
+        font = get_font(self.font_path, font_size)
 
         text = str(count)
-        bbox = draw.textbbox((0, 0), text, font=font)
+        bbox = text_bbox(text, self.font_path, font_size)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
 
@@ -534,15 +686,9 @@ class YouTubeThumbnailEngine:
 
         # 시간 텍스트
         font_size = 30
-        try:
-            if self.font_path:
-                font = ImageFont.truetype(self.font_path, font_size)
-            else:
-                font = ImageFont.load_default()
-        except Exception:
-            font = ImageFont.load_default()
+        font = get_font(self.font_path, font_size)
 
-        bbox = draw.textbbox((0, 0), duration, font=font)
+        bbox = text_bbox(duration, self.font_path, font_size)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
 
@@ -11,10 +11,27 @@ Date: 2025-11-09
 """
 import random
 import colorsys
-from typing import Dict, Any, List, Tuple
+import json
+from typing import Dict, Any, List, Sequence, Tuple
 import copy
 
 
+# 변형 종류 (재생성 API의 variation_type)
+VARIATION_TYPES = ('color', 'layout', 'complete')
+
+# 썸네일 엔진 텍스트 위치
+TEXT_POSITIONS = ('left', 'center', 'right')
+
+# 렌더링 설정(생성 API가 저장한 설정)에서 변형해도 유지하는 항목
+RENDER_CONTENT_KEYS = (
+    'main_text', 'subtitle_text', 'sentence_count', 'video_duration',
+    'background_image_path', 'channel_icon_path', 'youtube_url', 'channel_url'
+)
+
+# 브랜드 색상이 없는 설정의 기준 색상 (생성 API 기본값과 동일)
+DEFAULT_BRAND_COLORS = {'primary': '#FF5733', 'secondary': '#3357FF', 'accent': '#FFD700'}
+
+
 class VariationEngine:
     """
     썸네일 변형 생성 엔진
@@ -89,6 +106,16 @@ class VariationEngine:
         """
         new_config = copy.deepcopy(original_config)
 
+        # 렌더링 설정: 텍스트 위치 변경 (썸네일 엔진의 레이아웃 요소)
+        if self._is_render_config(original_config):
+            current_position = original_config.get('text_position', 'center')
+            new_position = random.choice([p for p in TEXT_POSITIONS if p != current_position])
+            new_config['text_position'] = new_position
+            new_config['variation_type'] = f'layout_text_{new_position}'
+
+            print(f"✅ 레이아웃 변형 생성: 텍스트 {current_position} → {new_position}")
+            return new_config
+
         # 레이아웃 패턴 목록
         layout_patterns = [
             'header_top_text_bottom',      # 헤더 상단 + 텍스트 하단
@@ -168,6 +195,17 @@ class VariationEngine:
         new_style_name = random.choice(available_styles)
         new_style = THUMBNAIL_STYLES[new_style_name]
 
+        # 렌더링 설정: 텍스트/배경/배지는 유지하고 스타일, 텍스트 위치, 색상 모두 변경
+        if self._is_render_config(original_config):
+            new_config['style'] = new_style_name
+            new_config['text_position'] = random.choice(TEXT_POSITIONS)
+            primary, secondary, accent = self._extract_colors_from_config(new_style)[:3]
+            new_config['brand_colors'] = {'primary': primary, 'secondary': secondary, 'accent': accent}
+            new_config['variation_type'] = f'complete_{new_style_name}'
+
+            print(f"✅ 완전 새 디자인: {original_style} → {new_style_name}")
+            return new_config
+
         # 새 스타일 적용 (텍스트 내용은 유지)
         original_text = new_config.get('text_content', {})
 
@@ -179,6 +217,80 @@ class VariationEngine:
         print(f"✅ 완전 새 디자인: {original_style} → {new_style_name}")
         return new_config
 
+    def create_variation(self, original_config: dict, variation_type: str) -> dict:
+        """
+        변형 종류별 새 설정 생성
+
+        Args:
+            original_config: 원본 썸네일 설정
+            variation_type: 'color', 'layout', 'complete'
+
+        Returns:
+            변형된 새 설정
+        """
+        if variation_type == 'color':
+            return self.regenerate_color_variation(original_config)
+        if variation_type == 'layout':
+            return self.regenerate_layout_variation(original_config)
+        if variation_type == 'complete':
+            return self.regenerate_complete_new(original_config)
+        raise ValueError(f"알 수 없는 변형 타입: {variation_type}")
+
+    def create_variation_grid(
+        self,
+        original_config: dict,
+        count: int = 12,
+        variation_types: Sequence[str] = VARIATION_TYPES
+    ) -> List[dict]:
+        """
+        변형 그리드용 설정 여러 개 생성 (변형 종류를 번갈아 사용, 중복 설정 제외)
+
+        Args:
+            original_config: 원본 썸네일 설정
+            count: 생성할 변형 수
+            variation_types: 사용할 변형 종류 ('color', 'layout', 'complete')
+
+        Returns:
+            변형 설정 리스트 (가능한 조합이 적으면 count보다 적을 수 있음)
+            각 설정의 'variation_type'은 변형 종류, 'variation_detail'은 세부 변형 내용
+        """
+        for variation_type in variation_types:
+            if variation_type not in VARIATION_TYPES:
+                raise ValueError(f"알 수 없는 변형 타입: {variation_type}")
+
+        variations = []
+        seen = {self._config_signature(original_config)}
+        attempts = 0
+        while len(variations) < count and attempts < count * 5:
+            variation_type = variation_types[attempts % len(variation_types)]
+            attempts += 1
+
+            new_config = self.create_variation(original_config, variation_type)
+            signature = self._config_signature(new_config)
+            if signature in seen:
+                continue
+            seen.add(signature)
+
+            new_config['variation_detail'] = new_config.get('variation_type')
+            new_config['variation_type'] = variation_type
+            variations.append(new_config)
+
+        print(f"✅ 변형 그리드 설정 생성: {len(variations)}개 ({', '.join(variation_types)})")
+        return variations
+
+    @staticmethod
+    def _config_signature(config: dict) -> str:
+        """변형 설명 항목을 제외한 설정 비교용 문자열"""
+        return json.dumps(
+            {k: v for k, v in config.items() if k not in ('variation_type', 'variation_detail')},
+            sort_keys=True, ensure_ascii=False, default=str
+        )
+
+    @staticmethod
+    def _is_render_config(config: dict) -> bool:
+        """생성 API가 저장한 렌더링 설정인지 (스타일 템플릿 설정이 아닌)"""
+        return 'main_text' in config
+
     # ================================================================
     # 색상 조화 알고리즘 (Color Theory)
     # ================================================================
@@ -258,6 +370,11 @@ class VariationEngine:
         """설정에서 색상 추출"""
         colors = []
 
+        # 브랜드 색상 (렌더링 설정)
+        if self._is_render_config(config):
+            brand_colors = config.get('brand_colors') or DEFAULT_BRAND_COLORS
+            colors.extend(brand_colors.get(key) or DEFAULT_BRAND_COLORS[key] for key in DEFAULT_BRAND_COLORS)
+
         # 레이아웃 색상
         if 'layout' in config:
             if 'header_color' in config['layout']:
@@ -293,6 +410,11 @@ class VariationEngine:
         """새 색상을 설정에 적용"""
         color_index = 0
 
+        # 브랜드 색상 교체 (렌더링 설정, 강조색은 서브 텍스트 색상)
+        if self._is_render_config(config):
+            config['brand_colors'] = dict(zip(DEFAULT_BRAND_COLORS, new_colors))
+            color_index += len(config['brand_colors'])
+
         # 레이아웃 색상 교체
         if 'layout' in config:
             if 'header_color' in config['layout'] and color_index < len(new_colors):
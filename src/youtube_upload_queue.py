@@ -0,0 +1,438 @@
+"""
+YouTube 재개 가능(resumable) 업로드 + 업로드 큐
+
+- 재개 가능 업로드 프로토콜을 HTTP로 직접 구현 (청크 크기 지정, 업로드 URL 교체 가능)
+  1. POST {upload_url}?uploadType=resumable → Location 헤더의 세션 URI
+  2. PUT 세션 URI + Content-Range로 청크 전송 → 308(진행 중, Range 헤더) 또는 200/201(완료)
+  3. 중단 후에는 PUT 세션 URI + 'Content-Range: bytes */전체크기'로 서버가 받은 위치 조회
+- 세션 URI/전송 위치를 JSON 파일에 저장하여 프로세스 재시작 후에도 이어서 업로드
+- 동시 업로드 수 제한 (JobQueue 워커 수), 일시적 오류는 지수 백오프로 재시도
+"""
+import json
+import os
+import random
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import requests
+
+from .atomic_cache import atomic_write_bytes, file_lock
+from .jobs import JobQueue, new_task_id
+
+
+YOUTUBE_UPLOAD_URL = 'https://www.googleapis.com/upload/youtube/v3/videos'
+
+# 청크 크기는 256KB의 배수여야 함 (마지막 청크 제외)
+CHUNK_ALIGNMENT = 256 * 1024
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+# 재시도할 HTTP 상태 코드 (서버 일시 오류)
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+
+
+class UploadSessionExpired(Exception):
+    """업로드 세션이 만료됨 (404/410) - 새 세션으로 처음부터 다시 업로드"""
+
+
+class UploadError(Exception):
+    """재시도해도 해결되지 않는 업로드 오류 (인증/요청 오류, 재시도 한도 초과)"""
+
+
+class _RetryableResponse(Exception):
+    """재시도 가능한 서버 응답 (5xx/429)"""
+
+
+def align_chunk_size(chunk_size: int) -> int:
+    """청크 크기를 256KB 배수로 내림 (최소 256KB)"""
+    return max(CHUNK_ALIGNMENT, chunk_size // CHUNK_ALIGNMENT * CHUNK_ALIGNMENT)
+
+
+class ResumableUpload:
+    """
+    파일 하나의 재개 가능 업로드
+
+    사용 예:
+        upload = ResumableUpload(session, 'video.mp4', body, chunk_size=8 * 1024 * 1024)
+        video = upload.upload()  # {'id': ..., 'snippet': ..., 'status': ...}
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        video_path: str,
+        body: dict,
+        upload_url: str = YOUTUBE_UPLOAD_URL,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        session_uri: Optional[str] = None,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        timeout: float = 60.0,
+        on_session: Optional[Callable[[Optional[str]], None]] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ):
+        """
+        ResumableUpload 초기화
+
+        Args:
+            session: HTTP 세션 (YouTube는 인증된 세션, 테스트는 일반 requests.Session)
+            video_path: 업로드할 비디오 파일 경로
+            body: 비디오 리소스 (snippet, status)
+            upload_url: 업로드 엔드포인트
+            chunk_size: 청크 크기 (256KB 배수로 내림)
+            session_uri: 이전에 시작한 세션 URI (있으면 이어서 업로드)
+            max_retries: 진행 없이 연속으로 실패할 수 있는 횟수
+            backoff_base: 재시도 대기 기본 시간 (초, 시도마다 2배)
+            backoff_max: 재시도 대기 최대 시간 (초)
+            timeout: 요청별 타임아웃 (초)
+            on_session: 세션 URI가 바뀔 때 호출 (저장용, 만료 시 None)
+            on_progress: 전송 위치가 바뀔 때 호출 (전송한 바이트, 전체 바이트)
+        """
+        self.session = session
+        self.video_path = Path(video_path)
+        self.body = body
+        self.upload_url = upload_url
+        self.chunk_size = align_chunk_size(chunk_size)
+        self.session_uri = session_uri
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.on_session = on_session
+        self.on_progress = on_progress
+        self.total_size = self.video_path.stat().st_size
+
+    def start(self) -> str:
+        """업로드 세션 시작 (세션 URI 반환)"""
+        params = {'uploadType': 'resumable', 'part': ','.join(self.body.keys())}
+        headers = {
+            'Content-Type': 'application/json; charset=UTF-8',
+            'X-Upload-Content-Length': str(self.total_size),
+            'X-Upload-Content-Type': 'video/mp4'
+        }
+        response = self.session.post(
+            self.upload_url, params=params, headers=headers,
+            data=json.dumps(self.body).encode('utf-8'), timeout=self.timeout
+        )
+        self._raise_for_status(response)
+
+        session_uri = response.headers.get('Location')
+        if not session_uri:
+            raise UploadError("업로드 세션 URI(Location 헤더)를 받지 못했습니다.")
+
+        self.session_uri = session_uri
+        if self.on_session:
+            self.on_session(session_uri)
+        return session_uri
+
+    def query_offset(self):
+        """
+        서버가 받은 위치 조회
+
+        Returns:
+            (다음에 보낼 바이트 위치, 완료된 경우 비디오 리소스 / 아니면 None)
+        """
+        response = self.session.put(
+            self.session_uri,
+            headers={'Content-Length': '0', 'Content-Range': f'bytes */{self.total_size}'},
+            timeout=self.timeout
+        )
+        return self._handle_chunk_response(response)
+
+    def upload(self) -> dict:
+        """
+        파일 전체 업로드 (중단된 세션이면 서버가 받은 위치부터 이어서 전송)
+
+        Returns:
+            업로드된 비디오 리소스
+
+        Raises:
+            UploadError: 재시도 한도 초과 또는 재시도 불가 오류
+        """
+        failures = 0
+        offset = None
+
+        while True:
+            try:
+                if self.session_uri is None:
+                    self.start()
+                    offset = 0
+                elif offset is None:
+                    offset, video = self.query_offset()
+                    if video is not None:
+                        return video
+
+                if self.on_progress:
+                    self.on_progress(offset, self.total_size)
+
+                new_offset, video = self._send_chunk(offset)
+                if video is not None:
+                    if self.on_progress:
+                        self.on_progress(self.total_size, self.total_size)
+                    return video
+
+                if new_offset > offset:
+                    failures = 0
+                    offset = new_offset
+                else:
+                    # 308인데 전송 위치가 그대로 (Range 없음/같은 Range) → 진행 없는 실패로 보고 대기 후 재전송
+                    offset = new_offset
+                    failures += 1
+                    self._backoff(failures, f"서버가 청크를 받지 않음 (전송 위치 {offset})")
+
+            except UploadSessionExpired:
+                # 세션 만료 → 새 세션으로 처음부터
+                self.session_uri = None
+                offset = None
+                if self.on_session:
+                    self.on_session(None)
+                failures += 1
+                self._backoff(failures, "업로드 세션 만료")
+
+            except (requests.RequestException, _RetryableResponse) as e:
+                # 네트워크 오류/서버 일시 오류 → 대기 후 서버가 받은 위치 다시 조회
+                offset = None
+                failures += 1
+                self._backoff(failures, str(e))
+
+    def _send_chunk(self, offset: int):
+        """offset부터 청크 하나 전송"""
+        with open(self.video_path, 'rb') as f:
+            f.seek(offset)
+            chunk = f.read(self.chunk_size)
+
+        end = offset + len(chunk) - 1
+        response = self.session.put(
+            self.session_uri,
+            data=chunk,
+            headers={
+                'Content-Length': str(len(chunk)),
+                'Content-Type': 'video/mp4',
+                'Content-Range': f'bytes {offset}-{end}/{self.total_size}'
+            },
+            timeout=self.timeout
+        )
+        return self._handle_chunk_response(response)
+
+    def _handle_chunk_response(self, response):
+        """청크 전송/위치 조회 응답 해석 → (다음 위치, 완료 시 비디오 리소스)"""
+        if response.status_code in (200, 201):
+            return self.total_size, response.json()
+
+        if response.status_code == 308:
+            # Range: bytes=0-{마지막으로 받은 바이트} (헤더가 없으면 아직 받은 바이트 없음)
+            received = response.headers.get('Range')
+            return (int(received.rsplit('-', 1)[1]) + 1 if received else 0), None
+
+        if response.status_code in (404, 410):
+            raise UploadSessionExpired(f"업로드 세션 만료 ({response.status_code})")
+
+        self._raise_for_status(response)
+        raise UploadError(f"예상하지 못한 응답입니다: {response.status_code}")
+
+    @staticmethod
+    def _raise_for_status(response):
+        """오류 응답 처리 (재시도 가능한 오류와 불가능한 오류 구분)"""
+        if response.status_code in RETRYABLE_STATUS:
+            raise _RetryableResponse(f"서버 일시 오류 ({response.status_code})")
+        if response.status_code >= 400:
+            raise UploadError(f"업로드 요청 실패 ({response.status_code}): {response.text[:300]}")
+
+    def _backoff(self, failures: int, reason: str):
+        """재시도 대기 (지수 백오프 + 지터, 한도 초과 시 UploadError)"""
+        if failures > self.max_retries:
+            raise UploadError(f"업로드 재시도 한도 초과 ({self.max_retries}회): {reason}")
+
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (failures - 1)))
+        delay += random.uniform(0, delay / 2)
+        print(f"   ⚠ 업로드 재시도 {failures}/{self.max_retries} ({delay:.1f}초 후): {reason}")
+        time.sleep(delay)
+
+
+class UploadQueue:
+    """
+    YouTube 업로드 큐
+
+    업로드 작업은 JSON 파일에 저장되며(세션 URI, 전송 위치, 결과),
+    resume()으로 재시작 전에 끝나지 않은 업로드를 이어서 진행
+
+    사용 예:
+        queue = UploadQueue('output/uploads.json', session_factory=uploader.new_session, max_parallel=2)
+        queue.resume()
+        upload_id = queue.enqueue('video.mp4', body)
+    """
+
+    def __init__(
+        self,
+        store_path: str,
+        session_factory: Callable[[], requests.Session],
+        upload_url: str = YOUTUBE_UPLOAD_URL,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_parallel: int = 2,
+        max_queue_size: int = 50,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        on_finished: Optional[Callable[[dict], None]] = None
+    ):
+        """
+        UploadQueue 초기화
+
+        Args:
+            store_path: 업로드 작업 저장 파일 경로 (JSON)
+            session_factory: 업로드마다 새 HTTP 세션을 만드는 함수 (인증은 큐 생성 전에 완료되어 있어야 함,
+                             동시 업로드가 세션을 공유하지 않도록 호출마다 새 세션 반환)
+            upload_url: 업로드 엔드포인트 (테스트 시 로컬 서버 주소)
+            chunk_size: 청크 크기 (256KB 배수로 내림)
+            max_parallel: 동시 업로드 수
+            max_queue_size: 대기열 최대 길이 (초과 시 QueueFullError)
+            max_retries: 업로드별 연속 실패 허용 횟수
+            backoff_base: 재시도 대기 기본 시간 (초)
+            on_finished: 업로드 종료(완료/실패) 시 호출 (업로드 작업)
+        """
+        self.store_path = Path(store_path)
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        self.session_factory = session_factory
+        self.upload_url = upload_url
+        self.chunk_size = align_chunk_size(chunk_size)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.on_finished = on_finished
+        self._queue = JobQueue(num_workers=max_parallel, max_queue_size=max_queue_size)
+
+    # ==================== 저장소 ====================
+
+    def _load(self) -> Dict[str, dict]:
+        """업로드 작업 로드 (없거나 손상되었으면 빈 목록)"""
+        try:
+            with open(self.store_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _update(self, upload_id: str, **fields) -> dict:
+        """업로드 작업 필드 갱신 (프로세스 간 파일 잠금 + 원자적 쓰기)"""
+        with file_lock(self.store_path):
+            uploads = self._load()
+            upload = uploads.setdefault(upload_id, {'upload_id': upload_id})
+            upload.update(fields, updated_at=datetime.now().isoformat())
+            atomic_write_bytes(
+                self.store_path,
+                json.dumps(uploads, ensure_ascii=False, indent=2).encode('utf-8')
+            )
+        return dict(upload)
+
+    def get(self, upload_id: str) -> Optional[dict]:
+        """업로드 작업 조회"""
+        return self._load().get(upload_id)
+
+    def uploads(self) -> list:
+        """전체 업로드 작업 (생성 순)"""
+        return sorted(self._load().values(), key=lambda upload: upload.get('created_at', ''))
+
+    # ==================== 큐 ====================
+
+    def enqueue(self, video_path: str, body: dict) -> str:
+        """
+        업로드 등록 (같은 파일의 업로드가 대기/진행 중이면 기존 업로드 ID 반환)
+
+        Args:
+            video_path: 업로드할 비디오 파일 경로
+            body: 비디오 리소스 (snippet, status)
+
+        Returns:
+            업로드 ID
+
+        Raises:
+            FileNotFoundError: 비디오 파일이 없는 경우
+            QueueFullError: 업로드 대기열이 가득 찬 경우
+        """
+        if not os.path.exists(video_path):
+            raise FileNotFoundError(f"❌ 비디오 파일을 찾을 수 없습니다: {video_path}")
+
+        video_path = str(Path(video_path).resolve())
+        for upload in self._load().values():
+            if upload['video_path'] == video_path and upload['status'] in ('queued', 'uploading'):
+                return upload['upload_id']
+
+        upload_id = new_task_id(prefix='upload')
+        self._update(
+            upload_id,
+            video_path=video_path,
+            body=body,
+            status='queued',
+            session_uri=None,
+            bytes_sent=0,
+            total_bytes=os.path.getsize(video_path),
+            video_id=None,
+            error=None,
+            created_at=datetime.now().isoformat()
+        )
+        try:
+            self._queue.submit(upload_id, self._run, upload_id)
+        except Exception:
+            self._update(upload_id, status='error', error='업로드 대기열이 가득 찼습니다.')
+            raise
+
+        print(f"📥 업로드 대기열 등록: {body['snippet'].get('title', '')} ({upload_id})")
+        return upload_id
+
+    def resume(self) -> int:
+        """
+        재시작 전에 끝나지 않은 업로드를 다시 큐에 넣음 (저장된 세션 URI로 이어서 업로드)
+
+        Returns:
+            다시 등록된 업로드 수
+        """
+        resumed = 0
+        for upload in self.uploads():
+            if upload['status'] not in ('queued', 'uploading'):
+                continue
+            self._update(upload['upload_id'], status='queued')
+            self._queue.submit(upload['upload_id'], self._run, upload['upload_id'])
+            print(f"♻ 중단된 업로드 재개: {upload['upload_id']} ({upload['bytes_sent']}/{upload['total_bytes']} bytes)")
+            resumed += 1
+        return resumed
+
+    def stats(self) -> dict:
+        """상태별 업로드 수 + 큐 상태"""
+        counts = {}
+        for upload in self._load().values():
+            counts[upload['status']] = counts.get(upload['status'], 0) + 1
+        return {'uploads': counts, 'queue': self._queue.stats()}
+
+    def _run(self, upload_id: str):
+        """업로드 실행 (워커 스레드)"""
+        upload = self._update(upload_id, status='uploading')
+        title = upload['body']['snippet'].get('title', '')
+
+        def on_progress(sent, total):
+            self._update(upload_id, bytes_sent=sent)
+            print(f"   업로드 진행 ({title}): {int(sent * 100 / max(1, total))}%")
+
+        try:
+            resumable = ResumableUpload(
+                self.session_factory(),
+                upload['video_path'],
+                upload['body'],
+                upload_url=self.upload_url,
+                chunk_size=self.chunk_size,
+                session_uri=upload['session_uri'],
+                max_retries=self.max_retries,
+                backoff_base=self.backoff_base,
+                on_session=lambda session_uri: self._update(upload_id, session_uri=session_uri),
+                on_progress=on_progress
+            )
+            video = resumable.upload()
+            upload = self._update(upload_id, status='completed', video_id=video['id'], session_uri=None)
+            print(f"✅ 업로드 완료: {title} (https://www.youtube.com/watch?v={video['id']})")
+        except Exception as e:
+            upload = self._update(upload_id, status='error', error=str(e))
+            print(f"❌ 업로드 실패: {title} - {e}")
+
+        if self.on_finished:
+            try:
+                self.on_finished(upload)
+            except Exception as e:
+                print(f"⚠ 업로드 완료 처리 실패 ({upload_id}): {e}")
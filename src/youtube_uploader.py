@@ -8,11 +8,14 @@ import json
 from pathlib import Path
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
+from google.auth.transport.requests import AuthorizedSession, Request
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
 import pickle
 
+from .youtube_upload_queue import (
+    DEFAULT_CHUNK_SIZE, YOUTUBE_UPLOAD_URL, ResumableUpload, UploadQueue
+)
+
 
 class YouTubeUploader:
     """YouTube 비디오 업로드 클래스"""
@@ -20,14 +23,22 @@ class YouTubeUploader:
     # OAuth 2.0 스코프
     SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
 
-    def __init__(self, credentials_path=None, token_path=None):
+    def __init__(self, credentials_path=None, token_path=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                 upload_url=YOUTUBE_UPLOAD_URL, session=None):
         """
         Args:
             credentials_path: OAuth 2.0 클라이언트 시크릿 JSON 파일 경로
             token_path: 저장된 토큰 파일 경로
+            chunk_size: 업로드 청크 크기 (256KB 배수, 실패 시 이 단위로 이어서 전송)
+            upload_url: 재개 가능 업로드 엔드포인트 (테스트 시 로컬 서버 주소)
+            session: HTTP 세션 (지정하면 OAuth 인증 생략, 테스트용)
         """
         self.credentials_path = credentials_path or 'client_secrets.json'
         self.token_path = token_path or 'youtube_token.pickle'
+        self.chunk_size = chunk_size
+        self.upload_url = upload_url
+        self.session = session
+        self.creds = None
         self.youtube = None
 
     def authenticate(self):
@@ -59,10 +70,90 @@ class YouTubeUploader:
             with open(self.token_path, 'wb') as token:
                 pickle.dump(creds, token)
 
-        # YouTube API 클라이언트 생성
+        # YouTube API 클라이언트 생성 (업로드는 토큰을 자동 갱신하는 인증 세션 사용)
+        self.creds = creds
         self.youtube = build('youtube', 'v3', credentials=creds)
+        self.session = AuthorizedSession(creds)
         print("✅ YouTube API 인증 완료")
 
+    def get_session(self):
+        """업로드용 HTTP 세션 (없으면 인증)"""
+        if self.session is None:
+            self.authenticate()
+        return self.session
+
+    def new_session(self):
+        """
+        업로드 하나 전용 HTTP 세션 (인증 정보는 공유하고 연결은 업로드마다 따로 사용)
+
+        업로드 큐 워커 스레드에서 호출되므로 인증하지 않음 → create_upload_queue에서 미리 인증
+        """
+        if self.creds is None:
+            if self.session is None:
+                raise RuntimeError("YouTube 인증 전에는 업로드 세션을 만들 수 없습니다. authenticate()를 먼저 호출하세요.")
+            return self.session  # 직접 지정한 세션 (테스트용)
+        return AuthorizedSession(self.creds)
+
+    @staticmethod
+    def build_body(title, description, tags=None, category_id='27', privacy_status='public', made_for_kids=False):
+        """
+        업로드할 비디오 리소스(snippet, status) 생성
+
+        Args:
+            title: 비디오 제목
+            description: 비디오 설명
+            tags: 태그 리스트 (없으면 기본 태그)
+            category_id: 카테고리 ID (27=Education)
+            privacy_status: 공개 상태 (public/private/unlisted)
+            made_for_kids: 어린이용 콘텐츠 여부
+        """
+        # 기본 태그
+        if tags is None:
+            tags = [
+                "영어회화", "영어표현", "영어공부", "영어숏츠",
+                "dailyenglish", "shorts", "영어초보", "영어발음"
+            ]
+
+        return {
+            'snippet': {
+                'title': title,
+                'description': description,
+                'tags': tags,
+                'categoryId': category_id
+            },
+            'status': {
+                'privacyStatus': privacy_status,
+                'selfDeclaredMadeForKids': made_for_kids
+            }
+        }
+
+    def create_upload_queue(self, store_path, max_parallel=2, max_retries=5, on_finished=None):
+        """
+        업로드 큐 생성 (세션 URI를 store_path에 저장하여 재시작 후에도 이어서 업로드)
+
+        Args:
+            store_path: 업로드 작업 저장 파일 경로 (JSON)
+            max_parallel: 동시 업로드 수
+            max_retries: 업로드별 연속 실패 허용 횟수
+            on_finished: 업로드 종료 시 호출 (업로드 작업)
+
+        Returns:
+            UploadQueue
+        """
+        # 워커 스레드가 동시에 OAuth 인증(브라우저 로그인)을 시작하지 않도록 큐를 만들기 전에 한 번 인증
+        if self.session is None:
+            self.authenticate()
+
+        return UploadQueue(
+            store_path,
+            session_factory=self.new_session,
+            upload_url=self.upload_url,
+            chunk_size=self.chunk_size,
+            max_parallel=max_parallel,
+            max_retries=max_retries,
+            on_finished=on_finished
+        )
+
     def upload_video(
         self,
         video_path,
@@ -88,60 +179,29 @@ class YouTubeUploader:
         Returns:
             dict: 업로드 결과 (video_id, url 등)
         """
-        if not self.youtube:
-            self.authenticate()
+        session = self.get_session()
 
         # 비디오 파일 존재 확인
         if not os.path.exists(video_path):
             raise FileNotFoundError(f"❌ 비디오 파일을 찾을 수 없습니다: {video_path}")
 
-        # 기본 태그
-        if tags is None:
-            tags = [
-                "영어회화", "영어표현", "영어공부", "영어숏츠",
-                "dailyenglish", "shorts", "영어초보", "영어발음"
-            ]
-
         # 비디오 메타데이터
-        body = {
-            'snippet': {
-                'title': title,
-                'description': description,
-                'tags': tags,
-                'categoryId': category_id
-            },
-            'status': {
-                'privacyStatus': privacy_status,
-                'selfDeclaredMadeForKids': made_for_kids
-            }
-        }
-
-        # 미디어 파일 업로드
-        media = MediaFileUpload(
-            video_path,
-            chunksize=-1,  # 전체 파일 한 번에 업로드
-            resumable=True,
-            mimetype='video/mp4'
-        )
+        body = self.build_body(title, description, tags, category_id, privacy_status, made_for_kids)
 
         print(f"📤 YouTube 업로드 시작: {title}")
         print(f"   파일: {video_path}")
         print(f"   크기: {os.path.getsize(video_path) / 1024 / 1024:.2f} MB")
 
-        # API 요청
-        request = self.youtube.videos().insert(
-            part=','.join(body.keys()),
-            body=body,
-            media_body=media
+        # 청크 단위 재개 가능 업로드 (네트워크 오류 시 서버가 받은 위치부터 이어서 전송)
+        upload = ResumableUpload(
+            session,
+            video_path,
+            body,
+            upload_url=self.upload_url,
+            chunk_size=self.chunk_size,
+            on_progress=lambda sent, total: print(f"   업로드 진행: {int(sent * 100 / max(1, total))}%")
         )
-
-        # 업로드 진행
-        response = None
-        while response is None:
-            status, response = request.next_chunk()
-            if status:
-                progress = int(status.progress() * 100)
-                print(f"   업로드 진행: {progress}%")
+        response = upload.upload()
 
         video_id = response['id']
         video_url = f"https://www.youtube.com/watch?v={video_id}"
@@ -158,27 +218,45 @@ class YouTubeUploader:
             'privacy_status': privacy_status
         }
 
-    def upload_from_metadata(self, video_path, metadata_path):
+    def upload_from_metadata(self, video_path, metadata_path, queue=None, privacy_status='public'):
         """
         메타데이터 JSON 파일을 사용하여 업로드
 
         Args:
             video_path: 비디오 파일 경로
             metadata_path: 메타데이터 JSON 파일 경로
+            queue: UploadQueue (지정하면 업로드 큐에 등록만 하고 바로 반환)
+            privacy_status: 공개 상태 (public/private/unlisted)
 
         Returns:
-            dict: 업로드 결과
+            dict: 업로드 결과 (큐 등록 시 upload_id)
         """
         # 메타데이터 로드
         with open(metadata_path, 'r', encoding='utf-8') as f:
             metadata = json.load(f)
 
+        if queue is not None:
+            body = self.build_body(
+                title=metadata.get('title', 'Daily English Mecca'),
+                description=metadata.get('description', ''),
+                tags=metadata.get('tags', []),
+                privacy_status=privacy_status
+            )
+            return {
+                'success': True,
+                'queued': True,
+                'upload_id': queue.enqueue(video_path, body),
+                'title': body['snippet']['title'],
+                'privacy_status': privacy_status
+            }
+
         # 업로드
         return self.upload_video(
             video_path=video_path,
             title=metadata.get('title', 'Daily English Mecca'),
             description=metadata.get('description', ''),
-            tags=metadata.get('tags', [])
+            tags=metadata.get('tags', []),
+            privacy_status=privacy_status
         )
 
 
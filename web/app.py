@@ -5,10 +5,12 @@ Daily English Mecca - Flask 웹 애플리케이션
 import os
 import sys
 import json
+import time
+import socket
 import threading
-from datetime import datetime
+from collections import deque
 from pathlib import Path
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
 from flask_cors import CORS
 from dotenv import load_dotenv
 
@@ -17,7 +19,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from src.content_analyzer import ContentAnalyzer
 from src.image_generator import ImageGenerator
-from src.tts_generator import TTSGenerator
+from src.tts_generator import DEFAULT_VOICES, TTSGenerator
 from src.video_creator import VideoCreator
 from src.youtube_metadata import YouTubeMetadataGenerator
 from src.resource_manager import ResourceManager
@@ -25,6 +27,15 @@ from src.background_music_downloader import BackgroundMusicDownloader
 from src.sentence_generator import SentenceGenerator
 from src.editor.config_manager import ConfigManager
 from src.editor.video_editor import VideoEditor
+from src.jobs import (
+    JobQueue, QueueFullError, RenderProgressLogger, SharedJobQueue, TaskCancelled, TaskStore,
+    new_task_id, request_hash
+)
+from src.atomic_cache import file_lock
+from src.file_serving import is_content_addressed, send_cached_file
+from src.image_derivatives import ImageDerivativeCache, negotiate_format
+from src.render_cache import RenderCache
+from src.prefetch_index import PrefetchIndex
 
 # 환경변수 로드
 load_dotenv()
@@ -35,55 +46,546 @@ CORS(app)
 
 # 설정
 app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB
-app.config['OUTPUT_DIR'] = Path(__file__).parent.parent / 'output'
-
-# 작업 상태 저장 (실제 프로덕션에서는 Redis 등 사용)
+# 출력 디렉토리
+app.config['OUTPUT_DIR'] = Path(os.getenv('OUTPUT_DIR', Path(__file__).parent.parent / 'output'))
+
+# 작업 큐 설정 (동시 작업 수 / 대기열 길이 / 단계별 동시 실행 한도)
+# 렌더링은 ffmpeg threads=4로 실행되므로 CPU 4코어당 1개를 기본값으로 사용
+app.config['RENDER_WORKERS'] = int(os.getenv('RENDER_WORKERS', 2))
+app.config['MAX_QUEUE_SIZE'] = int(os.getenv('MAX_QUEUE_SIZE', 10))
+app.config['API_STAGE_LIMIT'] = int(os.getenv('API_STAGE_LIMIT', 4))
+app.config['RENDER_STAGE_LIMIT'] = int(os.getenv('RENDER_STAGE_LIMIT', max(1, (os.cpu_count() or 4) // 4)))
+
+app.config['TASK_DB_PATH'] = Path(os.getenv('TASK_DB_PATH', app.config['OUTPUT_DIR'] / 'tasks.db'))
+app.config['TASK_LOG_BUFFER'] = int(os.getenv('TASK_LOG_BUFFER', 200))  # 작업별 로그 보관 줄 수
+app.config['SSE_KEEPALIVE'] = 15  # SSE 연결 유지용 주석 전송 간격 (초)
+app.config['DERIVATIVES_DIR'] = app.config['OUTPUT_DIR'] / 'derivatives'  # 미리보기용 축소 이미지 캐시
+app.config['PREFETCH_INDEX'] = app.config['OUTPUT_DIR'] / 'prefetch' / 'index.json'  # 사전 생성 콘텐츠 인덱스
+
+# 배포 모드
+# - local: 이 프로세스의 워커 스레드가 작업 실행 (기본, app.run 단일 프로세스)
+# - shared: 작업 상태/대기열/진행 상황을 SQLite 파일(TASK_DB_PATH)로 공유
+#           (같은 호스트의 프로세스끼리만 공유, TASK_DB_PATH는 로컬 디스크 경로여야 함)
+#           웹 프로세스는 여러 개 띄울 수 있고, 작업 실행은 render_worker.py 프로세스가 담당
+#           예) TASK_BACKEND=shared gunicorn -w 4 --chdir web app:app
+#               TASK_BACKEND=shared python render_worker.py  (렌더링 용량만큼 실행)
+app.config['TASK_BACKEND'] = os.getenv('TASK_BACKEND', 'local')
+app.config['SHARED_POLL_INTERVAL'] = float(os.getenv('SHARED_POLL_INTERVAL', 0.5))  # 다른 프로세스의 변경 확인 간격 (초)
+app.config['WORKER_POLL_INTERVAL'] = float(os.getenv('WORKER_POLL_INTERVAL', 2))  # 렌더 워커의 대기열 확인 간격 (초)
+app.config['WORKER_LEASE_SECONDS'] = float(os.getenv('WORKER_LEASE_SECONDS', 60))  # 작업 임대 기간 (heartbeat 없으면 재배정)
+app.config['WORKER_MAX_ATTEMPTS'] = int(os.getenv('WORKER_MAX_ATTEMPTS', 3))  # 워커 중단 시 재시도 한도
+
+# 작업 상태 (메모리 캐시 + SQLite 영구 저장)
 tasks = {}
+task_store = TaskStore(str(app.config['TASK_DB_PATH']))
+
+# 중복 제거 키 조회 ~ 작업 등록을 한 번에 처리하기 위한 잠금
+# (스레드 간: _submit_lock, 프로세스 간: TASK_DB_PATH 파일 잠금)
+_submit_lock = threading.Lock()
+
+# 미리보기용 축소 이미지 캐시
+derivative_cache = ImageDerivativeCache(str(app.config['DERIVATIVES_DIR']))
+
+# 예정된 스케줄 작업의 사전 생성 콘텐츠 (새벽 prefetch 작업 → 아침 생성 작업)
+prefetch_index = PrefetchIndex(str(app.config['PREFETCH_INDEX']))
+
+# 비디오 생성 작업 큐
+shared_backend = app.config['TASK_BACKEND'] == 'shared'
+stage_limits = {
+    'api': app.config['API_STAGE_LIMIT'],        # OpenAI API 호출 단계
+    'render': app.config['RENDER_STAGE_LIMIT']   # MoviePy/ffmpeg 렌더링 단계
+}
+
+if shared_backend:
+    job_queue = SharedJobQueue(
+        task_store,
+        max_queue_size=app.config['MAX_QUEUE_SIZE'],
+        stage_limits=stage_limits
+    )
+else:
+    job_queue = JobQueue(
+        num_workers=app.config['RENDER_WORKERS'],
+        max_queue_size=app.config['MAX_QUEUE_SIZE'],
+        stage_limits=stage_limits
+    )
 
 
 class TaskStatus:
-    """작업 상태 관리 클래스"""
+    """작업 상태 관리 클래스 (변경 시 TaskStore에 영구 저장)"""
 
-    def __init__(self, task_id):
+    def __init__(self, task_id, kind='generate', params=None, dedupe_key=None):
         self.task_id = task_id
-        self.status = 'processing'  # processing, completed, error
+        self.kind = kind  # 작업 종류 (재시작 시 실행 함수 선택용)
+        self.params = params or {}  # 작업 입력값 (재시작 시 재개용)
+        self.dedupe_key = dedupe_key  # 같은 입력의 중복 요청 병합용 키
+        self.status = 'queued'  # queued, processing, completed, error, cancelled
+        self.cancel_requested = False
+        self._cancel_checked_at = 0.0  # 공유 모드에서 마지막으로 취소 요청을 조회한 시각
+        self.owner = None  # 실행 중인 렌더 워커 ID (공유 모드, 이 워커가 작업을 가지고 있을 때만 저장)
+        self.lease_lost = False  # 임대 만료로 다른 워커에게 재배정됨 (이 워커는 중단해야 함)
         self.progress = 0
         self.current_step = ''
-        self.logs = []
+        self.logs = deque(maxlen=app.config['TASK_LOG_BUFFER'])  # 최근 로그 (링 버퍼)
+        self.log_offset = 0  # 링 버퍼에서 밀려난 로그 수 (로그 커서 = log_offset + 버퍼 내 위치)
+        self._log_lock = threading.Lock()  # logs/log_offset을 함께 읽고 쓰기 위한 잠금
+        self.checkpoints = {}  # 단계별 결과 (content, analysis, images, audio, video, metadata)
         self.result = None
         self.error = None
+        self.version = 0  # 변경될 때마다 증가 (SSE 스트림 대기용)
+        self._changed = threading.Condition()
+        self._done_callbacks = []  # 종료 시 호출할 콜백 (스케줄러 등, 이 프로세스에서 실행될 때만)
 
     def update(self, progress, step, log=None):
         """상태 업데이트"""
         self.progress = progress
         self.current_step = step
         if log:
-            self.logs.append(log)
+            with self._log_lock:
+                if len(self.logs) == self.logs.maxlen:
+                    self.log_offset += 1
+                self.logs.append(log)
+        self.save()
+
+    @property
+    def log_cursor(self):
+        """지금까지 기록된 전체 로그 수 (다음 조회의 since 값)"""
+        with self._log_lock:
+            return self.log_offset + len(self.logs)
+
+    def read_logs(self, since=None):
+        """
+        since 이후의 로그와 새 커서를 한 시점의 상태에서 함께 반환
+
+        로그와 커서를 따로 읽으면 그 사이에 추가된 로그를 건너뛰므로 update()와 같은 잠금 안에서 읽음
+
+        Args:
+            since: 로그 커서 (None이면 버퍼의 전체 로그, 링 버퍼에서 밀려난 로그는 생략)
+
+        Returns:
+            (로그 리스트, 로그 커서)
+        """
+        with self._log_lock:
+            start = 0 if since is None else max(0, since - self.log_offset)
+            return list(self.logs)[start:], self.log_offset + len(self.logs)
+
+    def wait_for_change(self, version, timeout):
+        """
+        상태가 version 이후로 변경될 때까지 대기
+
+        공유 모드에서는 다른 프로세스의 변경을 Condition으로 알 수 없으므로 DB version을 폴링
+
+        Returns:
+            현재 version (타임아웃 시 인자와 동일)
+        """
+        if shared_backend:
+            deadline = time.time() + timeout
+            while True:
+                current = task_store.get_version(self.task_id)
+                remaining = deadline - time.time()
+                if current != version or remaining <= 0:
+                    return current
+                time.sleep(min(app.config['SHARED_POLL_INTERVAL'], remaining))
+
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != version, timeout=timeout)
+            return self.version
+
+    def checkpoint(self, stage, data):
+        """단계 완료 결과 저장 (재시작 시 해당 단계 건너뛰기)"""
+        self.checkpoints[stage] = data
+        self.save()
+
+    def complete(self, result):
+        """작업 완료 처리"""
+        self.status = 'completed'
+        self.result = result
+        self.save()
+
+    def fail(self, error):
+        """작업 실패 처리"""
+        self.status = 'error'
+        self.error = str(error)
+        self.update(0, '오류 발생', f'❌ 오류: {str(error)}')
+
+    @property
+    def is_finished(self):
+        """종료 상태 여부 (완료/오류/취소)"""
+        return self.status in ('completed', 'error', 'cancelled')
+
+    def add_done_callback(self, callback):
+        """
+        작업 종료(완료/오류/취소) 시 callback(task) 호출 등록
+
+        이미 종료된 작업이면 바로 호출
+        """
+        with self._changed:
+            if not self.is_finished:
+                self._done_callbacks.append(callback)
+                return
+        callback(self)
+
+    def _run_done_callbacks(self):
+        """종료 콜백 실행 (한 번만)"""
+        with self._changed:
+            callbacks, self._done_callbacks = self._done_callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception as e:
+                print(f"⚠ 작업 종료 콜백 실패 ({self.task_id}): {e}")
+
+    def request_cancel(self):
+        """
+        작업 취소 요청
+
+        대기 중이면 큐에서 바로 제거하고, 실행 중이면 취소 플래그를 세워
+        작업 함수가 다음 단계 시작 전(렌더링 중에는 다음 프레임)에 중단하도록 함
+
+        Returns:
+            취소 요청이 받아들여졌으면 True (이미 종료된 작업이면 False)
+        """
+        if self.is_finished:
+            return False
+
+        self.cancel_requested = True
+        if job_queue.cancel(self.task_id) or not job_queue.is_running(self.task_id):
+            # 대기열에서 제거됐거나 실행 중인 워커가 없는 작업은 바로 취소 처리
+            self.mark_cancelled()
+        elif shared_backend:
+            # 다른 프로세스의 워커가 실행 중 → 취소 요청만 기록
+            # (이 프로세스의 상태 스냅샷으로 저장하면 워커의 진행 상황을 덮어쓰게 됨)
+            task_store.request_cancel(self.task_id)
+        else:
+            self.update(self.progress, '취소 중...', '⏹ 취소 요청 - 현재 단계 중단 중...')
+        return True
+
+    def is_cancel_requested(self):
+        """
+        취소 요청 여부 (공유 모드에서는 다른 프로세스의 요청도 주기적으로 조회)
+
+        임대를 잃은 워커도 True를 반환하여 작업을 중단시킴
+        """
+        if self.lease_lost:
+            return True
+        if not self.cancel_requested and shared_backend:
+            now = time.time()
+            if now - self._cancel_checked_at >= app.config['SHARED_POLL_INTERVAL']:
+                self._cancel_checked_at = now
+                self.cancel_requested = task_store.is_cancel_requested(self.task_id)
+        return self.cancel_requested
+
+    def raise_if_cancelled(self):
+        """취소 요청이 있으면 TaskCancelled 발생 (작업 함수의 단계 사이에서 호출)"""
+        if self.is_cancel_requested():
+            raise TaskCancelled(self.task_id)
+
+    def mark_cancelled(self):
+        """작업 취소 처리"""
+        self.status = 'cancelled'
+        self.update(self.progress, '취소됨', '⏹ 작업이 취소되었습니다.')
+
+    def render_logger(self, start, end, step='비디오 렌더링 중...'):
+        """렌더링 진행률을 start~end 구간으로 보고하는 MoviePy 로거 생성"""
+        return RenderProgressLogger(
+            on_progress=lambda percent: self.update(percent, step),
+            is_cancelled=self.is_cancel_requested,
+            start=start,
+            end=end
+        )
 
-    def to_dict(self):
-        """딕셔너리로 변환"""
+    def save(self):
+        """TaskStore에 현재 상태 저장"""
+        logs, cursor = self.read_logs()
+        log_offset = cursor - len(logs)
+        try:
+            saved = task_store.save({
+                'task_id': self.task_id,
+                'kind': self.kind,
+                'dedupe_key': self.dedupe_key,
+                'status': self.status,
+                'progress': self.progress,
+                'current_step': self.current_step,
+                'params': self.params,
+                'checkpoints': self.checkpoints,
+                'logs': logs,
+                'log_offset': log_offset,
+                'result': self.result,
+                'error': self.error
+            }, owner=self.owner)
+            if self.owner and not saved:
+                # 다른 워커에게 재배정된 작업 → 더 이상 상태를 덮어쓰지 않고 중단
+                self.lease_lost = True
+        except Exception as e:
+            # 저장 실패가 작업 자체를 중단시키지 않도록 함
+            print(f"⚠ 작업 상태 저장 실패 ({self.task_id}): {e}")
+
+        # 대기 중인 SSE 스트림 깨우기
+        with self._changed:
+            self.version += 1
+            self._changed.notify_all()
+
+        if self.is_finished and self._done_callbacks:
+            self._run_done_callbacks()
+
+    @classmethod
+    def from_record(cls, record):
+        """TaskStore 레코드로부터 복원"""
+        task = cls(record['task_id'], kind=record['kind'], params=record['params'],
+                   dedupe_key=record.get('dedupe_key'))
+        task.status = record['status']
+        task.progress = record['progress']
+        task.current_step = record['current_step']
+        task.logs.extend(record['logs'])
+        task.log_offset = record['log_offset']
+        task.checkpoints = record['checkpoints']
+        task.result = record['result']
+        task.error = record['error']
+        task.version = record.get('version', 0)
+        task.cancel_requested = record.get('cancel_requested', False)
+        return task
+
+    def to_dict(self, since=None):
+        """
+        딕셔너리로 변환
+
+        Args:
+            since: 로그 커서 (지정 시 해당 커서 이후의 로그만 포함)
+        """
+        logs, log_cursor = self.read_logs(since)
         return {
             'task_id': self.task_id,
+            'kind': self.kind,
             'status': self.status,
             'progress': self.progress,
             'current_step': self.current_step,
-            'logs': self.logs,
+            'queue_position': job_queue.position(self.task_id) if self.status == 'queued' else None,
+            'content': self.checkpoints.get('content'),  # 생성된 문장/퀴즈 데이터 (생성 단계 완료 후)
+            'logs': logs,
+            'log_cursor': log_cursor,
             'result': self.result,
             'error': self.error
         }
 
 
-def generate_video_task(task_id, sentences, voice='nova', quiz_data=None):
+def get_task(task_id):
+    """
+    작업 조회
+
+    local: 메모리 → TaskStore 순 (서버 재시작 후에도 조회 가능)
+    shared: 다른 프로세스가 갱신하므로 항상 TaskStore의 최신 상태
+    """
+    if shared_backend:
+        record = task_store.get(task_id)
+        return TaskStatus.from_record(record) if record else None
+
+    task = tasks.get(task_id)
+    if task is None:
+        record = task_store.get(task_id)
+        if record:
+            task = TaskStatus.from_record(record)
+            tasks[task_id] = task
+    return task
+
+
+def find_active_task(dedupe_key):
+    """같은 중복 제거 키로 대기/실행 중인 작업 조회 (없으면 None)"""
+    if shared_backend:
+        record = task_store.find_active(dedupe_key)
+        return TaskStatus.from_record(record) if record else None
+
+    for task in list(tasks.values()):
+        if task.dedupe_key == dedupe_key and not task.is_finished:
+            return task
+    return None
+
+
+def watch_task(task_id, callback):
+    """
+    작업 종료 시 callback(task) 호출 (상태 폴링 대신 사용)
+
+    local: 이 프로세스의 워커가 실행하므로 TaskStatus 종료 콜백으로 등록
+    shared: 렌더 워커 프로세스가 실행하므로 감시 스레드가 DB version 변경을 기다림
+
+    Returns:
+        작업이 존재하면 True
+    """
+    task = get_task(task_id)
+    if task is None:
+        return False
+
+    if not shared_backend:
+        task.add_done_callback(callback)
+        return True
+
+    def watch():
+        current = task
+        while not current.is_finished:
+            current.wait_for_change(current.version, timeout=app.config['SSE_KEEPALIVE'])
+            current = get_task(task_id) or current
+        callback(current)
+
+    threading.Thread(target=watch, name=f"watch-{task_id}", daemon=True).start()
+    return True
+
+
+def _files_exist(paths):
+    """체크포인트에 기록된 파일이 모두 남아있는지 확인"""
+    return all(path and Path(path).exists() for path in paths)
+
+
+# 다른 포맷 종류 (스토리 시리즈, 영화 명대사, 발음 연습, 뉴스)
+OTHER_FORMATS = ('story', 'movie', 'pronunciation', 'news')
+
+
+def build_content_request(data):
+    """
+    /api/generate 요청에서 포맷별 콘텐츠 입력값 추출 및 검증 (GPT 호출 없음)
+
+    Args:
+        data: 요청 JSON
+
+    Returns:
+        콘텐츠 입력값 딕셔너리 (format 키 + 포맷별 옵션)
+
+    Raises:
+        ValueError: 필수 입력값이 없거나 올바르지 않은 경우
+    """
+    format_type = data.get('format', 'manual')  # manual, theme, quiz, other
+
+    if format_type == 'theme':
+        # 테마별 묶음
+        if not data.get('theme'):
+            raise ValueError('주제를 선택해주세요.')
+        return {
+            'format': 'theme',
+            'theme': data['theme'],
+            'theme_detail': data.get('theme_detail', '')
+        }
+
+    if format_type == 'quiz':
+        # 퀴즈 챌린지 포맷
+        if not data.get('quiz_topic'):
+            raise ValueError('퀴즈 주제를 선택해주세요.')
+        return {
+            'format': 'quiz',
+            'quiz_topic': data['quiz_topic'],
+            'quiz_difficulty': data.get('quiz_difficulty', 'intermediate')
+        }
+
+    if format_type == 'other':
+        # 다른 포맷 (스토리 시리즈, 영화 명대사 등)
+        other_format = data.get('other_format')
+        if other_format not in OTHER_FORMATS:
+            raise ValueError(f'지원하지 않는 포맷입니다: {other_format}')
+
+        content = {'format': 'other', 'other_format': other_format}
+        if other_format == 'story':
+            content['story_theme'] = data.get('story_theme', '해외 여행')
+            content['story_day'] = int(data.get('story_day', 1))
+        elif other_format == 'movie':
+            movie_quote_id = data.get('movie_quote_id')  # 선택된 명대사 ID (없으면 None = 랜덤)
+            content['movie_quote_id'] = int(movie_quote_id) if movie_quote_id else None
+        return content
+
+    # manual 포맷 (직접 입력한 3문장)
+    sentences = data.get('sentences', [])
+    if not sentences or len(sentences) != 3:
+        raise ValueError('3개의 문장이 필요합니다.')
+
+    for sentence in sentences:
+        if not sentence.strip():
+            raise ValueError('빈 문장이 있습니다.')
+
+    return {'format': 'manual', 'sentences': sentences}
+
+
+def generate_content(api_key, content):
+    """
+    포맷별 문장/퀴즈 생성 (theme/quiz/other는 GPT 호출)
+
+    Args:
+        api_key: OpenAI API 키
+        content: build_content_request()가 반환한 콘텐츠 입력값
+
+    Returns:
+        (sentences, quiz_data) - quiz_data는 퀴즈 포맷일 때만 존재
+
+    Raises:
+        ValueError: 생성 결과 문장 개수가 올바르지 않은 경우
+    """
+    format_type = content['format']
+    quiz_data = None
+
+    if format_type == 'manual':
+        sentences = content['sentences']
+
+    elif format_type == 'theme':
+        sentence_gen = SentenceGenerator(api_key=api_key)
+        sentences = sentence_gen.generate_theme_sentences(content['theme'], content['theme_detail'])
+
+    elif format_type == 'quiz':
+        sentence_gen = SentenceGenerator(api_key=api_key)
+        quiz_data = sentence_gen.generate_quiz_content(content['quiz_topic'], content['quiz_difficulty'])
+
+        # 퀴즈 콘텐츠를 sentences로 변환 (TTS 생성용, 7개)
+        # 1. 질문 (한국어만)
+        # 2. 선택지 (영어만)
+        # 3. 정답 ("정답은 A입니다" 형태로)
+        # 4. 해설
+        # 5-7. 예문 3개
+        options_text = f"A, {quiz_data['option_a']}. B, {quiz_data['option_b']}."
+        answer_text = f"정답은 {quiz_data['correct_answer']}입니다."
+
+        sentences = [
+            quiz_data['question'],       # 1. 질문 (한국어만)
+            options_text,                # 2. 선택지 (영어만)
+            answer_text,                 # 3. 정답
+            quiz_data['explanation'],    # 4. 해설
+        ] + quiz_data['examples']        # 5-7. 예문 3개
+
+    else:
+        sentence_gen = SentenceGenerator(api_key=api_key)
+        other_format = content['other_format']
+
+        if other_format == 'story':
+            sentences = sentence_gen.generate_story_series(content['story_theme'], content['story_day'])
+        elif other_format == 'movie':
+            sentences = sentence_gen.generate_movie_quotes(selected_quote_id=content.get('movie_quote_id'))
+        elif other_format == 'pronunciation':
+            sentences = sentence_gen.generate_pronunciation_sentences()
+        else:
+            sentences = sentence_gen.generate_news_sentences()
+
+    # 최종 문장 검증 (manual은 정확히 3문장, quiz는 7개(고정), 나머지는 3~6문장 허용)
+    if not sentences:
+        raise ValueError('문장 생성 결과가 올바르지 않습니다.')
+    if format_type == 'quiz' and len(sentences) != 7:
+        raise ValueError(f'퀴즈 데이터가 올바르지 않습니다 ({len(sentences)}개). 7개여야 합니다.')
+    if format_type in ('theme', 'other') and not 3 <= len(sentences) <= 6:
+        raise ValueError(f'문장 개수가 올바르지 않습니다 ({len(sentences)}개). 3~6개여야 합니다.')
+
+    return sentences, quiz_data
+
+
+def generate_video_task(task_id, content=None, voice='nova', sentences=None, quiz_data=None, run_key=None):
     """
     백그라운드에서 비디오 생성 작업 실행
 
+    첫 단계에서 포맷별 문장/퀴즈를 생성한 뒤 이미지/음성/비디오를 생성함
+    이전 실행의 체크포인트가 있으면 완료된 단계는 건너뜀
+    (서버 재시작으로 중단된 작업 재개 시 API 비용/렌더링 시간 절약)
+
     Args:
         task_id: 작업 ID
-        sentences: 영어 문장 리스트
+        content: 콘텐츠 입력값 (build_content_request() 결과)
         voice: TTS 음성
-        quiz_data: 퀴즈 데이터 (퀴즈 포맷일 때만)
+        sentences: 영어 문장 리스트 (content 도입 전 저장된 작업 재개용)
+        quiz_data: 퀴즈 데이터 (content 도입 전 저장된 작업 재개용)
+        run_key: 스케줄러 실행 키 ('<슬롯>@<날짜>', 해당 실행의 사전 생성 콘텐츠 조회용)
     """
     task = tasks[task_id]
+    task.status = 'processing'
+    checkpoints = task.checkpoints
 
     try:
         # API 키 확인
@@ -101,6 +603,28 @@ def generate_video_task(task_id, sentences, voice='nova', quiz_data=None):
         for dir_path in [audio_dir, videos_dir, metadata_dir, resources_dir]:
             dir_path.mkdir(parents=True, exist_ok=True)
 
+        # 사전 생성된 문장/분석/이미지가 있으면 체크포인트로 사용 (음성은 캐시에서 복사)
+        if content and not checkpoints:
+            prefetched = prefetch_index.take(request_hash(content), run_key=run_key)
+            if prefetched:
+                checkpoints.update(prefetched)
+                task.update(1, '사전 생성 콘텐츠 사용', f'♻ 사전 생성된 콘텐츠 사용 (준비된 단계: {", ".join(prefetched)})')
+
+        # 0. 콘텐츠(문장/퀴즈) 생성
+        if 'content' in checkpoints:
+            sentences = checkpoints['content']['sentences']
+            quiz_data = checkpoints['content']['quiz_data']
+        else:
+            if sentences is None:
+                task.update(1, '문장 생성 중...', '⏳ 콘텐츠 생성 중...')
+                try:
+                    with job_queue.stage('api'):
+                        sentences, quiz_data = generate_content(api_key, content)
+                except Exception as e:
+                    raise RuntimeError(f'문장 생성 실패: {e}') from e
+            task.checkpoint('content', {'sentences': sentences, 'quiz_data': quiz_data})
+            task.update(3, '문장 생성 완료', f'✅ 문장 {len(sentences)}개 준비 완료')
+
         # 리소스 매니저 초기화 (캐싱 활성화)
         resource_manager = ResourceManager(str(resources_dir))
 
@@ -114,93 +638,133 @@ def generate_video_task(task_id, sentences, voice='nova', quiz_data=None):
             except Exception as e:
                 print(f"⚠ 배경 음악 다운로드 실패 (배경 음악 없이 계속 진행): {e}")
 
+        image_gen = ImageGenerator(api_key=api_key, resource_manager=resource_manager, use_cache=True)
+
         # 퀴즈 포맷이 아닐 때만 이미지 생성
         if not quiz_data:
-            # 1. 콘텐츠 분석
-            task.update(10, '문장 분석 중...', '✅ 문장 분석 시작')
-            analyzer = ContentAnalyzer(api_key=api_key)
-            analysis = analyzer.analyze_sentences(sentences)
-            task.update(15, '문장 분석 완료', f'✅ 문장 분석 완료 - 이미지 {analysis["num_images"]}개 생성 예정')
+            task.raise_if_cancelled()
 
-            # 1.5. 바이럴 훅 문구 생성 (AI 자동)
-            task.update(17, '훅 문구 생성 중...', '⏳ AI 훅 문구 생성 중...')
-            hook_phrase = analyzer.generate_hook_phrase(sentences)
-            task.update(20, '훅 문구 생성 완료', f'✅ 훅 문구: {hook_phrase}')
+            # 1. 콘텐츠 분석
+            if 'analysis' in checkpoints:
+                analysis = checkpoints['analysis']['analysis']
+                hook_phrase = checkpoints['analysis']['hook_phrase']
+                task.update(20, '문장 분석 완료', '♻ 이전 문장 분석 결과 재사용')
+            else:
+                task.update(10, '문장 분석 중...', '✅ 문장 분석 시작')
+                analyzer = ContentAnalyzer(api_key=api_key)
+                with job_queue.stage('api'):
+                    analysis = analyzer.analyze_sentences(sentences)
+                task.update(15, '문장 분석 완료', f'✅ 문장 분석 완료 - 이미지 {analysis["num_images"]}개 생성 예정')
+
+                # 1.5. 바이럴 훅 문구 생성 (AI 자동)
+                task.update(17, '훅 문구 생성 중...', '⏳ AI 훅 문구 생성 중...')
+                with job_queue.stage('api'):
+                    hook_phrase = analyzer.generate_hook_phrase(sentences)
+                task.update(20, '훅 문구 생성 완료', f'✅ 훅 문구: {hook_phrase}')
+                task.checkpoint('analysis', {'analysis': analysis, 'hook_phrase': hook_phrase})
 
             # 2. 이미지 생성 (모든 이미지는 resources/images에서 캐싱 관리)
-            task.update(25, '이미지 생성 중...', '⏳ 이미지 생성 시작')
-            image_gen = ImageGenerator(api_key=api_key, resource_manager=resource_manager, use_cache=True)
-            image_paths = []
-
-            for idx, prompt in enumerate(analysis['prompts']):
-                # 이미지를 resources/images에 직접 저장 (캐싱 + 재사용)
-                # output_path를 resource_manager 경로로 설정하여 중복 저장 방지
-                output_path = resource_manager.get_image_path(prompt)
-
-                image_path = image_gen.generate_image(
-                    prompt=prompt,
-                    output_path=str(output_path)
-                )
-                image_paths.append(image_path)
-                progress = 25 + (idx + 1) * (25 // len(analysis['prompts']))
-                task.update(progress, f'이미지 {idx+1}/{len(analysis["prompts"])} 생성 완료',
-                           f'✅ 이미지 {idx+1} 생성 완료')
+            if 'images' in checkpoints and _files_exist(checkpoints['images']):
+                image_paths = checkpoints['images']
+                task.update(50, '이미지 생성 완료', f'♻ 이전 이미지 {len(image_paths)}개 재사용')
+            else:
+                task.update(25, '이미지 생성 중...', '⏳ 이미지 생성 시작')
+                image_paths = []
+
+                for idx, prompt in enumerate(analysis['prompts']):
+                    task.raise_if_cancelled()
+
+                    # 이미지를 resources/images에 직접 저장 (캐싱 + 재사용)
+                    # output_path를 resource_manager 경로로 설정하여 중복 저장 방지
+                    output_path = resource_manager.get_image_path(prompt)
+
+                    with job_queue.stage('api'):
+                        image_path = image_gen.generate_image(
+                            prompt=prompt,
+                            output_path=str(output_path)
+                        )
+                    image_paths.append(image_path)
+                    progress = 25 + (idx + 1) * (25 // len(analysis['prompts']))
+                    task.update(progress, f'이미지 {idx+1}/{len(analysis["prompts"])} 생성 완료',
+                               f'✅ 이미지 {idx+1} 생성 완료')
+                task.checkpoint('images', image_paths)
         else:
             # 퀴즈 포맷은 이미지 생성 건너뛰기
             task.update(25, '퀴즈 모드: 이미지 생성 건너뛰기', '✅ 퀴즈 포맷 (텍스트 기반)')
-            image_gen = ImageGenerator(api_key=api_key, resource_manager=resource_manager, use_cache=True)
             image_paths = []
             analysis = {'image_groups': [], 'translations': []}
             hook_phrase = None
 
         # 3. 음성 생성 (각 문장별로 3가지 음성 생성 - 학습 효과 향상)
-        task.update(55, '음성 생성 중...', '⏳ 음성 생성 시작 (3가지 음성)')
-        tts_gen = TTSGenerator(api_key=api_key, resource_manager=resource_manager, use_cache=True)
+        task.raise_if_cancelled()
+        audio_checkpoint = checkpoints.get('audio')
+        if audio_checkpoint and _files_exist(
+            voice_info['path'] for info in audio_checkpoint for voice_info in info['voices'].values()
+        ):
+            audio_info = audio_checkpoint
+            task.update(70, '음성 생성 완료', '♻ 이전 음성 파일 재사용')
+        else:
+            task.update(55, '음성 생성 중...', '⏳ 음성 생성 시작 (3가지 음성)')
+            tts_gen = TTSGenerator(api_key=api_key, resource_manager=resource_manager, use_cache=True)
 
-        audio_info = tts_gen.generate_speech_per_sentence_multi_voice(
-            sentences=sentences,
-            output_dir=str(audio_dir)
-        )
-        # 평균 duration 계산 (alloy 기준)
-        total_audio_duration = sum(info['voices']['alloy']['duration'] for info in audio_info)
-        task.update(70, '음성 생성 완료', f'✅ 음성 생성 완료 (3가지 음성, 평균 {total_audio_duration:.1f}초)')
+            with job_queue.stage('api'):
+                audio_info = tts_gen.generate_speech_per_sentence_multi_voice(
+                    sentences=sentences,
+                    output_dir=str(audio_dir)
+                )
+            # 평균 duration 계산 (alloy 기준)
+            total_audio_duration = sum(info['voices']['alloy']['duration'] for info in audio_info)
+            task.update(70, '음성 생성 완료', f'✅ 음성 생성 완료 (3가지 음성, 평균 {total_audio_duration:.1f}초)')
+            task.checkpoint('audio', audio_info)
 
         # 4. 비디오 생성 (바이럴 훅 포함 or 퀴즈 포맷)
-        task.update(75, '비디오 생성 중...', '⏳ 비디오 생성 시작 (3-5분 소요)')
-        video_creator = VideoCreator(image_generator=image_gen, resource_manager=resource_manager)
+        task.raise_if_cancelled()
         video_path = videos_dir / f'daily_english_{task_id}.mp4'
 
-        try:
-            print(f"[DEBUG] 비디오 생성 시작: {video_path}")
-            task.update(77, '비디오 합성 중...', '⏳ MoviePy로 클립 합성 중...')
-
-            # 퀴즈 포맷이면 별도 함수 사용
-            if quiz_data:
-                print("[DEBUG] 퀴즈 비디오 생성 모드")
-                video_creator.create_quiz_video(
-                    quiz_data=quiz_data,
-                    audio_info=audio_info,
-                    output_path=str(video_path)
-                )
-            else:
-                print("[DEBUG] 일반 비디오 생성 모드")
-                video_creator.create_video(
-                    sentences=sentences,
-                    image_paths=image_paths,
-                    audio_info=audio_info,
-                    output_path=str(video_path),
-                    image_groups=analysis['image_groups'],
-                    translations=analysis.get('translations', []),
-                    hook_phrase=hook_phrase  # AI 자동 생성 바이럴 훅
-                )
+        if 'video' in checkpoints and video_path.exists():
+            task.update(90, '비디오 생성 완료', '♻ 이전에 렌더링된 비디오 재사용')
+        else:
+            task.update(75, '비디오 생성 중...', '⏳ 비디오 생성 시작 (3-5분 소요)')
+            video_creator = VideoCreator(image_generator=image_gen, resource_manager=resource_manager)
+            video_creator.render_logger = task.render_logger(78, 90)
 
-            print(f"[DEBUG] 비디오 생성 완료: {video_path.exists()}")
-            task.update(90, '비디오 생성 완료', '✅ 비디오 생성 완료')
-        except Exception as video_error:
-            print(f"[ERROR] 비디오 생성 실패: {video_error}")
-            raise video_error
+            try:
+                print(f"[DEBUG] 비디오 생성 시작: {video_path}")
+                task.update(77, '비디오 합성 중...', '⏳ MoviePy로 클립 합성 중...')
+
+                # 렌더링 동시 실행 한도 (CPU 바운드 단계)
+                with job_queue.stage('render'):
+                    task.raise_if_cancelled()
+
+                    # 퀴즈 포맷이면 별도 함수 사용
+                    if quiz_data:
+                        print("[DEBUG] 퀴즈 비디오 생성 모드")
+                        video_creator.create_quiz_video(
+                            quiz_data=quiz_data,
+                            audio_info=audio_info,
+                            output_path=str(video_path)
+                        )
+                    else:
+                        print("[DEBUG] 일반 비디오 생성 모드")
+                        video_creator.create_video(
+                            sentences=sentences,
+                            image_paths=image_paths,
+                            audio_info=audio_info,
+                            output_path=str(video_path),
+                            image_groups=analysis['image_groups'],
+                            translations=analysis.get('translations', []),
+                            hook_phrase=hook_phrase  # AI 자동 생성 바이럴 훅
+                        )
+
+                print(f"[DEBUG] 비디오 생성 완료: {video_path.exists()}")
+                task.update(90, '비디오 생성 완료', '✅ 비디오 생성 완료')
+                task.checkpoint('video', str(video_path))
+            except Exception as video_error:
+                print(f"[ERROR] 비디오 생성 실패: {video_error}")
+                raise video_error
 
         # 4.5. 편집 설정 자동 저장 (편집 기능용)
+        task.raise_if_cancelled()
         task.update(92, '편집 설정 저장 중...', '⏳ 편집 설정 생성 중...')
         config_dir = output_dir / 'edit_configs'
         config_manager = ConfigManager(str(config_dir))
@@ -217,27 +781,378 @@ def generate_video_task(task_id, sentences, voice='nova', quiz_data=None):
         task.update(94, '편집 설정 저장 완료', f'✅ 편집 설정 저장 완료: {config_path}')
 
         # 5. 유튜브 메타정보 생성
-        task.update(96, '메타정보 생성 중...', '⏳ 메타정보 생성 시작')
-        metadata_gen = YouTubeMetadataGenerator(api_key=api_key)
-        metadata = metadata_gen.generate_metadata(sentences)
-
         metadata_path = metadata_dir / f'metadata_{task_id}.json'
-        metadata_gen.save_metadata(metadata, str(metadata_path))
-        task.update(100, '완료!', '✅ 모든 작업 완료!')
+
+        if 'metadata' in checkpoints and metadata_path.exists():
+            metadata = checkpoints['metadata']
+            task.update(100, '완료!', '♻ 이전 메타정보 재사용')
+        else:
+            task.update(96, '메타정보 생성 중...', '⏳ 메타정보 생성 시작')
+            metadata_gen = YouTubeMetadataGenerator(api_key=api_key)
+            with job_queue.stage('api'):
+                metadata = metadata_gen.generate_metadata(sentences)
+
+            metadata_gen.save_metadata(metadata, str(metadata_path))
+            task.checkpoint('metadata', metadata)
+            task.update(100, '완료!', '✅ 모든 작업 완료!')
 
         # 작업 완료
-        task.status = 'completed'
-        task.result = {
+        task.complete({
             'video_path': f'/api/download/{task_id}/video',
             'video_filename': f'daily_english_{task_id}.mp4',
             'metadata': metadata,
             'metadata_path': f'/api/download/{task_id}/metadata'
-        }
+        })
+
+    except TaskCancelled:
+        task.mark_cancelled()
+    except Exception as e:
+        task.fail(e)
+
+
+def regenerate_video_task(task_id, video_id, config):
+    """
+    백그라운드에서 편집된 설정으로 비디오 재생성
+
+    작업별 임시 파일에 렌더링한 뒤 {video_id}_edited.mp4로 교체하므로
+    설정이 다른 재생성 요청이 동시에 실행되어도 결과 파일이 깨지지 않음
+
+    Args:
+        task_id: 작업 ID
+        video_id: 비디오 ID
+        config: 편집 설정 (요청 시점의 설정 스냅샷)
+    """
+    task = tasks[task_id]
+    task.status = 'processing'
+
+    videos_dir = app.config['OUTPUT_DIR'] / 'videos'
+    final_path = videos_dir / f'{video_id}_edited.mp4'
+    temp_path = videos_dir / f'{video_id}_edited.{task_id}.mp4'
 
+    try:
+        task.update(5, '재생성 준비 중...', f'⏳ 편집 설정 적용 중 (버전 {config.get("version", "-")})')
+        video_editor = VideoEditor(str(app.config['OUTPUT_DIR'] / 'edit_configs'), str(videos_dir))
+        start_time = time.time()
+
+        # 렌더링 동시 실행 한도 (CPU 바운드 단계)
+        with job_queue.stage('render'):
+            task.raise_if_cancelled()
+            task.update(10, '비디오 렌더링 중...', '⏳ 편집된 설정으로 비디오 렌더링 중 (3-5분 소요)')
+            video_editor.regenerate_video(
+                video_id,
+                config,
+                output_path=str(temp_path),
+                render_logger=task.render_logger(10, 95)
+            )
+
+        os.replace(temp_path, final_path)
+        processing_time = round(time.time() - start_time, 2)
+
+        task.update(100, '완료!', f'✅ 비디오 재생성 완료 ({processing_time}초)')
+        task.complete({
+            'video_id': video_id,
+            'video_path': f'/api/download/{video_id}/video_edited',
+            'processing_time': processing_time
+        })
+
+    except TaskCancelled:
+        task.mark_cancelled()
+    except Exception as e:
+        task.fail(e)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def prefetch_content_task(task_id, items):
+    """
+    예정된 생성 작업의 문장/분석/이미지/음성을 미리 생성 (새벽 사전 생성 작업)
+
+    이미지/음성은 생성 작업과 같은 ResourceManager 캐시 키로 저장하고,
+    문장/분석/이미지 체크포인트는 PrefetchIndex에 기록하여
+    같은 입력값의 생성 작업이 렌더링 단계부터 시작하도록 함
+    항목별로 단계가 끝날 때마다 기록하므로 중단 후 다시 실행하면 남은 단계만 생성
+
+    Args:
+        task_id: 작업 ID
+        items: 사전 생성 대상 [{'key': '<슬롯>@<날짜>', 'date': 'YYYY-MM-DD', 'content': 콘텐츠 입력값}, ...]
+    """
+    task = tasks[task_id]
+    task.status = 'processing'
+
+    try:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다.")
+
+        resources_dir = app.config['OUTPUT_DIR'] / 'resources'
+        resources_dir.mkdir(parents=True, exist_ok=True)
+        resource_manager = ResourceManager(str(resources_dir))
+        image_gen = ImageGenerator(api_key=api_key, resource_manager=resource_manager, use_cache=True)
+        tts_gen = TTSGenerator(api_key=api_key, resource_manager=resource_manager, use_cache=True)
+        analyzer = ContentAnalyzer(api_key=api_key)
+
+        expired = prefetch_index.prune()
+        if expired:
+            task.update(0, '사전 생성 준비 중...', f'🗑 지난 날짜의 사전 생성 항목 {expired}개 정리')
+
+        prepared = skipped = 0
+        for idx, item in enumerate(items):
+            task.raise_if_cancelled()
+            key = item['key']
+            progress = idx * 100 // len(items)
+
+            if prefetch_index.is_ready(key):
+                skipped += 1
+                task.update(progress, f'{key} 준비됨', f'♻ 이미 준비됨: {key}')
+                continue
+
+            entry = prefetch_index.get(key)
+            stages = entry['checkpoints'] if entry else {}
+            content_key = request_hash(item['content'])
+            task.update(progress, f'{key} 사전 생성 중...', f'⏳ {key} 사전 생성 시작')
+
+            # 1. 문장/퀴즈
+            if 'content' not in stages:
+                with job_queue.stage('api'):
+                    sentences, quiz_data = generate_content(api_key, item['content'])
+                stages['content'] = {'sentences': sentences, 'quiz_data': quiz_data}
+                prefetch_index.put(key, content_key, item['date'], stages, ready=False)
+            sentences = stages['content']['sentences']
+            quiz_data = stages['content']['quiz_data']
+
+            # 2. 분석 + 이미지 (퀴즈 포맷은 이미지 없음)
+            if not quiz_data:
+                if 'analysis' not in stages:
+                    with job_queue.stage('api'):
+                        analysis = analyzer.analyze_sentences(sentences)
+                        hook_phrase = analyzer.generate_hook_phrase(sentences)
+                    stages['analysis'] = {'analysis': analysis, 'hook_phrase': hook_phrase}
+                    prefetch_index.put(key, content_key, item['date'], stages, ready=False)
+
+                if not _files_exist(stages.get('images') or [None]):
+                    image_paths = []
+                    for prompt in stages['analysis']['analysis']['prompts']:
+                        task.raise_if_cancelled()
+                        with job_queue.stage('api'):
+                            image_paths.append(image_gen.generate_image(
+                                prompt=prompt,
+                                output_path=str(resource_manager.get_image_path(prompt))
+                            ))
+                    stages['images'] = image_paths
+                    prefetch_index.put(key, content_key, item['date'], stages, ready=False)
+
+            # 3. 음성 (생성 작업과 같은 캐시 키로 캐시에만 저장)
+            for sentence in sentences:
+                for voice in DEFAULT_VOICES:
+                    task.raise_if_cancelled()
+                    if resource_manager.audio_exists(sentence, voice):
+                        continue
+                    with job_queue.stage('api'):
+                        tts_gen.generate_speech(sentence, resource_manager.get_audio_path(sentence, voice), voice)
+
+            prefetch_index.put(key, content_key, item['date'], stages, ready=True)
+            prepared += 1
+            task.update((idx + 1) * 100 // len(items), f'{key} 준비 완료', f'✅ {key} 준비 완료 (문장 {len(sentences)}개)')
+
+        task.update(100, '완료!', f'✅ 사전 생성 완료 (새로 준비 {prepared}개, 이미 준비됨 {skipped}개)')
+        task.complete({
+            'prepared': prepared,
+            'skipped': skipped,
+            'items': [item['key'] for item in items]
+        })
+
+    except TaskCancelled:
+        task.mark_cancelled()
     except Exception as e:
-        task.status = 'error'
-        task.error = str(e)
-        task.update(0, '오류 발생', f'❌ 오류: {str(e)}')
+        task.fail(e)
+
+
+# 작업 종류별 실행 함수 (재시작 시 params로 다시 호출)
+TASK_RUNNERS = {
+    'generate': generate_video_task,
+    'regenerate': regenerate_video_task,
+    'prefetch': prefetch_content_task,
+}
+
+
+def submit_task(task):
+    """TaskStatus를 작업 큐에 제출 (params를 실행 함수 인자로 전달)"""
+    runner = TASK_RUNNERS[task.kind]
+    return job_queue.submit(task.task_id, runner, task.task_id, **task.params)
+
+
+def run_render_worker(worker_id=None):
+    """
+    렌더 워커 루프 (공유 모드 전용, render_worker.py에서 실행)
+
+    TaskStore의 queued 작업을 가져와 TASK_RUNNERS로 실행하고,
+    진행 상황/체크포인트/결과는 TaskStore에 저장되어 웹 프로세스에서 조회됨
+
+    Args:
+        worker_id: 워커 ID (기본: 호스트명-PID)
+    """
+    if not shared_backend:
+        raise RuntimeError("렌더 워커는 TASK_BACKEND=shared 모드에서만 실행할 수 있습니다.")
+
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    kinds = list(TASK_RUNNERS)
+    lease_seconds = app.config['WORKER_LEASE_SECONDS']
+    print(f"🛠 렌더 워커 시작: {worker_id} (작업 종류: {', '.join(kinds)}, 임대 {lease_seconds:.0f}초)")
+
+    while True:
+        # 죽은 워커의 작업 회수 (어느 워커든 수행)
+        for expired in task_store.requeue_expired(app.config['WORKER_MAX_ATTEMPTS']):
+            print(f"♻ 임대 만료 작업 회수: {expired['task_id']} "
+                  f"(워커 {expired['claimed_by']}, {expired['attempts']}회 시도 → {expired['status']})")
+
+        record = task_store.claim_next(worker_id, kinds, lease_seconds=lease_seconds)
+        if record is None:
+            time.sleep(app.config['WORKER_POLL_INTERVAL'])
+            continue
+
+        task = TaskStatus.from_record(record)
+        task.owner = worker_id
+        tasks[task.task_id] = task
+        print(f"▶ 작업 시작: {task.task_id} ({task.kind}, {record['attempts']}번째 시도)")
+
+        if record['attempts'] > 1:
+            completed_stages = ', '.join(task.checkpoints.keys()) or '없음'
+            task.update(task.progress, '다른 워커에서 재개 중...',
+                        f'♻ 워커 중단 감지 - {worker_id}에서 재개 (완료 단계: {completed_stages})')
+
+        stop_heartbeat = threading.Event()
+        heartbeat = threading.Thread(
+            target=_heartbeat_loop,
+            args=(task, worker_id, lease_seconds, stop_heartbeat),
+            name=f"heartbeat-{task.task_id}",
+            daemon=True
+        )
+        heartbeat.start()
+
+        try:
+            TASK_RUNNERS[task.kind](task.task_id, **task.params)
+        finally:
+            stop_heartbeat.set()
+            heartbeat.join()
+            tasks.pop(task.task_id, None)
+
+        if task.lease_lost:
+            print(f"⚠ 작업 임대 상실 - 다른 워커에게 재배정됨: {task.task_id}")
+        else:
+            print(f"■ 작업 종료: {task.task_id} ({task.status})")
+
+
+def _heartbeat_loop(task, worker_id, lease_seconds, stop_event):
+    """작업 실행 중 임대 기간의 1/3마다 임대 연장 (연장 실패 시 작업 중단 표시)"""
+    while not stop_event.wait(lease_seconds / 3):
+        if task.is_finished:
+            return
+        try:
+            if not task_store.heartbeat(task.task_id, worker_id, lease_seconds) and not task.is_finished:
+                task.lease_lost = True
+                return
+        except Exception as e:
+            # 일시적인 DB 잠금 등은 다음 주기에 다시 시도
+            print(f"⚠ heartbeat 실패 ({task.task_id}): {e}")
+
+
+def enqueue_task(kind, params):
+    """
+    작업 등록 (같은 종류/입력값으로 대기/실행 중인 작업이 있으면 기존 작업 반환)
+
+    Args:
+        kind: 작업 종류 (TASK_RUNNERS 키)
+        params: 실행 함수 인자 (재시작 시 재개용으로 함께 저장)
+
+    Returns:
+        (TaskStatus, 중복 요청 여부)
+
+    Raises:
+        QueueFullError: 작업 큐가 가득 찬 경우
+    """
+    dedupe_key = f'{kind}:{request_hash(params)}'
+
+    with _submit_lock, file_lock(app.config['TASK_DB_PATH']):
+        task = find_active_task(dedupe_key)
+        if task is not None:
+            return task, True
+
+        # 작업 상태 초기화
+        task_id = new_task_id()
+        task = TaskStatus(task_id, kind=kind, params=params, dedupe_key=dedupe_key)
+        tasks[task_id] = task
+        task.update(0, '작업 대기 중...')
+
+        # 작업 큐에 제출
+        try:
+            submit_task(task)
+        except QueueFullError:
+            tasks.pop(task_id, None)
+            task_store.delete(task_id)
+            raise
+
+    return task, False
+
+
+def enqueue_generate(content, voice='nova', run_key=None):
+    """
+    비디오 생성 작업 등록 (/api/generate, 스케줄러 공용)
+
+    Args:
+        content: build_content_request()가 반환한 콘텐츠 입력값
+        voice: TTS 음성
+        run_key: 스케줄러 실행 키 ('<슬롯>@<날짜>', 스케줄 작업만 지정)
+
+    Returns:
+        (TaskStatus, 중복 요청 여부)
+
+    Raises:
+        QueueFullError: 작업 큐가 가득 찬 경우
+    """
+    params = {'content': content, 'voice': voice}
+    if run_key:
+        params['run_key'] = run_key
+    return enqueue_task('generate', params)
+
+
+def enqueue_prefetch(items):
+    """
+    사전 생성 작업 등록 (스케줄러의 새벽 슬롯)
+
+    Args:
+        items: prefetch_content_task()의 사전 생성 대상 목록
+
+    Returns:
+        (TaskStatus, 중복 요청 여부)
+
+    Raises:
+        QueueFullError: 작업 큐가 가득 찬 경우
+    """
+    return enqueue_task('prefetch', {'items': items})
+
+
+def recover_interrupted_tasks():
+    """
+    서버 재시작 시 중단된 작업 복구
+
+    queued/processing 상태로 남아있는 작업을 다시 큐에 넣고,
+    실행 함수는 체크포인트를 보고 마지막 완료 단계 다음부터 재개함
+    """
+    for record in task_store.list_unfinished():
+        task = TaskStatus.from_record(record)
+        if task.kind not in TASK_RUNNERS:
+            continue
+
+        task.status = 'queued'
+        tasks[task.task_id] = task
+        completed_stages = ', '.join(task.checkpoints.keys()) or '없음'
+        task.update(task.progress, '재시작 후 대기 중...', f'♻ 서버 재시작 - 작업 재개 (완료 단계: {completed_stages})')
+
+        try:
+            submit_task(task)
+            print(f"♻ 중단된 작업 복구: {task.task_id} (완료 단계: {completed_stages})")
+        except QueueFullError:
+            task.fail('서버 재시작 후 작업 큐가 가득 차 재개하지 못했습니다.')
 
 
 # ==================== 라우트 ====================
@@ -256,161 +1171,153 @@ def editor():
 
 @app.route('/api/generate', methods=['POST'])
 def generate():
-    """비디오 생성 API (포맷별 분기 처리)"""
+    """
+    비디오 생성 API (포맷별 분기 처리)
+
+    입력값만 검증하고 바로 작업 ID를 반환함
+    theme/quiz/other 포맷의 문장 생성(GPT 호출)은 백그라운드 작업의 첫 단계에서 실행되며,
+    생성된 문장/퀴즈 데이터는 작업 상태의 content 필드로 확인
+
+    같은 입력값(포맷, 문장/주제, 음성)으로 대기/실행 중인 작업이 있으면
+    새 작업을 만들지 않고 기존 작업 ID를 반환 (더블 클릭, 스케줄러 재시도)
+    """
     try:
         data = request.get_json()
-        format_type = data.get('format', 'manual')  # manual, theme, quiz, other
         voice = data.get('voice', 'nova')
-        sentences = data.get('sentences', [])  # manual 포맷용
-        quiz_data = None  # 퀴즈 포맷용 데이터
 
         # API 키 확인
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
+        if not os.getenv("OPENAI_API_KEY"):
             return jsonify({'error': 'OPENAI_API_KEY가 설정되지 않았습니다.'}), 500
 
-        # 포맷별 문장 생성
-        if format_type == 'theme':
-            # 테마별 묶음
-            theme = data.get('theme')
-            theme_detail = data.get('theme_detail', '')
-
-            if not theme:
-                return jsonify({'error': '주제를 선택해주세요.'}), 400
-
-            # SentenceGenerator로 문장 생성
-            try:
-                sentence_gen = SentenceGenerator(api_key=api_key)
-                sentences = sentence_gen.generate_theme_sentences(theme, theme_detail)
-            except Exception as e:
-                return jsonify({'error': f'문장 생성 실패: {str(e)}'}), 500
-
-        elif format_type == 'quiz':
-            # 퀴즈 챌린지 포맷
-            quiz_topic = data.get('quiz_topic')
-            quiz_difficulty = data.get('quiz_difficulty', 'intermediate')
+        # 포맷별 입력 검증 → 작업 입력값
+        try:
+            content = build_content_request(data)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
 
-            if not quiz_topic:
-                return jsonify({'error': '퀴즈 주제를 선택해주세요.'}), 400
+        try:
+            task, deduplicated = enqueue_generate(content, voice)
+        except QueueFullError as e:
+            response = jsonify({'error': str(e), 'retry_after': e.retry_after})
+            response.headers['Retry-After'] = str(e.retry_after)
+            return response, 429
 
-            # SentenceGenerator로 퀴즈 콘텐츠 생성
-            try:
-                sentence_gen = SentenceGenerator(api_key=api_key)
-                quiz_content = sentence_gen.generate_quiz_content(quiz_topic, quiz_difficulty)
-
-                # 퀴즈 콘텐츠를 sentences로 변환 (TTS 생성용, 7개로 변경)
-                # 1. 질문 (한국어만)
-                # 2. 선택지 (영어만)
-                # 3. 정답 ("정답은 A입니다" 형태로)
-                # 4. 해설
-                # 5-7. 예문 3개
-                question_text = quiz_content['question']  # 한국어만
-                options_text = f"A, {quiz_content['option_a']}. B, {quiz_content['option_b']}."  # 영어만
-                answer_text = f"정답은 {quiz_content['correct_answer']}입니다."
-
-                sentences = [
-                    question_text,              # 1. 질문 (한국어만)
-                    options_text,               # 2. 선택지 (영어만)
-                    answer_text,                # 3. 정답
-                    quiz_content['explanation'],   # 4. 해설
-                ] + quiz_content['examples']       # 5-7. 예문 3개
-
-                # CRITICAL: quiz_data를 비디오 생성 함수에 전달하기 위해 변수에 저장
-                quiz_data = quiz_content  # 퀴즈 데이터를 thread에 전달
+        return jsonify({
+            'task_id': task.task_id,
+            'status': task.status,
+            'queue_position': job_queue.position(task.task_id) if task.status == 'queued' else None,
+            'format': content['format'],
+            'deduplicated': deduplicated,
+            'message': '이미 진행 중인 동일한 작업에 연결되었습니다.' if deduplicated else '비디오 생성이 시작되었습니다.'
+        })
 
-            except Exception as e:
-                return jsonify({'error': f'퀴즈 생성 실패: {str(e)}'}), 500
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
 
-        elif format_type == 'other':
-            # 다른 포맷 (스토리 시리즈, 영화 명대사 등)
-            other_format = data.get('other_format')  # story, movie, pronunciation, news
 
-            try:
-                sentence_gen = SentenceGenerator(api_key=api_key)
+@app.route('/api/status/<task_id>')
+def get_status(task_id):
+    """
+    작업 상태 조회 API
 
-                if other_format == 'story':
-                    story_theme = data.get('story_theme', '해외 여행')
-                    story_day = int(data.get('story_day', 1))
-                    sentences = sentence_gen.generate_story_series(story_theme, story_day)
+    Query:
+        since: 로그 커서 (이전 응답의 log_cursor) - 지정 시 새 로그만 반환
+    """
+    task = get_task(task_id)
 
-                elif other_format == 'movie':
-                    movie_quote_id = data.get('movie_quote_id')  # 선택된 명대사 ID (없으면 None = 랜덤)
-                    if movie_quote_id:
-                        movie_quote_id = int(movie_quote_id)
-                    sentences = sentence_gen.generate_movie_quotes(selected_quote_id=movie_quote_id)
+    if not task:
+        return jsonify({'error': '작업을 찾을 수 없습니다.'}), 404
 
-                elif other_format == 'pronunciation':
-                    sentences = sentence_gen.generate_pronunciation_sentences()
+    return jsonify(task.to_dict(since=request.args.get('since', type=int)))
 
-                elif other_format == 'news':
-                    sentences = sentence_gen.generate_news_sentences()
 
-                else:
-                    return jsonify({'error': f'지원하지 않는 포맷입니다: {other_format}'}), 400
+@app.route('/api/status/<task_id>/cancel', methods=['POST'])
+def cancel_task(task_id):
+    """
+    작업 취소 API
 
-            except Exception as e:
-                return jsonify({'error': f'문장 생성 실패: {str(e)}'}), 500
+    대기 중인 작업은 즉시 취소되고, 실행 중인 작업은 현재 단계가 끝나기 전에
+    (렌더링 중이면 다음 프레임에서) 중단됨
+    """
+    task = get_task(task_id)
 
-        else:
-            # manual 포맷 (기존 로직)
-            # 입력 검증
-            if not sentences or len(sentences) != 3:
-                return jsonify({'error': '3개의 문장이 필요합니다.'}), 400
+    if not task:
+        return jsonify({'error': '작업을 찾을 수 없습니다.'}), 404
 
-            for sentence in sentences:
-                if not sentence.strip():
-                    return jsonify({'error': '빈 문장이 있습니다.'}), 400
-
-        # 최종 문장 검증 (모든 포맷 공통)
-        if not sentences:
-            return jsonify({'error': '문장 생성 결과가 올바르지 않습니다.'}), 500
-
-        # manual 모드는 정확히 3문장, quiz는 7개(고정), 나머지는 3~6문장 허용
-        if format_type == 'manual':
-            if len(sentences) != 3:
-                return jsonify({'error': '3개의 문장이 필요합니다.'}), 400
-        elif format_type == 'quiz':
-            if len(sentences) != 7:
-                return jsonify({'error': f'퀴즈 데이터가 올바르지 않습니다 ({len(sentences)}개). 7개여야 합니다.'}), 500
-        else:
-            if len(sentences) < 3 or len(sentences) > 6:
-                return jsonify({'error': f'문장 개수가 올바르지 않습니다 ({len(sentences)}개). 3~6개여야 합니다.'}), 500
+    if not task.request_cancel():
+        return jsonify({'error': f'이미 종료된 작업입니다 ({task.status}).'}), 409
 
-        # 작업 ID 생성
-        task_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return jsonify(task.to_dict(since=task.log_cursor))
 
-        # 작업 상태 초기화
-        tasks[task_id] = TaskStatus(task_id)
 
-        # 백그라운드 스레드에서 비디오 생성
-        thread = threading.Thread(
-            target=generate_video_task,
-            args=(task_id, sentences, voice, quiz_data)  # quiz_data 전달
-        )
-        thread.daemon = False  # 작업이 완료될 때까지 유지
-        thread.start()
+def _sse_event(event, data, event_id=None):
+    """Server-Sent Events 메시지 포맷"""
+    message = f"event: {event}\n"
+    if event_id is not None:
+        message += f"id: {event_id}\n"
+    message += f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+    return message
 
-        return jsonify({
-            'task_id': task_id,
-            'status': 'processing',
-            'message': '비디오 생성이 시작되었습니다.',
-            'sentences': sentences,  # 생성된 문장 반환 (디버깅용)
-            'quiz_data': quiz_data if quiz_data else None  # 퀴즈 데이터 반환 (디버깅용)
-        })
 
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+@app.route('/api/status/<task_id>/stream')
+def stream_status(task_id):
+    """
+    작업 진행 상황 스트림 API (Server-Sent Events)
 
+    이벤트:
+        progress: {status, progress, current_step, queue_position}
+        log: {cursor, lines} - 새 로그 (id = 로그 커서)
+        done: 최종 상태 (완료/오류/취소 시 전송 후 스트림 종료)
 
-@app.route('/api/status/<task_id>')
-def get_status(task_id):
-    """작업 상태 조회 API"""
-    task = tasks.get(task_id)
+    재연결 시 Last-Event-ID 헤더(또는 since 쿼리)로 받은 로그 이후부터 이어서 전송
+    """
+    task = get_task(task_id)
 
     if not task:
         return jsonify({'error': '작업을 찾을 수 없습니다.'}), 404
 
-    return jsonify(task.to_dict())
+    cursor = request.args.get('since', type=int)
+    if cursor is None:
+        last_event_id = request.headers.get('Last-Event-ID', '')
+        cursor = int(last_event_id) if last_event_id.isdigit() else 0
+
+    keepalive = app.config['SSE_KEEPALIVE']
+
+    def event_stream(task, cursor):
+        while True:
+            # 상태를 읽기 전에 version을 먼저 기록해야 그 사이 변경을 놓치지 않음
+            version = task.version
+
+            yield _sse_event('progress', {
+                'status': task.status,
+                'progress': task.progress,
+                'current_step': task.current_step,
+                'queue_position': job_queue.position(task.task_id) if task.status == 'queued' else None
+            })
+
+            new_logs, cursor = task.read_logs(cursor)
+            if new_logs:
+                yield _sse_event('log', {'cursor': cursor, 'lines': new_logs}, event_id=cursor)
+
+            if task.is_finished:
+                yield _sse_event('done', task.to_dict(since=cursor))
+                return
+
+            # 변경이 없으면 연결 유지용 주석 전송
+            while task.wait_for_change(version, timeout=keepalive) == version:
+                yield ': keepalive\n\n'
+
+            # 공유 모드에서는 다른 프로세스가 갱신한 최신 상태를 다시 로드
+            task = get_task(task.task_id) or task
+
+    return Response(
+        stream_with_context(event_stream(task, cursor)),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'  # nginx 프록시 버퍼링 비활성화
+        }
+    )
 
 
 @app.route('/api/movie-quotes')
@@ -449,7 +1356,7 @@ def download(task_id, file_type):
         if not file_path.exists():
             return jsonify({'error': '파일을 찾을 수 없습니다.'}), 404
 
-        return send_file(
+        return send_cached_file(
             file_path,
             mimetype=mimetype,
             as_attachment=True,
@@ -529,31 +1436,63 @@ def save_video_config(video_id):
 
 @app.route('/api/video/<video_id>/regenerate', methods=['POST'])
 def regenerate_video(video_id):
-    """편집된 설정으로 비디오 재생성"""
-    try:
-        data = request.get_json()
-        config = data.get('config')
-
-        output_dir = app.config['OUTPUT_DIR']
-        config_dir = output_dir / 'edit_configs'
-        videos_dir = output_dir / 'videos'
+    """
+    편집된 설정으로 비디오 재생성 (백그라운드 작업으로 제출)
 
-        # VideoEditor 초기화
-        video_editor = VideoEditor(str(config_dir), str(videos_dir))
+    같은 비디오 + 같은 설정으로 대기/실행 중인 재생성 작업이 있으면
+    새 작업을 만들지 않고 기존 작업 ID를 반환
 
-        # 비디오 재생성
-        import time
-        start_time = time.time()
-
-        video_path = video_editor.regenerate_video(video_id, config)
+    Returns:
+        task_id - /api/status/<task_id>(/stream)로 진행 상황 조회,
+        완료 시 result.video_path로 결과 다운로드
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        config = data.get('config')
 
-        processing_time = time.time() - start_time
+        # 설정이 없으면 저장된 설정 사용 (요청 시점 스냅샷을 작업 입력값으로 고정)
+        if config is None:
+            config_manager = ConfigManager(str(app.config['OUTPUT_DIR'] / 'edit_configs'))
+            config = config_manager.load_config(video_id)
+            if config is None:
+                return jsonify({'error': '편집 설정을 찾을 수 없습니다.'}), 404
+
+        dedupe_key = f'regenerate:{video_id}:{request_hash(config)}'
+
+        with _submit_lock, file_lock(app.config['TASK_DB_PATH']):
+            task = find_active_task(dedupe_key)
+            deduplicated = task is not None
+
+            if not deduplicated:
+                task_id = new_task_id(prefix=f'regen_{video_id}')
+                task = TaskStatus(task_id, kind='regenerate', params={
+                    'video_id': video_id,
+                    'config': config
+                }, dedupe_key=dedupe_key)
+                tasks[task_id] = task
+                task.update(0, '작업 대기 중...')
+
+                # 작업 큐에 제출 (대기열이 가득 차면 429)
+                try:
+                    submit_task(task)
+                except QueueFullError as e:
+                    tasks.pop(task_id, None)
+                    task_store.delete(task_id)
+                    response = jsonify({'error': str(e), 'retry_after': e.retry_after})
+                    response.headers['Retry-After'] = str(e.retry_after)
+                    return response, 429
 
         return jsonify({
             'success': True,
-            'video_path': f'/api/download/{video_id}/video_edited',
-            'processing_time': round(processing_time, 2)
-        })
+            'task_id': task.task_id,
+            'status': task.status,
+            'queue_position': job_queue.position(task.task_id) if task.status == 'queued' else None,
+            'deduplicated': deduplicated,
+            'status_url': f'/api/status/{task.task_id}',
+            'stream_url': f'/api/status/{task.task_id}/stream',
+            'cancel_url': f'/api/status/{task.task_id}/cancel',
+            'message': '이미 진행 중인 재생성 작업에 연결되었습니다.' if deduplicated else '비디오 재생성이 시작되었습니다.'
+        }), 202
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -569,7 +1508,7 @@ def download_edited_video(video_id):
         if not file_path.exists():
             return jsonify({'error': '파일을 찾을 수 없습니다.'}), 404
 
-        return send_file(
+        return send_cached_file(
             file_path,
             mimetype='video/mp4',
             as_attachment=True,
@@ -946,15 +1885,54 @@ def serve_output_files(filename):
     """
     output 폴더의 파일들을 static으로 서빙
     (이미지, 오디오, 동영상 등)
+
+    Range 요청과 ETag/If-Modified-Since 조건부 요청 지원,
+    해시 파일명 리소스(resources/images, resources/audio)는 장기 캐시
     """
     try:
         output_dir = app.config['OUTPUT_DIR']
         file_path = output_dir / filename
 
-        if not file_path.exists():
+        if not file_path.exists() or not file_path.is_file():
             return jsonify({'error': '파일을 찾을 수 없습니다.'}), 404
 
-        return send_file(file_path)
+        return send_cached_file(file_path)
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/output-thumb/<int:width>/<path:filename>')
+def serve_output_thumbnail(width, filename):
+    """
+    output 폴더 이미지의 축소본 서빙 (편집기 미리보기용)
+
+    예: /output-thumb/320/resources/images/xxx.png?format=webp
+
+    Query:
+        format: webp 또는 jpeg (없으면 Accept 헤더로 결정)
+    """
+    try:
+        output_dir = app.config['OUTPUT_DIR']
+        file_path = output_dir / filename
+
+        if not file_path.exists() or not file_path.is_file():
+            return jsonify({'error': '파일을 찾을 수 없습니다.'}), 404
+
+        if file_path.suffix.lower() not in ('.png', '.jpg', '.jpeg', '.webp', '.gif'):
+            return jsonify({'error': '이미지 파일만 축소할 수 있습니다.'}), 400
+
+        fmt = negotiate_format(request.args.get('format', ''), request.headers.get('Accept', ''))
+        derivative_path = derivative_cache.get_derivative(str(file_path), width, fmt)
+
+        # 원본 파일명이 콘텐츠 해시면 같은 URL의 내용이 바뀌지 않으므로 장기 캐시
+        response = send_cached_file(
+            derivative_path,
+            mimetype=derivative_cache.mimetype(fmt),
+            immutable=is_content_addressed(file_path)
+        )
+        response.vary.add('Accept')
+        return response
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -971,4 +1949,17 @@ if __name__ == '__main__':
     print("🔗 http://localhost:5001 에서 실행 중...")
     print("=" * 50 + "\n")
 
+    # 중단된 작업 복구 (디버그 리로더의 감시 프로세스가 아닌 실제 서버 프로세스에서만)
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        # 공유 모드에서는 다른 워커가 실행 중인 작업일 수 있으므로 복구하지 않음
+        if not shared_backend:
+            recover_interrupted_tasks()
+
+        # 소스 파일이 삭제/변경된 렌더 캐시 항목 정리 (백그라운드)
+        render_cache = RenderCache(str(app.config['OUTPUT_DIR'] / 'resources' / 'renders'))
+        threading.Thread(target=render_cache.prune, name='render-cache-prune', daemon=True).start()
+
+        # 오래 사용하지 않은 미리보기 축소본 정리 (백그라운드)
+        threading.Thread(target=derivative_cache.prune_cache, name='derivative-cache-prune', daemon=True).start()
+
     app.run(debug=True, host='0.0.0.0', port=5001)
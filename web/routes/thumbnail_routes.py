@@ -7,10 +7,14 @@ URL 네임스페이스: /thumbnail-studio/*
 Author: Kelly & Claude Code
 Date: 2025-11-09
 """
-from flask import Blueprint, render_template, request, jsonify, send_file
+from flask import Blueprint, Response, render_template, request, jsonify, send_file, stream_with_context
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import json
 import os
 import sys
+import threading
+import time
 
 # 부모 디렉토리를 Python path에 추가 (src 모듈 import)
 project_root = Path(__file__).parent.parent.parent
@@ -23,9 +27,16 @@ from src.youtube_thumbnail import (
     ThumbnailHistory,
     StyleAnalyzer,
     VariationEngine,
-    get_style
+    VariationGridRenderer,
+    VARIATION_TYPES
 )
 from src.youtube_thumbnail.title_optimizer import ThumbnailTitleOptimizer
+from src.youtube_thumbnail.frame_extractor import FRAME_STRATEGIES
+from src.youtube_thumbnail.metadata_extractor import VIDEO_TTL, CHANNEL_TTL, STALE_TTL
+from src.atomic_cache import atomic_write_bytes
+from src.file_serving import send_cached_file
+from src.jobs import EventLog, fan_out, new_task_id, request_hash
+from src.image_derivatives import ImageDerivativeCache, negotiate_format
 
 # Blueprint 생성 (독립 네임스페이스)
 thumbnail_bp = Blueprint(
@@ -38,9 +49,83 @@ thumbnail_bp = Blueprint(
 output_base = project_root / 'output' / 'youtube_thumbnails'
 output_base.mkdir(parents=True, exist_ok=True)
 
-metadata_extractor = YouTubeMetadataExtractor()
+# yt-dlp 메타데이터 캐시 (유지 시간: 초, 환경변수로 조정)
+metadata_extractor = YouTubeMetadataExtractor(
+    cache_dir=str(output_base / 'metadata'),
+    video_ttl=int(os.environ.get('THUMBNAIL_VIDEO_METADATA_TTL', VIDEO_TTL)),
+    channel_ttl=int(os.environ.get('THUMBNAIL_CHANNEL_METADATA_TTL', CHANNEL_TTL)),
+    stale_ttl=int(os.environ.get('THUMBNAIL_METADATA_STALE_TTL', STALE_TTL))
+)
+channel_icon_dir = output_base / 'channels'
 channel_manager = ChannelProfile(profile_dir=str(output_base / 'profiles'))
 history_manager = ThumbnailHistory(session_dir=str(output_base / 'sessions'))
+derivative_cache = ImageDerivativeCache(cache_dir=str(output_base / 'derivatives'))
+
+# 썸네일 렌더링 결과 저장소 (입력값 해시별 PNG, 모든 세션 공유, 엔진 output_dir로 사용)
+render_cache_dir = output_base / 'renders'
+
+# 렌더링 결과 저장소 보관 기간/최대 용량 (블루프린트 등록 시 백그라운드로 정리)
+RENDER_CACHE_MAX_AGE_DAYS = float(os.environ.get('THUMBNAIL_RENDER_CACHE_DAYS', 30))
+RENDER_CACHE_MAX_SIZE_MB = float(os.environ.get('THUMBNAIL_RENDER_CACHE_MB', 2048))
+
+# 미리보기(선택 그리드/히스토리) 이미지 너비
+PREVIEW_WIDTH = 320
+
+# 변형 그리드 (한 번에 생성할 최대 변형 수, 렌더링 프로세스 수: 기본 CPU 수)
+GRID_MAX_COUNT = 24
+GRID_WORKERS = int(os.environ.get('THUMBNAIL_GRID_WORKERS', 0)) or None
+
+# YouTube 배경 프레임 선택 방식 (scored: 키프레임 채점, fixed: 시작/중간/끝 고정 시간대)
+FRAME_STRATEGY = os.environ.get('THUMBNAIL_FRAME_STRATEGY', 'scored')
+
+# generate 준비 단계별 타임아웃 (초) - 넘기면 해당 결과 없이 렌더링하고 도착하면 보완
+GENERATE_STEP_TIMEOUTS = {
+    'metadata': 20,
+    'frames': 90,
+    'channel_icon': 30,
+    'title': 20,
+    'reference': 45
+}
+
+# 동시에 처리할 것으로 예상하는 generate 요청 수 (준비 단계 스레드 풀 크기 계산용)
+GENERATE_CONCURRENCY = int(os.environ.get('THUMBNAIL_GENERATE_CONCURRENCY', 4))
+
+# 준비 단계 스레드 풀 (요청 여러 개의 단계가 공유, 기본: 단계 수 x 예상 동시 요청 수)
+# 타임아웃은 단계가 실행을 시작한 시점부터 계산되며, 타임아웃된 단계도 끝날 때까지 스레드를 사용
+generate_executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get('THUMBNAIL_GENERATE_WORKERS', 0)) or len(GENERATE_STEP_TIMEOUTS) * GENERATE_CONCURRENCY,
+    thread_name_prefix='thumbnail-generate'
+)
+# 늦게 도착한 결과로 다시 렌더링하는 보완 작업 풀 (준비 단계 풀을 차지하지 않도록 분리), 비동기 생성 작업 풀
+fill_in_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='thumbnail-fill-in')
+generate_job_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='thumbnail-job')
+
+# 비동기 생성 작업 (작업 ID → 이벤트 로그, 끝난 작업은 보관 시간 후 삭제)
+generate_jobs = {}
+generate_jobs_lock = threading.Lock()
+GENERATE_JOB_RETENTION = 3600
+
+# SSE 연결 유지 주석 전송 간격 (초)
+SSE_KEEPALIVE = 15
+
+
+@thumbnail_bp.record_once
+def _start_render_cache_prune(state):
+    """블루프린트 등록 시 렌더링 결과 저장소 / 축소 이미지 캐시 정리 (백그라운드)"""
+    engine = YouTubeThumbnailEngine(output_dir=str(render_cache_dir))
+    threading.Thread(
+        target=engine.prune_cache,
+        args=(RENDER_CACHE_MAX_AGE_DAYS, RENDER_CACHE_MAX_SIZE_MB),
+        name='thumbnail-render-cache-prune',
+        daemon=True
+    ).start()
+    threading.Thread(target=derivative_cache.prune_cache, name='thumbnail-derivative-cache-prune', daemon=True).start()
+
+
+def _preview_url(session_id: str, version: int, width: int = PREVIEW_WIDTH) -> str:
+    """버전별 축소 이미지 URL"""
+    return f'/thumbnail-studio/api/preview/{session_id}/v{version}?w={width}'
+
 
 # API 키 로드 (기존 시스템과 동일한 방식)
 api_key = os.environ.get('OPENAI_API_KEY')
@@ -89,8 +174,8 @@ def analyze_channel():
                 'error': 'YouTube 채널 URL이 필요합니다.'
             }), 400
 
-        # 채널 정보 추출 (아이콘 다운로드 포함)
-        channel_info = metadata_extractor.extract_channel_info(channel_url)
+        # 채널 정보 추출 (아이콘 다운로드 포함, 채널별 캐시)
+        channel_info = metadata_extractor.extract_channel_info(channel_url, output_dir=str(channel_icon_dir))
 
         if not channel_info:
             if not metadata_extractor.yt_dlp_available:
@@ -175,6 +260,400 @@ def analyze_url():
         }), 500
 
 
+def _parse_generate_form():
+    """
+    generate 요청 FormData 파싱 (요청 컨텍스트 안에서 호출)
+
+    참고 이미지는 임시 파일로 저장하고 경로만 넘김 (분석 단계에서 삭제)
+
+    Returns:
+        (파라미터 딕셔너리, 오류 메시지 또는 None)
+    """
+    params = {
+        'main_text': request.form.get('main_text', '').strip(),
+        'subtitle_text': request.form.get('subtitle_text', '').strip(),
+        'style': request.form.get('style', 'fire_english'),  # 기본값: Fire English 스타일
+        'sentence_count': request.form.get('sentence_count', type=int),
+        'video_duration': request.form.get('video_duration', '').strip(),
+        'text_position': request.form.get('text_position', 'center'),  # left/center/right
+        'youtube_url': request.form.get('youtube_url', '').strip(),  # NEW: YouTube URL
+        'channel_url': request.form.get('channel_url', '').strip(),  # NEW: 채널 URL
+        'use_kelly': request.form.get('use_kelly', 'false').lower() == 'true',  # Kelly 캐릭터 사용 여부
+        'frame_strategy': request.form.get('frame_strategy', FRAME_STRATEGY),  # 배경 프레임 선택 방식
+        'session_id': request.form.get('session_id'),  # 텍스트 수정 시 기존 세션
+        'brand_colors': None,
+        'reference_image_path': None
+    }
+
+    # 브랜드 색상
+    brand_primary = request.form.get('brand_color_primary', '').strip()
+    brand_secondary = request.form.get('brand_color_secondary', '').strip()
+    brand_accent = request.form.get('brand_color_accent', '').strip()
+
+    if brand_primary or brand_secondary or brand_accent:
+        params['brand_colors'] = {
+            'primary': brand_primary or '#FF5733',
+            'secondary': brand_secondary or '#3357FF',
+            'accent': brand_accent or '#FFD700'
+        }
+
+    # 필수 필드 검증
+    if not params['main_text']:
+        return params, '메인 텍스트는 필수입니다.'
+
+    if params['frame_strategy'] not in FRAME_STRATEGIES:
+        return params, f"지원하지 않는 프레임 선택 방식입니다: {params['frame_strategy']}"
+
+    # 참고 이미지 임시 저장 (GPT-4 Vision 분석 단계에서 사용 후 삭제)
+    reference_file = request.files.get('reference_image')
+    if reference_file and reference_file.filename:
+        temp_image_path = output_base / 'temp' / f'{new_task_id("reference")}_{Path(reference_file.filename).name}'
+        temp_image_path.parent.mkdir(parents=True, exist_ok=True)
+        reference_file.save(str(temp_image_path))
+        params['reference_image_path'] = str(temp_image_path)
+
+    return params, None
+
+
+def _extract_background_frames(youtube_url: str, frame_strategy: str) -> list:
+    """동영상에서 3개 프레임 추출 (다른 장면, 3개 미만이면 빈 리스트)"""
+    from src.youtube_thumbnail.frame_extractor import VideoFrameExtractor
+    frame_extractor = VideoFrameExtractor(output_dir=str(output_base / 'temp' / 'frames'))
+
+    print(f"📹 동영상에서 3개 프레임 추출 중... ({frame_strategy})")
+    frame_paths = frame_extractor.extract_frames_from_url(youtube_url, count=3, strategy=frame_strategy)
+
+    if frame_paths and len(frame_paths) >= 3:
+        print(f"✅ 3개 프레임 추출 완료:")
+        for i, path in enumerate(frame_paths, 1):
+            print(f"  {i}. {Path(path).name}")
+        return frame_paths
+    return []
+
+
+def _analyze_reference_image(image_path: str):
+    """참고 이미지 GPT-4 Vision 분석 (분석 후 임시 파일 삭제)"""
+    try:
+        analyzer = StyleAnalyzer(api_key=api_key)
+        reference_analysis = analyzer.analyze_reference_image(image_path)
+        print(f"✅ 참고 이미지 분석 완료: {reference_analysis}")
+        return reference_analysis
+    finally:
+        try:
+            Path(image_path).unlink()
+        except OSError:
+            pass
+
+
+def _generate_steps(params: dict) -> dict:
+    """
+    서로 의존하지 않는 준비 단계 (fan_out 입력: 이름 → (함수, 타임아웃))
+
+    metadata: YouTube 메타데이터 (프레임 추출 실패 시 기본 썸네일 URL)
+    frames: 배경 프레임 3개
+    channel_icon: 채널 아이콘 경로
+    title: CTR 최적화 제목 (GPT)
+    reference: 참고 이미지 분석 (GPT-4 Vision)
+    """
+    steps = {}
+    if params['youtube_url']:
+        steps['metadata'] = lambda: metadata_extractor.extract(params['youtube_url'])
+        steps['frames'] = lambda: _extract_background_frames(params['youtube_url'], params['frame_strategy'])
+
+    if params['channel_url']:
+        steps['channel_icon'] = lambda: (metadata_extractor.extract_channel_info(
+            params['channel_url'], output_dir=str(channel_icon_dir)
+        ) or {}).get('icon_path') or None
+
+    if api_key:
+        steps['title'] = lambda: ThumbnailTitleOptimizer(api_key=api_key).optimize_title(
+            original_title=params['main_text'],
+            context=params['subtitle_text'] if params['subtitle_text'] else None
+        )
+
+    if params['reference_image_path']:
+        if api_key:
+            steps['reference'] = lambda: _analyze_reference_image(params['reference_image_path'])
+        else:
+            Path(params['reference_image_path']).unlink(missing_ok=True)
+
+    return {name: (fn, GENERATE_STEP_TIMEOUTS[name]) for name, fn in steps.items()}
+
+
+def _generate_inputs(params: dict, results: dict) -> dict:
+    """
+    준비 단계 결과로 렌더링 입력 구성 (끝나지 않았거나 실패한 단계는 기본값)
+
+    Returns:
+        {'main_text', 'background_image_paths', 'channel_icon_path', 'reference_analysis', 'brand_colors'}
+    """
+    main_text = params['main_text']
+    if results.get('title'):
+        print(f"📝 제목 최적화: '{main_text}' → '{results['title']}'")
+        main_text = results['title']  # 최적화된 제목 사용
+
+    background_image_paths = list(results.get('frames') or [])
+    if params['youtube_url'] and not background_image_paths:
+        # 폴백: 기본 썸네일 1개만 사용
+        print(f"⚠️ 프레임 추출 실패, 기본 썸네일 사용")
+        thumbnail_url = (results.get('metadata') or {}).get('thumbnail_url', '')
+        if thumbnail_url:
+            try:
+                import requests
+                response = requests.get(thumbnail_url, timeout=10)
+                response.raise_for_status()
+                temp_bg_path = output_base / 'temp' / f'youtube_thumbnail_{request_hash(params["youtube_url"])[:16]}.jpg'
+                atomic_write_bytes(temp_bg_path, response.content)
+                background_image_paths = [str(temp_bg_path)]  # 1개만
+            except Exception as e:
+                print(f"⚠️ YouTube 기본 썸네일 다운로드 실패: {e}")
+
+    channel_icon_path = results.get('channel_icon')
+    if channel_icon_path:
+        print(f"✅ 채널 아이콘 로드: {channel_icon_path}")
+
+    # 참고 이미지의 색상 팔레트 적용
+    brand_colors = dict(params['brand_colors']) if params['brand_colors'] else None
+    reference_analysis = results.get('reference')
+    if reference_analysis and 'color_palette' in reference_analysis:
+        brand_colors = brand_colors or {}
+        palette = reference_analysis['color_palette']
+        brand_colors['primary'] = palette.get('primary', brand_colors.get('primary'))
+        brand_colors['secondary'] = palette.get('secondary', brand_colors.get('secondary'))
+        brand_colors['accent'] = palette.get('accent', brand_colors.get('accent'))
+
+    return {
+        'main_text': main_text,
+        'background_image_paths': background_image_paths,
+        'channel_icon_path': channel_icon_path,
+        'reference_analysis': reference_analysis,
+        'brand_colors': brand_colors
+    }
+
+
+def _resolve_session(params: dict, inputs: dict) -> str:
+    """
+    세션 생성 또는 기존 세션 사용
+
+    텍스트 수정 시: 기존 세션 ID가 있으면 재사용 (배경 이미지/채널 아이콘 보존, inputs 갱신)
+    """
+    existing_session_id = params['session_id']
+    session_thumbnails = history_manager.get_session_thumbnails(existing_session_id) if existing_session_id else []
+
+    if session_thumbnails:
+        # 기존 세션 재사용 (텍스트 수정 모드)
+        print(f"📁 기존 세션 재사용: {existing_session_id}")
+
+        # 마지막 썸네일의 배경 이미지 및 채널 아이콘 경로 가져오기
+        last_config = history_manager.load_thumbnail_config(existing_session_id, session_thumbnails[-1]['version']) or {}
+
+        # 배경 이미지 재사용
+        if not inputs['background_image_paths']:
+            last_bg_path = last_config.get('background_image_path')
+            if last_bg_path and Path(last_bg_path).exists():
+                inputs['background_image_paths'] = [last_bg_path]
+                print(f"✅ 이전 배경 이미지 재사용: {Path(last_bg_path).name}")
+
+        # 채널 아이콘 재사용
+        if not inputs['channel_icon_path']:
+            last_icon_path = last_config.get('channel_icon_path')
+            if last_icon_path and Path(last_icon_path).exists():
+                inputs['channel_icon_path'] = last_icon_path
+                print(f"✅ 이전 채널 아이콘 재사용: {Path(last_icon_path).name}")
+
+        return existing_session_id
+
+    # 새 세션 생성 (초기 생성)
+    session_id = history_manager.create_session({
+        'main_text': inputs['main_text'],
+        'subtitle_text': params['subtitle_text'],
+        'style': params['style'],
+        'reference_analysis': inputs['reference_analysis']
+    })
+    print(f"📁 새 세션 생성: {session_id}")
+    return session_id
+
+
+def _render_generate(session_id: str, params: dict, inputs: dict) -> list:
+    """
+    배경 이미지별 썸네일 렌더링 + 히스토리 저장
+
+    Returns:
+        저장된 버전 번호 리스트
+    """
+    # Kelly 캐릭터 경로 (사용 설정 시)
+    kelly_path = None
+    if params['use_kelly']:
+        # 기존 Kelly 이미지 찾기
+        kelly_candidates = [
+            project_root / 'output' / 'resources' / 'images' / 'kelly_casual_hoodie.png',
+            project_root / 'output' / 'resources' / 'images' / 'kelly_ponytail.png',
+            project_root / 'output' / 'resources' / 'images' / 'kelly_glasses.png'
+        ]
+        for path in kelly_candidates:
+            if path.exists():
+                kelly_path = str(path)
+                print(f"✅ Kelly 캐릭터 로드: {path.name}")
+                break
+
+    # 썸네일 엔진 초기화
+    thumbnail_engine = YouTubeThumbnailEngine(output_dir=str(render_cache_dir))
+
+    # 배경 이미지가 없으면 1개만 생성
+    background_image_paths = inputs['background_image_paths'] or [None]
+
+    # 썸네일 생성 (3개의 배경 이미지로 각각 생성)
+    print(f"🎨 TED 스타일 썸네일 생성 중...")
+    print(f"  - 배경 이미지 개수: {len(background_image_paths)}")
+    print(f"  - 채널 아이콘: {'있음' if inputs['channel_icon_path'] else '없음'}")
+    print(f"  - 텍스트 위치: {params['text_position']}")
+
+    thumbnail_versions = []
+
+    # 각 배경 이미지로 썸네일 생성
+    for i, bg_image_path in enumerate(background_image_paths, 1):
+        print(f"\n  📸 썸네일 {i}/{len(background_image_paths)} 생성 중...")
+
+        thumbnail_path = thumbnail_engine.create_thumbnail(
+            main_text=inputs['main_text'],
+            subtitle_text=params['subtitle_text'],
+            style=params['style'],
+            sentence_count=params['sentence_count'],
+            video_duration=params['video_duration'],
+            background_image_path=bg_image_path,  # 각기 다른 배경
+            channel_icon_path=inputs['channel_icon_path'],  # 모든 썸네일에 동일
+            text_position=params['text_position'],
+            brand_colors=inputs['brand_colors']
+        )
+
+        print(f"    ✅ 생성 완료: {Path(thumbnail_path).name}")
+
+        # 히스토리에 각각 저장
+        version = history_manager.save_thumbnail(
+            session_id=session_id,
+            thumbnail_path=thumbnail_path,
+            config={
+                'main_text': inputs['main_text'],
+                'subtitle_text': params['subtitle_text'],
+                'style': params['style'],
+                'sentence_count': params['sentence_count'],
+                'video_duration': params['video_duration'],
+                'brand_colors': inputs['brand_colors'],
+                'background_image_path': bg_image_path,
+                'channel_icon_path': inputs['channel_icon_path'],
+                'text_position': params['text_position'],
+                'youtube_url': params['youtube_url'],
+                'channel_url': params['channel_url'],
+                'thumbnail_index': i  # 몇 번째 썸네일인지
+            }
+        )
+        thumbnail_versions.append(version)
+
+    print(f"\n✅ 총 {len(thumbnail_versions)}개 썸네일 생성 완료!")
+    return thumbnail_versions
+
+
+def _versions_payload(session_id: str, versions: list) -> dict:
+    """버전 리스트 → 응답 필드 (다운로드/미리보기 URL)"""
+    return {
+        'session_id': session_id,
+        'versions': versions,  # [1, 2, 3]
+        'thumbnail_urls': [f'/thumbnail-studio/api/download/{session_id}/v{v}' for v in versions],  # 3개 URL
+        'preview_urls': [_preview_url(session_id, v, width=640) for v in versions],  # 선택 그리드용 축소본
+        'count': len(versions)
+    }
+
+
+def _fill_in_late_steps(session_id: str, params: dict, inputs: dict, results: dict, late: dict, emit):
+    """
+    타임아웃된 단계가 모두 끝나면 늦게 도착한 결과로 다시 렌더링하여 같은 세션에 새 버전 추가
+
+    Args:
+        inputs: 처음 렌더링에 사용한 입력 (새 결과가 없는 배경/아이콘은 그대로 사용)
+        results: 시간 안에 끝난 단계 결과 (늦은 결과가 추가됨)
+        late: fan_out이 반환한 늦은 단계 {이름: Future}
+        emit: emit(이벤트, 데이터, close=False) 진행 이벤트 콜백
+    """
+    remaining = set(late)
+    arrived = []
+    lock = threading.Lock()
+
+    def fill_in():
+        try:
+            if not arrived:
+                emit('done', {'session_id': session_id, 'updated': False}, close=True)
+                return
+
+            print(f"🔄 늦게 도착한 단계로 썸네일 보완: {arrived}")
+            updated_inputs = _generate_inputs(params, results)
+            for key in ('background_image_paths', 'channel_icon_path'):
+                updated_inputs[key] = updated_inputs[key] or inputs[key]
+            versions = _render_generate(session_id, params, updated_inputs)
+            emit('updated', dict(_versions_payload(session_id, versions), steps=arrived))
+            emit('done', {'session_id': session_id, 'updated': True}, close=True)
+        except Exception as e:
+            print(f"❌ 썸네일 보완 실패: {e}")
+            emit('done', {'session_id': session_id, 'updated': False, 'error': str(e)}, close=True)
+
+    def on_done(name, future):
+        error = future.exception()
+        if error is None and future.result():
+            results[name] = future.result()
+            status = 'done'
+        else:
+            status = 'failed'
+        emit('step', {'step': name, 'status': status, 'late': True})
+
+        with lock:
+            remaining.discard(name)
+            if status == 'done':
+                arrived.append(name)
+            last = not remaining
+        if last:
+            fill_in_executor.submit(fill_in)
+
+    for name, future in late.items():
+        future.add_done_callback(lambda future, name=name: on_done(name, future))
+
+
+def _run_generate(params: dict, emit=None) -> dict:
+    """
+    썸네일 생성 실행 (준비 단계 동시 실행 → 시간 안에 끝난 결과로 렌더링 → 늦은 결과는 나중에 보완)
+
+    Args:
+        params: _parse_generate_form 결과
+        emit: emit(이벤트, 데이터, close=False) 진행 이벤트 콜백 (비동기 작업용)
+
+    Returns:
+        응답 필드 (session_id, versions, thumbnail_urls, preview_urls, count, pending_steps, failed_steps)
+    """
+    emit = emit or (lambda event, data, close=False: None)
+    failed = []
+
+    def on_step(name, status, value):
+        if status == 'failed':
+            failed.append(name)
+            print(f"⚠️ {name} 단계 실패 (계속 진행): {value}")
+        elif status == 'timeout':
+            print(f"⚠️ {name} 단계 타임아웃 ({GENERATE_STEP_TIMEOUTS[name]}초), 없이 렌더링 후 도착하면 보완")
+        emit('step', {'step': name, 'status': status})
+
+    steps = _generate_steps(params)
+    emit('started', {'steps': list(steps)})
+    results, late = fan_out(generate_executor, steps, on_step=on_step)
+
+    inputs = _generate_inputs(params, results)
+    session_id = _resolve_session(params, inputs)
+    versions = _render_generate(session_id, params, inputs)
+
+    result = dict(_versions_payload(session_id, versions), pending_steps=list(late), failed_steps=failed)
+    emit('rendered', result, close=not late)
+
+    if late:
+        _fill_in_late_steps(session_id, params, inputs, results, late, emit)
+    return result
+
+
 @thumbnail_bp.route('/api/generate', methods=['POST'])
 def generate():
     """
@@ -183,6 +662,9 @@ def generate():
     엔드포인트: POST /thumbnail-studio/api/generate
     기존 /api/generate와 다른 경로 → 충돌 없음
 
+    메타데이터/프레임/채널 아이콘/제목 최적화/참고 이미지 분석을 동시에 실행하고
+    단계별 타임아웃 안에 끝난 결과로 렌더링 (늦은 단계는 도착하면 같은 세션에 새 버전으로 보완)
+
     FormData:
         - main_text: str (required)
         - subtitle_text: str (optional)
@@ -193,293 +675,187 @@ def generate():
         - brand_color_secondary: str (optional, hex)
         - brand_color_accent: str (optional, hex)
         - use_kelly: bool (optional, Kelly 캐릭터 사용 여부)
+        - frame_strategy: str (optional, scored/fixed - YouTube 배경 프레임 선택 방식)
         - reference_image: file (optional)
 
     Returns:
         {
             "success": true,
             "session_id": str,
-            "version": int,
-            "thumbnail_url": str
+            "versions": [int],
+            "thumbnail_urls": [str],
+            "preview_urls": [str],
+            "count": int,
+            "pending_steps": [str],  # 타임아웃 - 끝나면 새 버전 추가 (히스토리에서 확인)
+            "failed_steps": [str]
         }
     """
     try:
-        # FormData 파싱
-        main_text = request.form.get('main_text', '').strip()
-        subtitle_text = request.form.get('subtitle_text', '').strip()
-        style = request.form.get('style', 'fire_english')  # 기본값: Fire English 스타일
-        sentence_count = request.form.get('sentence_count', type=int)
-        video_duration = request.form.get('video_duration', '').strip()
-        text_position = request.form.get('text_position', 'center')  # left/center/right
-        youtube_url = request.form.get('youtube_url', '').strip()  # NEW: YouTube URL
-        channel_url = request.form.get('channel_url', '').strip()  # NEW: 채널 URL
-        use_kelly = request.form.get('use_kelly', 'false').lower() == 'true'  # Kelly 캐릭터 사용 여부
-
-        # 브랜드 색상
-        brand_colors = None
-        brand_primary = request.form.get('brand_color_primary', '').strip()
-        brand_secondary = request.form.get('brand_color_secondary', '').strip()
-        brand_accent = request.form.get('brand_color_accent', '').strip()
-
-        if brand_primary or brand_secondary or brand_accent:
-            brand_colors = {
-                'primary': brand_primary or '#FF5733',
-                'secondary': brand_secondary or '#3357FF',
-                'accent': brand_accent or '#FFD700'
-            }
-
-        # 필수 필드 검증
-        if not main_text:
+        params, error = _parse_generate_form()
+        if error:
             return jsonify({
                 'success': False,
-                'error': '메인 텍스트는 필수입니다.'
+                'error': error
             }), 400
 
-        # YouTube URL에서 3개의 프레임 추출 (동영상의 다른 장면)
-        background_image_paths = []  # 3개 배경 이미지
-        if youtube_url:
-            try:
-                # 1. 메타데이터 추출
-                from src.youtube_thumbnail.metadata_extractor import YouTubeMetadataExtractor
-                metadata_extractor = YouTubeMetadataExtractor()
-                video_metadata = metadata_extractor.extract(youtube_url)
-
-                if video_metadata:
-                    print(f"✅ YouTube 메타데이터 추출: {video_metadata['title'][:50]}...")
-
-                    # 영상 길이는 사용자가 입력한 경우만 사용 (자동 설정 제거)
-                    # video_duration이 비어있으면 배지가 표시되지 않음
-
-                # 2. 동영상에서 3개 프레임 추출 (다른 장면)
-                from src.youtube_thumbnail.frame_extractor import VideoFrameExtractor
-                frame_extractor = VideoFrameExtractor(output_dir=str(output_base / 'temp' / 'frames'))
-
-                print(f"📹 동영상에서 3개 프레임 추출 중...")
-                frame_paths = frame_extractor.extract_frames_from_url(youtube_url, count=3)
-
-                if frame_paths and len(frame_paths) >= 3:
-                    background_image_paths = frame_paths
-                    print(f"✅ 3개 프레임 추출 완료:")
-                    for i, path in enumerate(frame_paths, 1):
-                        print(f"  {i}. {Path(path).name}")
-                else:
-                    # 폴백: 기본 썸네일 1개만 사용
-                    print(f"⚠️ 프레임 추출 실패, 기본 썸네일 사용")
-                    thumbnail_url = video_metadata.get('thumbnail_url', '')
-                    if thumbnail_url:
-                        import requests
-                        response = requests.get(thumbnail_url, timeout=10)
-                        response.raise_for_status()
-                        temp_bg_path = output_base / 'temp' / f'youtube_thumbnail_{hash(youtube_url)}.jpg'
-                        temp_bg_path.parent.mkdir(parents=True, exist_ok=True)
-                        with open(temp_bg_path, 'wb') as f:
-                            f.write(response.content)
-                        background_image_paths = [str(temp_bg_path)]  # 1개만
+        return jsonify(dict(_run_generate(params), success=True))
 
-            except Exception as e:
-                print(f"⚠️ YouTube 프레임 추출 실패: {e}")
-                import traceback
-                traceback.print_exc()
+    except Exception as e:
+        print(f"❌ 썸네일 생성 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': f'썸네일 생성 실패: {str(e)}'
+        }), 500
 
-        # 채널 아이콘 다운로드
-        channel_icon_path = None
-        if channel_url:
-            try:
-                from src.youtube_thumbnail.metadata_extractor import YouTubeMetadataExtractor
-                metadata_extractor = YouTubeMetadataExtractor()
-                channel_info = metadata_extractor.extract_channel_info(channel_url)
 
-                if channel_info and channel_info.get('icon_path'):
-                    channel_icon_path = channel_info['icon_path']
-                    print(f"✅ 채널 아이콘 로드: {channel_icon_path}")
-            except Exception as e:
-                print(f"⚠️ 채널 아이콘 추출 실패 (계속 진행): {e}")
+def _prune_generate_jobs():
+    """끝난 지 오래된 비동기 생성 작업 삭제"""
+    expired_before = time.time() - GENERATE_JOB_RETENTION
+    with generate_jobs_lock:
+        for job_id in [job_id for job_id, job in generate_jobs.items() if job.closed and job.updated_at < expired_before]:
+            del generate_jobs[job_id]
 
-        # 메인 텍스트를 YouTube CTR 최적화 제목으로 변환
-        if api_key:
-            try:
-                title_optimizer = ThumbnailTitleOptimizer(api_key=api_key)
-                optimized_title = title_optimizer.optimize_title(
-                    original_title=main_text,
-                    context=subtitle_text if subtitle_text else None
-                )
-                print(f"📝 제목 최적화: '{main_text}' → '{optimized_title}'")
-                main_text = optimized_title  # 최적화된 제목 사용
-            except Exception as e:
-                print(f"⚠️ 제목 최적화 실패 (원본 사용): {e}")
-                # 실패해도 원본 제목으로 계속 진행
-
-        # 참고 이미지 처리 (GPT-4 Vision)
-        reference_analysis = None
-        if 'reference_image' in request.files:
-            reference_file = request.files['reference_image']
-            if reference_file.filename:
-                # 임시 저장
-                temp_image_path = output_base / 'temp' / reference_file.filename
-                temp_image_path.parent.mkdir(parents=True, exist_ok=True)
-                reference_file.save(str(temp_image_path))
-
-                # GPT-4 Vision 분석
-                if api_key:
-                    try:
-                        analyzer = StyleAnalyzer(api_key=api_key)
-                        reference_analysis = analyzer.analyze_reference_image(str(temp_image_path))
-                        print(f"✅ 참고 이미지 분석 완료: {reference_analysis}")
-                    except Exception as e:
-                        print(f"⚠ 참고 이미지 분석 실패 (계속 진행): {e}")
-
-                # 임시 파일 삭제
-                try:
-                    temp_image_path.unlink()
-                except:
-                    pass
-
-        # 세션 생성 또는 기존 세션 사용
-        # 텍스트 수정 시: 기존 세션 ID가 있으면 재사용 (배경 이미지 보존)
-        existing_session_id = request.form.get('session_id')
-
-        if existing_session_id and history_manager.get_session_thumbnails(existing_session_id):
-            # 기존 세션 재사용 (텍스트 수정 모드)
-            session_id = existing_session_id
-            print(f"📁 기존 세션 재사용: {session_id}")
-
-            # 마지막 썸네일의 배경 이미지 및 채널 아이콘 경로 가져오기
-            session_thumbnails = history_manager.get_session_thumbnails(session_id)
-            if session_thumbnails:
-                last_config = session_thumbnails[-1].get('config', {})
-
-                # 배경 이미지 재사용
-                if not background_image_paths:
-                    last_bg_path = last_config.get('background_image_path')
-                    if last_bg_path and Path(last_bg_path).exists():
-                        background_image_paths = [last_bg_path]
-                        print(f"✅ 이전 배경 이미지 재사용: {Path(last_bg_path).name}")
-
-                # 채널 아이콘 재사용
-                if not channel_icon_path:
-                    last_icon_path = last_config.get('channel_icon_path')
-                    if last_icon_path and Path(last_icon_path).exists():
-                        channel_icon_path = last_icon_path
-                        print(f"✅ 이전 채널 아이콘 재사용: {Path(last_icon_path).name}")
-        else:
-            # 새 세션 생성 (초기 생성)
-            session_id = history_manager.create_session({
-                'main_text': main_text,
-                'subtitle_text': subtitle_text,
-                'style': style,
-                'reference_analysis': reference_analysis
-            })
-            print(f"📁 새 세션 생성: {session_id}")
-
-        # Kelly 캐릭터 경로 (사용 설정 시)
-        kelly_path = None
-        if use_kelly:
-            # 기존 Kelly 이미지 찾기
-            kelly_candidates = [
-                project_root / 'output' / 'resources' / 'images' / 'kelly_casual_hoodie.png',
-                project_root / 'output' / 'resources' / 'images' / 'kelly_ponytail.png',
-                project_root / 'output' / 'resources' / 'images' / 'kelly_glasses.png'
-            ]
-            for path in kelly_candidates:
-                if path.exists():
-                    kelly_path = str(path)
-                    print(f"✅ Kelly 캐릭터 로드: {path.name}")
-                    break
-
-        # 썸네일 엔진 초기화
-        thumbnail_engine = YouTubeThumbnailEngine(output_dir=str(output_base / session_id))
-
-        # 스타일 설정 가져오기 (참고 이미지 분석 결과 병합)
-        style_config = get_style(style)
-        if reference_analysis:
-            # 참고 이미지의 색상 팔레트 적용
-            if 'color_palette' in reference_analysis:
-                if not brand_colors:
-                    brand_colors = {}
-                palette = reference_analysis['color_palette']
-                brand_colors['primary'] = palette.get('primary', brand_colors.get('primary'))
-                brand_colors['secondary'] = palette.get('secondary', brand_colors.get('secondary'))
-                brand_colors['accent'] = palette.get('accent', brand_colors.get('accent'))
-
-        # 썸네일 생성 (3개의 배경 이미지로 각각 생성)
-        print(f"🎨 TED 스타일 썸네일 생성 중...")
-        print(f"  - 배경 이미지 개수: {len(background_image_paths)}")
-        print(f"  - 채널 아이콘: {'있음' if channel_icon_path else '없음'}")
-        print(f"  - 텍스트 위치: {text_position}")
-
-        thumbnail_paths = []
-        thumbnail_versions = []
-
-        # 배경 이미지가 없으면 1개만 생성
-        if not background_image_paths:
-            background_image_paths = [None]
-
-        # 각 배경 이미지로 썸네일 생성
-        for i, bg_image_path in enumerate(background_image_paths, 1):
-            print(f"\n  📸 썸네일 {i}/{len(background_image_paths)} 생성 중...")
-
-            thumbnail_path = thumbnail_engine.create_thumbnail(
-                main_text=main_text,
-                subtitle_text=subtitle_text,
-                style=style,
-                sentence_count=sentence_count,
-                video_duration=video_duration,
-                background_image_path=bg_image_path,  # 각기 다른 배경
-                channel_icon_path=channel_icon_path,  # 모든 썸네일에 동일
-                text_position=text_position,
-                brand_colors=brand_colors
-            )
-
-            print(f"    ✅ 생성 완료: {Path(thumbnail_path).name}")
-            thumbnail_paths.append(thumbnail_path)
-
-            # 히스토리에 각각 저장
-            version = history_manager.save_thumbnail(
-                session_id=session_id,
-                thumbnail_path=thumbnail_path,
-                config={
-                    'main_text': main_text,
-                    'subtitle_text': subtitle_text,
-                    'style': style,
-                    'sentence_count': sentence_count,
-                    'video_duration': video_duration,
-                    'brand_colors': brand_colors,
-                    'background_image_path': bg_image_path,
-                    'channel_icon_path': channel_icon_path,
-                    'text_position': text_position,
-                    'youtube_url': youtube_url,
-                    'channel_url': channel_url,
-                    'thumbnail_index': i  # 몇 번째 썸네일인지
-                }
-            )
-            thumbnail_versions.append(version)
 
-        print(f"\n✅ 총 {len(thumbnail_paths)}개 썸네일 생성 완료!")
+def _run_generate_job(job: EventLog, params: dict):
+    """비동기 생성 작업 실행 (오류는 이벤트로 전달)"""
+    try:
+        _run_generate(params, emit=job.emit)
+    except Exception as e:
+        print(f"❌ 썸네일 생성 작업 오류: {e}")
+        job.emit('error', {'error': f'썸네일 생성 실패: {str(e)}'}, close=True)
 
-        # 썸네일 URL 리스트 생성
-        thumbnail_urls = [
-            f'/thumbnail-studio/api/download/{session_id}/v{v}'
-            for v in thumbnail_versions
-        ]
+
+def _sse_event(event, data, event_id=None):
+    """Server-Sent Events 메시지 포맷"""
+    message = f"event: {event}\n"
+    if event_id is not None:
+        message += f"id: {event_id}\n"
+    message += f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+    return message
+
+
+@thumbnail_bp.route('/api/generate-async', methods=['POST'])
+def generate_async():
+    """
+    썸네일 생성 API (비동기 작업)
+
+    엔드포인트: POST /thumbnail-studio/api/generate-async
+    FormData: /api/generate와 동일
+
+    Returns (202):
+        {
+            "success": true,
+            "job_id": str,
+            "status_url": str,   # 이벤트 폴링 (GET, ?since=커서)
+            "events_url": str    # Server-Sent Events 스트림
+        }
+
+    이벤트:
+        started: {steps}
+        step: {step, status(done/failed/timeout), late}
+        rendered: /api/generate 응답과 같은 필드
+        updated: 늦게 도착한 단계로 추가된 버전 {session_id, versions, ..., steps}
+        done / error: 마지막 이벤트
+    """
+    try:
+        params, error = _parse_generate_form()
+        if error:
+            return jsonify({
+                'success': False,
+                'error': error
+            }), 400
+
+        _prune_generate_jobs()
+        job_id = new_task_id('thumbnail')
+        job = EventLog()
+        with generate_jobs_lock:
+            generate_jobs[job_id] = job
+        generate_job_executor.submit(_run_generate_job, job, params)
 
         return jsonify({
             'success': True,
-            'session_id': session_id,
-            'versions': thumbnail_versions,  # [1, 2, 3]
-            'thumbnail_urls': thumbnail_urls,  # 3개 URL
-            'count': len(thumbnail_paths)
-        })
+            'job_id': job_id,
+            'status_url': f'/thumbnail-studio/api/generate-jobs/{job_id}',
+            'events_url': f'/thumbnail-studio/api/generate-jobs/{job_id}/events'
+        }), 202
 
     except Exception as e:
-        print(f"❌ 썸네일 생성 오류: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"❌ 썸네일 생성 작업 등록 오류: {e}")
         return jsonify({
             'success': False,
             'error': f'썸네일 생성 실패: {str(e)}'
         }), 500
 
 
+@thumbnail_bp.route('/api/generate-jobs/<job_id>', methods=['GET'])
+def generate_job_status(job_id: str):
+    """
+    비동기 생성 작업 이벤트 조회 (폴링)
+
+    Query:
+        since: 이벤트 커서 (이전 응답의 cursor) - 지정 시 새 이벤트만 반환
+    """
+    job = generate_jobs.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': '작업을 찾을 수 없습니다.'
+        }), 404
+
+    events = job.since(request.args.get('since', 0, type=int))
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'finished': job.closed,
+        'events': events,
+        'cursor': events[-1]['id'] if events else request.args.get('since', 0, type=int)
+    })
+
+
+@thumbnail_bp.route('/api/generate-jobs/<job_id>/events', methods=['GET'])
+def generate_job_events(job_id: str):
+    """
+    비동기 생성 작업 이벤트 스트림 (Server-Sent Events)
+
+    재연결 시 Last-Event-ID 헤더(또는 since 쿼리)로 받은 이벤트 이후부터 이어서 전송
+    """
+    job = generate_jobs.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': '작업을 찾을 수 없습니다.'
+        }), 404
+
+    cursor = request.args.get('since', type=int)
+    if cursor is None:
+        last_event_id = request.headers.get('Last-Event-ID', '')
+        cursor = int(last_event_id) if last_event_id.isdigit() else 0
+
+    def event_stream(cursor):
+        while True:
+            events = job.wait(cursor, timeout=SSE_KEEPALIVE)
+            if not events:
+                if job.closed:
+                    return
+                yield ': keepalive\n\n'
+                continue
+
+            for event in events:
+                yield _sse_event(event['event'], event['data'], event_id=event['id'])
+            cursor = events[-1]['id']
+
+    return Response(
+        stream_with_context(event_stream(cursor)),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'  # nginx 프록시 버퍼링 비활성화
+        }
+    )
+
+
 @thumbnail_bp.route('/api/regenerate', methods=['POST'])
 def regenerate():
     """
@@ -526,29 +902,19 @@ def regenerate():
         # 변형 타입별 새 설정 생성
         print(f"🔄 재생성 시작: {variation_type}")
 
-        if variation_type == 'color':
-            new_config = variation_engine.regenerate_color_variation(current_config)
-        elif variation_type == 'layout':
-            new_config = variation_engine.regenerate_layout_variation(current_config)
-        elif variation_type == 'complete':
-            new_config = variation_engine.regenerate_complete_new(current_config)
-        else:
+        if variation_type not in VARIATION_TYPES:
             return jsonify({
                 'success': False,
                 'error': f'알 수 없는 변형 타입: {variation_type}'
             }), 400
 
-        # 새 썸네일 생성
-        thumbnail_engine = YouTubeThumbnailEngine(output_dir=str(output_base / session_id))
+        new_config = variation_engine.create_variation(current_config, variation_type)
+
+        # 새 썸네일 생성 (배경/채널 아이콘/텍스트 위치 포함 원본 설정 그대로 사용)
+        thumbnail_engine = YouTubeThumbnailEngine(output_dir=str(render_cache_dir))
 
         thumbnail_path = thumbnail_engine.create_thumbnail(
-            main_text=new_config.get('main_text', ''),
-            subtitle_text=new_config.get('subtitle_text', ''),
-            style=new_config.get('style', 'fire_english'),
-            sentence_count=new_config.get('sentence_count'),
-            video_duration=new_config.get('video_duration', ''),
-            character_path=new_config.get('kelly_path'),
-            brand_colors=new_config.get('brand_colors')
+            **YouTubeThumbnailEngine.render_params(new_config)
         )
 
         print(f"✅ 재생성 완료: {thumbnail_path}")
@@ -568,7 +934,8 @@ def regenerate():
             'success': True,
             'session_id': session_id,
             'version': version,
-            'thumbnail_url': thumbnail_url
+            'thumbnail_url': thumbnail_url,
+            'preview_url': _preview_url(session_id, version)
         })
 
     except Exception as e:
@@ -581,6 +948,151 @@ def regenerate():
         }), 500
 
 
+@thumbnail_bp.route('/api/regenerate-grid', methods=['POST'])
+def regenerate_grid():
+    """
+    변형 그리드 생성 API (여러 변형을 한 번에 병렬 렌더링)
+
+    엔드포인트: POST /thumbnail-studio/api/regenerate-grid
+    Body: {
+        "session_id": str,
+        "current_version": int,
+        "count": int (기본 12, 최대 24),
+        "variation_types": ["color", "layout", "complete"] (기본: 모두)
+    }
+
+    Returns:
+        {
+            "success": true,
+            "session_id": str,
+            "versions": [int],
+            "thumbnail_urls": [str],
+            "preview_urls": [str],
+            "variation_types": [str],
+            "contact_sheet_url": str
+        }
+    """
+    try:
+        data = request.get_json() or {}
+        session_id = data.get('session_id', '').strip()
+        current_version = data.get('current_version', 1)
+        count = min(max(int(data.get('count', 12)), 1), GRID_MAX_COUNT)
+        variation_types = data.get('variation_types') or list(VARIATION_TYPES)
+
+        if not session_id:
+            return jsonify({
+                'success': False,
+                'error': '세션 ID가 필요합니다.'
+            }), 400
+
+        unknown_types = [t for t in variation_types if t not in VARIATION_TYPES]
+        if unknown_types:
+            return jsonify({
+                'success': False,
+                'error': f'알 수 없는 변형 타입: {", ".join(map(str, unknown_types))}'
+            }), 400
+
+        # 현재 버전의 설정 로드
+        current_config = history_manager.load_thumbnail_config(session_id, current_version)
+        if not current_config:
+            return jsonify({
+                'success': False,
+                'error': '버전을 찾을 수 없습니다.'
+            }), 404
+
+        # 변형 설정 생성 → 병렬 렌더링 (배경은 한 번만 준비)
+        print(f"🔄 변형 그리드 생성 시작: {count}개 ({', '.join(variation_types)})")
+        configs = VariationEngine().create_variation_grid(current_config, count, variation_types)
+        if not configs:
+            return jsonify({
+                'success': False,
+                'error': '생성할 수 있는 변형이 없습니다.'
+            }), 400
+
+        renderer = VariationGridRenderer(output_dir=str(render_cache_dir), max_workers=GRID_WORKERS)
+        thumbnail_paths = renderer.render(configs)
+        contact_sheet_path = renderer.create_contact_sheet(thumbnail_paths)
+
+        # 모든 버전과 모아보기 이미지를 한 번에 히스토리에 저장
+        versions = history_manager.save_thumbnails(
+            session_id,
+            list(zip(thumbnail_paths, configs)),
+            contact_sheet_path=contact_sheet_path
+        )
+
+        return jsonify({
+            'success': True,
+            'session_id': session_id,
+            'versions': versions,
+            'thumbnail_urls': [f'/thumbnail-studio/api/download/{session_id}/v{v}' for v in versions],
+            'preview_urls': [_preview_url(session_id, v) for v in versions],
+            'variation_types': [config['variation_type'] for config in configs],
+            'contact_sheet_url': f'/thumbnail-studio/api/contact-sheet/{session_id}/v{versions[0]}'
+        })
+
+    except Exception as e:
+        print(f"❌ 변형 그리드 생성 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': f'변형 그리드 생성 실패: {str(e)}'
+        }), 500
+
+
+# 세션 목록 한 페이지 최대 개수
+MAX_SESSIONS_PAGE = 100
+
+
+@thumbnail_bp.route('/api/sessions', methods=['GET'])
+def list_sessions():
+    """
+    최근 세션 목록 (최신순, 페이지네이션)
+
+    엔드포인트: GET /thumbnail-studio/api/sessions?limit=20&cursor=<next_cursor>
+
+    Query:
+        limit: 페이지 크기 (1~100, 기본 20)
+        offset: 건너뛸 세션 수 (페이지 번호 방식, cursor와 함께 쓰면 cursor 이후 기준)
+        cursor: 이전 응답의 next_cursor (깊은 페이지도 일정 비용)
+
+    Returns:
+        {
+            "success": true,
+            "sessions": [{"session_id", "created_at", "updated_at", "thumbnail_count", "cursor"}],
+            "total": int,
+            "next_cursor": str | null
+        }
+    """
+    limit = request.args.get('limit', 20, type=int)
+    if not 1 <= limit <= MAX_SESSIONS_PAGE:
+        return jsonify({
+            'success': False,
+            'error': f'limit은 1~{MAX_SESSIONS_PAGE} 사이여야 합니다.'
+        }), 400
+
+    try:
+        sessions = history_manager.list_sessions(
+            limit=limit,
+            offset=request.args.get('offset', 0, type=int),
+            cursor=request.args.get('cursor') or None
+        )
+
+        return jsonify({
+            'success': True,
+            'sessions': sessions,
+            'total': history_manager.count_sessions(),
+            'next_cursor': sessions[-1]['cursor'] if len(sessions) == limit else None
+        })
+
+    except Exception as e:
+        print(f"❌ 세션 목록 조회 오류: {e}")
+        return jsonify({
+            'success': False,
+            'error': f'세션 목록 조회 실패: {str(e)}'
+        }), 500
+
+
 @thumbnail_bp.route('/api/history/<session_id>', methods=['GET'])
 def get_history(session_id: str):
     """
@@ -596,6 +1108,7 @@ def get_history(session_id: str):
                 {
                     "version": int,
                     "url": str,
+                    "preview_url": str,
                     "variation_type": str,
                     "created_at": str
                 }
@@ -617,6 +1130,7 @@ def get_history(session_id: str):
             thumbnails.append({
                 'version': thumb['version'],
                 'url': f'/thumbnail-studio/api/download/{session_id}/v{thumb["version"]}',
+                'preview_url': _preview_url(session_id, thumb['version']),
                 'variation_type': thumb.get('variation_type', 'original'),
                 'created_at': thumb.get('created_at', '')
             })
@@ -675,6 +1189,66 @@ def download_thumbnail(session_id: str, version: int):
         }), 500
 
 
+@thumbnail_bp.route('/api/contact-sheet/<session_id>/v<int:version>', methods=['GET'])
+def contact_sheet(session_id: str, version: int):
+    """
+    변형 그리드 모아보기 이미지
+
+    엔드포인트: GET /thumbnail-studio/api/contact-sheet/<session_id>/v<version>
+    (version: 그리드에 포함된 아무 버전)
+    """
+    sheet_path = history_manager.get_contact_sheet_path(session_id, version)
+    if not sheet_path:
+        return jsonify({
+            'success': False,
+            'error': f'버전 {version}의 모아보기 이미지를 찾을 수 없습니다.'
+        }), 404
+
+    # 저장 후 바뀌지 않으므로 장기 캐시
+    return send_cached_file(sheet_path, mimetype='image/png', immutable=True)
+
+
+@thumbnail_bp.route('/api/preview/<session_id>/v<int:version>', methods=['GET'])
+def preview_thumbnail(session_id: str, version: int):
+    """
+    특정 버전 썸네일의 축소 이미지 (히스토리/선택 그리드 표시용)
+
+    엔드포인트: GET /thumbnail-studio/api/preview/<session_id>/v<version>?w=320&format=webp
+
+    Query:
+        w: 너비 (px, 기본 320)
+        format: webp 또는 jpeg (없으면 Accept 헤더로 결정)
+    """
+    try:
+        thumbnail_path_str = history_manager.get_thumbnail_path(session_id, version)
+
+        if not thumbnail_path_str or not Path(thumbnail_path_str).exists():
+            return jsonify({
+                'success': False,
+                'error': f'버전 {version}을 찾을 수 없습니다.'
+            }), 404
+
+        width = request.args.get('w', PREVIEW_WIDTH, type=int)
+        fmt = negotiate_format(request.args.get('format', ''), request.headers.get('Accept', ''))
+        derivative_path = derivative_cache.get_derivative(thumbnail_path_str, width, fmt)
+
+        # 버전 파일은 저장 후 바뀌지 않으므로 장기 캐시
+        response = send_cached_file(
+            derivative_path,
+            mimetype=derivative_cache.mimetype(fmt),
+            immutable=True
+        )
+        response.vary.add('Accept')
+        return response
+
+    except Exception as e:
+        print(f"❌ 미리보기 오류: {e}")
+        return jsonify({
+            'success': False,
+            'error': f'미리보기 생성 실패: {str(e)}'
+        }), 500
+
+
 @thumbnail_bp.route('/api/channel-profile', methods=['GET', 'POST'])
 def channel_profile():
     """
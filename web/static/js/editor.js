@@ -4,6 +4,7 @@ let videoId = null;
 let config = null;
 let selectedClipIndex = null;
 let hasUnsavedChanges = false; // 변경사항 추적
+const THUMBNAIL_WIDTH = 320; // 미리보기 이미지 너비 (px, 서버에서 축소본 제공)
 
 // ==================== 초기화 ====================
 
@@ -142,7 +143,7 @@ function loadIntroOutroImages() {
     const introImagePath = globalSettings.intro.custom_image || globalSettings.intro.default_image;
 
     if (introImagePath) {
-        const webPath = getRelativeImagePath(introImagePath);
+        const webPath = getThumbnailImagePath(introImagePath);
         introThumbnail.innerHTML = `<img src="${webPath}" alt="인트로 이미지">`;
     } else {
         // 이미지가 없으면 기본 배경색 표시
@@ -161,7 +162,7 @@ function loadIntroOutroImages() {
     const outroImagePath = globalSettings.outro.custom_image || globalSettings.outro.default_image;
 
     if (outroImagePath) {
-        const webPath = getRelativeImagePath(outroImagePath);
+        const webPath = getThumbnailImagePath(outroImagePath);
         outroThumbnail.innerHTML = `<img src="${webPath}" alt="아웃트로 이미지">`;
     } else {
         // 이미지가 없으면 기본 배경색 표시
@@ -322,7 +323,7 @@ function createSentenceCard(clip, index) {
     };
 
     // 이미지 경로
-    const imagePath = getRelativeImagePath(clip.image.path);
+    const imagePath = getThumbnailImagePath(clip.image.path);
 
     cardElement.innerHTML = `
         <div class="card-header">
@@ -455,6 +456,20 @@ function getRelativeImagePath(fullPath) {
     return fullPath.replace(/.*\/daily-english-mecca\//, '/');
 }
 
+/**
+ * 절대 경로를 미리보기용 축소 이미지 URL로 변환
+ * 예: /Users/.../output/resources/images/xxx.png → /output-thumb/320/resources/images/xxx.png
+ * (output 밖의 파일이나 동영상은 원본 URL 그대로 사용)
+ */
+function getThumbnailImagePath(fullPath, width = THUMBNAIL_WIDTH) {
+    const webPath = getRelativeImagePath(fullPath);
+
+    if (webPath.startsWith('/output/') && /\.(png|jpe?g|webp)$/i.test(webPath)) {
+        return webPath.replace(/^\/output\//, `/output-thumb/${width}/`);
+    }
+    return webPath;
+}
+
 /**
  * 텍스트 자르기
  */
@@ -555,7 +570,7 @@ async function uploadIntroImage(file) {
 
         // 썸네일 업데이트
         const introThumbnail = document.getElementById('intro-thumbnail');
-        const webPath = getRelativeImagePath(data.image_path);
+        const webPath = getThumbnailImagePath(data.image_path);
         introThumbnail.innerHTML = `<img src="${webPath}?t=${Date.now()}" alt="인트로 이미지">`;
 
         // 편집 패널 이미지도 업데이트
@@ -603,7 +618,7 @@ async function uploadOutroImage(file) {
 
         // 썸네일 업데이트
         const outroThumbnail = document.getElementById('outro-thumbnail');
-        const webPath = getRelativeImagePath(data.image_path);
+        const webPath = getThumbnailImagePath(data.image_path);
         outroThumbnail.innerHTML = `<img src="${webPath}?t=${Date.now()}" alt="아웃트로 이미지">`;
 
         // 편집 패널 이미지도 업데이트
@@ -660,7 +675,7 @@ async function generateIntroAIImage() {
 
         // 썸네일 업데이트
         const introThumbnail = document.getElementById('intro-thumbnail');
-        const webPath = getRelativeImagePath(data.image_path);
+        const webPath = getThumbnailImagePath(data.image_path);
         introThumbnail.innerHTML = `<img src="${webPath}?t=${Date.now()}" alt="인트로 이미지">`;
 
         // 편집 패널 이미지도 업데이트
@@ -717,7 +732,7 @@ async function generateOutroAIImage() {
 
         // 썸네일 업데이트
         const outroThumbnail = document.getElementById('outro-thumbnail');
-        const webPath = getRelativeImagePath(data.image_path);
+        const webPath = getThumbnailImagePath(data.image_path);
         outroThumbnail.innerHTML = `<img src="${webPath}?t=${Date.now()}" alt="아웃트로 이미지">`;
 
         // 편집 패널 이미지도 업데이트
@@ -803,7 +818,7 @@ async function uploadMediaFile(index, file) {
         const card = document.querySelector(`.sentence-card[data-index="${index}"]`);
         const thumbnail = card.querySelector('.thumbnail img');
         if (thumbnail) {
-            thumbnail.src = getRelativeImagePath(data.file_path) + '?t=' + Date.now(); // 캐시 방지
+            thumbnail.src = getThumbnailImagePath(data.file_path) + '?t=' + Date.now(); // 캐시 방지
         }
 
         showMessage('success', `미디어 교체 완료! (${data.file_type})`);
@@ -860,7 +875,7 @@ async function generateAIImage(index) {
         const card = document.querySelector(`.sentence-card[data-index="${index}"]`);
         const thumbnail = card.querySelector('.thumbnail img');
         if (thumbnail) {
-            thumbnail.src = getRelativeImagePath(data.image_path) + '?t=' + Date.now();
+            thumbnail.src = getThumbnailImagePath(data.image_path) + '?t=' + Date.now();
         }
 
         showMessage('success', `AI 이미지 생성 완료! ${data.message}`);
@@ -1073,7 +1088,7 @@ function displayIntroSettings() {
     const introImagePath = introSettings.custom_image || introSettings.default_image;
 
     if (introImagePath) {
-        const webPath = getRelativeImagePath(introImagePath);
+        const webPath = getThumbnailImagePath(introImagePath);
         introImagePreview.src = webPath;
     } else {
         introImagePreview.src = '';
@@ -1095,7 +1110,7 @@ function displayOutroSettings() {
     const outroImagePath = outroSettings.custom_image || outroSettings.default_image;
 
     if (outroImagePath) {
-        const webPath = getRelativeImagePath(outroImagePath);
+        const webPath = getThumbnailImagePath(outroImagePath);
         outroImagePreview.src = webPath;
     } else {
         outroImagePreview.src = '';
@@ -1147,7 +1162,7 @@ function displayClipSettings(index) {
     const imagePath = document.getElementById('image-path');
     if (clip.image.path) {
         // 이미지 경로를 웹 URL로 변환
-        const webPath = getRelativeImagePath(clip.image.path);
+        const webPath = getThumbnailImagePath(clip.image.path);
         clipImage.src = webPath;
         imagePath.textContent = clip.image.path;
     } else {
@@ -1477,12 +1492,26 @@ async function onRegenerate() {
     }
 
     const regenerateBtn = document.getElementById('btn-regenerate');
+    const cancelBtn = document.getElementById('loading-cancel');
+    let taskId = null;
+
+    const onCancel = async () => {
+        if (!taskId) return;
+        cancelBtn.disabled = true;
+        updateLoadingSubtext('취소 중...');
+        try {
+            await fetch(`/api/status/${taskId}/cancel`, { method: 'POST' });
+        } catch (error) {
+            console.error('Error cancelling task:', error);
+        }
+    };
 
     try {
         // 로딩 오버레이 및 버튼 상태 시작
-        showLoadingOverlay('🎬 비디오 재생성 중...', '약 3-5분 소요됩니다. 잠시만 기다려주세요.');
+        showLoadingOverlay('🎬 비디오 재생성 중...', '작업 대기 중...');
         setButtonLoading(regenerateBtn, true);
 
+        // 재생성 작업 제출 (즉시 task_id 반환, 같은 설정의 진행 중 작업이 있으면 그 작업에 연결)
         const response = await fetch(`/api/video/${videoId}/regenerate`, {
             method: 'POST',
             headers: {
@@ -1499,15 +1528,34 @@ async function onRegenerate() {
         }
 
         const data = await response.json();
+        taskId = data.task_id;
+
+        cancelBtn.disabled = false;
+        cancelBtn.classList.add('visible');
+        cancelBtn.addEventListener('click', onCancel);
+
+        // 완료/오류/취소될 때까지 진행 상황 표시
+        const finalStatus = await waitForTask(taskId, updateRegenerateProgress);
 
         // 로딩 오버레이 숨기기
         hideLoadingOverlay();
 
-        showMessage('success', `비디오 재생성 완료! (${data.processing_time}초 소요)`);
+        if (finalStatus.status === 'cancelled') {
+            showMessage('info', '비디오 재생성이 취소되었습니다.');
+            setTimeout(() => hideMessage(), 5000);
+            return;
+        }
+
+        if (finalStatus.status !== 'completed') {
+            throw new Error(finalStatus.error || '알 수 없는 오류');
+        }
+
+        const result = finalStatus.result;
+        showMessage('success', `비디오 재생성 완료! (${result.processing_time}초 소요)`);
 
         // 비디오 미리보기 업데이트
         const videoElement = document.getElementById('preview-video');
-        videoElement.src = data.video_path + '?t=' + Date.now(); // 캐시 방지
+        videoElement.src = result.video_path + '?t=' + Date.now(); // 캐시 방지
 
         setTimeout(() => hideMessage(), 5000);
 
@@ -1519,10 +1567,73 @@ async function onRegenerate() {
         showMessage('error', friendlyMessage);
     } finally {
         // 버튼 로딩 상태 해제
+        cancelBtn.classList.remove('visible');
+        cancelBtn.removeEventListener('click', onCancel);
         setButtonLoading(regenerateBtn, false);
     }
 }
 
+/**
+ * 재생성 진행 상황을 로딩 오버레이에 표시
+ */
+function updateRegenerateProgress(status) {
+    if (status.status === 'queued' && status.queue_position) {
+        updateLoadingSubtext(`대기 중 (${status.queue_position}번째)`);
+    } else {
+        updateLoadingSubtext(`${status.current_step} (${status.progress}%)`);
+    }
+}
+
+/**
+ * 백그라운드 작업이 끝날 때까지 대기 (SSE, 미지원/연결 끊김 시 폴링)
+ *
+ * @param {string} taskId - 작업 ID
+ * @param {Function} onProgress - 진행 상황 콜백 ({status, progress, current_step, queue_position})
+ * @returns {Promise<Object>} 최종 작업 상태 (completed / error / cancelled)
+ */
+function waitForTask(taskId, onProgress) {
+    const finalStatuses = ['completed', 'error', 'cancelled'];
+
+    return new Promise((resolve, reject) => {
+        const poll = () => {
+            const timer = setInterval(async () => {
+                try {
+                    const response = await fetch(`/api/status/${taskId}`);
+                    if (!response.ok) {
+                        throw new Error(`HTTP ${response.status}`);
+                    }
+                    const data = await response.json();
+                    onProgress(data);
+                    if (finalStatuses.includes(data.status)) {
+                        clearInterval(timer);
+                        resolve(data);
+                    }
+                } catch (error) {
+                    clearInterval(timer);
+                    reject(error);
+                }
+            }, 2000);
+        };
+
+        if (!window.EventSource) {
+            poll();
+            return;
+        }
+
+        const stream = new EventSource(`/api/status/${taskId}/stream`);
+        stream.addEventListener('progress', (e) => onProgress(JSON.parse(e.data)));
+        stream.addEventListener('done', (e) => {
+            stream.close();
+            resolve(JSON.parse(e.data));
+        });
+        stream.onerror = () => {
+            // 스트림이 끊기면 폴링으로 전환
+            stream.close();
+            poll();
+        };
+    });
+}
+
 async function onGenerateIntroImage() {
     const promptInput = document.getElementById('intro-image-prompt');
     const customPrompt = promptInput.value.trim();
@@ -1557,7 +1668,7 @@ async function onGenerateIntroImage() {
 
         // 썸네일 업데이트
         const introThumbnail = document.getElementById('intro-thumbnail');
-        const webPath = getRelativeImagePath(data.image_path);
+        const webPath = getThumbnailImagePath(data.image_path);
         introThumbnail.innerHTML = `<img src="${webPath}?t=${Date.now()}" alt="인트로 이미지">`;
 
         showMessage('success', `인트로 이미지 생성 완료! ${data.message}`);
@@ -1612,7 +1723,7 @@ async function onGenerateOutroImage() {
 
         // 썸네일 업데이트
         const outroThumbnail = document.getElementById('outro-thumbnail');
-        const webPath = getRelativeImagePath(data.image_path);
+        const webPath = getThumbnailImagePath(data.image_path);
         outroThumbnail.innerHTML = `<img src="${webPath}?t=${Date.now()}" alt="아웃트로 이미지">`;
 
         showMessage('success', `아웃트로 이미지 생성 완료! ${data.message}`);
@@ -1676,6 +1787,13 @@ function showLoadingOverlay(text = '처리 중...', subtext = '잠시만 기다
     overlay.classList.add('active');
 }
 
+/**
+ * 로딩 오버레이 보조 문구 변경
+ */
+function updateLoadingSubtext(subtext) {
+    document.getElementById('loading-subtext').textContent = subtext;
+}
+
 /**
  * 로딩 오버레이 숨기기
  */
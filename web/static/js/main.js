@@ -5,6 +5,8 @@
 // 전역 변수
 let currentTaskId = null;
 let pollingInterval = null;
+let statusStream = null;
+let logCursor = 0;
 
 // DOM 요소
 const formatSelection = document.getElementById('format-selection');
@@ -86,14 +88,70 @@ async function startVideoGeneration(sentences, voice) {
 }
 
 /**
- * 진행 상황 폴링 시작
+ * 진행 상황 수신 시작 (SSE 우선, 미지원/연결 실패 시 폴링)
  */
 function startPolling() {
-    // 기존 폴링이 있으면 중지
+    // 기존 폴링/스트림이 있으면 중지
+    stopStatusUpdates();
+    logCursor = 0;
+
+    if (window.EventSource) {
+        startStatusStream();
+    } else {
+        startStatusPolling();
+    }
+}
+
+/**
+ * 진행 상황 수신 중지
+ */
+function stopStatusUpdates() {
     if (pollingInterval) {
         clearInterval(pollingInterval);
+        pollingInterval = null;
+    }
+    if (statusStream) {
+        statusStream.close();
+        statusStream = null;
     }
+}
+
+/**
+ * Server-Sent Events로 진행 상황 수신
+ */
+function startStatusStream() {
+    statusStream = new EventSource(`/api/status/${currentTaskId}/stream?since=${logCursor}`);
+
+    statusStream.addEventListener('progress', (e) => {
+        updateProgress(JSON.parse(e.data));
+    });
+
+    statusStream.addEventListener('log', (e) => {
+        const data = JSON.parse(e.data);
+        appendLogs(data.lines);
+        logCursor = data.cursor;
+    });
+
+    statusStream.addEventListener('done', (e) => {
+        const data = JSON.parse(e.data);
+        stopStatusUpdates();
+        handleFinalStatus(data);
+    });
+
+    statusStream.onerror = () => {
+        // 스트림이 끊기면 폴링으로 전환 (받은 로그 이후부터 이어서 조회)
+        if (statusStream) {
+            console.warn('SSE 연결 끊김, 폴링으로 전환');
+            stopStatusUpdates();
+            startStatusPolling();
+        }
+    };
+}
 
+/**
+ * 폴링으로 진행 상황 수신
+ */
+function startStatusPolling() {
     // 1초마다 상태 확인
     pollingInterval = setInterval(async () => {
         await checkStatus();
@@ -108,7 +166,8 @@ function startPolling() {
  */
 async function checkStatus() {
     try {
-        const response = await fetch(`/api/status/${currentTaskId}`);
+        // 이전에 받은 로그 이후의 새 로그만 요청
+        const response = await fetch(`/api/status/${currentTaskId}?since=${logCursor}`);
 
         if (!response.ok) {
             throw new Error('상태 확인에 실패했습니다.');
@@ -118,25 +177,38 @@ async function checkStatus() {
 
         // 진행 상황 업데이트
         updateProgress(data);
+        appendLogs(data.logs);
+        logCursor = data.log_cursor;
 
-        // 완료 또는 오류 시 폴링 중지
-        if (data.status === 'completed') {
-            clearInterval(pollingInterval);
-            showResult(data);
-        } else if (data.status === 'error') {
-            clearInterval(pollingInterval);
-            alert('오류가 발생했습니다: ' + data.error);
-            showInputSection();
+        // 완료, 오류 또는 취소 시 폴링 중지
+        if (['completed', 'error', 'cancelled'].includes(data.status)) {
+            stopStatusUpdates();
+            handleFinalStatus(data);
         }
 
     } catch (error) {
         console.error('Error checking status:', error);
-        clearInterval(pollingInterval);
+        stopStatusUpdates();
         alert('상태 확인 중 오류가 발생했습니다.');
         showInputSection();
     }
 }
 
+/**
+ * 완료/오류/취소 상태 처리
+ */
+function handleFinalStatus(data) {
+    if (data.status === 'completed') {
+        showResult(data);
+    } else if (data.status === 'error') {
+        alert('오류가 발생했습니다: ' + data.error);
+        showInputSection();
+    } else if (data.status === 'cancelled') {
+        alert('작업이 취소되었습니다.');
+        showInputSection();
+    }
+}
+
 /**
  * 진행 상황 업데이트
  */
@@ -145,18 +217,29 @@ function updateProgress(data) {
     progressBar.style.width = data.progress + '%';
     progressText.textContent = data.progress + '%';
 
-    // 현재 단계
-    currentStepElement.textContent = data.current_step;
-
-    // 로그 업데이트
-    if (data.logs && data.logs.length > 0) {
-        logsElement.innerHTML = data.logs
-            .map(log => `<p>${escapeHtml(log)}</p>`)
-            .join('');
+    // 현재 단계 (대기 중이면 대기 순번 표시)
+    if (data.status === 'queued' && data.queue_position) {
+        currentStepElement.textContent = `대기 중 (${data.queue_position}번째)`;
+    } else {
+        currentStepElement.textContent = data.current_step;
+    }
+}
 
-        // 자동 스크롤
-        logsElement.scrollTop = logsElement.scrollHeight;
+/**
+ * 새 로그 추가
+ */
+function appendLogs(lines) {
+    if (!lines || lines.length === 0) {
+        return;
     }
+
+    logsElement.insertAdjacentHTML(
+        'beforeend',
+        lines.map(log => `<p>${escapeHtml(log)}</p>`).join('')
+    );
+
+    // 자동 스크롤
+    logsElement.scrollTop = logsElement.scrollHeight;
 }
 
 /**
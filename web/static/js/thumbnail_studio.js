@@ -365,7 +365,7 @@ async function generateThumbnail() {
 
             // 3개의 썸네일이 생성된 경우 선택 UI 표시
             if (data.count && data.count > 1 && data.thumbnail_urls) {
-                displayThumbnailSelection(data.thumbnail_urls, data.versions);
+                displayThumbnailSelection(data.preview_urls || data.thumbnail_urls, data.versions);
                 showToast(`✅ ${data.count}개 썸네일 생성 완료! 마음에 드는 것을 선택하세요.`, 'success');
             } else {
                 // 1개만 생성된 경우 기존 로직
@@ -599,7 +599,7 @@ async function loadHistory(sessionId) {
                 }
 
                 item.innerHTML = `
-                    <img src="${thumb.url}" alt="버전 ${thumb.version}">
+                    <img src="${thumb.preview_url || thumb.url}" alt="버전 ${thumb.version}" loading="lazy">
                     <div class="history-item-info">
                         <strong>v${thumb.version}</strong>
                         ${thumb.variation_type ? `<br><small>${thumb.variation_type}</small>` : ''}
@@ -822,7 +822,7 @@ async function applyTextEdit() {
             console.log('📸 3개 썸네일 생성됨:', data.thumbnail_urls);
 
             if (data.versions) {
-                displayThumbnailSelection(data.thumbnail_urls, data.versions);
+                displayThumbnailSelection(data.preview_urls || data.thumbnail_urls, data.versions);
                 showToast(`✅ ${data.count}개 썸네일 생성 완료! 마음에 드는 것을 선택하세요.`, 'success');
             }
         } else if (data.thumbnail_url || data.thumbnail_urls) {